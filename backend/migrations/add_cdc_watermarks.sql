@@ -0,0 +1,62 @@
+-- Watermarks for cdc_export.py: every backed-up table needs created_at and an
+-- updated_at that moves on every UPDATE, and an index on the watermark so a
+-- nightly delta reads one index range instead of the whole table
+
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+ALTER TABLE patients ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+ALTER TABLE patients ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+ALTER TABLE patient_transactions ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+ALTER TABLE patient_transactions ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+ALTER TABLE patient_refunds ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+ALTER TABLE patient_refunds ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+ALTER TABLE patient_admissions ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+ALTER TABLE patient_admissions ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+ALTER TABLE beds ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+ALTER TABLE beds ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+
+DROP TRIGGER IF EXISTS update_patients_updated_at ON patients;
+CREATE TRIGGER update_patients_updated_at
+    BEFORE UPDATE ON patients
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_patient_transactions_updated_at ON patient_transactions;
+CREATE TRIGGER update_patient_transactions_updated_at
+    BEFORE UPDATE ON patient_transactions
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_patient_refunds_updated_at ON patient_refunds;
+CREATE TRIGGER update_patient_refunds_updated_at
+    BEFORE UPDATE ON patient_refunds
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_patient_admissions_updated_at ON patient_admissions;
+CREATE TRIGGER update_patient_admissions_updated_at
+    BEFORE UPDATE ON patient_admissions
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_beds_updated_at ON beds;
+CREATE TRIGGER update_beds_updated_at
+    BEFORE UPDATE ON beds
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- Same expression cdc_export.py filters on
+CREATE INDEX IF NOT EXISTS idx_patients_cdc_watermark
+ON patients ((COALESCE(updated_at, created_at)));
+CREATE INDEX IF NOT EXISTS idx_patient_transactions_cdc_watermark
+ON patient_transactions ((COALESCE(updated_at, created_at)));
+CREATE INDEX IF NOT EXISTS idx_patient_refunds_cdc_watermark
+ON patient_refunds ((COALESCE(updated_at, created_at)));
+CREATE INDEX IF NOT EXISTS idx_patient_admissions_cdc_watermark
+ON patient_admissions ((COALESCE(updated_at, created_at)));
+CREATE INDEX IF NOT EXISTS idx_beds_cdc_watermark
+ON beds ((COALESCE(updated_at, created_at)));
+
+-- Force schema cache reload
+NOTIFY pgrst, 'reload config';
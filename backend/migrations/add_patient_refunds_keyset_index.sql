@@ -0,0 +1,7 @@
+-- Keyset index for paging /api/patient_refunds with limit/after:
+-- ORDER BY created_at DESC, id DESC LIMIT n reads one index range per page
+CREATE INDEX IF NOT EXISTS idx_patient_refunds_created_at_id
+ON patient_refunds (created_at DESC, id DESC);
+
+-- Force schema cache reload
+NOTIFY pgrst, 'reload config';
@@ -0,0 +1,326 @@
+-- Daily rollups for the dashboard, maintained by daily_stats.py. Writers only
+-- queue the (hospital, day) pairs they touch; the builder recomputes those
+-- days from the source tables, so the rollups never drift from them.
+
+-- Days are IST days, like the date ranges the dashboard and operations
+-- ledger filter on. Declared IMMUTABLE so it can be indexed; the zone is
+-- fixed, so only a tz database change could move a day. date_of_entry is
+-- DATE in some deployments and TIMESTAMPTZ in others.
+CREATE OR REPLACE FUNCTION daily_stats_day(value TIMESTAMP WITH TIME ZONE)
+RETURNS DATE AS $$
+    SELECT (value AT TIME ZONE 'Asia/Kolkata')::date
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION daily_stats_day(value DATE)
+RETURNS DATE AS $$
+    SELECT value
+$$ LANGUAGE sql IMMUTABLE;
+
+-- The rows each rollup counts and the day and department they count under.
+-- daily_stats.py aggregates them for the queued days and the daily-stats
+-- route aggregates today's live, so both read one definition. Rows without
+-- a hospital belong to the default hospital, as in server.js.
+
+-- Revenue follows the dashboard revenue card: the transaction date, then the
+-- patient's date of entry, then created_at; no cancelled bills, no
+-- [IPD_BILL] summaries, no ORTHO patients of DR. HEMANT. Dated and undated
+-- rows are separate branches so a day filter reaches the transaction_date
+-- index; undated rows are few, since add_transaction_date_column.sql
+-- backfilled them.
+CREATE OR REPLACE VIEW daily_stats_revenue_rows AS
+SELECT COALESCE(t.hospital_id, p.hospital_id, '550e8400-e29b-41d4-a716-446655440000') AS hospital_id,
+       t.transaction_date AS stat_date,
+       UPPER(TRIM(COALESCE(NULLIF(TRIM(t.department), ''), p.assigned_department, ''))) AS department,
+       UPPER(TRIM(COALESCE(t.payment_mode, ''))) AS payment_mode,
+       t.amount
+FROM patient_transactions t
+LEFT JOIN patients p ON p.id = t.patient_id
+WHERE t.transaction_date IS NOT NULL
+  AND t.status IS DISTINCT FROM 'CANCELLED'
+  AND NOT (t.transaction_type = 'SERVICE' AND POSITION('[IPD_BILL]' IN COALESCE(t.description, '')) > 0)
+  AND NOT (UPPER(TRIM(COALESCE(p.assigned_department, ''))) = 'ORTHO'
+           AND UPPER(TRIM(COALESCE(p.assigned_doctor, ''))) IN ('DR. HEMANT', 'DR HEMANT'))
+UNION ALL
+SELECT COALESCE(t.hospital_id, p.hospital_id, '550e8400-e29b-41d4-a716-446655440000'),
+       COALESCE(daily_stats_day(p.date_of_entry), daily_stats_day(t.created_at)),
+       UPPER(TRIM(COALESCE(NULLIF(TRIM(t.department), ''), p.assigned_department, ''))),
+       UPPER(TRIM(COALESCE(t.payment_mode, ''))),
+       t.amount
+FROM patient_transactions t
+LEFT JOIN patients p ON p.id = t.patient_id
+WHERE t.transaction_date IS NULL
+  AND t.status IS DISTINCT FROM 'CANCELLED'
+  AND NOT (t.transaction_type = 'SERVICE' AND POSITION('[IPD_BILL]' IN COALESCE(t.description, '')) > 0)
+  AND NOT (UPPER(TRIM(COALESCE(p.assigned_department, ''))) = 'ORTHO'
+           AND UPPER(TRIM(COALESCE(p.assigned_doctor, ''))) IN ('DR. HEMANT', 'DR HEMANT'));
+
+-- Refunds are the patient_refunds table by creation day, as the dashboard
+-- reads them
+CREATE OR REPLACE VIEW daily_stats_refund_rows AS
+SELECT COALESCE(r.hospital_id, p.hospital_id, '550e8400-e29b-41d4-a716-446655440000') AS hospital_id,
+       daily_stats_day(r.created_at) AS stat_date,
+       UPPER(TRIM(COALESCE(p.assigned_department, ''))) AS department,
+       r.amount
+FROM patient_refunds r
+LEFT JOIN patients p ON p.id = r.patient_id;
+
+CREATE OR REPLACE VIEW daily_stats_patient_rows AS
+SELECT COALESCE(hospital_id, '550e8400-e29b-41d4-a716-446655440000') AS hospital_id,
+       COALESCE(daily_stats_day(date_of_entry), daily_stats_day(created_at)) AS stat_date,
+       UPPER(TRIM(COALESCE(assigned_department, ''))) AS department
+FROM patients;
+
+-- A stay ends at its discharge; one closed without a discharge date only
+-- counts on its admission day, and an active one is still open
+CREATE OR REPLACE VIEW daily_stats_stay_rows AS
+SELECT COALESCE(a.hospital_id, p.hospital_id, '550e8400-e29b-41d4-a716-446655440000') AS hospital_id,
+       UPPER(TRIM(COALESCE(p.assigned_department, ''))) AS department,
+       daily_stats_day(a.admission_date) AS admitted,
+       daily_stats_day(a.actual_discharge_date) AS discharged,
+       COALESCE(daily_stats_day(a.actual_discharge_date),
+                CASE WHEN UPPER(a.status) = 'ACTIVE' THEN NULL ELSE daily_stats_day(a.admission_date) END) AS ended,
+       a.bed_id
+FROM patient_admissions a
+LEFT JOIN patients p ON p.id = a.patient_id
+WHERE a.admission_date IS NOT NULL;
+
+-- Revenue by payment mode
+CREATE TABLE IF NOT EXISTS daily_revenue (
+    hospital_id UUID NOT NULL,
+    stat_date DATE NOT NULL,
+    department TEXT NOT NULL,
+    payment_mode TEXT NOT NULL,
+    transactions INTEGER NOT NULL DEFAULT 0,
+    revenue NUMERIC(14,2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (hospital_id, stat_date, department, payment_mode)
+);
+
+CREATE TABLE IF NOT EXISTS daily_stats (
+    hospital_id UUID NOT NULL,
+    stat_date DATE NOT NULL,
+    department TEXT NOT NULL,
+    transactions INTEGER NOT NULL DEFAULT 0,
+    revenue NUMERIC(14,2) NOT NULL DEFAULT 0,
+    refunds INTEGER NOT NULL DEFAULT 0,
+    refund_amount NUMERIC(14,2) NOT NULL DEFAULT 0,
+    new_patients INTEGER NOT NULL DEFAULT 0,
+    admissions INTEGER NOT NULL DEFAULT 0,
+    discharges INTEGER NOT NULL DEFAULT 0,
+    -- Midnight census: stays still open at the end of the day
+    in_patients INTEGER NOT NULL DEFAULT 0,
+    occupied_beds INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (hospital_id, stat_date, department)
+);
+
+-- Days waiting for the builder. No key, so concurrent writers never wait on
+-- each other; the builder deduplicates when it claims them. Nullable so a
+-- row with no date at all never fails the write that queues it.
+CREATE TABLE IF NOT EXISTS daily_stats_queue (
+    hospital_id UUID,
+    stat_date DATE
+);
+
+CREATE TABLE IF NOT EXISTS daily_stats_state (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    refreshed_through DATE NOT NULL,
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    days INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER NOT NULL DEFAULT 0
+);
+
+-- What the builder reads a day's rows through
+CREATE INDEX IF NOT EXISTS idx_patient_transactions_transaction_date ON patient_transactions(transaction_date);
+CREATE INDEX IF NOT EXISTS idx_patient_transactions_patient_id ON patient_transactions(patient_id);
+CREATE INDEX IF NOT EXISTS idx_patient_transactions_undated
+ON patient_transactions(patient_id) WHERE transaction_date IS NULL;
+CREATE INDEX IF NOT EXISTS idx_patient_refunds_stat_day ON patient_refunds ((daily_stats_day(created_at)));
+CREATE INDEX IF NOT EXISTS idx_patient_refunds_patient_id ON patient_refunds(patient_id);
+CREATE INDEX IF NOT EXISTS idx_patients_stat_day
+ON patients ((COALESCE(daily_stats_day(date_of_entry), daily_stats_day(created_at))));
+CREATE INDEX IF NOT EXISTS idx_patient_admissions_patient_id ON patient_admissions(patient_id);
+
+-- Rows without a hospital belong to the default hospital, as in server.js
+CREATE OR REPLACE FUNCTION queue_transaction_days()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        INSERT INTO daily_stats_queue (hospital_id, stat_date)
+        SELECT DISTINCT COALESCE(t.hospital_id, p.hospital_id, '550e8400-e29b-41d4-a716-446655440000'),
+               COALESCE(t.transaction_date, daily_stats_day(p.date_of_entry), daily_stats_day(t.created_at))
+        FROM old_rows t
+        LEFT JOIN patients p ON p.id = t.patient_id;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        INSERT INTO daily_stats_queue (hospital_id, stat_date)
+        SELECT DISTINCT COALESCE(t.hospital_id, p.hospital_id, '550e8400-e29b-41d4-a716-446655440000'),
+               COALESCE(t.transaction_date, daily_stats_day(p.date_of_entry), daily_stats_day(t.created_at))
+        FROM new_rows t
+        LEFT JOIN patients p ON p.id = t.patient_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION queue_refund_days()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        INSERT INTO daily_stats_queue (hospital_id, stat_date)
+        SELECT DISTINCT COALESCE(r.hospital_id, p.hospital_id, '550e8400-e29b-41d4-a716-446655440000'),
+               daily_stats_day(r.created_at)
+        FROM old_rows r
+        LEFT JOIN patients p ON p.id = r.patient_id;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        INSERT INTO daily_stats_queue (hospital_id, stat_date)
+        SELECT DISTINCT COALESCE(r.hospital_id, p.hospital_id, '550e8400-e29b-41d4-a716-446655440000'),
+               daily_stats_day(r.created_at)
+        FROM new_rows r
+        LEFT JOIN patients p ON p.id = r.patient_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- A stay touches every day from admission to discharge; open stays up to
+-- today, and the builder rolls them forward from there
+CREATE OR REPLACE FUNCTION queue_admission_days()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        INSERT INTO daily_stats_queue (hospital_id, stat_date)
+        SELECT DISTINCT COALESCE(a.hospital_id, p.hospital_id, '550e8400-e29b-41d4-a716-446655440000'), d::date
+        FROM old_rows a
+        LEFT JOIN patients p ON p.id = a.patient_id
+        CROSS JOIN generate_series(daily_stats_day(a.admission_date),
+                                   COALESCE(daily_stats_day(a.actual_discharge_date), daily_stats_day(NOW())),
+                                   INTERVAL '1 day') d
+        WHERE a.admission_date IS NOT NULL;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        INSERT INTO daily_stats_queue (hospital_id, stat_date)
+        SELECT DISTINCT COALESCE(a.hospital_id, p.hospital_id, '550e8400-e29b-41d4-a716-446655440000'), d::date
+        FROM new_rows a
+        LEFT JOIN patients p ON p.id = a.patient_id
+        CROSS JOIN generate_series(daily_stats_day(a.admission_date),
+                                   COALESCE(daily_stats_day(a.actual_discharge_date), daily_stats_day(NOW())),
+                                   INTERVAL '1 day') d
+        WHERE a.admission_date IS NOT NULL;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- A patient's entry date, department, doctor and hospital also decide where
+-- their transactions, refunds and stays are counted, so a change to any of
+-- them requeues those days under both the old and the new values. Deleting
+-- a patient cascades to those rows, whose own triggers queue them.
+CREATE OR REPLACE FUNCTION queue_patient_days()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO daily_stats_queue (hospital_id, stat_date)
+        SELECT DISTINCT COALESCE(hospital_id, '550e8400-e29b-41d4-a716-446655440000'),
+               COALESCE(daily_stats_day(date_of_entry), daily_stats_day(created_at))
+        FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO daily_stats_queue (hospital_id, stat_date)
+        SELECT DISTINCT COALESCE(hospital_id, '550e8400-e29b-41d4-a716-446655440000'),
+               COALESCE(daily_stats_day(date_of_entry), daily_stats_day(created_at))
+        FROM old_rows;
+    ELSE
+        WITH changed AS (
+            SELECT o.id
+            FROM old_rows o
+            JOIN new_rows n ON n.id = o.id
+            WHERE (o.date_of_entry, o.created_at, o.assigned_department, o.assigned_doctor, o.hospital_id)
+                  IS DISTINCT FROM (n.date_of_entry, n.created_at, n.assigned_department, n.assigned_doctor, n.hospital_id)
+        ), moved AS (
+            SELECT o.id, o.hospital_id, o.date_of_entry, o.created_at FROM old_rows o JOIN changed USING (id)
+            UNION ALL
+            SELECT n.id, n.hospital_id, n.date_of_entry, n.created_at FROM new_rows n JOIN changed USING (id)
+        )
+        INSERT INTO daily_stats_queue (hospital_id, stat_date)
+        SELECT COALESCE(m.hospital_id, '550e8400-e29b-41d4-a716-446655440000'),
+               COALESCE(daily_stats_day(m.date_of_entry), daily_stats_day(m.created_at))
+        FROM moved m
+        UNION
+        SELECT COALESCE(t.hospital_id, m.hospital_id, '550e8400-e29b-41d4-a716-446655440000'),
+               COALESCE(t.transaction_date, daily_stats_day(m.date_of_entry), daily_stats_day(t.created_at))
+        FROM moved m
+        JOIN patient_transactions t ON t.patient_id = m.id
+        UNION
+        SELECT COALESCE(r.hospital_id, m.hospital_id, '550e8400-e29b-41d4-a716-446655440000'),
+               daily_stats_day(r.created_at)
+        FROM moved m
+        JOIN patient_refunds r ON r.patient_id = m.id
+        UNION
+        SELECT COALESCE(a.hospital_id, m.hospital_id, '550e8400-e29b-41d4-a716-446655440000'), d::date
+        FROM moved m
+        JOIN patient_admissions a ON a.patient_id = m.id
+        CROSS JOIN generate_series(daily_stats_day(a.admission_date),
+                                   COALESCE(daily_stats_day(a.actual_discharge_date), daily_stats_day(NOW())),
+                                   INTERVAL '1 day') d
+        WHERE a.admission_date IS NOT NULL;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Statement triggers with transition tables: a bulk load queues its distinct
+-- days once instead of one queue row per source row. A trigger with
+-- transition tables can only fire on one event, hence three per table.
+DROP TRIGGER IF EXISTS queue_daily_stats_insert ON patient_transactions;
+CREATE TRIGGER queue_daily_stats_insert AFTER INSERT ON patient_transactions
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_transaction_days();
+DROP TRIGGER IF EXISTS queue_daily_stats_update ON patient_transactions;
+CREATE TRIGGER queue_daily_stats_update AFTER UPDATE ON patient_transactions
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_transaction_days();
+DROP TRIGGER IF EXISTS queue_daily_stats_delete ON patient_transactions;
+CREATE TRIGGER queue_daily_stats_delete AFTER DELETE ON patient_transactions
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_transaction_days();
+
+DROP TRIGGER IF EXISTS queue_daily_stats_insert ON patient_refunds;
+CREATE TRIGGER queue_daily_stats_insert AFTER INSERT ON patient_refunds
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_refund_days();
+DROP TRIGGER IF EXISTS queue_daily_stats_update ON patient_refunds;
+CREATE TRIGGER queue_daily_stats_update AFTER UPDATE ON patient_refunds
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_refund_days();
+DROP TRIGGER IF EXISTS queue_daily_stats_delete ON patient_refunds;
+CREATE TRIGGER queue_daily_stats_delete AFTER DELETE ON patient_refunds
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_refund_days();
+
+DROP TRIGGER IF EXISTS queue_daily_stats_insert ON patient_admissions;
+CREATE TRIGGER queue_daily_stats_insert AFTER INSERT ON patient_admissions
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_admission_days();
+DROP TRIGGER IF EXISTS queue_daily_stats_update ON patient_admissions;
+CREATE TRIGGER queue_daily_stats_update AFTER UPDATE ON patient_admissions
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_admission_days();
+DROP TRIGGER IF EXISTS queue_daily_stats_delete ON patient_admissions;
+CREATE TRIGGER queue_daily_stats_delete AFTER DELETE ON patient_admissions
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_admission_days();
+
+DROP TRIGGER IF EXISTS queue_daily_stats_insert ON patients;
+CREATE TRIGGER queue_daily_stats_insert AFTER INSERT ON patients
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_patient_days();
+DROP TRIGGER IF EXISTS queue_daily_stats_update ON patients;
+CREATE TRIGGER queue_daily_stats_update AFTER UPDATE ON patients
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_patient_days();
+DROP TRIGGER IF EXISTS queue_daily_stats_delete ON patients;
+CREATE TRIGGER queue_daily_stats_delete AFTER DELETE ON patients
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION queue_patient_days();
+
+-- Force schema cache reload
+NOTIFY pgrst, 'reload config';
@@ -0,0 +1,29 @@
+-- =====================================================
+-- CREATE SERVICE CATALOG TABLE
+-- Parsed RGHS packages and lab services, bulk-loaded by catalog_loader.py
+-- (parse_rghs.py --load-db / generate_services.py --load-db) so billing
+-- routes can join and price against them.
+-- Safe to run more than once.
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS service_catalog (
+  code VARCHAR(50) PRIMARY KEY,
+  family VARCHAR(20) NOT NULL,
+  name TEXT NOT NULL,
+  normalized_name TEXT NOT NULL,
+  category VARCHAR(100),
+  rate DECIMAL(10, 2) NOT NULL,
+  rates DECIMAL(10, 2)[] NOT NULL,
+  source TEXT,
+  created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Code lookups use the primary key. normalized_name is lower-cased with
+-- punctuation collapsed (catalog_index.normalize_name); text_pattern_ops
+-- serves both exact matches and prefix searches (LIKE 'abc%').
+CREATE INDEX IF NOT EXISTS idx_service_catalog_normalized_name
+  ON service_catalog (normalized_name text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS idx_service_catalog_family_category
+  ON service_catalog (family, category);
@@ -939,12 +939,25 @@ app.put('/api/patients/:id/reject-appointment', authenticateToken, async (req, r
   }
 });
 
+// Largest page /api/patient_refunds returns when `limit` is given
+const MAX_REFUNDS_PAGE_SIZE = 1000;
+
 // Get patient refunds
+// Optional paging: `limit` caps the page (at most MAX_REFUNDS_PAGE_SIZE) and
+// `after_created_at` / `after_id` are the `page_cursor` and id of the last
+// refund of the previous page. Pages follow (created_at, id) descending, so
+// each one is an index range scan rather than an OFFSET over everything before
+// it, and a refund deleted between pages does not end the listing early.
+// `page_cursor` is created_at as text: the JSON timestamp drops microseconds,
+// and a cursor rounded to milliseconds would skip rows.
 app.get('/api/patient_refunds', authenticateToken, async (req, res) => {
   try {
-    const { start_date, end_date } = req.query;
+    const { start_date, end_date, limit, after_created_at, after_id } = req.query;
+    if (!after_created_at !== !after_id) {
+      return res.status(400).json({ error: 'after_created_at and after_id must be given together' });
+    }
     let query = `
-      SELECT r.*,
+      SELECT r.*,${limit ? ' r.created_at::text as page_cursor,' : ''}
              json_build_object(
                'id', p.id,
                'patient_id', p.patient_id,
@@ -958,7 +971,7 @@ app.get('/api/patient_refunds', authenticateToken, async (req, res) => {
                'date_of_entry', p.date_of_entry
              ) as patient
       FROM patient_refunds r
-      LEFT JOIN patients p ON r.patient_id = p.patient_id
+      LEFT JOIN patients p ON r.patient_id = p.id
       WHERE 1=1
     `;
     const params = [];
@@ -976,7 +989,23 @@ app.get('/api/patient_refunds', authenticateToken, async (req, res) => {
       paramCount++;
     }
 
-    query += ' ORDER BY r.created_at DESC';
+    if (after_created_at) {
+      query += ` AND (r.created_at, r.id) < ($${paramCount}::timestamptz, $${paramCount + 1})`;
+      params.push(after_created_at, after_id);
+      paramCount += 2;
+    }
+
+    query += ' ORDER BY r.created_at DESC, r.id DESC';
+
+    if (limit) {
+      const pageSize = parseInt(limit, 10);
+      if (!Number.isInteger(pageSize) || pageSize < 1) {
+        return res.status(400).json({ error: 'limit must be a positive integer' });
+      }
+      query += ` LIMIT $${paramCount}`;
+      params.push(Math.min(pageSize, MAX_REFUNDS_PAGE_SIZE));
+      paramCount++;
+    }
 
     const result = await pool.query(query, params);
     res.json(result.rows);
@@ -1602,41 +1631,164 @@ app.put('/api/beds/:id', authenticateToken, async (req, res) => {
 
 // ==================== DASHBOARD ROUTES ====================
 
-// Get dashboard stats
+// Daily dashboard figures: days closed before the last daily_stats.py refresh
+// come from the daily_stats / daily_revenue rollups, and the days since (today
+// at least) are computed live from the same daily_stats_*_rows views the
+// refresh reads, so today's numbers are never a frozen snapshot.
+// Days are Asia/Kolkata calendar days (daily_stats_day). Revenue follows the
+// dashboard card rules: transactions by transaction_date (entry date when
+// unset), excluding cancelled rows, [IPD_BILL] service rows and the ORTHO /
+// DR. HEMANT patients; refunds are reported separately, not netted off.
+const DAILY_STATS_BOUNDS = `bounds AS (
+  SELECT COALESCE(MAX(refreshed_through), daily_stats_day(NOW())) as live_from, daily_stats_day(NOW()) as today
+  FROM daily_stats_state
+)`;
+
+// Get dashboard stats. Today's revenue and admissions follow the daily-stats
+// rules (Asia/Kolkata day, no cancelled or [IPD_BILL] rows); today is always
+// a live day, so it is read from the daily_stats_* views past the bounds.
+// Active patients and available beds are current states the rollups don't
+// keep, so they stay plain counts, all in one round trip.
 app.get('/api/dashboard/stats', authenticateToken, async (req, res) => {
   try {
-    // Get total patients
-    const patientsResult = await pool.query(
-      'SELECT COUNT(*) as count FROM patients WHERE is_active = true'
+    const result = await pool.query(
+      `WITH ${DAILY_STATS_BOUNDS}
+       SELECT (SELECT COUNT(*) FROM patients WHERE is_active = true) as total_patients,
+              (SELECT COUNT(*) FROM daily_stats_stay_rows a, bounds b
+               WHERE a.admitted <= b.today AND (a.ended IS NULL OR a.ended > b.today)) as active_admissions,
+              -- A scalar day reaches the transaction_date index; joining bounds scans the view
+              (SELECT COALESCE(SUM(c.amount), 0) FROM daily_stats_revenue_rows c
+               WHERE c.stat_date = (SELECT today FROM bounds)) as today_revenue,
+              (SELECT COUNT(*) FROM beds WHERE status = 'available') as available_beds`
     );
+    const stats = result.rows[0];
 
-    // Get active admissions
-    const admissionsResult = await pool.query(
-      'SELECT COUNT(*) as count FROM patient_admissions WHERE status = $1',
-      ['active']
-    );
+    res.json({
+      totalPatients: parseInt(stats.total_patients),
+      activeAdmissions: parseInt(stats.active_admissions),
+      todayRevenue: parseFloat(stats.today_revenue),
+      availableBeds: parseInt(stats.available_beds)
+    });
+  } catch (error) {
+    console.error('Error fetching dashboard stats:', error);
+    res.status(500).json({ error: 'Server error' });
+  }
+});
 
-    // Get today's revenue
-    const revenueResult = await pool.query(
-      `SELECT COALESCE(SUM(amount), 0) as total 
-       FROM patient_transactions 
-       WHERE transaction_date = CURRENT_DATE`
-    );
+app.get('/api/dashboard/daily-stats', authenticateToken, async (req, res) => {
+  try {
+    const { start_date, end_date, hospital_id, department } = req.query;
+    let where = 'WHERE 1=1';
+    const params = [];
+    let paramCount = 1;
+
+    if (start_date) {
+      where += ` AND stat_date >= $${paramCount}`;
+      params.push(start_date);
+      paramCount++;
+    }
+
+    if (end_date) {
+      where += ` AND stat_date <= $${paramCount}`;
+      params.push(end_date);
+      paramCount++;
+    }
+
+    if (hospital_id) {
+      where += ` AND hospital_id = $${paramCount}`;
+      params.push(hospital_id);
+      paramCount++;
+    }
 
-    // Get available beds
-    const bedsResult = await pool.query(
-      'SELECT COUNT(*) as count FROM beds WHERE status = $1',
-      ['available']
+    if (department) {
+      where += ` AND department = $${paramCount}`;
+      params.push(department.trim().toUpperCase());
+      paramCount++;
+    }
+
+    const daysResult = await pool.query(
+      `WITH ${DAILY_STATS_BOUNDS},
+       stats AS (
+         SELECT s.hospital_id, s.stat_date, s.department, s.transactions, s.revenue, s.refunds, s.refund_amount,
+                s.new_patients, s.admissions, s.discharges, s.in_patients, s.occupied_beds
+         FROM daily_stats s, bounds b
+         WHERE s.stat_date < b.live_from
+         UNION ALL
+         SELECT c.hospital_id, c.stat_date, c.department, COUNT(*), COALESCE(SUM(c.amount), 0), 0, 0, 0, 0, 0, 0, 0
+         FROM daily_stats_revenue_rows c, bounds b
+         WHERE c.stat_date BETWEEN b.live_from AND b.today
+         GROUP BY 1, 2, 3
+         UNION ALL
+         SELECT f.hospital_id, f.stat_date, f.department, 0, 0, COUNT(*), COALESCE(SUM(f.amount), 0), 0, 0, 0, 0, 0
+         FROM daily_stats_refund_rows f, bounds b
+         WHERE f.stat_date BETWEEN b.live_from AND b.today
+         GROUP BY 1, 2, 3
+         UNION ALL
+         SELECT n.hospital_id, n.stat_date, n.department, 0, 0, 0, 0, COUNT(*), 0, 0, 0, 0
+         FROM daily_stats_patient_rows n, bounds b
+         WHERE n.stat_date BETWEEN b.live_from AND b.today
+         GROUP BY 1, 2, 3
+         UNION ALL
+         SELECT a.hospital_id, g.day, a.department, 0, 0, 0, 0, 0,
+                COUNT(*) FILTER (WHERE a.admitted = g.day),
+                COUNT(*) FILTER (WHERE a.discharged = g.day),
+                COUNT(*) FILTER (WHERE a.ended IS NULL OR a.ended > g.day),
+                COUNT(DISTINCT a.bed_id) FILTER (WHERE a.ended IS NULL OR a.ended > g.day)
+         FROM bounds b
+         CROSS JOIN LATERAL (SELECT generate_series(b.live_from, b.today, INTERVAL '1 day')::date as day) g
+         JOIN daily_stats_stay_rows a ON a.admitted <= g.day AND (a.ended IS NULL OR a.ended >= g.day)
+         GROUP BY 1, 2, 3
+       )
+       SELECT stat_date::text as date, SUM(transactions)::int as transactions, SUM(revenue) as revenue,
+              SUM(refunds)::int as refunds, SUM(refund_amount) as refund_amount,
+              SUM(new_patients)::int as new_patients, SUM(admissions)::int as admissions,
+              SUM(discharges)::int as discharges, SUM(in_patients)::int as in_patients,
+              SUM(occupied_beds)::int as occupied_beds
+       FROM stats ${where}
+       GROUP BY stat_date
+       ORDER BY stat_date`,
+      params
+    );
+    const modesResult = await pool.query(
+      `WITH ${DAILY_STATS_BOUNDS},
+       modes AS (
+         SELECT r.hospital_id, r.stat_date, r.department, r.payment_mode, r.transactions, r.revenue
+         FROM daily_revenue r, bounds b
+         WHERE r.stat_date < b.live_from
+         UNION ALL
+         SELECT c.hospital_id, c.stat_date, c.department, c.payment_mode, 1, COALESCE(c.amount, 0)
+         FROM daily_stats_revenue_rows c, bounds b
+         WHERE c.stat_date BETWEEN b.live_from AND b.today
+       )
+       SELECT payment_mode, SUM(transactions)::int as transactions, SUM(revenue) as revenue
+       FROM modes ${where}
+       GROUP BY payment_mode
+       ORDER BY SUM(revenue) DESC`,
+      params
+    );
+    const stateResult = await pool.query(
+      `WITH ${DAILY_STATS_BOUNDS}
+       SELECT st.refreshed_at, b.live_from::text as live_from
+       FROM daily_stats_state st, bounds b`
     );
 
     res.json({
-      totalPatients: parseInt(patientsResult.rows[0].count),
-      activeAdmissions: parseInt(admissionsResult.rows[0].count),
-      todayRevenue: parseFloat(revenueResult.rows[0].total),
-      availableBeds: parseInt(bedsResult.rows[0].count)
+      days: daysResult.rows.map(row => ({
+        ...row,
+        revenue: parseFloat(row.revenue),
+        refund_amount: parseFloat(row.refund_amount)
+      })),
+      paymentModes: modesResult.rows.map(row => ({ ...row, revenue: parseFloat(row.revenue) })),
+      // Never refreshed: the days before today have no rollup rows yet
+      refreshedAt: stateResult.rows[0]?.refreshed_at || null,
+      liveFrom: stateResult.rows[0]?.live_from || null
     });
   } catch (error) {
-    console.error('Error fetching dashboard stats:', error);
+    console.error('Error fetching daily stats:', error);
+    // If the rollup migration hasn't been applied yet, return nothing rather than fail
+    if (error.code === '42P01' || error.code === '42883') {
+      return res.json({ days: [], paymentModes: [], refreshedAt: null, liveFrom: null });
+    }
     res.status(500).json({ error: 'Server error' });
   }
 });
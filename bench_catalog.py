@@ -0,0 +1,178 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from catalog_compiler import compile_medical_services, write_rghs_columns
+from catalog_index import CatalogIndex
+from generate_services import CLASSIFIER, get_category, iter_services, parse_price, raw_data
+from parse_rghs import iter_rghs_list
+from service_dedup import ServiceDeduper
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+RESULTS_FILE = 'catalog_bench_results.json'
+
+# Words from the real lab list, so names hit the classifier keywords at a
+# realistic rate
+LAB_NAMES = [line.split('\t')[0].strip() for line in raw_data.strip().split('\n')]
+WORDS = sorted({word for name in LAB_NAMES for word in name.split()})
+RGHS_CATEGORIES = ['GENERAL / SKIN PROCEDURES', 'ENT PROCEDURES', 'OPHTHALMOLOGY PROCEDURES',
+                   'ORTHOPAEDIC PROCEDURES', 'UROLOGY / NEPHROLOGY PROCEDURES']
+
+def synth_name(rng):
+    # Mostly real names, with suffixes so the catalog keeps growing with size
+    if rng.random() < 0.5:
+        return rng.choice(LAB_NAMES)
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(2, 5)))
+
+def write_lab_list(path, lines, seed=1):
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(lines):
+            name = synth_name(rng)
+            if rng.random() < 0.9:
+                name = f"{name} {i}"  # ~10% exact duplicates, like the real list
+            f.write(f"{name}\t{rng.randint(50, 9000)}\n")
+
+def write_rghs_list(path, lines, seed=1):
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(lines):
+            if i % 50 == 0:
+                f.write(f"{rng.choice(RGHS_CATEGORIES)}\n")
+                continue
+            rate = rng.randint(30, 15000)
+            low = int(rate * 0.87)
+            f.write(f"{synth_name(rng)} {i} – {rate} – {rate} – {low} – {low}\n")
+
+def measure(fn, memory, repeat):
+    # Best of `repeat` runs, which is far less noisy than a single timing
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    stats = {'seconds': round(best, 6)}
+    if memory:
+        # Second run under tracemalloc: tracing slows Python down, so it is
+        # kept out of the timed run
+        tracemalloc.start()
+        fn()
+        stats['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, stats
+
+def read_lines(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().splitlines()
+
+def parse_lab_lines(lines):
+    parsed = []
+    for line in lines:
+        parts = line.split('\t')
+        if len(parts) >= 2:
+            parsed.append((parts[0].strip(), parse_price(parts[1])))
+    return parsed
+
+def dedup_names(parsed):
+    deduper = ServiceDeduper()
+    return [(name, price) for name, price in parsed if deduper.add(name, price)]
+
+def bench_lab(workdir, lines, memory, repeat):
+    source = os.path.join(workdir, f'lab_{lines}.tsv')
+    output = os.path.join(workdir, 'medicalServices.ts')
+    write_lab_list(source, lines)
+
+    stages = {}
+    text_lines, stages['read'] = measure(lambda: read_lines(source), memory, repeat)
+    parsed, stages['parse'] = measure(lambda: parse_lab_lines(text_lines), memory, repeat)
+    unique, stages['dedup'] = measure(lambda: dedup_names(parsed), memory, repeat)
+    names = [name for name, _ in unique]
+    _, stages['classify'] = measure(lambda: [get_category(name) for name in names], memory, repeat)
+    _, stages['classify_batch'] = measure(lambda: CLASSIFIER.classify_batch(names), memory, repeat)
+    services = list(iter_services(text_lines))
+    _, stages['emit'] = measure(lambda: compile_medical_services(iter(services), output), memory, repeat)
+    _, stages['end_to_end'] = measure(lambda: compile_medical_services(iter_services(read_lines(source)), output), memory, repeat)
+    return {'format': 'lab', 'lines': lines, 'records': len(services), 'stages': stages}
+
+def bench_rghs(workdir, lines, memory, repeat):
+    source = os.path.join(workdir, f'rghs_{lines}.txt')
+    output = os.path.join(workdir, 'rghsPackages.json')
+    write_rghs_list(source, lines)
+
+    stages = {}
+    _, stages['read'] = measure(lambda: read_lines(source), memory, repeat)
+    packages, stages['parse'] = measure(lambda: list(iter_rghs_list(source)), memory, repeat)
+    names = [pkg['name'] for pkg in packages]
+    _, stages['classify'] = measure(lambda: CLASSIFIER.classify_batch(names), memory, repeat)
+
+    def build_index():
+        index = CatalogIndex()
+        for name in names:
+            index.add(name)
+        return index
+
+    _, stages['index'] = measure(build_index, memory, repeat)
+    _, stages['emit'] = measure(lambda: write_rghs_columns(iter(packages), output), memory, repeat)
+    _, stages['end_to_end'] = measure(lambda: write_rghs_columns(iter_rghs_list(source), output), memory, repeat)
+    return {'format': 'rghs', 'lines': lines, 'records': len(packages), 'stages': stages}
+
+def find_regressions(results, baseline, threshold):
+    previous = {(r['format'], r['lines']): r['stages'] for r in baseline['results']}
+    regressions = []
+    for result in results:
+        old_stages = previous.get((result['format'], result['lines']))
+        if not old_stages:
+            continue
+        for stage, stats in result['stages'].items():
+            old = old_stages.get(stage)
+            # Sub-millisecond stages are dominated by noise
+            if old and old['seconds'] >= 0.001 and stats['seconds'] > old['seconds'] * threshold:
+                regressions.append(f"{result['format']}/{result['lines']}/{stage}: {old['seconds']:.4f}s -> {stats['seconds']:.4f}s")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the catalog generators on synthetic price lists")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--formats', nargs='+', choices=['rghs', 'lab'], default=['rghs', 'lab'])
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per stage; the fastest is kept")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc peak-memory runs")
+    parser.add_argument('--output', default=RESULTS_FILE)
+    parser.add_argument('--baseline', help="previous results file; exit non-zero on slower stages")
+    parser.add_argument('--threshold', type=float, default=1.25, help="slowdown ratio counted as a regression")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for lines in args.sizes:
+            for fmt in args.formats:
+                bench = bench_rghs if fmt == 'rghs' else bench_lab
+                result = bench(workdir, lines, not args.no_memory, args.repeat)
+                results.append(result)
+                summary = ', '.join(f"{stage} {stats['seconds']:.3f}s" for stage, stats in result['stages'].items())
+                print(f"{fmt:>4} {lines:>9,} lines: {summary}")
+
+    report = {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    print(f"Wrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = find_regressions(results, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        sys.exit(1 if regressions else 0)
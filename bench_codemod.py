@@ -0,0 +1,113 @@
+import argparse
+import json
+import os
+import platform
+import time
+from datetime import datetime, timezone
+
+import codemod
+import ts_lexer
+from codemod_rules import BACKUP_PATTERN, EXPORT_PATTERN, REFUNDS_QUERY
+
+DEFAULT_FILES = ['src/components/EnhancedDashboard.tsx', 'src/App.tsx']
+RESULTS_FILE = 'codemod_bench_results.json'
+
+# A refunds query whose .order(...) terminator is missing: the old whole-file
+# pattern scans from here to the end of the file for every copy
+UNTERMINATED_QUERY = """
+  const loadRefundsPreview = async () => {
+    const { data: refundData, error: refundError } = await supabase
+      .from('patient_refunds')
+      .select('*');
+    return refundError ? [] : refundData;
+  };
+"""
+
+def measure(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+def largest_components(root, count):
+    paths = [path for path in codemod.iter_source_files(root) if path.endswith('.tsx')]
+    return sorted(paths, key=os.path.getsize, reverse=True)[:count]
+
+def with_unterminated_queries(content, copies):
+    # Spread the copies through the file, each at a statement boundary
+    lines = content.split('\n')
+    step = max(1, len(lines) // (copies + 1))
+    for i in range(copies, 0, -1):
+        at = i * step
+        while at < len(lines) and lines[at].strip() != '':
+            at += 1
+        lines.insert(at, UNTERMINATED_QUERY)
+    return '\n'.join(lines)
+
+def bench_file(label, path, content, repeat, rules):
+    jsx = path.endswith('.tsx')
+
+    def unbounded():
+        # fix_app_tsx_v2.py: both patterns over the whole file
+        EXPORT_PATTERN.sub('', BACKUP_PATTERN.sub('', content))
+
+    def bounded():
+        codemod.apply_rules(content, rules)
+
+    def bounded_cold():
+        # Includes lexing the file, as on the first rule to look at it
+        ts_lexer._cache.clear()
+        codemod.apply_rules(content, rules)
+
+    return {
+        'file': label,
+        'lines': content.count('\n') + 1,
+        'anchors': content.count(REFUNDS_QUERY),
+        'stages': {
+            'lex': measure(lambda: ts_lexer.SourceIndex(content, jsx), repeat),
+            'unbounded_regex': measure(unbounded, repeat),
+            'anchored_bounded_cold': measure(bounded_cold, repeat),
+            'anchored_bounded': measure(bounded, repeat),
+        },
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark anchored, statement-bounded codemod rules against whole-file regexes")
+    parser.add_argument('files', nargs='*', default=DEFAULT_FILES)
+    parser.add_argument('--largest', type=int, default=3, help="also bench the N largest components under src/")
+    parser.add_argument('--unterminated', type=int, default=40,
+                        help="copies of an unterminated refunds query injected for the worst-case runs")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per stage; the fastest is kept")
+    parser.add_argument('--output', default=RESULTS_FILE)
+    args = parser.parse_args()
+
+    codemod.load_rules()
+    # Whole rule set on every file, so the anchor prefilter does the skipping
+    rules = [codemod.RULES[name] for name in codemod.resolve_rules(['fix_app_tsx_v2'])]
+    paths = list(dict.fromkeys(args.files + largest_components(codemod.SOURCE_ROOT, args.largest)))
+
+    results = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        cases = [(path, content)]
+        if args.unterminated:
+            cases.append((f"{path} (+{args.unterminated} unterminated)", with_unterminated_queries(content, args.unterminated)))
+        for label, text in cases:
+            result = bench_file(label, path, text, args.repeat, rules)
+            results.append(result)
+            summary = ', '.join(f"{stage} {seconds * 1000:.2f}ms" for stage, seconds in result['stages'].items())
+            print(f"{label} ({result['lines']:,} lines, {result['anchors']} anchors): {summary}")
+
+    report = {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
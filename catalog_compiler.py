@@ -0,0 +1,177 @@
+import json
+import os
+import re
+from array import array
+
+from catalog_manifest import file_hash, write_if_changed
+
+# The generated list only; medicalServices.ts keeps the hand-written types and
+# helpers and re-exports it
+MEDICAL_SERVICES_HEADER = """// Generated by generate_services.py from its lab price list; do not edit.
+import type { MedicalService } from './medicalServices';
+
+export const MEDICAL_SERVICES_DATA: MedicalService[] = [
+"""
+
+FOOTER = "];\n"
+
+# Bump whenever the layout of rghsPackages.json changes; src/data/rghsPackages.ts checks it
+RGHS_COLUMNS_VERSION = 1
+
+SHARD_MANIFEST_VERSION = 1
+
+# Large write buffer so each record is a cheap in-memory append, not a syscall
+BUFFER_SIZE = 1 << 20
+# Smaller per file when one handle per category is open at once
+SHARD_BUFFER_SIZE = 64 << 10
+
+
+def format_medical_service(service):
+    # id and code are the service's registry code, so they survive edits to the list
+    code = f"id: '{service['code']}', code: '{service['code']}', " if service.get('code') else ''
+    price = service['defaultPrice']
+    return (f"  {{ {code}name: `{service['name']}`, category: '{service['category']}', "
+            f"defaultPrice: {price}, basePrice: {price}, isActive: true }},\n")
+
+
+def write_catalog(records, output_file, header, format_record, footer=FOOTER):
+    # Records are consumed one at a time, so `records` can be a generator and
+    # the full module is never held in memory
+    count = 0
+    with open(output_file, 'w', buffering=BUFFER_SIZE) as f:
+        f.write(header)
+        for record in records:
+            f.write(format_record(record))
+            count += 1
+        f.write(footer)
+    return count
+
+
+def compile_medical_services(services, output_file):
+    return write_catalog(services, output_file, MEDICAL_SERVICES_HEADER, format_medical_service)
+
+
+def build_rghs_columns(packages):
+    # Parallel columns instead of one dict per package: category is an index
+    # into `categories`, and `rates` is a row-major matrix of `tiers` ints per row
+    codes = []
+    names = []
+    categories = []
+    category_ids = {}
+    category_column = array('H')
+    rates = array('I')
+    tiers = None
+
+    for pkg in packages:
+        if tiers is None:
+            tiers = len(pkg['rates'])
+        elif len(pkg['rates']) != tiers:
+            raise ValueError(f"{pkg['code']} has {len(pkg['rates'])} rate tiers, expected {tiers}")
+
+        category = pkg['category']
+        if category not in category_ids:
+            category_ids[category] = len(categories)
+            categories.append(category)
+
+        codes.append(pkg['code'])
+        names.append(pkg['name'])
+        category_column.append(category_ids[category])
+        rates.extend(pkg['rates'])
+
+    return {
+        'version': RGHS_COLUMNS_VERSION,
+        'tiers': tiers or 0,
+        'codes': codes,
+        'names': names,
+        'categories': categories,
+        'category': category_column.tolist(),
+        'rates': rates.tolist(),
+    }
+
+
+def write_rghs_columns(packages, output_file):
+    columns = build_rghs_columns(packages)
+    with open(output_file, 'w', buffering=BUFFER_SIZE) as f:
+        json.dump(columns, f, ensure_ascii=False, separators=(',', ':'))
+        f.write("\n")
+    return len(columns['codes'])
+
+
+def shard_name(value):
+    return re.sub(r'[^A-Za-z0-9_]', '_', str(value)) or 'UNCATEGORIZED'
+
+
+def write_shard_manifest(output_dir, counts, ext):
+    # Lists every shard with its record count and content hash. Shards left
+    # over from a previous run whose category no longer exists are removed.
+    manifest_path = os.path.join(output_dir, 'manifest.json')
+    shards = []
+    for name in sorted(counts):
+        path = os.path.join(output_dir, name + ext)
+        shards.append({'name': name, 'file': name + ext, 'count': counts[name], 'hash': file_hash(path)[:16]})
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except FileNotFoundError:
+        previous = {'shards': []}
+    current_files = {shard['file'] for shard in shards}
+    for shard in previous['shards']:
+        if shard['file'] not in current_files:
+            try:
+                os.remove(os.path.join(output_dir, shard['file']))
+            except FileNotFoundError:
+                pass
+
+    write_if_changed(manifest_path, json.dumps({'version': SHARD_MANIFEST_VERSION, 'shards': shards}, indent=2) + "\n")
+    return [manifest_path] + [os.path.join(output_dir, shard['file']) for shard in shards]
+
+
+def write_sharded_catalog(records, output_dir, header_for, format_record, footer=FOOTER, ext='.ts'):
+    # One module per category, streamed like write_catalog: each category's
+    # file is opened on its first record and written as records arrive
+    os.makedirs(output_dir, exist_ok=True)
+    handles = {}
+    counts = {}
+    try:
+        for record in records:
+            name = shard_name(record['category'])
+            f = handles.get(name)
+            if f is None:
+                f = handles[name] = open(os.path.join(output_dir, name + ext), 'w', buffering=SHARD_BUFFER_SIZE)
+                f.write(header_for(name))
+                counts[name] = 0
+            f.write(format_record(record))
+            counts[name] += 1
+        for f in handles.values():
+            f.write(footer)
+    finally:
+        for f in handles.values():
+            f.close()
+    return write_shard_manifest(output_dir, counts, ext)
+
+
+def medical_services_shard_header(name):
+    return (
+        "import type { MedicalService } from '../medicalServices';\n\n"
+        f"// {name} shard, generated by generate_services.py --sharded\n"
+        "export const MEDICAL_SERVICES_SHARD: MedicalService[] = [\n"
+    )
+
+
+def compile_medical_services_shards(services, output_dir):
+    return write_sharded_catalog(services, output_dir, medical_services_shard_header, format_medical_service)
+
+
+def write_rghs_shards(packages, output_dir):
+    # Columns are built per category, so each shard is a self-contained
+    # rghsPackages.json for one category
+    os.makedirs(output_dir, exist_ok=True)
+    by_category = {}
+    for pkg in packages:
+        by_category.setdefault(shard_name(pkg['category']), []).append(pkg)
+
+    counts = {}
+    for name, group in by_category.items():
+        counts[name] = write_rghs_columns(group, os.path.join(output_dir, name + '.json'))
+    return write_shard_manifest(output_dir, counts, '.json')
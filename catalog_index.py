@@ -0,0 +1,80 @@
+import json
+import re
+
+from catalog_compiler import BUFFER_SIZE
+
+# Bump whenever the emitted layout changes; src/utils/catalogIndex.ts checks it
+INDEX_VERSION = 1
+
+def normalize_name(name):
+    # Must stay in sync with normalizeCatalogName() in src/utils/catalogIndex.ts
+    return re.sub(r'[^a-z0-9]+', ' ', name.lower()).strip()
+
+def name_trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class CatalogIndex:
+    def __init__(self):
+        self.names = []
+        self.tokens = {}
+        self.trigrams = {}
+        self.positions = {}
+
+    def add(self, name):
+        position = len(self.names)
+        normalized = normalize_name(name)
+        self.names.append(normalized)
+        # First occurrence wins, same as Array.prototype.find on the catalog
+        self.positions.setdefault(name, position)
+        # Positions only grow, so every postings list stays sorted
+        for token in set(normalized.split()):
+            self.tokens.setdefault(token, []).append(position)
+        for gram in name_trigrams(normalized):
+            self.trigrams.setdefault(gram, []).append(position)
+
+    def track(self, records, key='name'):
+        # Index records as they stream through to the catalog compiler
+        for record in records:
+            self.add(record[key])
+            yield record
+
+    def to_dict(self):
+        tokens = sorted(self.tokens)
+        return {
+            'version': INDEX_VERSION,
+            'names': self.names,
+            'tokens': tokens,
+            'tokenPostings': [self.tokens[token] for token in tokens],
+            'trigrams': {gram: self.trigrams[gram] for gram in sorted(self.trigrams)},
+            'positions': self.positions,
+        }
+
+    def search(self, query):
+        # Python twin of searchCatalog() so generator output can be checked offline
+        q = normalize_name(query)
+        if not q:
+            return []
+        if len(q) < 3:
+            matches = set()
+            for token, postings in self.tokens.items():
+                if token.startswith(q):
+                    matches.update(postings)
+            return sorted(matches)
+
+        postings = []
+        for gram in name_trigrams(q):
+            if gram not in self.trigrams:
+                return []
+            postings.append(self.trigrams[gram])
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for other in postings[1:]:
+            candidates.intersection_update(other)
+        return sorted(p for p in candidates if q in self.names[p])
+
+def write_index_ts(index, output_file, export_name):
+    with open(output_file, 'w', buffering=BUFFER_SIZE) as f:
+        f.write("import type { CatalogIndex } from '../utils/catalogIndex';\n\n")
+        f.write(f"export const {export_name}: CatalogIndex = ")
+        json.dump(index.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+        f.write(";\n")
@@ -0,0 +1,200 @@
+import argparse
+import io
+import json
+import os
+import tempfile
+import time
+
+from catalog_index import normalize_name
+
+SCHEMA_FILE = 'backend/migrations/create_service_catalog.sql'
+DEFAULT_DATABASE_URL = os.environ.get('DATABASE_URL', 'postgresql://postgres@localhost:5432/postgres')
+
+# Rows per COPY round trip. Records are streamed, so only one batch of text is
+# held in memory at a time.
+COPY_BATCH_ROWS = 50_000
+
+COLUMNS = ['code', 'family', 'name', 'normalized_name', 'category', 'rate', 'rates', 'source']
+
+# COPY text format: tab-separated, \N for NULL, backslash escapes
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+STAGING_DDL = """
+CREATE TEMP TABLE service_catalog_staging (
+  seq BIGINT NOT NULL,
+  code VARCHAR(50) NOT NULL,
+  family VARCHAR(20) NOT NULL,
+  name TEXT NOT NULL,
+  normalized_name TEXT NOT NULL,
+  category VARCHAR(100),
+  rate DECIMAL(10, 2) NOT NULL,
+  rates DECIMAL(10, 2)[] NOT NULL,
+  source TEXT
+) ON COMMIT DROP
+"""
+
+# One set-based upsert from the staging table. DISTINCT ON keeps the first
+# occurrence of a code, since ON CONFLICT cannot touch the same row twice in
+# one statement. Unchanged rows are skipped so updated_at stays meaningful.
+UPSERT_SQL = """
+WITH upserted AS (
+  INSERT INTO service_catalog (code, family, name, normalized_name, category, rate, rates, source)
+  SELECT DISTINCT ON (code) code, family, name, normalized_name, category, rate, rates, source
+  FROM service_catalog_staging
+  ORDER BY code, seq
+  ON CONFLICT (code) DO UPDATE SET
+    family = EXCLUDED.family,
+    name = EXCLUDED.name,
+    normalized_name = EXCLUDED.normalized_name,
+    category = EXCLUDED.category,
+    rate = EXCLUDED.rate,
+    rates = EXCLUDED.rates,
+    source = EXCLUDED.source,
+    updated_at = NOW()
+  WHERE (service_catalog.family, service_catalog.name, service_catalog.category,
+         service_catalog.rates, service_catalog.source)
+    IS DISTINCT FROM (EXCLUDED.family, EXCLUDED.name, EXCLUDED.category, EXCLUDED.rates, EXCLUDED.source)
+  RETURNING (xmax = 0) AS inserted
+)
+SELECT COUNT(*) FILTER (WHERE inserted), COUNT(*) FILTER (WHERE NOT inserted) FROM upserted
+"""
+
+def connect(database_url=DEFAULT_DATABASE_URL):
+    # psycopg (3) is preferred for its streaming COPY; psycopg2 also works.
+    # Neither is needed unless a catalog is actually loaded.
+    try:
+        import psycopg
+        return psycopg.connect(database_url)
+    except ImportError:
+        pass
+    try:
+        import psycopg2
+    except ImportError:
+        raise RuntimeError("Loading into Postgres needs psycopg (pip install 'psycopg[binary]') or psycopg2") from None
+    return psycopg2.connect(database_url)
+
+def sqlstate(error):
+    # psycopg and psycopg2 name the SQLSTATE attribute differently
+    return getattr(error, 'sqlstate', None) or getattr(error, 'pgcode', None)
+
+def copy_text(cursor, sql, data):
+    if hasattr(cursor, 'copy_expert'):  # psycopg2
+        cursor.copy_expert(sql, io.StringIO(data))
+    else:
+        with cursor.copy(sql) as copy:
+            copy.write(data)
+
+def copy_file(cursor, sql, path, chunk=1 << 20):
+    # Streams a COPY text file without holding it in memory
+    with open(path, 'r', encoding='utf-8') as f:
+        if hasattr(cursor, 'copy_expert'):  # psycopg2
+            cursor.copy_expert(sql, f, size=chunk)
+        else:
+            with cursor.copy(sql) as copy:
+                while data := f.read(chunk):
+                    copy.write(data)
+
+def copy_field(value):
+    # Most names need no escaping, and the membership tests are far cheaper
+    # than translate()
+    if value is None:
+        return '\\N'
+    if '\\' in value or '\t' in value or '\n' in value or '\r' in value:
+        return value.translate(COPY_ESCAPES)
+    return value
+
+def format_copy_row(seq, record):
+    # normalize_name() output is [a-z0-9 ] only, so it is never escaped
+    rates = record['rates']
+    return (f"{seq}\t{copy_field(record['code'])}\t{copy_field(record['family'])}\t{copy_field(record['name'])}\t"
+            f"{normalize_name(record['name'])}\t{copy_field(record.get('category'))}\t{rates[0]}\t"
+            f"{{{','.join(map(str, rates))}}}\t{copy_field(record.get('source'))}\n")
+
+def ensure_schema(cursor, schema_file=SCHEMA_FILE):
+    with open(schema_file, 'r', encoding='utf-8') as f:
+        cursor.execute(f.read())
+
+def load_catalog(records, database_url=DEFAULT_DATABASE_URL, batch_rows=COPY_BATCH_ROWS, schema_file=SCHEMA_FILE):
+    # `records` are dicts with code, family, name, category, rates (a list,
+    # first entry is the standard rate) and source. Everything runs in one
+    # transaction, so a failed load leaves service_catalog untouched.
+    started = time.perf_counter()
+    copy_sql = f"COPY service_catalog_staging (seq, {', '.join(COLUMNS)}) FROM STDIN"
+    conn = connect(database_url)
+    try:
+        with conn.cursor() as cursor:
+            ensure_schema(cursor, schema_file)
+            cursor.execute(STAGING_DDL)
+
+            rows = 0
+            batch = []
+            for record in records:
+                batch.append(format_copy_row(rows, record))
+                rows += 1
+                if len(batch) >= batch_rows:
+                    copy_text(cursor, copy_sql, ''.join(batch))
+                    batch = []
+            if batch:
+                copy_text(cursor, copy_sql, ''.join(batch))
+            copied = time.perf_counter()
+
+            cursor.execute(UPSERT_SQL)
+            inserted, updated = cursor.fetchone()
+            cursor.execute("ANALYZE service_catalog")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    seconds = time.perf_counter() - started
+    return {
+        'rows': rows,
+        'inserted': inserted,
+        'updated': updated,
+        'unchanged': rows - inserted - updated,
+        'copy_seconds': copied - started,
+        'seconds': seconds,
+        'rows_per_second': rows / seconds if seconds else 0.0,
+    }
+
+def describe_load(stats):
+    return (f"Loaded {stats['rows']:,} rows into service_catalog in {stats['seconds']:.2f}s "
+            f"({stats['rows_per_second']:,.0f} rows/s; {stats['inserted']} inserted, {stats['updated']} updated, "
+            f"{stats['unchanged']} unchanged or duplicate)")
+
+def iter_master(path):
+    # service_master.json as written by ingest_tariffs.py
+    with open(path, 'r', encoding='utf-8') as f:
+        for service in json.load(f):
+            yield dict(service, source=service['sources'][0])
+
+def iter_synthetic(lines, workdir):
+    # Synthetic RGHS tariff, for timing a large load against a scratch database
+    from bench_catalog import write_rghs_list
+    from parse_rghs import iter_rghs_list
+    from service_ids import ServiceIdRegistry
+
+    # The source names the tariff rather than its temporary path, so loading
+    # the same size twice leaves every row unchanged
+    path = os.path.join(workdir, 'synthetic.rghs.txt')
+    write_rghs_list(path, lines)
+    registry = ServiceIdRegistry(os.path.join(workdir, 'service_ids.json'))
+    for package in iter_rghs_list(path, registry):
+        yield dict(package, family='RGHS', source=f'synthetic:{lines}')
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-load parsed catalogs into the service_catalog table")
+    parser.add_argument('--database-url', default=DEFAULT_DATABASE_URL)
+    parser.add_argument('--master', default='service_master.json', help="service master written by ingest_tariffs.py")
+    parser.add_argument('--synthetic', type=int, metavar='LINES', help="load a synthetic RGHS tariff instead of the master")
+    parser.add_argument('--batch-rows', type=int, default=COPY_BATCH_ROWS)
+    args = parser.parse_args()
+
+    if args.synthetic:
+        with tempfile.TemporaryDirectory() as workdir:
+            stats = load_catalog(iter_synthetic(args.synthetic, workdir), args.database_url, args.batch_rows)
+    else:
+        stats = load_catalog(iter_master(args.master), args.database_url, args.batch_rows)
+    print(describe_load(stats))
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+
+MANIFEST_FILE = 'catalog_manifest.json'
+VERSIONS_FILE = 'src/data/catalogVersions.json'
+
+def record_hash(record):
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+def file_hash(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+def hash_records(records, key, schema):
+    # `schema` names the output formats, so bumping e.g. INDEX_VERSION changes
+    # the content hash even when no source record changed
+    digest = hashlib.sha256(schema.encode('utf-8'))
+    record_hashes = {}
+    for record in records:
+        h = record_hash(record)
+        record_hashes[record[key]] = h
+        digest.update(f"{record[key]}\0{h}\n".encode('utf-8'))
+    return digest.hexdigest(), record_hashes
+
+def write_if_changed(path, content):
+    # Leave the file (and its mtime) alone when the bytes would not change
+    data = content.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+class CatalogManifest:
+    def __init__(self, path=MANIFEST_FILE, versions_path=VERSIONS_FILE):
+        self.path = path
+        self.versions_path = versions_path
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.catalogs = json.load(f)
+        except FileNotFoundError:
+            self.catalogs = {}
+
+    def is_current(self, name, content_hash, outputs):
+        entry = self.catalogs.get(name)
+        if not entry or entry['hash'] != content_hash:
+            return False
+        # Outputs edited or deleted by hand still force a rewrite. Every file
+        # the last run wrote is checked, not only the fixed `outputs`, so shard
+        # files are covered too.
+        if any(path not in entry['outputs'] for path in outputs):
+            return False
+        return all(h == file_hash(path) for path, h in entry['outputs'].items())
+
+    def diff(self, name, record_hashes):
+        previous = self.catalogs.get(name, {}).get('records', {})
+        added = [key for key in record_hashes if key not in previous]
+        removed = [key for key in previous if key not in record_hashes]
+        changed = [key for key, h in record_hashes.items() if key in previous and previous[key] != h]
+        return {'added': added, 'removed': removed, 'changed': changed}
+
+    def update(self, name, content_hash, record_hashes, outputs):
+        entry = self.catalogs.get(name, {})
+        version = entry.get('version', 0)
+        if entry.get('hash') != content_hash:
+            version += 1
+        self.catalogs[name] = {
+            'version': version,
+            'hash': content_hash,
+            'count': len(record_hashes),
+            'outputs': {path: file_hash(path) for path in outputs},
+            'records': record_hashes,
+        }
+        return version
+
+    def save(self):
+        write_if_changed(self.path, json.dumps(self.catalogs, indent=2, ensure_ascii=False) + "\n")
+        # Small version/hash table the front end can import as a cache key
+        versions = {
+            name: {'version': entry['version'], 'hash': entry['hash'][:16], 'count': entry['count']}
+            for name, entry in sorted(self.catalogs.items())
+        }
+        write_if_changed(self.versions_path, json.dumps(versions, indent=2) + "\n")
+
+def regenerate(name, iter_records, key, schema, outputs, write_outputs, force=False):
+    # `iter_records` is called twice: once to hash, and again to write only if
+    # something changed. Parsing is cheap; rewriting outputs busts caches.
+    manifest = CatalogManifest()
+    content_hash, record_hashes = hash_records(iter_records(), key, schema)
+    if not force and manifest.is_current(name, content_hash, outputs):
+        return None
+
+    changes = manifest.diff(name, record_hashes)
+    # Writers that produce a variable set of files (shards) return their paths
+    written = write_outputs(iter_records())
+    outputs = written or outputs
+    changes['version'] = manifest.update(name, content_hash, record_hashes, outputs)
+    changes['count'] = len(record_hashes)
+    manifest.save()
+    return changes
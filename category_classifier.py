@@ -0,0 +1,94 @@
+import json
+import os
+import re
+from collections import Counter
+
+RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'category_rules.json')
+
+def load_rules(path=RULES_FILE):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    rules = [(rule['category'], tuple(k.lower() for k in rule['keywords'])) for rule in data['rules']]
+    return rules, data['default']
+
+def keyword_regex(keywords):
+    # Alternation factored into a trie, so the engine reads each character of
+    # the name once per position instead of once per keyword. Optional tails
+    # are greedy: at any position the longest keyword that starts there wins.
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def emit(node):
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if '' in node else body
+    return emit(trie)
+
+def compile_rules(rules):
+    # One regex over every keyword, matched zero-width so overlapping keywords
+    # are all seen. A match is the longest keyword at its position, and every
+    # other keyword there is a prefix of it, so it is mapped to the first rule
+    # owning it or any of its prefixes.
+    first_rule = {}
+    for i, (_, keywords) in enumerate(rules):
+        for keyword in keywords:
+            first_rule.setdefault(keyword, i)
+    if not first_rule:
+        return None, {}
+    rule_at = {keyword: min(i for prefix, i in first_rule.items() if keyword.startswith(prefix))
+               for keyword in first_rule}
+    return re.compile(f"(?=({keyword_regex(first_rule)}))", re.DOTALL), rule_at
+
+# Rules are tried in file order and the first rule with a keyword anywhere in
+# the name wins; names matching no rule get the default category.
+class CategoryClassifier:
+    def __init__(self, rules, default):
+        self.rules = rules
+        self.default = default
+        self.hits = Counter()
+        self.pattern, self.rule_at = compile_rules(rules)
+
+    @classmethod
+    def from_file(cls, path=RULES_FILE):
+        rules, default = load_rules(path)
+        return cls(rules, default)
+
+    def classify(self, name):
+        category = self._match(name.lower())
+        self.hits[category] += 1
+        return category
+
+    def _match(self, lower_name):
+        # A single scan of the name; stops at the first keyword of the first rule
+        if self.pattern is None:
+            return self.default
+        best = None
+        for match in self.pattern.finditer(lower_name):
+            rule = self.rule_at[match.group(1)]
+            if rule == 0:
+                return self.rules[0][0]
+            if best is None or rule < best:
+                best = rule
+        return self.default if best is None else self.rules[best][0]
+
+    def classify_batch(self, names):
+        # Lab masters repeat the same names across panels and branches, so each
+        # distinct name is matched once and the rest are dict lookups
+        cache = {}
+        result = []
+        for name in names:
+            category = cache.get(name)
+            if category is None:
+                category = cache[name] = self._match(name.lower())
+            result.append(category)
+        self.hits.update(result)
+        return result
+
+    def hit_counts(self):
+        return dict(self.hits)
@@ -0,0 +1,378 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
+
+from catalog_loader import DEFAULT_DATABASE_URL, connect, copy_text
+from catalog_manifest import write_if_changed
+from export_stream import INDEX_FILE, INDEX_STRIDE, INDEX_VERSION, load_index, table_file, write_table
+from ledger_reconcile import external_sort
+
+OUTPUT_DIR = 'cdc_backups'
+MANIFEST_FILE = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# Foreign key order, which restore --load also inserts in
+TABLES = ['patients', 'beds', 'patient_admissions', 'patient_transactions', 'patient_refunds']
+KEY_COLUMN = 'id'
+WATERMARK_COLUMNS = ('updated_at', 'created_at')
+
+# A delta covers changes up to now() minus this lag. updated_at is set to the
+# writing transaction's start time, so a transaction still open when the
+# backup runs commits rows stamped in the past; the lag leaves it time to
+# commit before its window is read.
+SAFETY_LAG_SECONDS = 600
+# Take a fresh base after this many deltas so restores replay a bounded chain
+BASE_EVERY = 30
+FETCH_ROWS = 10_000
+LOAD_BATCH_ROWS = 50_000
+
+def load_manifest(output_dir=OUTPUT_DIR):
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {'version': MANIFEST_VERSION, 'tables': {}, 'checkpoints': []}
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"{output_dir} was written by another version of cdc_export.py; start a new backup directory")
+    return manifest
+
+def save_manifest(manifest, output_dir):
+    write_if_changed(os.path.join(output_dir, MANIFEST_FILE), json.dumps(manifest, indent=2) + "\n")
+
+def watermark_expression(columns):
+    # The change time of a row; None when the table has no timestamp at all
+    present = [column for column in WATERMARK_COLUMNS if column in columns]
+    if len(present) == 2:
+        return f"COALESCE({present[0]}, {present[1]})"
+    return present[0] if present else None
+
+def table_columns(cursor, table):
+    cursor.execute("SELECT column_name FROM information_schema.columns "
+                   "WHERE table_schema = current_schema() AND table_name = %s", (table,))
+    return {name for (name,) in cursor.fetchall()}
+
+def micros_to_iso(micros):
+    if micros is None:
+        return None
+    return datetime.fromtimestamp(micros / 1_000_000, timezone.utc).isoformat()
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def write_segment(conn, table, expression, low, high, path):
+    # Rows of `table` whose watermark is in [low, high) as gzip NDJSON lines
+    # of [key, watermark in epoch microseconds, row]. A base (low None) also
+    # takes rows with no timestamp, and a table without timestamps is copied
+    # whole. Written to a temporary file and renamed, so a segment named in
+    # the manifest is always complete. Returns the row count.
+    if expression is None:
+        select = f"SELECT {KEY_COLUMN}::text, NULL::bigint, row_to_json(t)::text FROM {table} t"
+        params = ()
+    else:
+        where = f"{expression} < to_timestamp(%s / 1e6)"
+        params = (high,)
+        if low is None:
+            where = f"({where} OR {expression} IS NULL)"
+        else:
+            where = f"{expression} >= to_timestamp(%s / 1e6) AND {where}"
+            params = (low, high)
+        select = (f"SELECT {KEY_COLUMN}::text, (extract(epoch FROM {expression}) * 1000000)::bigint, "
+                  f"row_to_json(t)::text FROM {table} t WHERE {where}")
+
+    count = 0
+    fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    os.close(fd)
+    try:
+        with gzip.open(temporary, 'wt', encoding='utf-8', compresslevel=6) as f:
+            with conn.cursor(name=f"cdc_{table}") as cursor:
+                cursor.itersize = FETCH_ROWS
+                cursor.execute(select, params)
+                for key, micros, row in cursor:
+                    f.write(f"[{json.dumps(key)},{'null' if micros is None else micros},{row}]\n")
+                    count += 1
+        conn.commit()
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    return count
+
+def write_keys(conn, table, path):
+    # Every live key, so a restore can drop rows deleted since the base;
+    # watermarks alone never see a DELETE
+    count = 0
+    fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    os.close(fd)
+    try:
+        with gzip.open(temporary, 'wt', encoding='utf-8', compresslevel=6) as f:
+            with conn.cursor(name=f"cdc_{table}_keys") as cursor:
+                cursor.itersize = FETCH_ROWS * 10
+                cursor.execute(f"SELECT {KEY_COLUMN}::text FROM {table}")
+                for (key,) in cursor:
+                    f.write(json.dumps(key) + "\n")
+                    count += 1
+        conn.commit()
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    return count
+
+def run_backup(database_url=DEFAULT_DATABASE_URL, output_dir=OUTPUT_DIR, tables=TABLES, base=False, keys=True,
+               lag=SAFETY_LAG_SECONDS, base_every=BASE_EVERY, log=print):
+    # One checkpoint: a base segment for tables with none yet (or when asked,
+    # or after base_every deltas), otherwise the rows changed since the
+    # table's last checkpoint. The manifest is saved after every table, so an
+    # interrupted run resumes from the tables it finished. A delta also lists
+    # the live keys unless keys is off, which leaves deletions out of restores.
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    conn = connect(database_url)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT (extract(epoch FROM now() - make_interval(secs => %s)) * 1000000)::bigint", (lag,))
+        high = cursor.fetchone()[0]
+        conn.commit()
+        checkpoint = {'high_us': high, 'high': micros_to_iso(high),
+                      'taken_at': datetime.now(timezone.utc).isoformat(), 'tables': {}}
+
+        for table in tables:
+            columns = table_columns(cursor, table)
+            conn.commit()
+            if not columns:
+                log(f"{table}: not in the database, skipped")
+                continue
+            if KEY_COLUMN not in columns:
+                raise ValueError(f"{table} has no {KEY_COLUMN} column to key changes on")
+            expression = watermark_expression(columns)
+            entry = manifest['tables'].setdefault(table, {'segments': [], 'high_us': None})
+            since_base = 0
+            for segment in reversed(entry['segments']):
+                if segment['kind'] != 'delta':
+                    break
+                since_base += 1
+            full = (base or expression is None or entry['high_us'] is None or entry.get('watermark') != expression
+                    or since_base >= base_every)
+            if not full and high <= entry['high_us']:
+                log(f"{table}: nothing new since {micros_to_iso(entry['high_us'])}")
+                continue
+
+            seq = entry['segments'][-1]['seq'] + 1 if entry['segments'] else 1
+            kind = 'base' if full else 'delta'
+            low = None if full else entry['high_us']
+            os.makedirs(os.path.join(output_dir, table), exist_ok=True)
+            name = f"{table}/{seq:06d}-{kind}.ndjson.gz"
+            path = os.path.join(output_dir, name)
+            started = time.perf_counter()
+            rows = write_segment(conn, table, expression, low, high, path)
+            segment = {'seq': seq, 'kind': kind, 'file': name, 'rows': rows, 'low_us': low, 'high_us': high,
+                       'bytes': os.path.getsize(path), 'sha256': file_sha256(path)}
+            entry['segments'].append(segment)
+            if keys and not full:
+                keys_name = f"{table}/{seq:06d}-keys.ndjson.gz"
+                keys_path = os.path.join(output_dir, keys_name)
+                segment['keys'] = {'file': keys_name, 'rows': write_keys(conn, table, keys_path),
+                                   'sha256': file_sha256(keys_path)}
+            entry['high_us'] = high
+            entry['watermark'] = expression
+            checkpoint['tables'][table] = seq
+            save_manifest(manifest, output_dir)
+            log(f"{table}: {kind} {seq} with {rows:,} rows, {segment['bytes']:,} bytes "
+                f"in {time.perf_counter() - started:.1f}s")
+
+        if checkpoint['tables']:
+            manifest['checkpoints'].append(checkpoint)
+            save_manifest(manifest, output_dir)
+    finally:
+        conn.close()
+    return manifest
+
+def parse_time(value):
+    # Epoch microseconds of an ISO timestamp; a naive one is taken as UTC
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1_000_000)
+
+def restore_chain(entry, target):
+    # The segments to replay for the state at `target`: the newest base taken
+    # by then, and the deltas after it that started before it
+    segments = entry['segments']
+    bases = [i for i, segment in enumerate(segments) if segment['kind'] == 'base' and segment['high_us'] <= target]
+    if not bases:
+        return None
+    start = bases[-1]
+    chain = [segments[start]]
+    for segment in segments[start + 1:]:
+        if segment['kind'] == 'base' or segment['low_us'] >= target:
+            break
+        chain.append(segment)
+    return chain
+
+def verified_lines(output_dir, name, sha256):
+    path = os.path.join(output_dir, name)
+    if file_sha256(path) != sha256:
+        raise ValueError(f"{name} does not match its checksum in the manifest")
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        yield from f
+
+def versions(output_dir, chain, target):
+    # (key, -seq, row) per row version in the chain up to `target`, and
+    # (key, -seq, None) per live key of the last key listing in the chain
+    listing = max((segment for segment in chain if 'keys' in segment and segment['high_us'] <= target),
+                  key=itemgetter('seq'), default=None)
+    for segment in chain:
+        for line in verified_lines(output_dir, segment['file'], segment['sha256']):
+            key, micros, row = json.loads(line)
+            if micros is None or micros <= target:
+                yield key, -segment['seq'], row
+    if listing is not None:
+        for line in verified_lines(output_dir, listing['keys']['file'], listing['keys']['sha256']):
+            yield json.loads(line), -listing['seq'], None
+
+def replay(output_dir, chain, target, workdir):
+    # The newest version of each key; a key missing from the last key listing
+    # was deleted, unless its newest version came after that listing
+    listed = max((segment['seq'] for segment in chain if 'keys' in segment and segment['high_us'] <= target),
+                 default=None)
+    ordered = external_sort(versions(output_dir, chain, target), itemgetter(0, 1), workdir)
+    for key, items in groupby(ordered, key=itemgetter(0)):
+        newest = None
+        alive = False
+        for _, negative_seq, row in items:
+            if row is None:
+                alive = True
+            elif newest is None:
+                newest = (-negative_seq, row)
+        if newest is None:
+            continue
+        if listed is not None and newest[0] <= listed and not alive:
+            continue
+        yield newest[1]
+
+def restore(output_dir=OUTPUT_DIR, target=None, restore_dir='cdc_restore', tables=None, log=print):
+    # Rebuilds every table as of `target` (epoch microseconds; default the
+    # last checkpoint) into an export_stream split directory, so the readers
+    # of a split export can use it directly. Exact at a checkpoint; between
+    # two, a row changed again before the later one falls back to its
+    # version before that, since a delta keeps only the newest. Returns the
+    # index.
+    manifest = load_manifest(output_dir)
+    if not manifest['checkpoints']:
+        raise ValueError(f"{output_dir} has no checkpoints to restore from")
+    last = manifest['checkpoints'][-1]['high_us']
+    target = last if target is None else target
+    if target > last:
+        log(f"Changes after the last checkpoint ({micros_to_iso(last)}) were never backed up")
+    os.makedirs(restore_dir, exist_ok=True)
+    entries = {}
+    with tempfile.TemporaryDirectory(dir=restore_dir) as workdir:
+        for table in tables or list(manifest['tables']):
+            chain = restore_chain(manifest['tables'][table], target)
+            if chain is None:
+                log(f"{table}: no base taken by {micros_to_iso(target)}, skipped")
+                continue
+            if len(chain) > 1 and not any('keys' in segment and segment['high_us'] <= target for segment in chain):
+                log(f"{table}: warning, no key listing since the base at {micros_to_iso(chain[0]['high_us'])}; "
+                    f"rows deleted after it are restored anyway")
+            filename = table_file(table, None)
+            count, offsets = write_table(replay(output_dir, chain, target, workdir),
+                                         os.path.join(restore_dir, filename))
+            entries[table] = {'file': filename, 'rows': count, 'offsets': offsets}
+            log(f"{table}: {count:,} rows from {len(chain)} segments")
+    index = {
+        'version': INDEX_VERSION,
+        'source': os.path.abspath(output_dir),
+        'restored_to': micros_to_iso(target),
+        'compression': None,
+        'stride': INDEX_STRIDE,
+        'tables': entries,
+    }
+    write_if_changed(os.path.join(restore_dir, INDEX_FILE), json.dumps(index, indent=2) + "\n")
+    return index
+
+def load_restore(restore_dir, database_url=DEFAULT_DATABASE_URL, log=print):
+    # Inserts a restored directory into empty tables of the same schema, in
+    # foreign key order. Rows go through COPY as jsonb and are spread into
+    # columns by jsonb_populate_record, so column order does not matter.
+    index = load_index(restore_dir)
+    order = [table for table in TABLES if table in index['tables']]
+    order += [table for table in index['tables'] if table not in order]
+    conn = connect(database_url)
+    try:
+        cursor = conn.cursor()
+        for table in order:
+            entry = index['tables'][table]
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS cdc_restore_rows (doc jsonb)")
+            with open(os.path.join(restore_dir, entry['file']), 'r', encoding='utf-8') as f:
+                batch = []
+                for line in f:
+                    batch.append(line.rstrip("\n").replace('\\', '\\\\') + "\n")
+                    if len(batch) >= LOAD_BATCH_ROWS:
+                        copy_text(cursor, "COPY cdc_restore_rows (doc) FROM STDIN", ''.join(batch))
+                        batch = []
+                if batch:
+                    copy_text(cursor, "COPY cdc_restore_rows (doc) FROM STDIN", ''.join(batch))
+            cursor.execute(f"INSERT INTO {table} SELECT r.* FROM cdc_restore_rows s, "
+                           f"jsonb_populate_record(NULL::{table}, s.doc) r")
+            cursor.execute("TRUNCATE cdc_restore_rows")
+            log(f"{table}: loaded {entry['rows']:,} rows")
+        conn.commit()
+    finally:
+        conn.close()
+
+def describe(manifest):
+    lines = []
+    for table, entry in manifest['tables'].items():
+        total = sum(segment['bytes'] for segment in entry['segments'])
+        lines.append(f"{table}: {len(entry['segments'])} segments, {total:,} bytes, "
+                     f"through {micros_to_iso(entry['high_us'])}")
+        for segment in entry['segments'][-5:]:
+            lines.append(f"  {segment['seq']:>6} {segment['kind']:<5} {segment['rows']:>10,} rows "
+                         f"{segment['bytes']:>12,} bytes  to {micros_to_iso(segment['high_us'])}")
+    lines.append(f"{len(manifest['checkpoints'])} checkpoints")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incremental watermark backups of the hospital tables, with point-in-time restore")
+    parser.add_argument('--database-url', default=DEFAULT_DATABASE_URL)
+    parser.add_argument('--output', default=OUTPUT_DIR, help="backup directory holding segments and manifest.json")
+    parser.add_argument('--tables', nargs='+', default=None)
+    parser.add_argument('--base', action='store_true', help="take a full base segment instead of a delta")
+    parser.add_argument('--no-keys', dest='keys', action='store_false',
+                        help="skip the live key listing on deltas; restores then keep rows deleted since the base")
+    parser.add_argument('--lag-seconds', type=int, default=SAFETY_LAG_SECONDS)
+    parser.add_argument('--base-every', type=int, default=BASE_EVERY, help="deltas before an automatic base")
+    parser.add_argument('--status', action='store_true', help="describe the backup instead of taking one")
+    parser.add_argument('--restore', metavar='DIR', help="restore into DIR (as a split export) instead of backing up")
+    parser.add_argument('--at', help="restore the state at this ISO time (naive times are UTC); default the last checkpoint")
+    parser.add_argument('--load', action='store_true', help="after --restore, insert the rows into --database-url")
+    args = parser.parse_args()
+
+    if args.status:
+        print(describe(load_manifest(args.output)))
+        sys.exit(0)
+    if args.restore:
+        started = time.perf_counter()
+        restore(args.output, parse_time(args.at) if args.at else None, args.restore, args.tables)
+        print(f"Restored into {args.restore} in {time.perf_counter() - started:.1f}s.")
+        if args.load:
+            load_restore(args.restore, args.database_url)
+        sys.exit(0)
+
+    started = time.perf_counter()
+    run_backup(args.database_url, args.output, args.tables or TABLES, args.base, args.keys, args.lag_seconds,
+               args.base_every)
+    print(f"Backup finished in {time.perf_counter() - started:.1f}s.")
@@ -0,0 +1,305 @@
+import argparse
+import difflib
+import fnmatch
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog_manifest import write_if_changed
+from ts_lexer import content_hash, index_source
+
+SOURCE_ROOT = 'src'
+SOURCE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+SKIP_DIRS = {'node_modules', 'dist', '.git'}
+
+# Files handed to each worker at a time. Most files match no rule and cost one
+# read, so batching keeps pool overhead below the actual work.
+FILES_PER_TASK = 16
+
+# Per-file record of the content hash each file had after the rules (name and
+# version) it went through; see run()
+CACHE_FILE = '.codemod_cache.json'
+CACHE_VERSION = 1
+
+# Seconds a rule may spend on one file before its edit is abandoned
+DEFAULT_BUDGET = 0.5
+
+RULES = {}
+GROUPS = {}
+
+class RuleBudgetExceeded(Exception):
+    pass
+
+# Deadline of the rule currently running in this process; bounded helpers
+# check it between regions
+_deadline = None
+
+def check_budget():
+    if _deadline is not None and time.perf_counter() > _deadline:
+        raise RuleBudgetExceeded()
+
+# A rule is a pure function from file content to file content. Rules never
+# read or write files themselves: the engine reads each file once, runs every
+# rule that targets it in registration order, and writes it at most once.
+class Rule:
+    def __init__(self, name, apply, files=None, version=1, anchors=(), budget=DEFAULT_BUDGET):
+        self.name = name
+        self.apply = apply
+        # Glob patterns relative to the source root, e.g. 'components/*.tsx';
+        # None targets every source file
+        self.files = files
+        self.version = version
+        # Literals that must all occur in a file for the rule to run at all;
+        # a substring test is far cheaper than any regex or lex
+        self.anchors = tuple(anchors)
+        self.budget = budget
+
+    def targets(self, rel_path):
+        return self.files is None or any(fnmatch.fnmatch(rel_path, pattern) for pattern in self.files)
+
+    def anchored(self, content):
+        return all(anchor in content for anchor in self.anchors)
+
+def rule(name, files=None, version=1, groups=(), anchors=(), budget=DEFAULT_BUDGET):
+    def register(apply):
+        if name in RULES:
+            raise ValueError(f"Codemod rule {name!r} is registered twice")
+        RULES[name] = Rule(name, apply, files, version, anchors, budget)
+        for group in groups:
+            GROUPS.setdefault(group, []).append(name)
+        return apply
+    return register
+
+def resolve_rules(names):
+    # Group names expand to their rules; order is preserved, duplicates dropped
+    resolved = []
+    for name in names:
+        for rule_name in GROUPS.get(name, [name]):
+            if rule_name not in RULES:
+                raise KeyError(f"Unknown codemod rule or group: {rule_name}")
+            if rule_name not in resolved:
+                resolved.append(rule_name)
+    return resolved
+
+def iter_source_files(root=SOURCE_ROOT, extensions=SOURCE_EXTENSIONS):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for filename in sorted(filenames):
+            if filename.endswith(extensions):
+                yield os.path.join(dirpath, filename)
+
+def relative_path(path, root):
+    return os.path.relpath(path, root).replace(os.sep, '/')
+
+def sub_in_statements(pattern, replacement, content, anchor, jsx=True):
+    # Runs `pattern` only inside the statement around each occurrence of
+    # `anchor`, so a lazy [\s\S]*? can never scan (or backtrack through) the
+    # rest of the file when its terminator is missing
+    pos = content.find(anchor)
+    if pos == -1:
+        return content
+    index = index_source(content, jsx)
+    pieces = []
+    last = 0
+    while pos != -1:
+        check_budget()
+        start, end = index.statement_span(pos)
+        if start >= last:
+            pieces.append(content[last:start])
+            pieces.append(pattern.sub(replacement, content[start:end]))
+            last = end
+        pos = content.find(anchor, max(end, pos + 1))
+    pieces.append(content[last:])
+    return ''.join(pieces)
+
+def apply_rules(content, rules):
+    # Rules match on '\n' line endings; the caller restores CRLF on write.
+    # Returns the new content, the rules that changed it, seconds per rule run
+    # and the rules that went over budget (their edits are dropped).
+    global _deadline
+    applied = []
+    timings = {}
+    over_budget = []
+    for r in rules:
+        if not r.anchored(content):
+            continue
+        started = time.perf_counter()
+        _deadline = started + r.budget
+        try:
+            updated = r.apply(content)
+        except RuleBudgetExceeded:
+            updated = content
+        finally:
+            _deadline = None
+        timings[r.name] = time.perf_counter() - started
+        if timings[r.name] > r.budget:
+            over_budget.append(r.name)
+            continue
+        if updated != content:
+            applied.append(r.name)
+            content = updated
+    return content, applied, timings, over_budget
+
+def cache_covers(entry, rules):
+    # True when the cached content already went through every rule, at its
+    # current version
+    return entry is not None and all(entry['rules'].get(r.name) == r.version for r in rules)
+
+def transform_file(path, root, rule_names, cached=None, dry_run=False):
+    rel_path = relative_path(path, root)
+    result = {'path': rel_path, 'applied': [], 'changed': False, 'timings': {}, 'over_budget': [],
+              'diff': '', 'cache': cached, 'skipped': False}
+    rules = [RULES[name] for name in rule_names if RULES[name].targets(rel_path)]
+    if not rules:
+        return result
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        original = f.read()
+    digest = content_hash(original)
+    # A file that was touched but not edited keeps the rules it already went
+    # through; edited content starts over
+    done = dict(cached['rules']) if cached is not None and cached['hash'] == digest else {}
+    pending = [r for r in rules if done.get(r.name) != r.version]
+
+    crlf = '\r\n' in original
+    content, applied, timings, over_budget = apply_rules(original.replace('\r\n', '\n') if crlf else original, pending)
+    if crlf:
+        content = content.replace('\n', '\r\n')
+    result.update(applied=applied, timings=timings, over_budget=over_budget)
+
+    if dry_run:
+        if content != original:
+            result['diff'] = ''.join(difflib.unified_diff(
+                original.splitlines(keepends=True), content.splitlines(keepends=True),
+                f"a/{rel_path}", f"b/{rel_path}"))
+        return result
+
+    result['changed'] = bool(applied) and write_if_changed(path, content)
+    done.update((r.name, r.version) for r in pending if r.name not in over_budget)
+    stat = os.stat(path)
+    result['cache'] = {'hash': content_hash(content), 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'rules': done}
+    return result
+
+def load_rules():
+    # Rule modules register on import. Called in workers too, since spawned
+    # processes (the default on Windows) start without them.
+    import codemod_rules  # noqa: F401
+
+def transform_batch(task):
+    files, root, rule_names, dry_run = task
+    load_rules()
+    return [transform_file(path, root, rule_names, cached, dry_run) for path, cached in files]
+
+def load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return cache['files'] if cache.get('version') == CACHE_VERSION else {}
+
+def save_cache(path, files):
+    write_if_changed(path, json.dumps({'version': CACHE_VERSION, 'files': files}, indent=1, sort_keys=True) + "\n")
+
+def default_cache_path(root):
+    # Next to the source root, i.e. at the repository root for src/
+    return os.path.join(os.path.dirname(os.path.abspath(root)), CACHE_FILE)
+
+def run(rule_names, root=SOURCE_ROOT, workers=None, dry_run=False, cache_path=None):
+    # Returns one result per file with targeted rules; files whose size and
+    # mtime match a cache entry that covers every rule are skipped without
+    # being read
+    load_rules()
+    rule_names = resolve_rules(rule_names)
+    cache = load_cache(cache_path) if cache_path else {}
+
+    results = []
+    pending = []
+    for path in iter_source_files(root):
+        rel_path = relative_path(path, root)
+        rules = [RULES[name] for name in rule_names if RULES[name].targets(rel_path)]
+        if not rules:
+            continue
+        cached = cache.get(rel_path)
+        if cache_covers(cached, rules):
+            stat = os.stat(path)
+            if stat.st_mtime_ns == cached['mtime_ns'] and stat.st_size == cached['size']:
+                results.append({'path': rel_path, 'applied': [], 'changed': False, 'timings': {}, 'over_budget': [],
+                                'diff': '', 'cache': cached, 'skipped': True})
+                continue
+        pending.append((path, cached))
+
+    tasks = [(pending[i:i + FILES_PER_TASK], root, rule_names, dry_run) for i in range(0, len(pending), FILES_PER_TASK)]
+    # Not worth starting a pool for a batch or two
+    if workers == 1 or len(tasks) <= 2:
+        batches = map(transform_batch, tasks)
+        results.extend(result for batch in batches for result in batch)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results.extend(result for batch in pool.map(transform_batch, tasks) for result in batch)
+
+    if cache_path and not dry_run:
+        for result in results:
+            if result['cache'] is not None:
+                cache[result['path']] = result['cache']
+        save_cache(cache_path, cache)
+    return results
+
+def summarize_timings(results):
+    # rule -> [files run on, files changed, total seconds]
+    totals = {}
+    for result in results:
+        for name, seconds in result['timings'].items():
+            entry = totals.setdefault(name, [0, 0, 0.0])
+            entry[0] += 1
+            entry[1] += name in result['applied']
+            entry[2] += seconds
+    return totals
+
+def main(default_rules=None, root=SOURCE_ROOT, description="Apply codemod rules to every source file in one pass"):
+    # The fix scripts in src/ call this with their own group as the default
+    load_rules()
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('rules', nargs='*', default=default_rules or ['migration'],
+                        help=f"rules or groups to apply (groups: {', '.join(sorted(GROUPS))})")
+    parser.add_argument('--root', default=root)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--dry-run', action='store_true', help="print unified diffs and per-rule timings; write nothing")
+    parser.add_argument('--no-cache', action='store_true', help=f"ignore {CACHE_FILE} and rerun every rule")
+    parser.add_argument('--list', action='store_true', help="list registered rules and groups")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, r in RULES.items():
+            print(f"{name} (v{r.version}): {', '.join(r.files) if r.files else 'all files'}")
+        for group, names in sorted(GROUPS.items()):
+            print(f"group {group}: {', '.join(names)}")
+        return
+
+    started = time.perf_counter()
+    cache_path = None if args.no_cache else default_cache_path(args.root)
+    results = run(args.rules, args.root, args.workers, args.dry_run, cache_path)
+    for result in results:
+        if args.dry_run:
+            sys.stdout.write(result['diff'])
+        elif result['applied']:
+            print(f"{result['path']}: {', '.join(result['applied'])}")
+        for name in result['over_budget']:
+            print(f"{result['path']}: {name} exceeded its {RULES[name].budget}s budget, edit skipped")
+
+    if args.dry_run:
+        for name, (files, changed, seconds) in summarize_timings(results).items():
+            print(f"{name}: ran on {files} files, would change {changed}, {seconds * 1000:.2f}ms")
+    skipped = sum(1 for result in results if result['skipped'])
+    changed = sum(1 for result in results if result['changed'] or result['diff'])
+    verb = "would change" if args.dry_run else "changed"
+    print(f"Checked {len(results)} targeted files ({skipped} cached), {verb} {changed} in {time.perf_counter() - started:.2f}s.")
+
+if __name__ == "__main__":
+    # Run through the importable module so rules register into the same
+    # RULES table main() reads, not into a separate __main__ copy
+    import codemod
+    codemod.main()
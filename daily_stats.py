@@ -0,0 +1,219 @@
+import argparse
+import time
+
+from catalog_loader import DEFAULT_DATABASE_URL, connect, sqlstate
+
+MIGRATION = 'backend/migrations/create_daily_stats.sql'
+
+# Transaction advisory lock, so two refreshes never rebuild the same days
+LOCK_KEY = 4_216_087_306
+
+# The days this refresh recomputes; every statement below joins on it
+TOUCHED_DDL = """
+CREATE TEMP TABLE daily_stats_touched (
+    hospital_id UUID NOT NULL,
+    stat_date DATE NOT NULL,
+    PRIMARY KEY (hospital_id, stat_date)
+) ON COMMIT DROP
+"""
+
+# Deleting is the claim: days queued by writers that commit after this
+# statement stay queued for the next refresh
+CLAIM_SQL = """
+WITH claimed AS (DELETE FROM daily_stats_queue RETURNING hospital_id, stat_date)
+INSERT INTO daily_stats_touched
+SELECT DISTINCT hospital_id, stat_date FROM claimed
+WHERE hospital_id IS NOT NULL AND stat_date IS NOT NULL
+ON CONFLICT DO NOTHING
+"""
+
+# Open stays change the census every day without any write, so each day
+# since the last refresh is recomputed for the hospitals that have one
+ROLL_FORWARD_SQL = """
+INSERT INTO daily_stats_touched
+SELECT DISTINCT hospital_id, d::date
+FROM daily_stats_stay_rows
+CROSS JOIN generate_series(GREATEST(admitted, %s), daily_stats_day(NOW()), INTERVAL '1 day') d
+WHERE ended IS NULL
+ON CONFLICT DO NOTHING
+"""
+
+# Every day any counted row lands on, for a full rebuild
+ALL_DAYS_SQL = """
+INSERT INTO daily_stats_touched
+SELECT hospital_id, stat_date FROM (
+    SELECT hospital_id, stat_date FROM daily_stats_revenue_rows
+    UNION
+    SELECT hospital_id, stat_date FROM daily_stats_refund_rows
+    UNION
+    SELECT hospital_id, stat_date FROM daily_stats_patient_rows
+    UNION
+    SELECT hospital_id, d::date
+    FROM daily_stats_stay_rows
+    CROSS JOIN generate_series(admitted, COALESCE(ended, daily_stats_day(NOW())), INTERVAL '1 day') d
+) days
+WHERE stat_date IS NOT NULL
+ON CONFLICT DO NOTHING
+"""
+
+CLEAR_SQL = [
+    """DELETE FROM daily_revenue r USING daily_stats_touched k
+       WHERE r.hospital_id = k.hospital_id AND r.stat_date = k.stat_date""",
+    """DELETE FROM daily_stats s USING daily_stats_touched k
+       WHERE s.hospital_id = k.hospital_id AND s.stat_date = k.stat_date""",
+]
+
+# The rows are defined by the daily_stats_*_rows views in the migration. The
+# days go in as an array so the filter reaches each view's index rather than
+# being applied after a join; a full rebuild reads every row anyway, and
+# without the join the planner can hash the groups instead of sorting
+def scoped(view, alias, full):
+    if full:
+        return f"{view} {alias}"
+    return (f"(SELECT * FROM {view} WHERE stat_date = ANY(ARRAY(SELECT DISTINCT stat_date FROM daily_stats_touched))) "
+            f"{alias} JOIN daily_stats_touched k ON k.hospital_id = {alias}.hospital_id AND k.stat_date = {alias}.stat_date")
+
+REVENUE_SQL = """
+INSERT INTO daily_revenue (hospital_id, stat_date, department, payment_mode, transactions, revenue)
+SELECT c.hospital_id, c.stat_date, c.department, c.payment_mode, COUNT(*), COALESCE(SUM(c.amount), 0)
+FROM {revenue}
+GROUP BY 1, 2, 3, 4
+"""
+
+# Revenue comes from the rows just written to daily_revenue; admissions count
+# a midnight census of the stays open at the end of each day
+STATS_SQL = """
+INSERT INTO daily_stats (hospital_id, stat_date, department, transactions, revenue, refunds, refund_amount,
+                         new_patients, admissions, discharges, in_patients, occupied_beds)
+SELECT hospital_id, stat_date, department, SUM(transactions), SUM(revenue), SUM(refunds), SUM(refund_amount),
+       SUM(new_patients), SUM(admissions), SUM(discharges), SUM(in_patients), SUM(occupied_beds)
+FROM (
+    SELECT r.hospital_id, r.stat_date, r.department, SUM(r.transactions) AS transactions, SUM(r.revenue) AS revenue,
+           0 AS refunds, 0 AS refund_amount, 0 AS new_patients, 0 AS admissions, 0 AS discharges,
+           0 AS in_patients, 0 AS occupied_beds
+    FROM daily_revenue r
+    JOIN daily_stats_touched k ON k.hospital_id = r.hospital_id AND k.stat_date = r.stat_date
+    GROUP BY 1, 2, 3
+    UNION ALL
+    SELECT f.hospital_id, f.stat_date, f.department, 0, 0, COUNT(*), COALESCE(SUM(f.amount), 0), 0, 0, 0, 0, 0
+    FROM {refunds}
+    GROUP BY 1, 2, 3
+    UNION ALL
+    SELECT n.hospital_id, n.stat_date, n.department, 0, 0, 0, 0, COUNT(*), 0, 0, 0, 0
+    FROM {patients}
+    GROUP BY 1, 2, 3
+    UNION ALL
+    SELECT k.hospital_id, k.stat_date, s.department, 0, 0, 0, 0, 0,
+           COUNT(*) FILTER (WHERE s.admitted = k.stat_date),
+           COUNT(*) FILTER (WHERE s.discharged = k.stat_date),
+           COUNT(*) FILTER (WHERE s.ended IS NULL OR s.ended > k.stat_date),
+           COUNT(DISTINCT s.bed_id) FILTER (WHERE s.ended IS NULL OR s.ended > k.stat_date)
+    FROM daily_stats_stay_rows s
+    JOIN daily_stats_touched k ON k.hospital_id = s.hospital_id AND s.admitted <= k.stat_date
+                               AND (s.ended IS NULL OR s.ended >= k.stat_date)
+    GROUP BY 1, 2, 3
+) parts
+GROUP BY 1, 2, 3
+"""
+
+STATE_SQL = """
+INSERT INTO daily_stats_state (id, refreshed_through, refreshed_at, days, duration_ms)
+VALUES (TRUE, daily_stats_day(NOW()), NOW(), %s, %s)
+ON CONFLICT (id) DO UPDATE SET refreshed_through = EXCLUDED.refreshed_through,
+    refreshed_at = EXCLUDED.refreshed_at, days = EXCLUDED.days, duration_ms = EXCLUDED.duration_ms
+"""
+
+def missing_migration(error):
+    # Undefined table or function: the migration has not been applied
+    return sqlstate(error) in ('42P01', '42883')
+
+def refresh(database_url=DEFAULT_DATABASE_URL, full=False, log=print):
+    started = time.perf_counter()
+    conn = connect(database_url)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", (LOCK_KEY,))
+        if not cursor.fetchone()[0]:
+            log("Another refresh is running; the days queued since it started are left for the next one.")
+            conn.rollback()
+            return None
+        try:
+            cursor.execute("SELECT refreshed_through FROM daily_stats_state")
+        except Exception as error:
+            if missing_migration(error):
+                raise RuntimeError(f"daily_stats tables are missing; apply {MIGRATION} first") from None
+            raise
+        row = cursor.fetchone()
+        # Without a previous refresh there is nothing to be incremental from
+        full = full or row is None
+
+        cursor.execute(TOUCHED_DDL)
+        cursor.execute(CLAIM_SQL)
+        if full:
+            cursor.execute(ALL_DAYS_SQL)
+        else:
+            cursor.execute(ROLL_FORWARD_SQL, (row[0],))
+        cursor.execute("SELECT COUNT(*) FROM daily_stats_touched")
+        days = cursor.fetchone()[0]
+        # Without statistics the planner guesses the temp table's size and can
+        # scan the sources whole for a handful of days
+        cursor.execute("ANALYZE daily_stats_touched")
+
+        if full:
+            cursor.execute("DELETE FROM daily_revenue")
+            cursor.execute("DELETE FROM daily_stats")
+        else:
+            for sql in CLEAR_SQL:
+                cursor.execute(sql)
+        cursor.execute(REVENUE_SQL.format(revenue=scoped('daily_stats_revenue_rows', 'c', full)))
+        revenue_rows = cursor.rowcount
+        cursor.execute(STATS_SQL.format(refunds=scoped('daily_stats_refund_rows', 'f', full),
+                                        patients=scoped('daily_stats_patient_rows', 'n', full)))
+        stats_rows = cursor.rowcount
+        seconds = time.perf_counter() - started
+        cursor.execute(STATE_SQL, (days, round(seconds * 1000)))
+        conn.commit()
+    finally:
+        conn.close()
+    log(f"{'Rebuilt' if full else 'Refreshed'} {days} hospital-days in {seconds:.2f}s: "
+        f"{stats_rows} daily_stats rows, {revenue_rows} daily_revenue rows.")
+    return {'full': full, 'days': days, 'stats_rows': stats_rows, 'revenue_rows': revenue_rows, 'seconds': seconds}
+
+def describe(database_url=DEFAULT_DATABASE_URL):
+    conn = connect(database_url)
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT refreshed_through, refreshed_at, days, duration_ms FROM daily_stats_state")
+        except Exception as error:
+            if missing_migration(error):
+                return f"daily_stats tables are missing; apply {MIGRATION} first"
+            raise
+        state = cursor.fetchone()
+        cursor.execute("SELECT COUNT(*) FROM (SELECT DISTINCT hospital_id, stat_date FROM daily_stats_queue "
+                       "WHERE stat_date IS NOT NULL) queued")
+        queued = cursor.fetchone()[0]
+        cursor.execute("SELECT COUNT(*), MIN(stat_date), MAX(stat_date) FROM daily_stats")
+        rows, first, last = cursor.fetchone()
+    finally:
+        conn.close()
+    if state is None:
+        return f"Never refreshed; {queued} hospital-days queued. Run daily_stats.py to build the rollups."
+    refreshed_through, refreshed_at, days, duration_ms = state
+    lines = [f"Last refresh {refreshed_at:%Y-%m-%d %H:%M:%S %Z}: {days} hospital-days in {duration_ms} ms "
+             f"(census rolled forward through {refreshed_through})",
+             f"{rows} daily_stats rows" + (f" from {first} to {last}" if rows else ""),
+             f"{queued} hospital-days queued for the next refresh"]
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the daily_stats and daily_revenue dashboard rollups")
+    parser.add_argument('--database-url', default=DEFAULT_DATABASE_URL)
+    parser.add_argument('--full', action='store_true', help="rebuild every day instead of only the queued ones")
+    parser.add_argument('--status', action='store_true', help="describe the last refresh and the queue")
+    args = parser.parse_args()
+
+    if args.status:
+        print(describe(args.database_url))
+    else:
+        refresh(args.database_url, args.full)
@@ -0,0 +1,255 @@
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+
+from catalog_manifest import write_if_changed
+
+EXPORT_FILE = 'supabase_real_data.json'
+OUTPUT_DIR = 'supabase_export'
+INDEX_FILE = 'index.json'
+INDEX_VERSION = 1
+
+# Characters read from the export per refill; a row larger than this just
+# takes more refills
+READ_CHUNK = 1 << 20
+
+# Rows per indexed block. Reading rows [a, b) seeks to the block holding a and
+# decodes at most one block of rows it does not need. With compression each
+# block is its own gzip member, so it decompresses without the ones before it.
+INDEX_STRIDE = 1024
+
+COMPRESSIONS = {None: '.ndjson', 'gzip': '.ndjson.gz'}
+WHITESPACE = ' \t\r\n'
+
+class ExportReader:
+    # Incremental reader for export-supabase-real-data.js output: one JSON
+    # object of table name -> array of rows. Rows are decoded one at a time
+    # with raw_decode() over a buffer holding only the unread tail, so memory
+    # is bounded by READ_CHUNK plus the largest row, not by the export.
+    def __init__(self, f, chunk=READ_CHUNK):
+        self.f = f
+        self.chunk = chunk
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def fill(self):
+        # Drops the consumed prefix and reads more; False at end of file
+        if self.eof:
+            return False
+        data = self.f.read(self.chunk)
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        self.eof = not data
+        return not self.eof
+
+    def peek(self):
+        # Next non-whitespace character, without consuming it
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, chars):
+        char = self.peek()
+        if char not in chars or not char:
+            raise ValueError(f"Expected one of {chars!r} in export, found {char or 'end of file'!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        # One complete JSON value. A value ending exactly at the buffer end may
+        # be cut short (a number, or a row split mid-token), so it is retried
+        # with more input until it ends before the buffer does or the file ends.
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            if end < len(self.buffer) or self.eof:
+                self.pos = end
+                return value
+            self.fill()
+
+    def rows(self):
+        # Rows of the array at the current position
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(',]') == ']':
+                return
+
+    def tables(self):
+        # (name, rows) per table, in file order. Unread rows are skipped when
+        # the next table is requested.
+        self.expect('{')
+        if self.peek() == '}':
+            return
+        while True:
+            name = self.value()
+            self.expect(':')
+            if self.peek() == '[':
+                rows = self.rows()
+                yield name, rows
+                for _ in rows:
+                    pass
+            else:
+                # Not a table (e.g. export metadata); a one-row table keeps it
+                yield name, iter([self.value()])
+            if self.expect(',}') == '}':
+                return
+
+def iter_tables(path, chunk=READ_CHUNK):
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from ExportReader(f, chunk).tables()
+
+def table_file(name, compression):
+    # Table names come from the export, so keep them to one safe path component
+    safe = ''.join(c if c.isalnum() or c in '-_' else '_' for c in name) or '_'
+    return safe + COMPRESSIONS[compression]
+
+def encode_row(row):
+    return (json.dumps(row, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+def gzip_member(data):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+def write_table(rows, path, compression=None, stride=INDEX_STRIDE):
+    # Writes rows as NDJSON; returns (row count, byte offset of each block of
+    # `stride` rows). Only one block is held in memory.
+    offsets = []
+    count = 0
+    block = []
+    with open(path, 'wb') as f:
+        def flush():
+            offsets.append(f.tell())
+            data = b''.join(block)
+            f.write(gzip_member(data) if compression == 'gzip' else data)
+            block.clear()
+
+        for row in rows:
+            block.append(encode_row(row))
+            count += 1
+            if len(block) >= stride:
+                flush()
+        if block:
+            flush()
+    return count, offsets
+
+def split_export(path=EXPORT_FILE, output_dir=OUTPUT_DIR, compression=None, stride=INDEX_STRIDE, chunk=READ_CHUNK):
+    # One NDJSON file per table plus index.json with row counts and block
+    # offsets. Returns the index.
+    os.makedirs(output_dir, exist_ok=True)
+    stat = os.stat(path)
+    tables = {}
+    for name, rows in iter_tables(path, chunk):
+        filename = table_file(name, compression)
+        count, offsets = write_table(rows, os.path.join(output_dir, filename), compression, stride)
+        tables[name] = {'file': filename, 'rows': count, 'offsets': offsets}
+
+    index = {
+        'version': INDEX_VERSION,
+        'source': os.path.abspath(path),
+        'source_size': stat.st_size,
+        'source_mtime_ns': stat.st_mtime_ns,
+        'compression': compression,
+        'stride': stride,
+        'tables': tables,
+    }
+    write_if_changed(os.path.join(output_dir, INDEX_FILE), json.dumps(index, indent=2) + "\n")
+    return index
+
+def load_index(output_dir=OUTPUT_DIR):
+    with open(os.path.join(output_dir, INDEX_FILE), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    if index.get('version') != INDEX_VERSION:
+        raise ValueError(f"{output_dir} was written by another version of export_stream.py; split the export again")
+    return index
+
+def iter_block_lines(f, compression):
+    # Lines from the current offset to the end of the file. A gzip file is
+    # decompressed member by member from here on.
+    if compression != 'gzip':
+        yield from f
+        return
+    pending = b''
+    decompressor = zlib.decompressobj(31)
+    while True:
+        data = f.read(READ_CHUNK)
+        if not data:
+            break
+        while data:
+            pending += decompressor.decompress(data)
+            data = decompressor.unused_data
+            if decompressor.eof:
+                decompressor = zlib.decompressobj(31)
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line + b"\n"
+    if pending:
+        yield pending
+
+def read_rows(table, start=0, stop=None, output_dir=OUTPUT_DIR, index=None):
+    # Rows [start, stop) of one table, decoding only the blocks they fall in
+    index = index or load_index(output_dir)
+    entry = index['tables'][table]
+    stop = entry['rows'] if stop is None else min(stop, entry['rows'])
+    if start >= stop:
+        return
+    stride = index['stride']
+    block = start // stride
+    with open(os.path.join(output_dir, entry['file']), 'rb') as f:
+        f.seek(entry['offsets'][block])
+        row = block * stride
+        for line in iter_block_lines(f, index['compression']):
+            if row >= stop:
+                return
+            if row >= start:
+                yield json.loads(line)
+            row += 1
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Split a Supabase JSON export into per-table NDJSON with a row-offset index")
+    parser.add_argument('export', nargs='?', default=EXPORT_FILE)
+    parser.add_argument('--output', default=OUTPUT_DIR)
+    parser.add_argument('--gzip', action='store_true', help="compress each table, one gzip member per indexed block")
+    parser.add_argument('--stride', type=int, default=INDEX_STRIDE, help="rows per indexed block")
+    parser.add_argument('--read', metavar='TABLE', help="print rows of TABLE from an existing split instead of splitting")
+    parser.add_argument('--start', type=int, default=0)
+    parser.add_argument('--stop', type=int, default=None)
+    parser.add_argument('--trace-memory', action='store_true', help="report peak Python heap use while splitting")
+    args = parser.parse_args()
+
+    if args.read:
+        for row in read_rows(args.read, args.start, args.stop, args.output):
+            sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+        sys.exit(0)
+
+    if args.trace_memory:
+        import tracemalloc
+        tracemalloc.start()
+    started = time.perf_counter()
+    index = split_export(args.export, args.output, 'gzip' if args.gzip else None, args.stride)
+    seconds = time.perf_counter() - started
+
+    for name, entry in index['tables'].items():
+        size = os.path.getsize(os.path.join(args.output, entry['file']))
+        print(f"{name}: {entry['rows']:,} rows, {size:,} bytes in {entry['file']}")
+    total = sum(entry['rows'] for entry in index['tables'].values())
+    print(f"Split {index['source_size']:,} bytes into {len(index['tables'])} tables ({total:,} rows) in {seconds:.2f}s.")
+    if args.trace_memory:
+        print(f"Peak traced memory: {tracemalloc.get_traced_memory()[1] / 1024 / 1024:.1f} MiB")
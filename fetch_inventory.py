@@ -0,0 +1,342 @@
+import argparse
+import bisect
+import json
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from codemod import FILES_PER_TASK, SOURCE_ROOT, iter_source_files, relative_path
+from ts_lexer import index_for_path
+
+REPORT_FILE = 'fetch_inventory.json'
+
+# Callbacks passed to these run once per element
+LOOP_METHODS = {'map', 'forEach', 'flatMap', 'filter', 'reduce', 'some', 'every', 'find', 'findIndex'}
+LOOP_KEYWORDS = {'for', 'while'}
+# Any of these in a supabase chain bounds the rows it can return
+BOUNDING_METHODS = {'limit', 'range', 'single', 'maybeSingle', 'gt', 'gte', 'lt', 'lte'}
+WRITE_METHODS = {'insert', 'update', 'upsert', 'delete'}
+READ_HTTP_METHODS = {'get', 'head'}
+# Service methods named like this change data, so repeating them is not a
+# duplicate fetch
+WRITE_METHOD_NAME = re.compile(r'^(?:create|update|delete|remove|add|save|mark|insert|upsert|set|clear)[A-Z_]')
+HTTP_METHODS = {'get', 'post', 'put', 'patch', 'delete', 'head'}
+# Clients created with axios.create() across src/services, plus axios itself
+HTTP_CLIENTS = {'axios', 'api', 'apiClient'}
+SERVICE_NAME = re.compile(r'^[A-Za-z]\w*Service$')
+NON_NETWORK_SERVICES = {'localStorageService'}
+# Hooks whose callback's name is the variable they are assigned to
+WRAPPER_HOOKS = {'useCallback', 'useMemo'}
+DECLARATION_KEYWORDS = {'const', 'let', 'var'}
+CONTROL_KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'with', 'return'}
+DATE_LITERAL = re.compile(r"""^['"`](\d{4})-\d{2}-\d{2}['"`]$""")
+# A from/to range this wide is "everything", e.g. ('2000-01-01', '2100-12-31')
+SENTINEL_RANGE_YEARS = 50
+
+# Ranking weights: a call per loop iteration is the worst offender, then
+# reads with no bound, then the same endpoint fetched again by one component
+LOOP_WEIGHT = 8
+UNBOUNDED_WEIGHT = 4
+DUPLICATE_WEIGHT = 2
+
+class FileInventory:
+    def __init__(self, rel_path, content):
+        self.rel_path = rel_path
+        self.index = index_for_path(rel_path, content)
+        self.source = content
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', content)]
+        # close offset -> open offset, to walk back over a (...) group
+        self.opening = {close: open_pos for open_pos, close in self.index.closing.items()}
+        self.clients = HTTP_CLIENTS | set(re.findall(r'(\w+)\s*=\s*axios\.create\(', content))
+        self.sites = []
+
+    def line(self, offset):
+        return bisect.bisect_right(self.line_starts, offset)
+
+    def text(self, i):
+        return self.index.text(i) if 0 <= i < len(self.index.tokens) else ''
+
+    def token_at(self, offset):
+        return self.index.find_token(offset)
+
+    def skip_group(self, i):
+        # Token index just past the (...) group opened at token i
+        close = self.index.closing.get(self.index.tokens[i][1])
+        return len(self.index.tokens) if close is None else self.token_at(close + 1)
+
+    def loop_reason(self, i):
+        # Why the bracket opened at token i runs once per element, if it does
+        text = self.text(i)
+        if text == '(' and self.text(i - 2) == '.' and self.text(i - 1) in LOOP_METHODS:
+            return f".{self.text(i - 1)}()"
+        if text == '{':
+            if self.text(i - 1) == 'do':
+                return 'do loop'
+            if self.text(i - 1) == ')':
+                open_pos = self.opening.get(self.index.tokens[i - 1][1])
+                keyword = self.text(self.token_at(open_pos) - 1) if open_pos is not None else ''
+                if keyword in LOOP_KEYWORDS:
+                    return f"{keyword} loop"
+        return None
+
+    def before_group(self, j):
+        # Token index just before the (...) group that closes at token j
+        return self.token_at(self.opening.get(self.index.tokens[j][1], 0)) - 1
+
+    def skip_return_type(self, j):
+        # `(...): Promise<T[]> {` and `(...): T =>`: back to the ')' when the
+        # tokens before j are a return type annotation
+        depth = self.index.tokens[j][3]
+        for k in range(j, max(j - 64, 1), -1):
+            if self.index.tokens[k][3] > depth:
+                continue
+            if self.index.tokens[k][3] < depth or self.text(k) in (';', '{', '}', '=', '=>'):
+                break
+            if self.text(k) == ':' and self.text(k - 1) == ')':
+                return k - 1
+        return j
+
+    def declared_name(self, j):
+        # Name assigned at the '=' token j, past any type annotation:
+        # `const App: React.FC<Props> =`
+        for k in range(j - 1, max(j - 16, 0), -1):
+            if self.text(k) in DECLARATION_KEYWORDS:
+                return self.text(k + 1)
+            if self.text(k) in (';', '{', '}', '(', ')'):
+                break
+        return self.text(j - 1) if self.index.tokens[j - 1][0] == 'ident' else None
+
+    def frame_name(self, i):
+        # Name of the function whose body (or callback argument list) opens at
+        # token i: `const name = (...) => {`, `function name(...) {`,
+        # `name(...): T {`, or the hook a callback is passed to
+        j = self.skip_return_type(i - 1)
+        if self.text(j) == '=>':
+            j = self.skip_return_type(j - 1)
+            j = self.before_group(j) if self.text(j) == ')' else j - 1
+        elif self.text(j) == ')':
+            j = self.before_group(j)
+        else:
+            return None
+        if self.text(j) == 'async':
+            j -= 1
+        if self.text(j) == 'function':
+            j -= 1
+        if self.text(j) == '(':
+            # Callback argument: named after a plain callee such as useEffect;
+            # method callbacks (.then, .map) belong to the enclosing function
+            j -= 1
+            if self.index.tokens[j][0] != 'ident' or self.text(j - 1) in ('.', '?.'):
+                return None
+            if self.text(j) in WRAPPER_HOOKS and self.text(j - 1) == '=':
+                return self.declared_name(j - 1)
+            return self.text(j)
+        if self.text(j) == '=':
+            return self.declared_name(j)
+        if self.index.tokens[j][0] == 'ident' and self.text(j) not in CONTROL_KEYWORDS:
+            return self.text(j)
+        return None
+
+    def argument_texts(self, i):
+        # Top-level arguments of the call whose '(' is token i, as source text
+        tokens = self.index.tokens
+        close = self.index.closing.get(tokens[i][1])
+        if close is None:
+            return []
+        depth = tokens[i][3]
+        args = []
+        start = tokens[i][2]
+        for k in range(i + 1, self.token_at(close)):
+            if tokens[k][3] == depth and self.text(k) == ',':
+                args.append(self.source[start:tokens[k][1]].strip())
+                start = tokens[k][2]
+        last = self.source[start:close].strip()
+        if last:
+            args.append(last)
+        return args
+
+    def bounded_later(self, i, scope_end):
+        # `let query = supabase.from(...)...; query = query.gte(...)`: the
+        # builder is narrowed by later statements in the same function
+        if self.text(i - 1) != '=' or self.index.tokens[i - 2][0] != 'ident':
+            return False
+        variable = re.escape(self.text(i - 2))
+        methods = '|'.join(sorted(BOUNDING_METHODS))
+        pattern = re.compile(rf'\b{variable}\s*(?:=\s*{variable}\b[^;]*?)?\.\s*(?:{methods})\s*\(')
+        return pattern.search(self.source, self.index.tokens[i][2], scope_end) is not None
+
+    def supabase_site(self, i, scope_end):
+        # `<client>.from('table')` followed by a chain of .method(...) calls
+        table_args = self.argument_texts(i + 3)
+        table = table_args[0].strip('\'"`') if table_args else '?'
+        chain = []
+        args = {}
+        k = self.skip_group(i + 3)
+        while self.text(k) in ('.', '?.') and self.index.tokens[k + 1][0] == 'ident' and self.text(k + 2) == '(':
+            method = self.text(k + 1)
+            chain.append(method)
+            args[method] = self.argument_texts(k + 2)
+            k = self.skip_group(k + 2)
+
+        site = {'kind': 'supabase', 'endpoint': f"supabase:{table}", 'chain': chain,
+                'write': bool(WRITE_METHODS.intersection(chain))}
+        if not site['write']:
+            head_only = any('head: true' in arg for arg in args.get('select', []))
+            if ('select' in chain and not head_only and not BOUNDING_METHODS.intersection(chain)
+                    and not self.bounded_later(i, scope_end)):
+                site['unbounded'] = "select without a limit, range or date filter"
+        return site
+
+    def http_site(self, i, method):
+        args = self.argument_texts(i + 3)
+        url = args[0] if args else '?'
+        # Template parameters and concatenated ids all name the same endpoint
+        url = re.sub(r'\$\{[^}]*\}', ':param', url)
+        url = re.sub(r"""['"`]\s*\+\s*[\w.]+""", ":param'", url).strip('\'"`')
+        # Drop the base URL prefix: `${API_URL}/api/patients`
+        url = re.sub(r'^:param(?=/)', '', url)
+        return {'kind': 'http', 'endpoint': f"{method.upper()} {url}", 'chain': [method],
+                'write': method not in READ_HTTP_METHODS}
+
+    def service_site(self, i, service, method):
+        site = {'kind': 'service', 'endpoint': f"{service}.{method}", 'chain': [method],
+                'write': WRITE_METHOD_NAME.match(method) is not None}
+        args = self.argument_texts(i + 3)
+        years = [DATE_LITERAL.match(arg) for arg in args]
+        years = [int(match.group(1)) for match in years if match]
+        if len(years) >= 2 and max(years) - min(years) >= SENTINEL_RANGE_YEARS:
+            site['unbounded'] = f"sentinel date range {min(years)}-{max(years)}"
+        return site
+
+    def scan(self):
+        tokens = self.index.tokens
+        # Frames for the open brackets around the current token:
+        # (close offset, loop reason or None, function name or None)
+        frames = []
+        for i, (kind, start, end, _) in enumerate(tokens):
+            while frames and frames[-1][0] < start:
+                frames.pop()
+            text = self.source[start:end]
+            if text in ('(', '{', '[', '${'):
+                close = self.index.closing.get(start)
+                if close is not None:
+                    frames.append((close, self.loop_reason(i), self.frame_name(i) if text in ('{', '(') else None))
+                continue
+            if kind != 'ident' or self.text(i + 1) not in ('.', '?.'):
+                if text == 'fetch' and self.text(i + 1) == '(' and self.text(i - 1) not in ('.', 'function'):
+                    args = self.argument_texts(i + 1)
+                    url = re.sub(r'\$\{[^}]*\}', ':param', args[0] if args else '?').strip('\'"`')
+                    self.add_site(start, frames, {'kind': 'http', 'endpoint': f"fetch {url}", 'chain': ['fetch'],
+                                                     'write': False})
+                continue
+
+            member = self.text(i + 2)
+            if self.text(i + 3) != '(' or self.text(i - 1) == '.' and self.text(i - 2) != 'this':
+                continue
+            if member == 'from' and 'supabase' in text.lower():
+                scope_end = frames[-1][0] if frames else len(self.source)
+                self.add_site(start, frames, self.supabase_site(i, scope_end))
+            elif member in HTTP_METHODS and text in self.clients:
+                self.add_site(start, frames, self.http_site(i, member))
+            elif SERVICE_NAME.match(text) and text not in NON_NETWORK_SERVICES:
+                self.add_site(start, frames, self.service_site(i, text, member))
+        return self.sites
+
+    def add_site(self, offset, frames, site):
+        names = [name for _, _, name in frames if name]
+        loops = [reason for _, reason, _ in frames if reason]
+        site.update({
+            'file': self.rel_path,
+            'line': self.line(offset),
+            # Outermost named function, normally the component or service
+            'scope': names[0] if names else '<module>',
+            'function': names[-1] if names else '<module>',
+        })
+        if loops:
+            site['in_loop'] = loops[-1]
+        self.sites.append(site)
+
+def scan_batch(task):
+    paths, root = task
+    sites = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        sites.extend(FileInventory(relative_path(path, root), content).scan())
+    return sites
+
+def score_sites(sites):
+    # Same endpoint read more than once within one component or service
+    counts = {}
+    for site in sites:
+        key = (site['file'], site['scope'], site['endpoint'])
+        if not site['write']:
+            counts[key] = counts.get(key, 0) + 1
+    for site in sites:
+        repeats = counts.get((site['file'], site['scope'], site['endpoint']), 1)
+        if repeats > 1:
+            site['duplicates'] = repeats
+        site['score'] = (1 + LOOP_WEIGHT * ('in_loop' in site) + UNBOUNDED_WEIGHT * ('unbounded' in site)
+                         + DUPLICATE_WEIGHT * (repeats - 1))
+    return sites
+
+def rank_endpoints(sites):
+    endpoints = {}
+    for site in sites:
+        entry = endpoints.setdefault(site['endpoint'], {'endpoint': site['endpoint'], 'score': 0, 'calls': 0,
+                                                        'in_loop': 0, 'unbounded': 0, 'duplicated': 0, 'sites': []})
+        entry['score'] += site['score']
+        entry['calls'] += 1
+        entry['in_loop'] += 'in_loop' in site
+        entry['unbounded'] += 'unbounded' in site
+        entry['duplicated'] += 'duplicates' in site
+        entry['sites'].append(site)
+    ranked = sorted(endpoints.values(), key=lambda entry: (-entry['score'], entry['endpoint']))
+    for entry in ranked:
+        entry['sites'].sort(key=lambda site: (-site['score'], site['file'], site['line']))
+    return ranked
+
+def build_inventory(root=SOURCE_ROOT, workers=None):
+    paths = list(iter_source_files(root))
+    tasks = [(paths[i:i + FILES_PER_TASK], root) for i in range(0, len(paths), FILES_PER_TASK)]
+    if workers == 1:
+        batches = map(scan_batch, tasks)
+        sites = [site for batch in batches for site in batch]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            sites = [site for batch in pool.map(scan_batch, tasks) for site in batch]
+    return rank_endpoints(score_sites(sites)), len(paths)
+
+def describe_site(site):
+    flags = []
+    if 'in_loop' in site:
+        flags.append(f"in {site['in_loop']}")
+    if 'unbounded' in site:
+        flags.append(site['unbounded'])
+    if 'duplicates' in site:
+        flags.append(f"{site['duplicates']}x in {site['scope']}")
+    return f"{site['file']}:{site['line']} {site['function']}" + (f" ({'; '.join(flags)})" if flags else '')
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Index data-fetch call sites under src/ and rank the ones to batch first")
+    parser.add_argument('--root', default=SOURCE_ROOT)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--top', type=int, default=20, help="endpoints to print")
+    parser.add_argument('--output', default=REPORT_FILE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    ranked, files = build_inventory(args.root, args.workers)
+    calls = sum(entry['calls'] for entry in ranked)
+    with open(args.output, 'w') as f:
+        json.dump({'files': files, 'calls': calls, 'endpoints': ranked}, f, indent=2)
+        f.write("\n")
+
+    for entry in ranked[:args.top]:
+        print(f"{entry['score']:>4}  {entry['endpoint']}  ({entry['calls']} calls, {entry['in_loop']} in loops, "
+              f"{entry['unbounded']} unbounded, {entry['duplicated']} duplicated)")
+        for site in entry['sites'][:3]:
+            if site['score'] > 1:
+                print(f"        {describe_site(site)}")
+    print(f"Indexed {calls} call sites to {len(ranked)} endpoints in {files} files in {time.perf_counter() - started:.2f}s, "
+          f"see {args.output}.")
@@ -1,6 +1,15 @@
 
+import argparse
 import re
 
+from catalog_compiler import SHARD_MANIFEST_VERSION, compile_medical_services, compile_medical_services_shards
+from catalog_index import INDEX_VERSION, CatalogIndex, write_index_ts
+from catalog_loader import DEFAULT_DATABASE_URL, describe_load, load_catalog
+from catalog_manifest import regenerate
+from category_classifier import CategoryClassifier
+from service_dedup import ServiceDeduper, priced_key, write_report
+from service_ids import ServiceIdRegistry
+
 raw_data = """24 Hrs Urinary Albumin	210
 24 Hrs Urinary Calcium	210
 24 Hrs Urinary Calcium	210
@@ -617,57 +626,117 @@ Z N Stain for AFB	150
 βETA - HCG (βHCG)	800
 Allergy Drugs Only	1600"""
 
-lines = raw_data.strip().split('\n')
-services = []
+SHARD_DIR = 'src/data/medicalServiceShards'
+
+# Category keywords and their precedence live in category_rules.json
+CLASSIFIER = CategoryClassifier.from_file()
 
 def get_category(name):
-    lower_name = name.lower()
-    if any(k in lower_name for k in ['test', 'profile', 'culture', 'stain', 'smear', 'analysis', 'count', 'serum', 'urine', 'fluid', 'aspirat', 'cytology', 'pcr', 'elisa', 'hemogram', 'blood']):
-        return 'LAB_TEST'
-    if any(k in lower_name for k in ['x-ray', 'xray', 'ct scan', 'mri', 'usg', 'ultrasound', 'doppler']):
-        return 'XRAY'
-    if any(k in lower_name for k in ['biopsy', 'fnac', 'aspirat', 'drainage', 'dressing', 'suture', 'removal']):
-        return 'PROCEDURE'
-    return 'LAB_TEST' # Default to LAB_TEST as most items seem to be labs
+    return CLASSIFIER.classify(name)
+
+def parse_price(text):
+    try:
+        return float(re.sub(r'[^\d.]', '', text))
+    except ValueError:
+        return None
+
+def with_codes(services, registry):
+    # The LAB codes ingest_tariffs.py hands out, so the TS module and the
+    # service_catalog table agree
+    used = set()
+    for service in services:
+        code = registry.assign('LAB', service['name'])
+        if code in used:
+            code = registry.assign('LAB', service['name'], key=priced_key(service['name'], [service['defaultPrice']]))
+        used.add(code)
+        yield dict(service, code=code)
+
+def iter_services(lines, deduper=None):
+    # Near-duplicates ("24 Hrs. Urine Albumin" / "24 Hrs Urinary Albumin") at
+    # the same price are merged into the first spelling; see service_dedup
+    deduper = deduper or ServiceDeduper()
+
+    for line in lines:
+        parts = line.split('\t')
+        if len(parts) >= 2:
+            name = parts[0].strip()
+            price = parse_price(parts[1])
+            if price is None:
+                continue
+            if not deduper.add(name, price):
+                continue
+                
+            category = get_category(name)
+            yield {
+                'name': name,
+                'category': category,
+                'defaultPrice': price
+            }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate src/data/medicalServicesCatalog.ts from the lab price list")
+    parser.add_argument('--force', action='store_true', help="rewrite outputs even if the manifest says they are current")
+    parser.add_argument('--sharded', action='store_true', help=f"write one module per category to {SHARD_DIR}/ plus a manifest")
+    parser.add_argument('--load-db', nargs='?', const=DEFAULT_DATABASE_URL, metavar='DATABASE_URL',
+                        help="also bulk-load the services into the service_catalog table")
+    args = parser.parse_args()
 
-seen_names = set()
+    lines = raw_data.strip().split('\n')
+    registry = ServiceIdRegistry()
 
-for line in lines:
-    parts = line.split('\t')
-    if len(parts) >= 2:
-        name = parts[0].strip()
-        if name in seen_names:
-            continue
-        seen_names.add(name)
-        
-        try:
-            price = float(re.sub(r'[^\d.]', '', parts[1]))
-        except ValueError:
-            continue
-            
-        category = get_category(name)
-        services.append({
-            'name': name,
-            'category': category,
-            'defaultPrice': price
-        })
+    dedupers = []
 
-# Generate TypeScript file
-ts_content = """export interface MedicalService {
-  name: string;
-  category: 'LAB_TEST' | 'XRAY' | 'PROCEDURE' | 'MEDICINE' | 'SERVICE';
-  defaultPrice: number;
-}
+    def iter_records():
+        deduper = ServiceDeduper()
+        dedupers.append(deduper)
+        return with_codes(iter_services(lines, deduper), registry)
 
-export const MEDICAL_SERVICES_DATA: MedicalService[] = [
-"""
+    if args.sharded:
+        catalog_name = 'medicalServices:sharded'
+        schema = f"medical-services-ts-v2/dedup-v2/shards-v{SHARD_MANIFEST_VERSION}"
+        outputs = [f'{SHARD_DIR}/manifest.json']
 
-for service in services:
-    ts_content += f"  {{ name: `{service['name']}`, category: '{service['category']}', defaultPrice: {service['defaultPrice']} }},\n"
+        def write_outputs(services):
+            CLASSIFIER.hits.clear()
+            return compile_medical_services_shards(services, SHARD_DIR)
+    else:
+        catalog_name = 'medicalServices'
+        schema = f"medical-services-ts-v2/dedup-v2/index-v{INDEX_VERSION}"
+        # medicalServices.ts is hand-edited and re-exports the generated list
+        outputs = ['src/data/medicalServicesCatalog.ts', 'src/data/medicalServicesIndex.ts']
 
-ts_content += "];\n"
+        # Generate TypeScript file and its search index
+        def write_outputs(services):
+            CLASSIFIER.hits.clear()
+            index = CatalogIndex()
+            compile_medical_services(index.track(services), outputs[0])
+            write_index_ts(index, outputs[1], 'MEDICAL_SERVICES_INDEX')
 
-with open('src/data/medicalServices.ts', 'w') as f:
-    f.write(ts_content)
+    changes = regenerate(
+        catalog_name,
+        iter_records,
+        key='name',
+        schema=schema,
+        outputs=outputs,
+        write_outputs=write_outputs,
+        force=args.force,
+    )
+    registry.save()
+    report = dedupers[0].report()
+    write_report(report)
+    print(f"Merged {report['merged']} near-duplicate names; {report['price_conflicts']} with differing prices were kept for review, see service_merge_report.json.")
+    if changes is None:
+        print(f"{outputs[0]} unchanged, nothing written.")
+    else:
+        print(f"Generated {outputs[0]} with {changes['count']} services (version {changes['version']}).")
+        print(f"Category hits: {CLASSIFIER.hit_counts()}")
 
-print(f"Generated src/data/medicalServices.ts with {len(services)} services.")
+    if args.load_db:
+        rows = (
+            {'code': service['code'], 'family': 'LAB', 'name': service['name'],
+             'category': service['category'], 'rates': [service['defaultPrice']], 'source': 'generate_services.py'}
+            for service in with_codes(iter_services(lines), registry)
+        )
+        stats = load_catalog(rows, args.load_db)
+        registry.save()
+        print(describe_load(stats))
@@ -0,0 +1,229 @@
+import argparse
+import glob
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog_compiler import BUFFER_SIZE
+from catalog_index import normalize_name
+from parse_rghs import RGHS_CODE_START, parse_rghs_line
+from service_dedup import canonical_key, priced_key
+from service_ids import ServiceIdRegistry
+
+# Built-in sources, in priority order: when the same service appears in more
+# than one list of a family, the earlier source's rates win
+DEFAULT_SOURCES = [
+    ('rghs', 'temp_rghs_list.txt'),
+    ('lab-embedded', 'generate_services.py'),
+    ('ts-catalog', 'src/data/hospitalServicesAndProcedures.ts'),
+]
+
+# Branch-specific price lists dropped here are picked up by extension
+TARIFF_DIR = 'tariffs'
+TARIFF_PATTERNS = [
+    ('rghs', '*.rghs.txt'),
+    ('lab', '*.tsv'),
+]
+
+MASTER_FILE = 'service_master.json'
+CHUNK_BYTES = 4 << 20
+
+TS_ENTRY_PATTERN = re.compile(
+    r"\{\s*id:\s*'[^']*',\s*(?:service|procedure)_code:\s*'(?P<code>[^']*)',\s*"
+    r"(?:service|procedure)_name:\s*'(?P<name>[^']*)',\s*category:\s*'(?P<category>[^']*)',\s*"
+    r"rate:\s*(?P<rate>\d+(?:\.\d+)?)"
+)
+
+def discover_sources(tariff_dir=TARIFF_DIR):
+    sources = [(kind, path) for kind, path in DEFAULT_SOURCES if os.path.exists(path)]
+    for kind, pattern in TARIFF_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(tariff_dir, pattern))):
+            sources.append((kind, path))
+    return sources
+
+def plan_chunks(kind, path, chunk_bytes=CHUNK_BYTES):
+    # Line-based lists are split into byte ranges that end on a newline, so a
+    # large file is parsed by several workers at once
+    if kind not in ('rghs', 'lab'):
+        return [(kind, path, 0, None)]
+
+    size = os.path.getsize(path)
+    chunks = []
+    with open(path, 'rb') as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            chunks.append((kind, path, start, end))
+            start = end
+    return chunks
+
+def read_chunk_lines(path, start, end):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return data.decode('utf-8').splitlines()
+
+def parse_rghs_chunk(path, start, end):
+    # Packages before the first header in this chunk belong to whatever section
+    # the previous chunk ended in; they get category None and the merge step
+    # fills it in
+    records = []
+    category = None
+    for line in read_chunk_lines(path, start, end):
+        parsed = parse_rghs_line(line)
+        if parsed is None:
+            continue
+        if parsed[0] == 'header':
+            category = parsed[1]
+            continue
+        _, name, rates = parsed
+        records.append({'family': 'RGHS', 'name': name, 'category': category, 'rates': rates})
+    return records, category
+
+def parse_lab_lines(lines):
+    # Imported here so workers that only parse RGHS chunks skip the lab module
+    from generate_services import CLASSIFIER, parse_price
+
+    records = []
+    for line in lines:
+        parts = line.split('\t')
+        if len(parts) < 2:
+            continue
+        name = parts[0].strip()
+        price = parse_price(parts[1])
+        if not name or price is None:
+            continue
+        records.append({'family': 'LAB', 'name': name, 'category': None, 'rates': [price]})
+    categories = CLASSIFIER.classify_batch([record['name'] for record in records])
+    for record, category in zip(records, categories):
+        record['category'] = category
+    return records
+
+def parse_ts_catalog(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    records = []
+    for match in TS_ENTRY_PATTERN.finditer(content):
+        code = match.group('code')
+        records.append({
+            'family': code.split('-')[0],
+            'code': code,
+            'name': match.group('name'),
+            'category': match.group('category'),
+            'rates': [float(match.group('rate'))],
+        })
+    return records
+
+def parse_task(task):
+    kind, path, start, end = task
+    if kind == 'rghs':
+        records, last_category = parse_rghs_chunk(path, start, end)
+    elif kind == 'lab':
+        records, last_category = parse_lab_lines(read_chunk_lines(path, start, end)), None
+    elif kind == 'lab-embedded':
+        from generate_services import raw_data
+        records, last_category = parse_lab_lines(raw_data.strip().split('\n')), None
+    elif kind == 'ts-catalog':
+        records, last_category = parse_ts_catalog(path), None
+    else:
+        raise ValueError(f"Unknown tariff source kind: {kind}")
+    # Computing keys here keeps the serial merge step down to dict lookups.
+    # `key` groups near-duplicates; `id_key` is what the ID registry is keyed on.
+    for record in records:
+        record['source'] = path
+        record['key'] = canonical_key(record['name'])
+        record['id_key'] = normalize_name(record['name'])
+    return task, records, last_category
+
+def merge_results(results, registry):
+    # `results` arrive in task order, so the merge (and every code the registry
+    # hands out) is deterministic regardless of which worker finished first.
+    # A near-duplicate is only merged at the same rates; at other rates it is
+    # kept as its own service and counted as a rate conflict.
+    services = []
+    groups = {}
+    used = set()
+    stats = {'parsed': 0, 'duplicates': 0, 'rate_conflicts': 0}
+    carry_category = {}
+
+    for (kind, path, _, _), records, last_category in results:
+        for record in records:
+            stats['parsed'] += 1
+            if record['category'] is None:
+                record['category'] = carry_category.get(path, 'GENERAL')
+
+            entries = groups.setdefault((record['family'], record['key']), [])
+            existing = next((entry for entry in entries if entry['rates'] == record['rates']), None)
+            if existing is not None:
+                stats['duplicates'] += 1
+                if record['source'] not in existing['sources']:
+                    existing['sources'].append(record['source'])
+                continue
+            if entries:
+                stats['rate_conflicts'] += 1
+
+            code = record.get('code')
+            if code is None:
+                start = RGHS_CODE_START if record['family'] == 'RGHS' else 1
+                code = registry.assign(record['family'], record['name'], start=start, key=record['id_key'])
+                if code in used:
+                    code = registry.assign(record['family'], record['name'], start=start,
+                                           key=priced_key(record['name'], record['rates']))
+            used.add(code)
+            entry = {
+                'code': code,
+                'family': record['family'],
+                'name': record['name'],
+                'category': record['category'],
+                'rates': record['rates'],
+                'sources': [record['source']],
+            }
+            entries.append(entry)
+            services.append(entry)
+        if last_category is not None:
+            carry_category[path] = last_category
+
+    return services, stats
+
+def ingest(sources, workers=None, chunk_bytes=CHUNK_BYTES, registry=None):
+    registry = registry or ServiceIdRegistry()
+    tasks = [chunk for kind, path in sources for chunk in plan_chunks(kind, path, chunk_bytes)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(parse_task, tasks))
+    services, stats = merge_results(results, registry)
+    stats['sources'] = len(sources)
+    stats['chunks'] = len(tasks)
+    stats['services'] = len(services)
+    return services, stats
+
+def write_master(services, output_file):
+    with open(output_file, 'w', buffering=BUFFER_SIZE) as f:
+        f.write("[\n")
+        for i, service in enumerate(services):
+            f.write(json.dumps(service, ensure_ascii=False))
+            f.write(",\n" if i < len(services) - 1 else "\n")
+        f.write("]\n")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse every tariff source in parallel into one deduplicated service master")
+    parser.add_argument('--tariff-dir', default=TARIFF_DIR)
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--chunk-mb', type=float, default=CHUNK_BYTES / (1 << 20))
+    parser.add_argument('--output', default=MASTER_FILE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    registry = ServiceIdRegistry()
+    sources = discover_sources(args.tariff_dir)
+    services, stats = ingest(sources, args.workers, int(args.chunk_mb * (1 << 20)), registry)
+    write_master(services, args.output)
+    registry.save()
+
+    elapsed = time.perf_counter() - started
+    print(f"Ingested {stats['sources']} sources in {stats['chunks']} chunks: {stats['parsed']} records -> "
+          f"{stats['services']} services ({stats['duplicates']} duplicates merged, {stats['rate_conflicts']} kept at differing rates) "
+          f"in {elapsed:.2f}s. Wrote {args.output}.")
@@ -0,0 +1,440 @@
+import argparse
+import csv
+import heapq
+import json
+import os
+import pickle
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import date
+from itertools import groupby
+from operator import itemgetter
+
+from catalog_loader import connect
+from catalog_manifest import write_if_changed
+from export_stream import EXPORT_FILE, iter_tables, load_index, read_rows
+from revenue_snapshot import iso_date
+
+OUTPUT_DIR = 'ledger_reconciliation'
+
+# Rows sorted in memory before a run is spilled to disk; the join then merges
+# the runs, so memory stays bounded however many rows there are
+RUN_ROWS = 500_000
+SPILL_BATCH_ROWS = 10_000
+
+# A transaction_date this many days away from created_at is reported as drift
+DRIFT_DAYS = 7
+
+# Tuples flowing through the join. Sort keys come first.
+#   patient:     (id, patient_code, date_of_entry, name)
+#   transaction: (patient_id, id, amount, status, transaction_date, created_at)
+#   refund:      (patient_id, id, amount, created_at)
+# Both patient_id columns are patients.id. Dates are 'YYYY-MM-DD' or None; created_at is kept as the raw timestamp
+# text, as the refunds route compares it to a date (see refund_in_range).
+
+# /api/transactions/for-ledger, reduced to per-day totals. Run on Postgres or
+# on the SQLite stand-in to check the engine's sql_daily totals.
+LEDGER_SQL = """
+SELECT COALESCE(CAST(t.transaction_date AS TEXT), CAST(DATE(t.created_at) AS TEXT)) AS day,
+       COUNT(*), SUM(t.amount)
+FROM patient_transactions t
+LEFT JOIN patients p ON t.patient_id = p.id
+WHERE (
+  (t.transaction_date IS NOT NULL AND t.transaction_date >= {p} AND t.transaction_date <= {p})
+  OR
+  (t.transaction_date IS NULL AND DATE(t.created_at) >= {p} AND DATE(t.created_at) <= {p})
+)
+GROUP BY 1
+ORDER BY 1
+"""
+
+# /api/patient_refunds, reduced the same way
+REFUNDS_SQL = """
+SELECT CAST(DATE(r.created_at) AS TEXT) AS day, COUNT(*), SUM(r.amount)
+FROM patient_refunds r
+LEFT JOIN patients p ON r.patient_id = p.id
+WHERE r.created_at >= {p} AND r.created_at <= {p}
+GROUP BY 1
+ORDER BY 1
+"""
+
+STANDIN_SCHEMA = """
+CREATE TABLE patients (id TEXT PRIMARY KEY, patient_id TEXT, first_name TEXT, last_name TEXT, date_of_entry TEXT);
+CREATE TABLE patient_transactions (id TEXT PRIMARY KEY, patient_id TEXT, amount REAL, status TEXT,
+                                   transaction_date TEXT, created_at TEXT);
+CREATE TABLE patient_refunds (id TEXT PRIMARY KEY, patient_id TEXT, amount REAL, created_at TEXT);
+CREATE INDEX idx_patient_transactions_transaction_date ON patient_transactions (transaction_date);
+CREATE INDEX idx_patient_transactions_created_at ON patient_transactions (created_at);
+"""
+
+def patient_tuple(row):
+    name = ' '.join(part for part in (row.get('first_name'), row.get('last_name')) if part)
+    return (row['id'], row.get('patient_id') or '', iso_date(row.get('date_of_entry')), name)
+
+def transaction_tuple(row):
+    transaction_date = row.get('transaction_date')
+    return (row.get('patient_id') or '', row['id'], float(row.get('amount') or 0), row.get('status') or '',
+            str(transaction_date)[:10] if transaction_date is not None else None, str(row.get('created_at') or ''))
+
+def refund_tuple(row):
+    return (row.get('patient_id') or '', row['id'], float(row.get('amount') or 0), str(row.get('created_at') or ''))
+
+TUPLES = {'patients': patient_tuple, 'patient_transactions': transaction_tuple, 'patient_refunds': refund_tuple}
+
+class Source:
+    # Re-iterable row streams for the three tables; each call streams again
+    def __init__(self, tables):
+        self.tables = tables
+
+    def rows(self, table):
+        return self.tables[table]()
+
+def export_source(path=EXPORT_FILE):
+    # Tables missing from the export (it has no patient_refunds) are empty
+    def table(name):
+        def rows():
+            for table_name, table_rows in iter_tables(path):
+                if table_name == name:
+                    yield from map(TUPLES[name], table_rows)
+                    return
+        return rows
+    return Source({name: table(name) for name in TUPLES})
+
+def split_source(output_dir):
+    index = load_index(output_dir)
+
+    def table(name):
+        def rows():
+            if name in index['tables']:
+                yield from map(TUPLES[name], read_rows(name, output_dir=output_dir, index=index))
+        return rows
+    return Source({name: table(name) for name in TUPLES})
+
+def database_source(database_url):
+    queries = {
+        'patients': "SELECT id::text, patient_id, date_of_entry::text, CONCAT_WS(' ', first_name, last_name) FROM patients",
+        'patient_transactions': "SELECT patient_id::text, id::text, amount, status, transaction_date::text, "
+                                "created_at::text FROM patient_transactions",
+        'patient_refunds': "SELECT patient_id::text, id::text, amount, created_at::text FROM patient_refunds",
+    }
+
+    def table(name):
+        def rows():
+            conn = connect(database_url)
+            try:
+                with conn.cursor(name=f"ledger_{name}") as cursor:
+                    cursor.itersize = SPILL_BATCH_ROWS * 5
+                    cursor.execute(queries[name])
+                    for row in cursor:
+                        if name == 'patients':
+                            yield (row[0], row[1] or '', iso_date(row[2]), row[3] or '')
+                        elif name == 'patient_transactions':
+                            yield (row[0] or '', row[1], float(row[2] or 0), row[3] or '',
+                                   row[4][:10] if row[4] else None, row[5] or '')
+                        else:
+                            yield (row[0] or '', row[1], float(row[2] or 0), row[3] or '')
+            finally:
+                conn.close()
+        return rows
+    return Source({name: table(name) for name in TUPLES})
+
+def spill(rows, workdir):
+    fd, path = tempfile.mkstemp(dir=workdir, suffix='.run')
+    with os.fdopen(fd, 'wb') as f:
+        for i in range(0, len(rows), SPILL_BATCH_ROWS):
+            pickle.dump(rows[i:i + SPILL_BATCH_ROWS], f, pickle.HIGHEST_PROTOCOL)
+    return path
+
+def read_run(path):
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+def external_sort(rows, key, workdir, run_rows=RUN_ROWS):
+    # Sorted runs of run_rows spilled to workdir, merged lazily; a single run
+    # never touches the disk
+    runs = []
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= run_rows:
+            batch.sort(key=key)
+            runs.append(spill(batch, workdir))
+            batch = []
+    batch.sort(key=key)
+    if not runs:
+        return iter(batch)
+    runs.append(spill(batch, workdir))
+    return heapq.merge(*(read_run(path) for path in runs), key=key)
+
+def merge_groups(patients, *streams):
+    # Sort-merge join: yields (key, patients, rows of each stream) per key, in
+    # key order. Every input must already be sorted by its first field.
+    def tag_rows(tag, rows):
+        for row in rows:
+            yield row[0], tag, row
+
+    tagged = [tag_rows(tag, rows) for tag, rows in enumerate((patients,) + streams)]
+    merged = heapq.merge(*tagged, key=itemgetter(0, 1))
+    for key, items in groupby(merged, key=itemgetter(0)):
+        groups = [[] for _ in range(len(streams) + 1)]
+        for _, tag, row in items:
+            groups[tag].append(row)
+        yield key, groups[0], groups[1:]
+
+def in_range(day, start, end):
+    return day is not None and (start is None or day >= start) and (end is None or day <= end)
+
+def refund_in_range(created_at, start, end):
+    # The refunds route compares the created_at timestamp to bare dates, so the
+    # end date only includes refunds at exactly midnight
+    day = created_at[:10]
+    if start is not None and day < start:
+        return False
+    if end is None or day < end:
+        return True
+    return day == end and created_at[11:].strip('0:.') in ('', '+', 'Z')
+
+def days_apart(a, b):
+    return abs((date.fromisoformat(a) - date.fromisoformat(b)).days)
+
+class Reconciliation:
+    def __init__(self, output_dir, start=None, end=None, drift_days=DRIFT_DAYS):
+        self.output_dir = output_dir
+        self.start = start
+        self.end = end
+        self.drift_days = drift_days
+        # Ledger day (what the operations ledger shows) ->
+        # [revenue, refunds, revenue entries, refund entries]
+        self.daily = {}
+        # Day the API selects rows by -> [rows, amount], for verification
+        self.sql_daily = {}
+        self.sql_refunds_daily = {}
+        self.mismatch_counts = {}
+        self.patients = 0
+        self.transactions = 0
+        self.refunds = 0
+
+    def mismatch(self, kind, row_id, patient, detail):
+        self.mismatch_counts[kind] = self.mismatch_counts.get(kind, 0) + 1
+        self.mismatch_writer.writerow([kind, row_id, patient, detail])
+
+    def add_day(self, day, amount, refund):
+        entry = self.daily.setdefault(day, [0.0, 0.0, 0, 0])
+        entry[1 if refund else 0] += amount
+        entry[3 if refund else 2] += 1
+
+    def patient_group(self, key, patients, transactions, refunds):
+        patient = patients[0] if patients else None
+        date_of_entry = patient[2] if patient else None
+        charged = refunded = 0.0
+        days = []
+        for _, row_id, amount, status, transaction_date, created_at in transactions:
+            created_day = created_at[:10] or None
+            sql_day = transaction_date or created_day
+            if not in_range(sql_day, self.start, self.end):
+                continue
+            self.transactions += 1
+            entry = self.sql_daily.setdefault(sql_day, [0, 0.0])
+            entry[0] += 1
+            entry[1] += amount
+            if patient is None:
+                self.mismatch('orphan_transaction', row_id, key, "patient_id matches no patients.id")
+            if (transaction_date and created_day and transaction_date != created_day
+                    and days_apart(transaction_date, created_day) > self.drift_days):
+                self.mismatch('date_drift', row_id, key, f"transaction_date {transaction_date}, created {created_day}")
+            if status == 'CANCELLED':
+                continue
+            ledger_day = transaction_date or date_of_entry or created_day
+            if ledger_day != sql_day:
+                self.mismatch('ledger_date_differs', row_id, key, f"selected by {sql_day}, shown on {ledger_day}")
+            days.append(ledger_day)
+            if amount < 0:
+                refunded -= amount
+                self.add_day(ledger_day, -amount, True)
+            else:
+                charged += amount
+                self.add_day(ledger_day, amount, False)
+        for _, row_id, amount, created_at in refunds:
+            if not refund_in_range(created_at, self.start, self.end):
+                continue
+            self.refunds += 1
+            entry = self.sql_refunds_daily.setdefault(created_at[:10], [0, 0.0])
+            entry[0] += 1
+            entry[1] += amount
+            if patient is None:
+                self.mismatch('orphan_refund', row_id, key,
+                              "patient_id matches no patients.id; the ledger falls back to created_at")
+            ledger_day = date_of_entry or created_at[:10]
+            days.append(ledger_day)
+            refunded += amount
+            self.add_day(ledger_day, amount, True)
+
+        if not days:
+            return
+        if refunded > charged + 0.005:
+            self.mismatch('over_refund', key, key, f"refunded {refunded:.2f} of {charged:.2f} charged")
+        self.patients += 1
+        self.patient_writer.writerow([key, patient[1] if patient else '', patient[3] if patient else '',
+                                      f"{charged:.2f}", f"{refunded:.2f}", f"{charged - refunded:.2f}",
+                                      min(days), max(days)])
+
+    def run(self, source, workdir):
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(os.path.join(self.output_dir, 'patients.csv'), 'w', newline='', encoding='utf-8') as patients_file, \
+                open(os.path.join(self.output_dir, 'mismatches.csv'), 'w', newline='', encoding='utf-8') as mismatch_file:
+            self.patient_writer = csv.writer(patients_file)
+            self.patient_writer.writerow(['patient', 'patient_code', 'name', 'charged', 'refunded', 'balance',
+                                          'first_day', 'last_day'])
+            self.mismatch_writer = csv.writer(mismatch_file)
+            self.mismatch_writer.writerow(['kind', 'id', 'patient', 'detail'])
+
+            refunds = external_sort(source.rows('patient_refunds'), itemgetter(0), workdir)
+            patients = external_sort(source.rows('patients'), itemgetter(0), workdir)
+            transactions = external_sort(source.rows('patient_transactions'), itemgetter(0), workdir)
+            for key, group_patients, (group_transactions, group_refunds) in merge_groups(patients, transactions, refunds):
+                if len(group_patients) > 1:
+                    self.mismatch('duplicate_patient_id', key, key, f"{len(group_patients)} patients share it")
+                self.patient_group(key, group_patients, group_transactions, group_refunds)
+
+        with open(os.path.join(self.output_dir, 'daily.csv'), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['day', 'revenue', 'refunds', 'net', 'revenue_entries', 'refund_entries'])
+            for day in sorted(self.daily, key=lambda day: day or ''):
+                revenue, refunds, revenue_entries, refund_entries = self.daily[day]
+                writer.writerow([day or '', f"{revenue:.2f}", f"{refunds:.2f}", f"{revenue - refunds:.2f}",
+                                 revenue_entries, refund_entries])
+        return self.summary()
+
+    def summary(self):
+        return {
+            'start': self.start,
+            'end': self.end,
+            'patients': self.patients,
+            'transactions': self.transactions,
+            'refunds': self.refunds,
+            'revenue': round(sum(entry[0] for entry in self.daily.values()), 2),
+            'refunded': round(sum(entry[1] for entry in self.daily.values()), 2),
+            'mismatches': dict(sorted(self.mismatch_counts.items())),
+        }
+
+def reconcile(source, output_dir=OUTPUT_DIR, start=None, end=None, drift_days=DRIFT_DAYS):
+    with tempfile.TemporaryDirectory() as workdir:
+        reconciliation = Reconciliation(output_dir, start, end, drift_days)
+        summary = reconciliation.run(source, workdir)
+    write_if_changed(os.path.join(output_dir, 'summary.json'), json.dumps(summary, indent=2) + "\n")
+    return reconciliation
+
+def load_standin(source, path=':memory:'):
+    # SQLite copy of the three tables with the columns the routes read, for
+    # checking the engine where no Postgres is at hand
+    db = sqlite3.connect(path)
+    db.executescript(STANDIN_SCHEMA)
+    db.executemany("INSERT INTO patients VALUES (?, ?, ?, '', ?)",
+                   ((p[0], p[1], p[2], p[3]) for p in source.rows('patients')))
+    db.executemany("INSERT INTO patient_transactions VALUES (?, ?, ?, ?, ?, ?)",
+                   ((t[1], t[0], t[2], t[3], t[4], t[5]) for t in source.rows('patient_transactions')))
+    db.executemany("INSERT INTO patient_refunds VALUES (?, ?, ?, ?)",
+                   ((r[1], r[0], r[2], r[3]) for r in source.rows('patient_refunds')))
+    db.commit()
+    return db
+
+def verify(reconciliation, db, placeholder='?'):
+    # Compares the engine's per-day counts and sums with the routes' SQL over
+    # the same range; returns a list of differences
+    # Year 1, as Postgres has no year 0
+    start = reconciliation.start or '0001-01-01'
+    end = reconciliation.end or '9999-12-31'
+    cursor = db.cursor()
+    differences = []
+    checks = [(LEDGER_SQL, [start, end, start, end], reconciliation.sql_daily, 'transactions'),
+              (REFUNDS_SQL, [start, end], reconciliation.sql_refunds_daily, 'refunds')]
+    for sql, params, engine, label in checks:
+        cursor.execute(sql.format(p=placeholder), params)
+        expected = {day: (count, float(total or 0)) for day, count, total in cursor.fetchall()}
+        for day in sorted(set(expected) | set(engine)):
+            count, total = expected.get(day, (0, 0.0))
+            got_count, got_total = engine.get(day, (0, 0.0))
+            if count != got_count or abs(total - got_total) > 0.005:
+                differences.append(f"{label} {day}: SQL {count} rows / {total:.2f}, engine {got_count} rows / {got_total:.2f}")
+    return differences
+
+def synthetic_source(patients, transactions_per_patient=10, refund_rate=0.02, seed=0):
+    # Deterministic random data, regenerated on every pass, for scale runs
+    days = [f"2024-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)]
+
+    def patient_rows():
+        draw = random.Random(seed).random
+        for i in range(patients):
+            day = days[int(draw() * len(days))]
+            yield (f"p{i:09d}", f"P{i:09d}", day if draw() < 0.9 else None, f"Patient {i}")
+
+    def transaction_rows():
+        draw = random.Random(seed + 1).random
+        for i in range(patients * transactions_per_patient):
+            patient = int(draw() * patients * 1.001)  # a few orphans
+            day = days[int(draw() * len(days))]
+            yield (f"p{patient:09d}", f"t{i:011d}", float(int(draw() * 5200) - 200),
+                   'CANCELLED' if draw() < 0.01 else 'COMPLETED',
+                   day if draw() < 0.95 else None, f"{day}T{int(draw() * 24):02d}:15:00.000000")
+
+    def refund_rows():
+        draw = random.Random(seed + 2).random
+        for i in range(int(patients * transactions_per_patient * refund_rate)):
+            day = days[int(draw() * len(days))]
+            yield (f"p{int(draw() * patients):09d}", f"r{i:011d}", float(50 + int(draw() * 950)),
+                   f"{day}T{int(draw() * 24):02d}:30:00.000000")
+
+    return Source({'patients': patient_rows, 'patient_transactions': transaction_rows, 'patient_refunds': refund_rows})
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the operations ledger offline and report balances and mismatches")
+    source_group = parser.add_mutually_exclusive_group()
+    source_group.add_argument('--export', metavar='JSON', help=f"read a Supabase export (default {EXPORT_FILE})")
+    source_group.add_argument('--split', metavar='DIR', help="read per-table NDJSON written by export_stream.py")
+    source_group.add_argument('--database-url', help="read the tables from Postgres")
+    source_group.add_argument('--synthetic', type=int, metavar='PATIENTS', help="generate PATIENTS patients with 10 transactions each")
+    parser.add_argument('--from', dest='start', metavar='YYYY-MM-DD')
+    parser.add_argument('--to', dest='end', metavar='YYYY-MM-DD')
+    parser.add_argument('--output', default=OUTPUT_DIR)
+    parser.add_argument('--drift-days', type=int, default=DRIFT_DAYS)
+    parser.add_argument('--verify', action='store_true',
+                        help="check daily totals against the routes' SQL (on --database-url, else a SQLite stand-in)")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        source = synthetic_source(args.synthetic)
+    elif args.split:
+        source = split_source(args.split)
+    elif args.database_url:
+        source = database_source(args.database_url)
+    else:
+        source = export_source(args.export or EXPORT_FILE)
+
+    started = time.perf_counter()
+    reconciliation = reconcile(source, args.output, args.start, args.end, args.drift_days)
+    seconds = time.perf_counter() - started
+    summary = reconciliation.summary()
+    print(f"Reconciled {summary['transactions']:,} transactions and {summary['refunds']:,} refunds for "
+          f"{summary['patients']:,} patients in {seconds:.2f}s: revenue {summary['revenue']:,.2f}, "
+          f"refunded {summary['refunded']:,.2f}.")
+    for kind, count in summary['mismatches'].items():
+        print(f"  {kind}: {count:,}")
+
+    if args.verify:
+        if args.database_url:
+            db = connect(args.database_url)
+            differences = verify(reconciliation, db, '%s')
+        else:
+            db = load_standin(source)
+            differences = verify(reconciliation, db)
+        db.close()
+        for difference in differences:
+            print(f"  MISMATCH {difference}")
+        print(f"Verified against the route SQL: {len(differences)} differing days.")
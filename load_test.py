@@ -0,0 +1,294 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timezone
+from urllib.parse import urlsplit
+
+DEFAULT_BASE_URL = os.environ.get('API_URL', 'http://localhost:3001')
+# The admin account the backend test-*.js scripts log in with
+DEFAULT_EMAIL = os.environ.get('LOAD_TEST_EMAIL', 'admin@indic.com')
+DEFAULT_PASSWORD = os.environ.get('LOAD_TEST_PASSWORD', 'admin123')
+RESULTS_FILE = 'load_test_results.json'
+
+# Concurrency:seconds per stage; the default ramps up to a busy OPD morning
+DEFAULT_STAGES = '5:20,20:30,50:30'
+REQUEST_TIMEOUT = 30.0
+PERCENTILES = (50, 95, 99)
+
+# Weighted mix of the routes reception and billing hit during OPD hours.
+# Paths are formatted with {today}, {month_start} and {icd10}.
+DEFAULT_MIX = [
+    {'name': 'opd-queues', 'path': '/api/opd-queues?date={today}', 'weight': 35},
+    {'name': 'patients', 'path': '/api/patients', 'weight': 10},
+    {'name': 'beds', 'path': '/api/beds', 'weight': 20},
+    {'name': 'icd10', 'path': '/api/icd10?q={icd10}', 'weight': 20},
+    {'name': 'for-ledger', 'path': '/api/transactions/for-ledger?start_date={month_start}&end_date={today}', 'weight': 15},
+]
+ICD10_QUERIES = ['fever', 'fracture', 'diabetes', 'hypertension', 'M54', 'J18', 'knee', 'back pain']
+
+class HttpError(Exception):
+    pass
+
+class Connection:
+    # One keep-alive HTTP/1.1 connection, as a browser tab would hold. Kept to
+    # the standard library so the harness runs wherever Python does.
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL: {base_url}")
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.ssl = parts.scheme == 'https'
+        self.prefix = parts.path.rstrip('/')
+        self.reader = None
+        self.writer = None
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl or None)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    async def request(self, method, path, body=None, token=None):
+        # Returns (status, body bytes); reconnects once if the server closed
+        # the idle connection
+        for attempt in (0, 1):
+            if self.writer is None:
+                await self.open()
+            try:
+                return await self._request(method, path, body, token)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.close()
+                if attempt:
+                    raise
+
+    async def _request(self, method, path, body, token):
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        headers = [f"{method} {self.prefix}{path} HTTP/1.1", f"Host: {self.host}:{self.port}",
+                   "Accept: application/json", "Connection: keep-alive", f"Content-Length: {len(payload)}"]
+        if payload:
+            headers.append("Content-Type: application/json")
+        if token:
+            headers.append(f"Authorization: Bearer {token}")
+        self.writer.write(("\r\n".join(headers) + "\r\n\r\n").encode('latin-1') + payload)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed before a response")
+        status = int(status_line.split()[1])
+        length = None
+        chunked = False
+        keep_alive = True
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            name = name.strip().lower()
+            value = value.strip()
+            if name == 'content-length':
+                length = int(value)
+            elif name == 'transfer-encoding' and 'chunked' in value.lower():
+                chunked = True
+            elif name == 'connection' and value.lower() == 'close':
+                keep_alive = False
+
+        if chunked:
+            parts = []
+            while True:
+                size = int((await self.reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                parts.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            data = b''.join(parts)
+        elif length is not None:
+            data = await self.reader.readexactly(length)
+        else:
+            data = await self.reader.read()
+            keep_alive = False
+        if not keep_alive:
+            self.close()
+        return status, data
+
+async def login(base_url, email, password):
+    connection = Connection(base_url)
+    try:
+        status, data = await connection.request('POST', '/api/auth/login', {'email': email, 'password': password})
+    finally:
+        connection.close()
+    if status != 200:
+        raise HttpError(f"Login as {email} failed with HTTP {status}: {data[:200]!r}")
+    return json.loads(data)['token']
+
+def load_mix(path=None):
+    if path is None:
+        return DEFAULT_MIX
+    with open(path, 'r', encoding='utf-8') as f:
+        mix = json.load(f)
+    for route in mix:
+        if not {'name', 'path', 'weight'} <= set(route):
+            raise ValueError(f"Route entries need name, path and weight: {route}")
+    return mix
+
+def parse_stages(spec):
+    stages = []
+    for part in spec.split(','):
+        concurrency, _, seconds = part.partition(':')
+        stages.append((int(concurrency), float(seconds)))
+    return stages
+
+def format_path(template, rng):
+    today = date.today()
+    return template.format(today=today.isoformat(), month_start=today.replace(day=1).isoformat(),
+                           icd10=rng.choice(ICD10_QUERIES))
+
+async def virtual_user(user, base_url, token, mix, deadline, samples, think, seed):
+    # Requests routes from the mix back to back (plus think time) on one
+    # connection until the stage deadline; appends (route, seconds, ok)
+    rng = random.Random(seed * 100_003 + user)
+    names = [route['name'] for route in mix]
+    weights = [route['weight'] for route in mix]
+    paths = {route['name']: route['path'] for route in mix}
+    connection = Connection(base_url)
+    try:
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            path = format_path(paths[name], rng)
+            started = time.perf_counter()
+            try:
+                status, _ = await asyncio.wait_for(connection.request('GET', path, token=token), REQUEST_TIMEOUT)
+                ok = status < 400
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError):
+                connection.close()
+                ok = False
+            samples.append((name, time.perf_counter() - started, ok))
+            if think:
+                await asyncio.sleep(rng.expovariate(1 / think))
+    finally:
+        connection.close()
+
+def percentile(ordered, p):
+    # Nearest-rank percentile of an already sorted list
+    if not ordered:
+        return None
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+def summarize(samples, seconds):
+    latencies = sorted(latency for _, latency, _ in samples)
+    errors = sum(1 for _, _, ok in samples if not ok)
+    summary = {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': errors / len(samples) if samples else 0.0,
+        'throughput_rps': len(samples) / seconds if seconds else 0.0,
+        'mean_ms': sum(latencies) / len(latencies) * 1000 if latencies else None,
+        'max_ms': latencies[-1] * 1000 if latencies else None,
+    }
+    for p in PERCENTILES:
+        value = percentile(latencies, p)
+        summary[f"p{p}_ms"] = value * 1000 if value is not None else None
+    return summary
+
+async def run_stage(base_url, token, mix, concurrency, seconds, think, seed):
+    samples = []
+    started = time.perf_counter()
+    deadline = started + seconds
+    await asyncio.gather(*(virtual_user(user, base_url, token, mix, deadline, samples, think, seed)
+                           for user in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    by_route = {}
+    for sample in samples:
+        by_route.setdefault(sample[0], []).append(sample)
+    return {
+        'concurrency': concurrency,
+        'seconds': elapsed,
+        'routes': {name: summarize(route_samples, elapsed) for name, route_samples in sorted(by_route.items())},
+        'total': summarize(samples, elapsed),
+    }
+
+async def run_load_test(base_url, stages, mix, email=DEFAULT_EMAIL, password=DEFAULT_PASSWORD, think=0.0, seed=0):
+    token = await login(base_url, email, password)
+    results = []
+    for concurrency, seconds in stages:
+        stage = await run_stage(base_url, token, mix, concurrency, seconds, think, seed)
+        print_stage(stage)
+        results.append(stage)
+    return results
+
+def print_stage(stage):
+    print(f"{stage['concurrency']} users for {stage['seconds']:.1f}s:")
+    for name, summary in list(stage['routes'].items()) + [('TOTAL', stage['total'])]:
+        if not summary['requests']:
+            continue
+        print(f"  {name:<14} {summary['requests']:>7,} req  {summary['throughput_rps']:>8.1f} req/s  "
+              f"p50 {summary['p50_ms']:>8.1f}ms  p95 {summary['p95_ms']:>8.1f}ms  p99 {summary['p99_ms']:>8.1f}ms  "
+              f"errors {summary['error_rate']:.1%}")
+
+def compare(results, baseline, tolerance):
+    # Regressions against an earlier results file: p95 latency more than
+    # `tolerance` slower, or a higher error rate, at the same concurrency
+    regressions = []
+    previous = {stage['concurrency']: stage for stage in baseline['stages']}
+    for stage in results:
+        before = previous.get(stage['concurrency'])
+        if before is None:
+            continue
+        for name, summary in stage['routes'].items():
+            old = before['routes'].get(name)
+            if old is None or not old['requests'] or not summary['requests']:
+                continue
+            if old['p95_ms'] and summary['p95_ms'] > old['p95_ms'] * (1 + tolerance):
+                regressions.append(f"{name} at {stage['concurrency']} users: p95 {old['p95_ms']:.1f}ms -> "
+                                   f"{summary['p95_ms']:.1f}ms")
+            if summary['error_rate'] > old['error_rate'] + 0.01:
+                regressions.append(f"{name} at {stage['concurrency']} users: errors {old['error_rate']:.1%} -> "
+                                   f"{summary['error_rate']:.1%}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a weighted route mix against the backend with ramped concurrency")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--email', default=DEFAULT_EMAIL)
+    parser.add_argument('--password', default=DEFAULT_PASSWORD)
+    parser.add_argument('--stages', default=DEFAULT_STAGES, help="comma-separated USERS:SECONDS stages")
+    parser.add_argument('--mix', help="JSON list of {name, path, weight} routes (default: the OPD mix)")
+    parser.add_argument('--think-ms', type=float, default=0.0, help="mean think time between a user's requests")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=RESULTS_FILE)
+    parser.add_argument('--baseline', help="earlier results file; exit 1 on regressions against it")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed p95 slowdown against the baseline")
+    args = parser.parse_args()
+
+    stages = parse_stages(args.stages)
+    mix = load_mix(args.mix)
+    started_at = datetime.now(timezone.utc).isoformat()
+    results = asyncio.run(run_load_test(args.base_url, stages, mix, args.email, args.password,
+                                        args.think_ms / 1000, args.seed))
+    report = {
+        'generated_at': started_at,
+        'base_url': args.base_url,
+        'mix': mix,
+        'think_ms': args.think_ms,
+        'stages': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
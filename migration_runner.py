@@ -0,0 +1,799 @@
+import argparse
+import fnmatch
+import hashlib
+import heapq
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from catalog_loader import DEFAULT_DATABASE_URL, connect, sqlstate
+from catalog_manifest import write_if_changed
+
+# Directories whose *.sql files are migrations, in the order ties are broken
+SOURCES = ('.', 'database_migrations', 'backend/migrations', 'migrations')
+REPORT_FILE = 'migration_report.json'
+# Scripts written to be pasted into the SQL editor once, whose statements look
+# like a migration: they only run when --allow names them
+HAND_RUN = {
+    'backend/migrations/SUPABASE_RUN_THIS.sql':
+        "one-off fix for the Supabase SQL editor; redefines the payment_mode and transaction_type checks",
+}
+JOBS = 8
+
+LEDGER_DDL = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+  name TEXT PRIMARY KEY,
+  checksum CHAR(64) NOT NULL,
+  statements INTEGER NOT NULL,
+  duration_ms INTEGER,
+  applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+)
+"""
+
+# duration_ms stays NULL for scripts recorded with --mark-applied
+RECORD_SQL = """
+INSERT INTO schema_migrations (name, checksum, statements, duration_ms)
+VALUES (%s, %s, %s, %s)
+ON CONFLICT (name) DO UPDATE SET
+  checksum = EXCLUDED.checksum,
+  statements = EXCLUDED.statements,
+  duration_ms = EXCLUDED.duration_ms,
+  applied_at = NOW()
+"""
+
+# Session advisory lock, so two runners never apply the same script
+LOCK_KEY = 4_216_087_305
+# A migration waiting this long on a table lock gives up instead of stalling
+# the application's queries queued behind it; it is retried later in the run
+LOCK_TIMEOUT = '30s'
+RETRIES = 2
+RETRY_STATES = {'40P01', '55P03'}  # deadlock_detected, lock_not_available
+
+# Everything the splitter must step over: comments, quoted strings and
+# identifiers, dollar quotes, psql meta-commands and statement ends
+LEXEME = re.compile(r'''--[^\n]*|/\*|(?<![\w$])[eE]'|'|"(?:[^"]|"")*"|(?<![\w$])\$(?:[A-Za-z_]\w*)?\$|;|^[ \t]*\\[^\n]*''',
+                    re.MULTILINE)
+COMMENT_MARK = re.compile(r"/\*|\*/")
+
+IDENT = r'(?:"(?:[^"]|"")+"|[A-Za-z_][\w$]*)'
+NAME = rf'{IDENT}(?:\s*\.\s*{IDENT})?'
+NAME_RE = re.compile(NAME)
+IDENT_RE = re.compile(IDENT)
+QUOTED = re.compile(r'"(?:[^"]|"")*"')
+
+CREATES = re.compile(rf"\bCREATE\s+(?:OR\s+REPLACE\s+)?(?:(?:GLOBAL|LOCAL)\s+)?(?:(?:TEMP|TEMPORARY|UNLOGGED)\s+)?"
+                     rf"(?:MATERIALIZED\s+)?(?:TABLE|VIEW|FUNCTION|PROCEDURE|TYPE|SEQUENCE|EXTENSION|SCHEMA|DOMAIN)\s+"
+                     rf"(?:IF\s+NOT\s+EXISTS\s+)?({NAME})", re.IGNORECASE)
+CREATE_INDEX = re.compile(rf"\bCREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?"
+                          rf"(?:(?!ON\b)({NAME})\s+)?ON\s+(?:ONLY\s+)?({NAME})", re.IGNORECASE)
+CREATE_ON = re.compile(rf"\bCREATE\s+(?:OR\s+REPLACE\s+)?(?:CONSTRAINT\s+)?(?:TRIGGER|POLICY)\s+{NAME}.*?\bON\s+({NAME})",
+                       re.IGNORECASE | re.DOTALL)
+DROP_ON = re.compile(rf"\bDROP\s+(?:TRIGGER|POLICY)\s+(?:IF\s+EXISTS\s+)?{NAME}\s+ON\s+({NAME})", re.IGNORECASE)
+DROPS = re.compile(rf"\bDROP\s+(?:MATERIALIZED\s+)?(TABLE|VIEW|FUNCTION|PROCEDURE|TYPE|SEQUENCE|INDEX|SCHEMA|DOMAIN|"
+                   rf"EXTENSION)\s+(?:CONCURRENTLY\s+)?(?:IF\s+EXISTS\s+)?"
+                   rf"({NAME}(?:\s*\([^)]*\))?(?:\s*,\s*{NAME}(?:\s*\([^)]*\))?)*)", re.IGNORECASE)
+ALTERS = re.compile(rf"\bALTER\s+(?:MATERIALIZED\s+)?(?:TABLE|VIEW|FUNCTION|PROCEDURE|TYPE|SEQUENCE|INDEX|SCHEMA|DOMAIN)\s+"
+                    rf"(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?({NAME})", re.IGNORECASE)
+RENAMES = re.compile(rf"\bRENAME\s+TO\s+({NAME})", re.IGNORECASE)
+DATA_WRITES = re.compile(rf"\b(INSERT\s+INTO|DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?|COPY)\s+(?:ONLY\s+)?({NAME})",
+                         re.IGNORECASE)
+UPDATES = re.compile(rf"\bUPDATE\s+(?:ONLY\s+)?({NAME})", re.IGNORECASE)
+COMMENTS = re.compile(rf"\bCOMMENT\s+ON\s+(TABLE|COLUMN|VIEW|FUNCTION|INDEX|TYPE|SEQUENCE)\s+({NAME}(?:\s*\.\s*{IDENT})?)",
+                      re.IGNORECASE)
+GRANTS = re.compile(rf"\b(?:GRANT|REVOKE)\b[^;]*?\bON\s+(?:(TABLE|FUNCTION|SEQUENCE|SCHEMA|ALL)\s+)?({NAME})",
+                    re.IGNORECASE)
+READS = re.compile(rf"\b(?:FROM|JOIN|REFERENCES|EXECUTE\s+(?:FUNCTION|PROCEDURE))\s+(?:ONLY\s+)?({NAME})", re.IGNORECASE)
+# Function calls, e.g. a column DEFAULT needing a function another script creates
+CALLS = re.compile(r"\b([A-Za-z_][\w$]*(?:\s*\.\s*[A-Za-z_][\w$]*)?)\s*\(")
+# `ON UPDATE CASCADE`, `BEFORE INSERT OR UPDATE ON`, `FOR UPDATE`, `DO UPDATE SET`
+# and `GRANT UPDATE ON` are not UPDATE statements
+NOT_UPDATED = {'set', 'on', 'of', 'using', 'to', 'with', 'cascade', 'restrict', 'no', 'or', 'for', 'each'}
+UPDATE_CONTEXT = {'on', 'or', 'before', 'after', 'for', 'do', 'of', 'instead'}
+FUNCTION_STATEMENT = re.compile(r"\s*CREATE\s+(?:OR\s+REPLACE\s+)?(?:FUNCTION|PROCEDURE)\b", re.IGNORECASE)
+TRANSACTION_CONTROL = re.compile(r"\s*(?:BEGIN|COMMIT|ROLLBACK|END|START\s+TRANSACTION|SAVEPOINT|RELEASE)\b"
+                                 r"(?:\s+(?:TRANSACTION|WORK))?\s*$", re.IGNORECASE)
+# Dynamic SQL in a DO block touches tables no pattern can see
+DYNAMIC = re.compile(r"\bEXECUTE\b(?!\s+(?:FUNCTION|PROCEDURE)\b)", re.IGNORECASE)
+# Statements Postgres refuses to run inside a transaction block
+NON_TRANSACTIONAL = re.compile(r"\bCONCURRENTLY\b|\bVACUUM\b|\bCREATE\s+DATABASE\b|\bALTER\s+SYSTEM\b", re.IGNORECASE)
+CATALOG_SCHEMAS = {'information_schema', 'pg_catalog'}
+
+def blank(text):
+    # Spaces in place of everything but newlines, so offsets keep their lines
+    return re.sub(r"[^\n]", ' ', text)
+
+def comment_end(text, position):
+    # Postgres block comments nest
+    depth = 0
+    for match in COMMENT_MARK.finditer(text, position):
+        depth += 1 if match.group() == '/*' else -1
+        if depth == 0:
+            return match.end()
+    return len(text)
+
+def string_end(text, position, escapes):
+    # '' is a quote in any string; E'' strings also take backslash escapes
+    while True:
+        close = text.find("'", position)
+        if close < 0:
+            return len(text)
+        if escapes:
+            backslashes = close - len(text[position:close].rstrip('\\')) - position
+            if backslashes % 2:
+                position = close + 1
+                continue
+        if text.startswith("'", close + 1):
+            position = close + 2
+            continue
+        return close + 1
+
+def mask(text, top=True):
+    # `text` with comments, string contents and psql meta-commands blanked and
+    # dollar quotes unwrapped, plus the offsets of the semicolons that end
+    # statements and the spans of meta-commands. Dollar-quoted bodies are
+    # masked the same way, since DO blocks hold statements that matter.
+    out = []
+    ends = []
+    meta = []
+    position = 0
+    while (match := LEXEME.search(text, position)) is not None:
+        start = match.start()
+        lexeme = match.group()
+        out.append(text[position:start])
+        end = match.end()
+        if lexeme == ';':
+            ends.append(start)
+            out.append(lexeme)
+        elif lexeme == '/*':
+            end = comment_end(text, start)
+            out.append(blank(text[start:end]))
+        elif lexeme.startswith('--'):
+            out.append(blank(lexeme))
+        elif lexeme.startswith('"'):
+            out.append(lexeme)
+        elif lexeme.endswith("'"):
+            end = string_end(text, end, escapes=len(lexeme) == 2)
+            out.append(blank(text[start:end]))
+        elif lexeme.startswith('$'):
+            close = text.find(lexeme, end)
+            if close < 0:
+                close = end = len(text)
+            else:
+                end = close + len(lexeme)
+            body = mask(text[match.end():close], top=False)[0]
+            out.append(' ' * len(lexeme) + body + ' ' * (end - close))
+        elif top:
+            meta.append((start, end))
+            out.append(blank(lexeme))
+        else:
+            out.append(lexeme)
+        position = end
+    out.append(text[position:])
+    return ''.join(out), ends, meta
+
+def split_statements(text):
+    # (line, sql, code) per statement, where `sql` is the text to execute and
+    # `code` the same span masked for analysis. Also returns the whole script
+    # with meta-commands blanked, ready to run as one batch.
+    code, ends, meta = mask(text)
+    runnable = text
+    for start, end in reversed(meta):
+        runnable = runnable[:start] + blank(runnable[start:end]) + runnable[end:]
+    statements = []
+    start = 0
+    for end in ends + [len(text)]:
+        piece = code[start:end]
+        if piece.strip():
+            first = start + len(piece) - len(piece.lstrip())
+            statements.append((text.count('\n', 0, first) + 1, runnable[first:end].strip(), piece.strip()))
+        start = end + 1
+    return statements, runnable, len(meta)
+
+def object_name(raw):
+    # Lower-cased unless quoted, without the public schema; None for catalogs
+    parts = [part[1:-1].replace('""', '"') if part.startswith('"') else part.lower()
+             for part in IDENT_RE.findall(raw)]
+    if len(parts) > 1 and parts[0] == 'public':
+        parts = parts[1:]
+    if parts[0] in CATALOG_SCHEMAS or parts[-1].startswith('pg_'):
+        return None
+    return '.'.join(parts)
+
+def names(raw):
+    return [name for name in map(object_name, NAME_RE.findall(re.sub(r"\([^)]*\)", ' ', raw))) if name]
+
+def finditer(pattern, code, upper, quoted, keyword=None):
+    # Matches that do not start inside a quoted identifier such as a policy
+    # named "Users can update transactions". Most statements lack most
+    # keywords, and a substring test is far cheaper than the pattern.
+    if keyword and keyword not in upper:
+        return
+    for match in pattern.finditer(code):
+        if not any(start < match.start() < end for start, end in quoted):
+            yield match
+
+def analyze(statements):
+    # The objects a script creates, changes and depends on, what it destroys,
+    # which of its statements rewrite existing rows, whether it only
+    # sets comments, whether it can run in a single transaction and whether it
+    # runs dynamic SQL. A function's body only runs when called, so what it
+    # touches counts as read and never as destructive or a data change.
+    creates, writes, reads = set(), set(), set()
+    destructive = []
+    updated = []
+    data_changes = []
+    remodelled, commented = set(), set()
+    transactional = True
+    dynamic = False
+    for line, _, code in statements:
+        if TRANSACTION_CONTROL.match(code) or NON_TRANSACTIONAL.search(code):
+            transactional = False
+        quoted = [match.span() for match in QUOTED.finditer(code)]
+        upper = code.upper()
+        function = FUNCTION_STATEMENT.match(code)
+        made, changed, used, altered = set(), set(), set(), set()
+        dropped, updates = [], []
+        for match in finditer(CREATES, code, upper, quoted, 'CREATE'):
+            made.update(names(match.group(1)))
+        for match in finditer(RENAMES, code, upper, quoted, 'RENAME'):
+            made.update(names(match.group(1)))
+        for match in finditer(CREATE_INDEX, code, upper, quoted, 'INDEX'):
+            made.update(names(match.group(1) or ''))
+            changed.update(names(match.group(2)))
+        for pattern, keyword in ((CREATE_ON, 'CREATE'), (DROP_ON, 'DROP'), (ALTERS, 'ALTER')):
+            for match in finditer(pattern, code, upper, quoted, keyword):
+                changed.update(names(match.group(1)))
+                altered.update(names(match.group(1)))
+        for match in finditer(DROPS, code, upper, quoted, 'DROP'):
+            changed.update(names(match.group(2)))
+            if match.group(1).upper() in ('TABLE', 'SCHEMA'):
+                dropped.append(f"line {line}: DROP {match.group(1).upper()} {', '.join(names(match.group(2)))}")
+        for match in finditer(DATA_WRITES, code, upper, quoted):
+            changed.update(names(match.group(2)))
+            verb = match.group(1).split()[0].upper()
+            if verb in ('DELETE', 'TRUNCATE'):
+                dropped.append(f"line {line}: {verb} {', '.join(names(match.group(2)))}")
+        for match in finditer(UPDATES, code, upper, quoted, 'UPDATE'):
+            before = re.search(r"(\w+)\s*$", code[:match.start()])
+            if before and before.group(1).lower() in UPDATE_CONTEXT or match.group(1).lower() in NOT_UPDATED:
+                continue
+            changed.update(names(match.group(1)))
+            updates.append((line, names(match.group(1))))
+        for match in finditer(COMMENTS, code, upper, quoted, 'COMMENT'):
+            target = NAME_RE.findall(match.group(2)) if match.group(1).upper() != 'COLUMN' else \
+                ['.'.join(IDENT_RE.findall(match.group(2))[:-1])]
+            changed.update(name for name in map(object_name, target) if name)
+            commented.update(name for name in map(object_name, target) if name)
+        for match in finditer(GRANTS, code, upper, quoted):
+            if (match.group(1) or '').upper() not in ('SCHEMA', 'ALL'):
+                changed.update(names(match.group(2)))
+        for pattern in (READS, CALLS):
+            for match in finditer(pattern, code, upper, quoted):
+                used.update(names(match.group(1)))
+        if function:
+            header = CREATES.match(code.lstrip())
+            made = set(names(header.group(1))) if header else set()
+            used |= changed
+            changed = set()
+        else:
+            destructive.extend(reason for reason in dropped if reason not in destructive)
+            updated.extend(updates)
+            remodelled |= made | altered
+            dynamic = dynamic or DYNAMIC.search(code) is not None
+        creates |= made
+        writes |= made | changed
+        reads |= used
+    # An UPDATE backfilling a table the script itself creates or alters is part
+    # of the schema change; any other one rewrites existing rows
+    for line, targets in updated:
+        rows = [name for name in targets if name not in remodelled]
+        if rows:
+            data_changes.append(f"line {line}: UPDATE {', '.join(rows)}")
+    comments_only = bool(writes) and writes <= commented and not remodelled and not data_changes
+    return creates, writes, reads - writes, destructive, data_changes, comments_only, transactional, dynamic
+
+def natural_key(name):
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r"(\d+)", name)]
+
+def checksum(text):
+    # Line endings are normalised so a checkout on Windows matches the ledger
+    return hashlib.sha256(text.replace('\r\n', '\n').encode('utf-8')).hexdigest()
+
+def load_script(path, name):
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        text = f.read()
+    statements, runnable, meta = split_statements(text)
+    creates, writes, reads, destructive, data_changes, comments_only, transactional, dynamic = analyze(statements)
+    # Setting comments alone changes nothing later scripts need; such scripts
+    # poke a schema cache, like RESET_SUPABASE_CACHE.sql
+    if not writes or comments_only:
+        kind = 'check'
+    elif name in HAND_RUN:
+        kind = 'manual'
+        data_changes = [HAND_RUN[name]] + data_changes
+    elif destructive:
+        kind = 'destructive'
+    elif data_changes:
+        kind = 'data'
+    else:
+        kind = 'migration'
+    return {
+        'name': name,
+        'path': path,
+        'checksum': checksum(text),
+        'statements': statements,
+        'sql': runnable,
+        'meta_commands': meta,
+        'creates': creates,
+        'writes': writes,
+        'reads': reads,
+        'destructive': destructive,
+        'data_changes': data_changes,
+        'transactional': transactional,
+        'dynamic': dynamic,
+        'kind': kind,
+    }
+
+def discover(sources=SOURCES, only=(), exclude=()):
+    # Every *.sql file directly in each source, sources in order and files in
+    # natural order (002 before 010). Names are paths relative to the repo.
+    scripts = []
+    seen = set()
+    for source in sources:
+        for filename in sorted(os.listdir(source), key=natural_key):
+            path = os.path.normpath(os.path.join(source, filename))
+            name = path.replace(os.sep, '/')
+            if not filename.endswith('.sql') or not os.path.isfile(path) or name in seen:
+                continue
+            if only and not any(fnmatch.fnmatch(name, pattern) for pattern in only):
+                continue
+            if any(fnmatch.fnmatch(name, pattern) for pattern in exclude):
+                continue
+            seen.add(name)
+            scripts.append(load_script(path, name))
+    return scripts
+
+def execution_order(scripts):
+    # The listed order, except that the first script creating an object runs
+    # before every other script touching it, so ADD_X.sql sorting ahead of
+    # CREATE_X.sql still waits for its table. Scripts creating the object
+    # themselves need not wait, and scripts running dynamic SQL keep their
+    # listed place. A cycle releases its earliest listed script.
+    creator = {}
+    for i, script in enumerate(scripts):
+        for name in script['creates']:
+            creator.setdefault(name, i)
+    before = []
+    waiting = [0] * len(scripts)
+    followers = defaultdict(list)
+    for i, script in enumerate(scripts):
+        needs = {creator[name] for name in (script['writes'] | script['reads']) - script['creates'] if name in creator}
+        if script['dynamic']:
+            needs.update(range(i))
+        needs.discard(i)
+        before.append(needs)
+        for j in needs:
+            waiting[i] += 1
+            followers[j].append(i)
+    ready = [i for i, count in enumerate(waiting) if not count]
+    heapq.heapify(ready)
+    placed = [False] * len(scripts)
+    order = []
+    while len(order) < len(scripts):
+        i = heapq.heappop(ready) if ready else cycle_start(before, placed)
+        if placed[i]:
+            continue
+        placed[i] = True
+        order.append(scripts[i])
+        for k in followers[i]:
+            waiting[k] -= 1
+            if not waiting[k] and not placed[k]:
+                heapq.heappush(ready, k)
+    return order
+
+def cycle_start(before, placed):
+    # Every script left when nothing is ready waits on another one left, so
+    # walking those waits from any of them runs into a cycle
+    seen = []
+    i = placed.index(False)
+    while i not in seen:
+        seen.append(i)
+        i = min(j for j in before[i] if not placed[j])
+    return min(seen[seen.index(i):])
+
+def dependencies(ordered):
+    # The earlier scripts each script must wait for: the last writer of every
+    # object it touches and, for objects it writes, the readers since that
+    # writer. Scripts sharing nothing may run side by side. A script running
+    # dynamic SQL may touch anything, so it waits for everything before it
+    # and everything after it waits for it.
+    last_writer = {}
+    readers = defaultdict(list)
+    deps = {}
+    barrier = None
+    since_barrier = []
+    for script in ordered:
+        name = script['name']
+        if script['dynamic']:
+            deps[name] = set(since_barrier) | ({barrier} if barrier else set())
+            barrier = name
+            since_barrier = []
+            last_writer.clear()
+            readers.clear()
+            continue
+        since_barrier.append(name)
+        needs = {barrier} if barrier else set()
+        for obj in script['reads']:
+            if obj in last_writer:
+                needs.add(last_writer[obj])
+            readers[obj].append(name)
+        for obj in script['writes']:
+            if obj in last_writer:
+                needs.add(last_writer[obj])
+            needs.update(readers.pop(obj, ()))
+            last_writer[obj] = name
+        needs.discard(name)
+        deps[name] = needs
+    return deps
+
+def waves(ordered, deps):
+    # Scripts grouped by the earliest round they could run in with unlimited
+    # connections; the number of waves is the critical path
+    level = {}
+    for script in ordered:
+        level[script['name']] = 1 + max((level[dep] for dep in deps[script['name']]), default=0)
+    grouped = defaultdict(list)
+    for name, wave in level.items():
+        grouped[wave].append(name)
+    return [grouped[wave] for wave in sorted(grouped)]
+
+def ensure_ledger(conn):
+    cursor = conn.cursor()
+    cursor.execute(LEDGER_DDL)
+    conn.commit()
+
+def read_ledger(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT name, checksum FROM schema_migrations")
+    rows = dict(cursor.fetchall())
+    conn.commit()
+    return rows
+
+def existing_tables(conn):
+    # Tables already in the public schema, besides the ledger; Supabase
+    # creates its auth and storage schemas in every project
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM information_schema.tables WHERE table_type = 'BASE TABLE' "
+                   "AND table_schema = 'public' AND table_name <> 'schema_migrations'")
+    count = cursor.fetchone()[0]
+    conn.commit()
+    return count
+
+def classify(scripts, ledger):
+    # applied: same name and checksum; renamed: the checksum was applied under
+    # another name; changed: applied, but the file has been edited since
+    applied_checksums = set(ledger.values())
+    states = {}
+    for script in scripts:
+        recorded = ledger.get(script['name'])
+        if recorded == script['checksum']:
+            states[script['name']] = 'applied'
+        elif recorded is not None:
+            states[script['name']] = 'changed'
+        elif script['checksum'] in applied_checksums:
+            states[script['name']] = 'renamed'
+        else:
+            states[script['name']] = 'pending'
+    return states
+
+def record(cursor, script, seconds):
+    cursor.execute(RECORD_SQL, (script['name'], script['checksum'], len(script['statements']),
+                                None if seconds is None else round(seconds * 1000)))
+
+def error_line(script, error, statement_line=None):
+    # Postgres reports a 1-based offset into the batch it was sent
+    position = getattr(getattr(error, 'diag', None), 'statement_position', None)
+    if statement_line is None and position:
+        return script['sql'].count('\n', 0, int(position) - 1) + 1
+    return statement_line
+
+def apply_script(conn, script):
+    # A script without transaction control runs as one batch in one
+    # transaction together with its ledger row, so it applies completely or
+    # not at all. Others run statement by statement in autocommit and are
+    # recorded once all of them succeeded. Returns the seconds taken.
+    cursor = conn.cursor()
+    started = time.perf_counter()
+    if script['transactional']:
+        try:
+            cursor.execute(script['sql'])
+            record(cursor, script, time.perf_counter() - started)
+            conn.commit()
+        except Exception as error:
+            conn.rollback()
+            error.line = error_line(script, error)
+            raise
+        return time.perf_counter() - started
+
+    conn.autocommit = True
+    try:
+        for line, sql, _ in script['statements']:
+            try:
+                cursor.execute(sql)
+            except Exception as error:
+                # A script's own BEGIN leaves the failed transaction open
+                try:
+                    cursor.execute("ROLLBACK")
+                except Exception:
+                    pass
+                error.line = error_line(script, error, line)
+                raise
+        seconds = time.perf_counter() - started
+        record(cursor, script, seconds)
+    finally:
+        conn.autocommit = False
+    return seconds
+
+def run_migrations(ordered, deps, database_url=DEFAULT_DATABASE_URL, jobs=JOBS, keep_going=False, log=print):
+    # Runs `ordered` over up to `jobs` connections, each script once its
+    # dependencies among them succeeded. A failure only holds back the
+    # scripts depending on it; with `keep_going`, a failed script that ran in
+    # one transaction was rolled back without a trace and holds back nothing.
+    # Returns a result per script name.
+    names = {script['name'] for script in ordered}
+    by_name = {script['name']: script for script in ordered}
+    rank = {script['name']: i for i, script in enumerate(ordered)}
+    waiting = {name: deps[name] & names for name in names}
+    followers = defaultdict(list)
+    for name, needs in waiting.items():
+        for dep in needs:
+            followers[dep].append(name)
+    ready = [(rank[name], name) for name in names if not waiting[name]]
+    heapq.heapify(ready)
+
+    local = threading.local()
+    connections = []
+    connections_lock = threading.Lock()
+
+    def worker(script):
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = local.conn = connect(database_url)
+            with connections_lock:
+                connections.append(conn)
+            cursor = conn.cursor()
+            cursor.execute(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+            conn.commit()
+        for attempt in range(RETRIES + 1):
+            try:
+                return apply_script(conn, script)
+            except Exception as error:
+                if sqlstate(error) not in RETRY_STATES or attempt == RETRIES or not script['transactional']:
+                    raise
+                time.sleep(0.5 * (attempt + 1))
+
+    def release(name, released):
+        for follower in released:
+            waiting[follower].discard(name)
+            if not waiting[follower] and follower not in results:
+                heapq.heappush(ready, (rank[follower], follower))
+
+    def hold_back(name):
+        # A failed dynamic script only kept the others from running beside
+        # it, so just the scripts touching what it writes wait on it
+        held = followers[name]
+        script = by_name[name]
+        if keep_going and script['transactional']:
+            held = []
+            release(name, followers[name])
+        elif script['dynamic']:
+            held = [follower for follower in held
+                    if (by_name[follower]['reads'] | by_name[follower]['writes']) & script['writes']]
+            release(name, set(followers[name]) - set(held))
+        stack = list(held)
+        while stack:
+            follower = stack.pop()
+            if follower not in results:
+                results[follower] = {'status': 'blocked', 'after': name}
+                log(f"{'':>9}  {follower} skipped, it depends on {name}")
+                stack.extend(followers[follower])
+
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            running = {}
+            while ready or running:
+                while ready and len(running) < jobs:
+                    _, name = heapq.heappop(ready)
+                    running[pool.submit(worker, by_name[name])] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        seconds = future.result()
+                    except Exception as error:
+                        line = getattr(error, 'line', None)
+                        message = str(error).strip().splitlines()[0] if str(error).strip() else type(error).__name__
+                        results[name] = {'status': 'failed', 'error': message, 'line': line}
+                        log(f"{'FAILED':>9}  {name}{f':{line}' if line else ''}: {message}")
+                        hold_back(name)
+                        continue
+                    results[name] = {'status': 'applied', 'seconds': seconds}
+                    log(f"{seconds:8.2f}s  {name}")
+                    release(name, followers[name])
+    finally:
+        for conn in connections:
+            conn.close()
+    return results
+
+def select(scripts, include_destructive=False, include_data=False, allow=()):
+    # Read-only checks and HAND_RUN scripts never run; scripts deleting or
+    # dropping data, or rewriting rows such as one-off fixes, only on request.
+    # Scripts matching `allow` run whatever their kind.
+    kept = [script for script in scripts if script['kind'] == 'migration'
+            or script['kind'] == 'destructive' and include_destructive
+            or script['kind'] == 'data' and include_data
+            or any(fnmatch.fnmatch(script['name'], pattern) for pattern in allow)]
+    excluded = [script for script in scripts if script not in kept]
+    return kept, excluded
+
+def describe_plan(ordered, deps, excluded):
+    lines = []
+    kinds = Counter(script['kind'] for script in excluded)
+    lines.append(f"{len(ordered)} migrations, {sum(map(len, deps.values()))} dependencies; excluded "
+                 f"{kinds['check']} read-only checks, {kinds['data']} data changes"
+                 f"{' (--include-data or --allow GLOB runs them)' if kinds['data'] else ''}, "
+                 f"{kinds['manual']} run-by-hand scripts and "
+                 f"{kinds['destructive']} destructive scripts"
+                 f"{' (--include-destructive runs them)' if kinds['destructive'] else ''}")
+    meta = [script['name'] for script in ordered if script['meta_commands']]
+    if meta:
+        lines.append(f"psql meta-commands are skipped in {', '.join(meta)}")
+    external = Counter(obj for script in ordered for obj in script['reads'] if '.' in obj)
+    if external:
+        lines.append(f"Objects outside this tree: {', '.join(sorted(external))}")
+    grouped = waves(ordered, deps)
+    lines.append(f"{len(grouped)} waves, at most {max(map(len, grouped), default=0)} scripts wide:")
+    for wave, batch in enumerate(grouped, 1):
+        lines.append(f"  {wave:>3}. {', '.join(batch)}")
+    return "\n".join(lines)
+
+def describe_status(scripts, states, ledger, excluded):
+    lines = []
+    counts = Counter(states.values())
+    lines.append(f"{counts['applied']} applied, {counts['pending']} pending, {counts['changed']} changed since "
+                 f"applied, {counts['renamed']} renamed; {len(excluded)} excluded")
+    for script in scripts:
+        state = states[script['name']]
+        if state != 'applied':
+            lines.append(f"  {state:<8} {script['name']}")
+    for script in excluded:
+        if script['name'] in ledger:
+            lines.append(f"  applied  {script['name']} (excluded now: {script['kind']})")
+    known = {script['name'] for script in scripts} | {script['name'] for script in excluded}
+    missing = set(ledger) - known
+    if missing:
+        lines.append(f"{len(missing)} ledger entries match no script here (renamed, deleted or outside these sources)")
+    return "\n".join(lines)
+
+def build_report(ordered, deps, excluded, states, results, seconds, jobs):
+    migrations = []
+    for script in ordered:
+        entry = {
+            'name': script['name'],
+            'state': states.get(script['name'], 'pending'),
+            'statements': len(script['statements']),
+            'transactional': script['transactional'],
+            'depends_on': sorted(deps[script['name']]),
+        }
+        entry.update(results.get(script['name'], {}))
+        if 'seconds' in entry:
+            entry['seconds'] = round(entry['seconds'], 3)
+        migrations.append(entry)
+    return {
+        'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'jobs': jobs,
+        'seconds': round(seconds, 3),
+        'migrations': migrations,
+        'excluded': [{'name': script['name'], 'kind': script['kind'], 'reasons': script['destructive'] + script['data_changes']}
+                     for script in excluded],
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply the repo's SQL scripts once each, independent ones in parallel")
+    parser.add_argument('--database-url', default=DEFAULT_DATABASE_URL)
+    parser.add_argument('--source', action='append', help=f"directory of .sql files (default: {', '.join(SOURCES)})")
+    parser.add_argument('--only', action='append', default=[], metavar='GLOB', help="limit to scripts matching")
+    parser.add_argument('--exclude', action='append', default=[], metavar='GLOB')
+    parser.add_argument('--include-destructive', action='store_true',
+                        help="also run scripts that DELETE, TRUNCATE or DROP tables")
+    parser.add_argument('--include-data', action='store_true',
+                        help="also run scripts that UPDATE existing rows, such as one-off data fixes")
+    parser.add_argument('--allow', action='append', default=[], metavar='GLOB',
+                        help="run scripts matching even if they are excluded as checks, data changes, run by hand or destructive")
+    parser.add_argument('--rerun-changed', action='store_true', help="run scripts edited since they were applied")
+    parser.add_argument('--jobs', type=int, default=JOBS, help="concurrent connections")
+    parser.add_argument('--keep-going', action='store_true',
+                        help="run the dependents of scripts that failed and were rolled back")
+    parser.add_argument('--plan', action='store_true', help="print the dependency waves without connecting")
+    parser.add_argument('--status', action='store_true', help="compare the ledger with the scripts on disk")
+    parser.add_argument('--mark-applied', action='store_true',
+                        help="record pending scripts as applied without running them, for databases set up by hand")
+    parser.add_argument('--force', action='store_true',
+                        help="run every pending script even though the database has tables but an empty ledger")
+    parser.add_argument('--output', default=REPORT_FILE, help="per-migration timings as JSON")
+    args = parser.parse_args()
+
+    scripts = discover(args.source or SOURCES, args.only, args.exclude)
+    selected, excluded = select(scripts, args.include_destructive, args.include_data, args.allow)
+    ordered = execution_order(selected)
+    deps = dependencies(ordered)
+    if args.plan:
+        print(describe_plan(ordered, deps, excluded))
+        raise SystemExit(0)
+
+    started = time.perf_counter()
+    conn = connect(args.database_url)
+    try:
+        ensure_ledger(conn)
+        if args.status:
+            ledger = read_ledger(conn)
+            print(describe_status(ordered, classify(ordered, ledger), ledger, excluded))
+            raise SystemExit(0)
+        cursor = conn.cursor()
+        cursor.execute("SELECT pg_try_advisory_lock(%s)", (LOCK_KEY,))
+        if not cursor.fetchone()[0]:
+            raise SystemExit("Another migration run holds the lock; try again once it finishes")
+        conn.commit()
+        # Read under the lock, so a run that just finished is accounted for
+        ledger = read_ledger(conn)
+        states = classify(ordered, ledger)
+        # A database set up by hand or by another tool has its schema but no
+        # ledger; running every script against it would replay old fixes
+        if not ledger and not (args.mark_applied or args.force):
+            tables = existing_tables(conn)
+            if tables:
+                raise SystemExit(f"The database has {tables} tables but no applied migrations recorded. Record its "
+                                 f"current state with --mark-applied, or pass --force to run all "
+                                 f"{len(ordered)} migrations against it.")
+
+        due = {'pending', 'changed'} if args.rerun_changed else {'pending'}
+        if args.mark_applied:
+            due.add('renamed')
+        else:
+            for script in ordered:
+                if states[script['name']] == 'renamed':
+                    record(cursor, script, None)
+            conn.commit()
+        todo = [script for script in ordered if states[script['name']] in due]
+        if args.mark_applied:
+            for script in todo:
+                record(cursor, script, None)
+            conn.commit()
+            print(f"Recorded {len(todo)} scripts as applied without running them.")
+            raise SystemExit(0)
+
+        if not todo:
+            print(f"Nothing to apply; {len(ordered)} migrations are up to date.")
+            raise SystemExit(0)
+        print(f"Applying {len(todo)} of {len(ordered)} migrations over {args.jobs} connections")
+        results = run_migrations(todo, deps, args.database_url, args.jobs, args.keep_going)
+    finally:
+        conn.close()
+
+    seconds = time.perf_counter() - started
+    report = build_report(ordered, deps, excluded, states, results, seconds, args.jobs)
+    write_if_changed(args.output, json.dumps(report, indent=2) + "\n")
+    outcome = Counter(result['status'] for result in results.values())
+    busy = sum(result.get('seconds', 0.0) for result in results.values())
+    print(f"Applied {outcome['applied']} migrations in {seconds:.1f}s ({busy:.1f}s of migration time); "
+          f"{outcome['failed']} failed, {outcome['blocked']} held back by a failure. Timings in {args.output}.")
+    slowest = sorted((item for item in results.items() if 'seconds' in item[1]), key=lambda item: -item[1]['seconds'])
+    for name, result in slowest[:5]:
+        print(f"  {result['seconds']:7.2f}s  {name}")
+    if outcome['failed']:
+        raise SystemExit(1)
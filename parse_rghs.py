@@ -1,76 +1,126 @@
 
-import re
+import argparse
 
-def parse_rghs_list(file_path):
-    packages = []
+from catalog_compiler import RGHS_COLUMNS_VERSION, SHARD_MANIFEST_VERSION, write_rghs_columns, write_rghs_shards
+from catalog_index import INDEX_VERSION, CatalogIndex, write_index_ts
+from catalog_loader import DEFAULT_DATABASE_URL, describe_load, load_catalog
+from catalog_manifest import regenerate
+from service_ids import ServiceIdRegistry
+
+RGHS_CODE_START = 100
+RGHS_SHARD_DIR = 'src/data/rghsPackageShards'
+
+def parse_rghs_line(line):
+    # Returns ('header', category), ('package', name, rates) or None
+    line = line.strip()
+    if not line:
+        return None
+    
+    # Parse line: Name – Rate – Rate – Rate – Rate
+    parts = line.split(' – ')
+
+    # Check if it's a category header (ALL CAPS). A line with rates is a
+    # package even when its name is upper case, like "HBSAG / ELISA – 300 – ..."
+    if len(parts) < 2 and line.isupper() and ("PROCEDURES" in line or "/" in line):
+        return ('header', line.split("PROCEDURES")[0].strip().replace("/", "_").replace(" ", "_").upper())
+
+    if len(parts) >= 2:
+        name = parts[0].strip()
+        # Keep every rate tier; the first one is the standard rate
+        try:
+            rates = [int(part.strip()) for part in parts[1:]]
+        except ValueError:
+            return None # Skip if any rate is not a number
+        return ('package', name, rates)
+    return None
+
+def make_package(code, name, rates, category):
+    return {
+        "id": f"pkg_{code.lower()}",
+        "code": code,
+        "name": name,
+        "rate": rates[0],
+        "rates": rates,
+        "category": category,
+        "description": name
+    }
+
+def iter_rghs_list(file_path, registry=None):
+    # Codes come from the persisted registry rather than a running counter
+    registry = registry or ServiceIdRegistry()
     current_category = "GENERAL"
-    count = 100  # Starting ID
+    emitted = set()
 
     with open(file_path, 'r') as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            parsed = parse_rghs_line(line)
+            if parsed is None:
                 continue
-            
-            # Check if it's a category header (ALL CAPS)
-            if line.isupper() and "PROCEDURES" in line or line.isupper() and "/" in line:
-                current_category = line.split("PROCEDURES")[0].strip().replace("/", "_").replace(" ", "_").upper()
+            if parsed[0] == 'header':
+                current_category = parsed[1]
                 continue
-            
-            # Parse line: Name – Rate – Rate – Rate – Rate
-            # Regex to find the rates at the end
-            parts = line.split(' – ')
-            if len(parts) >= 2:
-                name = parts[0].strip()
-                # Rates are the subsequent parts. We'll take the first one as standard rate
-                try:
-                    rate = int(parts[1].strip())
-                except ValueError:
-                    continue # Skip if rate is not a number
-
-                code = f"RGHS-{count:03d}"
-                count += 1
-
-                packages.append({
-                    "id": f"pkg_{code.lower()}",
-                    "code": code,
-                    "name": name,
-                    "rate": rate,
-                    "category": current_category,
-                    "description": name
-                })
-
-    return packages
-
-def generate_ts_file(packages, output_file):
-    ts_content = """
-export interface RGHSPackage {
-  id: string;
-  code: string;
-  name: string;
-  rate: number;
-  category: string;
-  description?: string;
-}
-
-export const RGHS_PACKAGES_DATA: RGHSPackage[] = [
-"""
-    
-    for pkg in packages:
-        ts_content += "  {\n"
-        ts_content += f"    id: '{pkg['id']}',\n"
-        ts_content += f"    code: '{pkg['code']}',\n"
-        ts_content += f"    name: \"{pkg['name']}\",\n"
-        ts_content += f"    rate: {pkg['rate']},\n"
-        ts_content += f"    category: '{pkg['category']}',\n"
-        ts_content += f"    description: \"{pkg['description']}\"\n"
-        ts_content += "  },\n"
-    
-    ts_content += "];\n"
 
-    with open(output_file, 'w') as f:
-        f.write(ts_content)
+            _, name, rates = parsed
+            code = registry.assign('RGHS', name, start=RGHS_CODE_START)
+            if code in emitted:
+                continue # Same package listed twice
+            emitted.add(code)
+            yield make_package(code, name, rates, current_category)
+
+def parse_rghs_list(file_path, registry=None):
+    return list(iter_rghs_list(file_path, registry))
+
+def generate_columns_file(packages, output_file):
+    return write_rghs_columns(packages, output_file)
+
+def describe_changes(changes):
+    return f"version {changes['version']}: {len(changes['added'])} added, {len(changes['changed'])} changed, {len(changes['removed'])} removed"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate src/data/rghsPackages.json from the RGHS rate list")
+    parser.add_argument('--source', default='temp_rghs_list.txt')
+    parser.add_argument('--force', action='store_true', help="rewrite outputs even if the manifest says they are current")
+    parser.add_argument('--sharded', action='store_true', help=f"write one JSON per category to {RGHS_SHARD_DIR}/ plus a manifest")
+    parser.add_argument('--load-db', nargs='?', const=DEFAULT_DATABASE_URL, metavar='DATABASE_URL',
+                        help="also bulk-load the packages into the service_catalog table")
+    args = parser.parse_args()
+
+    registry = ServiceIdRegistry()
+
+    if args.sharded:
+        catalog_name = 'rghsPackages:sharded'
+        schema = f"rghs-columns-v{RGHS_COLUMNS_VERSION}/shards-v{SHARD_MANIFEST_VERSION}"
+        outputs = [f'{RGHS_SHARD_DIR}/manifest.json']
+
+        def write_outputs(packages):
+            return write_rghs_shards(packages, RGHS_SHARD_DIR)
+    else:
+        catalog_name = 'rghsPackages'
+        schema = f"rghs-columns-v{RGHS_COLUMNS_VERSION}/index-v{INDEX_VERSION}"
+        outputs = ['src/data/rghsPackages.json', 'src/data/rghsPackagesIndex.ts']
+
+        def write_outputs(packages):
+            index = CatalogIndex()
+            generate_columns_file(index.track(packages), outputs[0])
+            write_index_ts(index, outputs[1], 'RGHS_PACKAGES_INDEX')
+
+    changes = regenerate(
+        catalog_name,
+        lambda: iter_rghs_list(args.source, registry),
+        key='code',
+        schema=schema,
+        outputs=outputs,
+        write_outputs=write_outputs,
+        force=args.force,
+    )
+    registry.save()
+    if changes is None:
+        print("RGHS packages unchanged, nothing written.")
+    else:
+        print(f"Generated {changes['count']} packages ({describe_changes(changes)}).")
 
-packages = parse_rghs_list('temp_rghs_list.txt')
-generate_ts_file(packages, 'src/data/rghsPackages.ts')
-print(f"Generated {len(packages)} packages.")
+    # Loaded even when the bundle is current: the database may be behind it
+    if args.load_db:
+        packages = iter_rghs_list(args.source, registry)
+        stats = load_catalog((dict(pkg, family='RGHS', source=args.source) for pkg in packages), args.load_db)
+        print(describe_load(stats))
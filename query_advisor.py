@@ -0,0 +1,722 @@
+import argparse
+import ast
+import bisect
+import json
+import re
+import statistics
+import sys
+from datetime import datetime, timezone
+
+from catalog_loader import DEFAULT_DATABASE_URL, connect, sqlstate
+from ts_lexer import index_source
+
+SERVER_FILE = 'backend/server.js'
+REPORT_FILE = 'query_advisor.json'
+
+CLIENTS = {'pool', 'client', 'db'}
+ROUTE_METHODS = {'get', 'post', 'put', 'patch', 'delete'}
+READ_STATEMENTS = ('SELECT', 'WITH')
+WRITE_STATEMENTS = ('INSERT', 'UPDATE', 'DELETE')
+
+# Timed runs per plan; the median is kept so one cold read does not decide
+REPEATS = 3
+# Scans reading fewer rows than this are not worth an index
+SEQ_SCAN_MIN_ROWS = 10_000
+SORT_MIN_ROWS = 10_000
+# Planner estimates off by more than this factor either way are flagged
+ESTIMATE_ERROR_FACTOR = 10
+ESTIMATE_MIN_ROWS = 100
+# Lower bounds of date ranges reach back this far from the newest row
+RANGE_DAYS = 30
+# Indexes must make their queries at least this much faster to be proposed
+MIN_SPEEDUP = 1.2
+# Seconds before a run gives up; its plan is then reported from estimates
+STATEMENT_TIMEOUT = 30.0
+QUERY_CANCELED = '57014'
+TENANT_COLUMN = 'hospital_id'
+TEMPORAL_TYPES = ('date', 'timestamp without time zone', 'timestamp with time zone')
+
+PLACEHOLDER = re.compile(r"\$(\d+)")
+DYNAMIC_PLACEHOLDER = '\x00'
+RELATION = re.compile(r"\b(?:FROM|JOIN|UPDATE|INTO)\s+([a-z_]\w*)(?:\s+(?:AS\s+)?(?!(?:WHERE|ON|LEFT|RIGHT|INNER|"
+                      r"OUTER|JOIN|CROSS|FULL|ORDER|GROUP|LIMIT|OFFSET|USING|SET|VALUES|RETURNING|FOR)\b)([a-z_]\w*))?",
+                      re.IGNORECASE)
+PARAMETER_CONTEXT = re.compile(r"(?P<expr>(?:DATE\(\s*)?(?:(?P<alias>\w+)\.)?(?P<column>\w+)\s*\)?(?:::\w+)?)\s*"
+                               r"(?P<op>=|>=|<=|<>|!=|<|>|NOT\s+ILIKE|ILIKE|LIKE)\s*\$(?P<n>\d+)\b", re.IGNORECASE)
+LIMIT_PARAMETER = re.compile(r"\b(LIMIT|OFFSET)\s+\$(\d+)\b", re.IGNORECASE)
+# Comparisons in plan Filter / Index Cond text, e.g. `(date(created_at) >= '2025-08-01'::date)`
+PLAN_COMPARISON = re.compile(r"(?:date\((?:\w+\.)?(?P<fcol>\w+)\)|\((?:\w+\.)?(?P<ccol>\w+)\)::date|"
+                             r"(?:\w+\.)?(?P<col>\w+))\s+(?P<op>=|>=|<=|<|>|~~\*|~~)\s")
+
+def js_string(text):
+    # Single- and double-quoted JS strings share Python's escapes closely enough
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text[1:-1]
+
+class QueryExtractor:
+    # SQL passed to pool/client.query() in one JS file. A literal argument is
+    # taken as is; a variable is rebuilt from its declaration and every
+    # `name += ...` before the call. Appends nested deeper than the
+    # declaration are conditional (the WHERE 1=1 builders), so those queries
+    # yield a 'base' variant without them and a 'full' one with all of them.
+    def __init__(self, source, path=SERVER_FILE):
+        self.path = path
+        self.index = index_source(source, jsx=False)
+        self.source = source
+        self.line_starts = [0] + [i + 1 for i, char in enumerate(source) if char == '\n']
+        self.constants = {}
+        self.routes = self._routes()
+
+    def line(self, position):
+        return bisect.bisect_right(self.line_starts, position)
+
+    def _routes(self):
+        # (offset, 'GET /api/...') for each app.<method>('path', ...)
+        index = self.index
+        routes = []
+        for i in range(len(index.tokens) - 4):
+            if (index.text(i) == 'app' and index.text(i + 1) == '.' and index.text(i + 2) in ROUTE_METHODS
+                    and index.text(i + 3) == '(' and index.tokens[i + 4][0] == 'string'):
+                routes.append((index.tokens[i][1], f"{index.text(i + 2).upper()} {js_string(index.text(i + 4))}"))
+        return routes
+
+    def route_at(self, position):
+        k = bisect.bisect_right(self.routes, (position, '￿')) - 1
+        return self.routes[k][1] if k >= 0 else None
+
+    def expression_end(self, i, depth, stops):
+        # First token index from i on that ends an expression at `depth`
+        tokens = self.index.tokens
+        while i < len(tokens):
+            if tokens[i][3] < depth or (tokens[i][3] == depth and self.index.text(i) in stops):
+                return i
+            i += 1
+        return i
+
+    def parts(self, start, stop):
+        # Evaluates tokens [start, stop) as string/template literals joined by
+        # '+'. Returns a list of text and ('expr', source) pieces, or the
+        # variable name when the whole expression is one identifier, or None.
+        index = self.index
+        tokens = index.tokens
+        if stop - start == 1 and tokens[start][0] == 'ident':
+            return index.text(start)
+        pieces = []
+        i = start
+        while i < stop:
+            kind, begin, end, depth = tokens[i]
+            text = index.text(i)
+            if kind == 'string':
+                pieces.append(js_string(text))
+            elif kind == 'template':
+                pieces.append(text.replace('\\`', '`').replace('\\$', '$').replace('\\\\', '\\'))
+            elif text == '${':
+                close = index.find_token(index.closing.get(begin, len(self.source)))
+                expr = self.source[end:tokens[close][1]].strip()
+                # A top-level string constant such as a shared CTE is inlined
+                constant = self.constant(expr)
+                pieces.extend(constant if constant is not None else [('expr', expr)])
+                i = close
+            elif text != '+':
+                return None
+            i += 1
+        return pieces
+
+    def constant(self, name):
+        # The text of `const name = <literals>;` at the top level, else None
+        if name not in self.constants:
+            self.constants[name] = None
+            index = self.index
+            tokens = index.tokens
+            for i in range(1, len(tokens) - 2):
+                if (tokens[i][3] == 0 and tokens[i][0] == 'ident' and index.text(i) == name
+                        and index.text(i - 1) == 'const' and index.text(i + 1) == '='):
+                    pieces = self.parts(i + 2, self.expression_end(i + 2, 0, (';',)))
+                    if isinstance(pieces, list) and all(isinstance(piece, str) for piece in pieces):
+                        self.constants[name] = pieces
+                    break
+        return self.constants[name]
+
+    def builder(self, name, call):
+        # (initial pieces, [(pieces, conditional, alternative)]) for a `let name = ...`
+        # before token `call`, or None if it cannot be followed
+        index = self.index
+        tokens = index.tokens
+        decl = None
+        for i in range(call - 1, 0, -1):
+            if (tokens[i][0] == 'ident' and index.text(i) == name and index.text(i - 1) in ('let', 'const', 'var')
+                    and index.text(i + 1) == '='):
+                decl = i
+                break
+        if decl is None:
+            return None
+        depth = tokens[decl][3]
+        end = self.expression_end(decl + 2, depth, (';',))
+        initial = self.parts(decl + 2, end)
+        if initial is None or isinstance(initial, str):
+            return None
+        appends = []
+        for i in range(end, call):
+            if (tokens[i][0] == 'ident' and index.text(i) == name and index.text(i - 1) != '.'
+                    and index.text(i + 1) == '+' and index.text(i + 2) == '='
+                    and tokens[i + 1][2] == tokens[i + 2][1]):
+                append_end = self.expression_end(i + 3, tokens[i][3], (';',))
+                pieces = self.parts(i + 3, append_end)
+                if pieces is None or isinstance(pieces, str):
+                    return None
+                appends.append((pieces, tokens[i][3] > depth, self.in_else_branch(i)))
+        return initial, appends
+
+    def in_else_branch(self, i):
+        # True when token i sits in an `else` or `else if` block, which is an
+        # alternative to an append already taken for the 'full' variant
+        index = self.index
+        tokens = index.tokens
+        depth = tokens[i][3]
+        j = i - 1
+        while j >= 0 and not (tokens[j][3] == depth and index.text(j) == '{'):
+            j -= 1
+        if j <= 0:
+            return False
+        before = j - 1
+        if index.text(before) == ')':
+            # `else if (...) {`: step back over the condition to the `if`
+            while before >= 0 and not (tokens[before][3] == tokens[j - 1][3] and index.text(before) == '('):
+                before -= 1
+            before -= 1
+            if before < 0 or index.text(before) != 'if':
+                return False
+            before -= 1
+        return before >= 0 and index.text(before) == 'else'
+
+    def queries(self):
+        # Yields query dicts; unreadable ones carry a 'skipped' reason instead of SQL
+        index = self.index
+        tokens = index.tokens
+        for i in range(len(tokens) - 3):
+            if not (tokens[i][0] == 'ident' and index.text(i) in CLIENTS and index.text(i + 1) == '.'
+                    and index.text(i + 2) == 'query' and index.text(i + 3) == '('):
+                continue
+            position = tokens[i][1]
+            base = {'line': self.line(position), 'route': self.route_at(position)}
+            depth = tokens[i + 3][3]
+            end = self.expression_end(i + 4, depth, (',', ')'))
+            pieces = self.parts(i + 4, end)
+            if isinstance(pieces, str):
+                built = self.builder(pieces, i)
+                if built is None:
+                    yield dict(base, skipped=f"cannot follow how `{pieces}` is built")
+                    continue
+                initial, appends = built
+                variants = [('full', initial + [p for pieces, _, alternative in appends if not alternative
+                                                for p in pieces])]
+                if any(conditional for _, conditional, _ in appends):
+                    base_pieces = initial + [p for pieces, conditional, _ in appends if not conditional for p in pieces]
+                    variants.insert(0, ('base', base_pieces))
+                else:
+                    variants[0] = ('static', variants[0][1])
+            elif pieces is None:
+                yield dict(base, skipped="query text is not a literal")
+                continue
+            else:
+                variants = [('static', pieces)]
+
+            for variant, variant_pieces in variants:
+                sql = render(variant_pieces)
+                if sql is None:
+                    yield dict(base, variant=variant, skipped="interpolates values into the SQL text")
+                    continue
+                keyword = sql.split(None, 1)[0].upper() if sql.strip() else ''
+                if keyword not in READ_STATEMENTS + WRITE_STATEMENTS:
+                    continue  # BEGIN, COMMIT, ROLLBACK, SET ...
+                yield dict(base, id=f"{base['line']}:{variant}", variant=variant, sql=sql,
+                           writes=keyword in WRITE_STATEMENTS)
+
+def render(pieces):
+    # SQL text with `$${n}` placeholders numbered after the literal ones, in
+    # order; None when some other value is interpolated
+    out = []
+    for piece in pieces:
+        if isinstance(piece, str):
+            out.append(piece)
+        elif out and out[-1].endswith('$'):
+            out[-1] = out[-1][:-1]
+            out.append(DYNAMIC_PLACEHOLDER)
+        else:
+            return None
+    sql = ''.join(out)
+    numbered = [int(n) for n in PLACEHOLDER.findall(sql)]
+    next_number = max(numbered, default=0)
+    pieces = sql.split(DYNAMIC_PLACEHOLDER)
+    sql = pieces[0]
+    for piece in pieces[1:]:
+        next_number += 1
+        sql += f"${next_number}" + piece
+    return ' '.join(sql.split())
+
+def extract_queries(path=SERVER_FILE):
+    with open(path, 'r', encoding='utf-8') as f:
+        return list(QueryExtractor(f.read(), path).queries())
+
+def relations(sql):
+    # alias -> table for every FROM/JOIN/UPDATE/INTO; a table is its own alias
+    aliases = {}
+    for table, alias in RELATION.findall(sql):
+        aliases.setdefault(table.lower(), table.lower())
+        if alias:
+            aliases[alias.lower()] = table.lower()
+    return aliases
+
+def iter_nodes(plan):
+    yield plan
+    for child in plan.get('Plans', ()):
+        yield from iter_nodes(child)
+
+def scanned_rows(node, table_rows=None):
+    # Rows a scan read. Plans that were not executed have no counts, so a
+    # sequential scan is taken to read its whole table (as the planner sees it).
+    loops = node.get('Actual Loops', 1) or 1
+    if 'Actual Rows' not in node:
+        if table_rows and node.get('Relation Name'):
+            return table_rows(node['Relation Name'])
+        return node.get('Plan Rows', 0)
+    return (node['Actual Rows'] + node.get('Rows Removed by Filter', 0)) * loops
+
+def plan_findings(plan, table_rows=None):
+    # Sequential scans, sorts and row-estimate errors worth a look
+    findings = []
+    for node in iter_nodes(plan):
+        kind = node['Node Type']
+        loops = node.get('Actual Loops', 1) or 1
+        actual = node.get('Actual Rows', node.get('Plan Rows', 0)) * loops
+        estimated = node.get('Plan Rows', 0) * loops
+        if kind == 'Seq Scan' and scanned_rows(node, table_rows) >= SEQ_SCAN_MIN_ROWS:
+            findings.append({'kind': 'seq_scan', 'relation': node.get('Relation Name'),
+                             'rows': scanned_rows(node, table_rows), 'filter': node.get('Filter')})
+        elif kind in ('Sort', 'Incremental Sort') and actual >= SORT_MIN_ROWS:
+            findings.append({'kind': 'sort', 'keys': node.get('Sort Key'), 'rows': actual,
+                             'method': node.get('Sort Method'), 'disk_kb': node.get('Sort Space Used')
+                             if node.get('Sort Space Type') == 'Disk' else None})
+        if 'Actual Rows' in node and max(actual, estimated) >= ESTIMATE_MIN_ROWS and (
+                actual > max(estimated, 1) * ESTIMATE_ERROR_FACTOR or estimated > max(actual, 1) * ESTIMATE_ERROR_FACTOR):
+            findings.append({'kind': 'estimate', 'node': kind, 'relation': node.get('Relation Name'),
+                             'estimated': estimated, 'actual': actual})
+    return findings
+
+def static_findings(query):
+    # Patterns visible in the SQL itself
+    sql = query['sql'].upper()
+    findings = []
+    if sql.startswith(READ_STATEMENTS) and ' ORDER BY ' in sql and not re.search(r"\bLIMIT\b", sql):
+        findings.append({'kind': 'unbounded_order_by'})
+    if re.search(r"\bDATE\(", sql):
+        findings.append({'kind': 'function_on_column', 'detail': 'DATE(column) comparisons cannot use a plain index'})
+    if re.search(r"I?LIKE\s+'%", sql):
+        findings.append({'kind': 'leading_wildcard'})
+    return findings
+
+def sql_literal(value):
+    if value is None:
+        return 'NULL'
+    return "'" + str(value).replace("'", "''") + "'"
+
+def index_name(table, columns, suffix=None):
+    name = '_'.join(['idx', table] + [re.sub(r"\W+", '_', column).strip('_') for column in columns]
+                    + ([suffix] if suffix else []))
+    return name[:63]
+
+class Advisor:
+    # Runs EXPLAIN (ANALYZE, BUFFERS) for extracted queries inside
+    # transactions that are always rolled back, so writes and trial indexes
+    # never persist
+    def __init__(self, conn, overrides=None, repeats=REPEATS, timeout=STATEMENT_TIMEOUT):
+        self.conn = conn
+        self.cursor = conn.cursor()
+        self.overrides = overrides or {}
+        self.repeats = repeats
+        self.timeout = timeout
+        self._columns = {}
+        self._indexes = {}
+        self._rows = {}
+        self._samples = {}
+
+    def fetch(self, sql):
+        self.cursor.execute(sql)
+        return self.cursor.fetchall()
+
+    def columns(self, table):
+        # column -> data type; empty when the table does not exist
+        if table not in self._columns:
+            rows = self.fetch("SELECT column_name, data_type FROM information_schema.columns "
+                              f"WHERE table_schema = current_schema() AND table_name = {sql_literal(table)}")
+            self.conn.rollback()
+            self._columns[table] = dict(rows)
+        return self._columns[table]
+
+    def table_rows(self, table):
+        # The planner's row count for a table, from its last ANALYZE
+        if table not in self._rows:
+            rows = self.fetch(f"SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass({sql_literal(table)})")
+            self.conn.rollback()
+            self._rows[table] = max(0, rows[0][0]) if rows and rows[0][0] is not None else 0
+        return self._rows[table]
+
+    def indexed_prefixes(self, table):
+        # Leading column lists of the table's existing indexes
+        if table not in self._indexes:
+            rows = self.fetch(f"SELECT indexdef FROM pg_indexes WHERE tablename = {sql_literal(table)}")
+            self.conn.rollback()
+            prefixes = []
+            for (definition,) in rows:
+                inner = definition[definition.index('(', definition.upper().index(' ON ')) + 1:definition.rindex(')')]
+                prefixes.append([part.strip().split(' ')[0].strip('"') for part in inner.split(',')])
+            self._indexes[table] = prefixes
+        return self._indexes[table]
+
+    def sample(self, table, column, kind):
+        # A representative value for `column`: a random row's value for
+        # equality, the newest value (or RANGE_DAYS before it) for ranges,
+        # and a short infix of a random value for LIKE patterns
+        key = (table, column, kind)
+        if key not in self._samples:
+            data_type = self.columns(table).get(column, '')
+            try:
+                if kind in ('lower', 'upper') and data_type in TEMPORAL_TYPES:
+                    newest = self.fetch(f"SELECT max({column})::date FROM {table}")[0][0]
+                    value = None
+                    if newest is not None:
+                        value = newest.isoformat() if kind == 'upper' else (
+                            self.fetch(f"SELECT ({sql_literal(newest.isoformat())}::date - {RANGE_DAYS})::text")[0][0])
+                else:
+                    rows = self.fetch(f"SELECT {column}::text FROM {table} TABLESAMPLE SYSTEM (1) "
+                                      f"WHERE {column} IS NOT NULL LIMIT 1")
+                    if not rows:
+                        rows = self.fetch(f"SELECT {column}::text FROM {table} WHERE {column} IS NOT NULL LIMIT 1")
+                    value = rows[0][0] if rows else None
+                    if value is not None and kind == 'like':
+                        word = value.split()[0] if value.split() else value
+                        value = f"%{word[:4]}%"
+                    elif value is not None and kind == 'date':
+                        value = value[:10]
+            finally:
+                self.conn.rollback()
+            self._samples[key] = value
+        return self._samples[key]
+
+    def parameters(self, query):
+        # Values for $1..$n, from the overrides file or sampled from the
+        # columns each placeholder is compared with
+        if query['id'] in self.overrides:
+            return self.overrides[query['id']], None
+        sql = query['sql']
+        count = max((int(n) for n in PLACEHOLDER.findall(sql)), default=0)
+        values = [None] * count
+        known = [False] * count
+        aliases = relations(sql)
+        for match in LIMIT_PARAMETER.finditer(sql):
+            n = int(match.group(2)) - 1
+            values[n], known[n] = ('50' if match.group(1).upper() == 'LIMIT' else '0'), True
+        for match in PARAMETER_CONTEXT.finditer(sql):
+            n = int(match.group('n')) - 1
+            if known[n]:
+                continue
+            column = match.group('column').lower()
+            if match.group('alias'):
+                tables = [aliases.get(match.group('alias').lower())]
+            else:
+                tables = [table for table in dict.fromkeys(aliases.values()) if column in self.columns(table)]
+            table = next((table for table in tables if table and column in self.columns(table)), None)
+            if table is None:
+                continue
+            op = match.group('op').upper()
+            if 'LIKE' in op:
+                kind = 'like'
+            elif op in ('>=', '>'):
+                kind = 'lower'
+            elif op in ('<=', '<'):
+                kind = 'upper'
+            elif match.group('expr').upper().startswith('DATE(') or match.group('expr').lower().endswith('::date'):
+                kind = 'date'
+            else:
+                kind = 'value'
+            values[n], known[n] = self.sample(table, column, kind), True
+        missing = [f"${n + 1}" for n in range(count) if not known[n]]
+        return values, (f"no value for {', '.join(missing)}; add them to the overrides file" if missing else None)
+
+    def explain_json(self, statement):
+        self.cursor.execute(statement)
+        result = self.cursor.fetchone()[0]
+        return (json.loads(result) if isinstance(result, str) else result)[0]
+
+    def plan(self, sql, values):
+        # (median execution ms, planning ms, plan) over `repeats` runs in the
+        # current transaction. A run hitting the statement timeout falls back
+        # to the estimated plan, with None for the timings.
+        arguments = f"({', '.join(sql_literal(value) for value in values)})" if values else ''
+        self.cursor.execute("DEALLOCATE ALL")
+        self.cursor.execute("SAVEPOINT advisor_plan")
+        runs = []
+        try:
+            self.cursor.execute(f"SET LOCAL statement_timeout = {int(self.timeout * 1000)}")
+            self.cursor.execute("SET LOCAL plan_cache_mode = force_custom_plan")
+            self.cursor.execute(f"PREPARE advisor_query AS {sql}")
+            for _ in range(self.repeats):
+                runs.append(self.explain_json(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) EXECUTE advisor_query{arguments}"))
+        except Exception as error:
+            if sqlstate(error) != QUERY_CANCELED:
+                raise
+            # Prepared statements outlive the rollback
+            self.cursor.execute("ROLLBACK TO SAVEPOINT advisor_plan")
+            self.cursor.execute("SET LOCAL plan_cache_mode = force_custom_plan")
+            return None, None, self.explain_json(f"EXPLAIN (FORMAT JSON) EXECUTE advisor_query{arguments}")['Plan']
+        self.cursor.execute("RELEASE SAVEPOINT advisor_plan")
+        runs.sort(key=lambda run: run['Execution Time'])
+        middle = runs[len(runs) // 2]
+        return statistics.median(run['Execution Time'] for run in runs), middle['Planning Time'], middle['Plan']
+
+    def explain(self, sql, values):
+        try:
+            return self.plan(sql, values)
+        finally:
+            self.conn.rollback()
+
+    def proposals(self, query, plan):
+        # Index proposals for each large sequential scan, from the columns its
+        # filter compares: equality columns lead, then one range or sort column.
+        # LIKE filters get trigram indexes; OR'd filters get one index per
+        # column so the planner can combine them with a BitmapOr.
+        proposals = []
+        sort_keys = {}
+        for node in iter_nodes(plan):
+            if node['Node Type'] in ('Sort', 'Incremental Sort'):
+                for key in node.get('Sort Key', ()):
+                    column, _, direction = key.partition(' ')
+                    alias, _, column = column.rpartition('.')
+                    sort_keys.setdefault((alias or None, column), direction.strip())
+        for node in iter_nodes(plan):
+            if node['Node Type'] != 'Seq Scan' or scanned_rows(node, self.table_rows) < SEQ_SCAN_MIN_ROWS:
+                continue
+            table = node.get('Relation Name')
+            columns = self.columns(table)
+            # Sort keys of this scan's alias (or unqualified ones) -> direction
+            sorted_by = {column: direction for (alias, column), direction in sort_keys.items()
+                         if alias in (None, node.get('Alias'))}
+            condition = (node.get('Filter') or '') + ' '
+            equal, ranges, likes = [], [], []
+            for match in PLAN_COMPARISON.finditer(condition):
+                column = match.group('fcol') or match.group('ccol') or match.group('col')
+                if column not in columns:
+                    continue
+                if match.group('op') in ('~~*', '~~'):
+                    target = likes
+                    expression = column
+                elif match.group('fcol') or match.group('ccol'):
+                    target = ranges if match.group('op') != '=' else equal
+                    # date() of a timestamptz depends on the session time zone,
+                    # so it cannot be indexed; index the column and rewrite
+                    expression = column if columns[column] == 'timestamp with time zone' else f"({column}::date)"
+                else:
+                    target = equal if match.group('op') == '=' else ranges
+                    expression = column
+                if expression not in target:
+                    target.append(expression)
+            if TENANT_COLUMN in equal:
+                equal.remove(TENANT_COLUMN)
+                equal.insert(0, TENANT_COLUMN)
+
+            for column in likes:
+                name = index_name(table, [column], 'trgm')
+                proposals.append({
+                    'table': table, 'columns': [column], 'method': 'gin', 'name': name,
+                    'sql': f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                           f"ON {table} USING gin ({column} gin_trgm_ops)",
+                    'requires': 'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+                    'reason': f"ILIKE/LIKE on {table}.{column} scans every row; a trigram index serves infix patterns",
+                })
+            if ' OR ' in condition and len(ranges) > 1:
+                groups = [equal + [column] for column in ranges]
+            elif ranges or equal:
+                trailing = ranges[:1] or [column for column in sorted_by if column in columns][:1]
+                groups = [equal + [column for column in trailing if column not in equal]]
+            else:
+                groups = []
+            for group in groups:
+                definition = [f"{column} DESC" if sorted_by.get(column) == 'DESC' and column == group[-1] else column
+                              for column in group]
+                reason = f"filter on {', '.join(group)} reads {scanned_rows(node, self.table_rows):,} rows of {table}"
+                if any(column in columns and columns[column] == 'timestamp with time zone'
+                       and f"date({column})" in condition for column in group):
+                    reason += ("; rewrite DATE(col) comparisons as col >= $1::date AND col < $2::date + 1 "
+                               "so this index applies")
+                name = index_name(table, group)
+                proposals.append({
+                    'table': table, 'columns': group, 'method': 'btree', 'name': name,
+                    'sql': f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                           f"ON {table} ({', '.join(definition)})",
+                    'reason': reason,
+                })
+        return [proposal for proposal in proposals
+                if not any(prefix[:len(proposal['columns'])] == proposal['columns']
+                           for prefix in self.indexed_prefixes(proposal['table']))]
+
+    def trial(self, proposal, queries):
+        # Builds the index inside a transaction, re-times the queries that
+        # asked for it, then rolls the index back. Returns {query id: ms},
+        # None where a query still timed out.
+        timings = {}
+        try:
+            if proposal.get('requires'):
+                self.cursor.execute(proposal['requires'])
+            self.cursor.execute(proposal['sql'].replace(' CONCURRENTLY', ''))
+            self.cursor.execute(f"ANALYZE {proposal['table']}")
+            for query in queries:
+                timings[query['id']] = self.plan(query['sql'], query['params'])[0]
+        finally:
+            self.conn.rollback()
+        return timings
+
+def advise(queries, conn, overrides=None, include_writes=False, repeats=REPEATS, timeout=STATEMENT_TIMEOUT,
+           log=print):
+    # Explains every query, collects findings and index proposals, and times
+    # each proposal against the queries it came from. Timed-out queries count
+    # as taking the full timeout, so their speedups are lower bounds.
+    advisor = Advisor(conn, overrides, repeats, timeout)
+    results = []
+    proposals = {}
+    for query in queries:
+        if 'skipped' in query:
+            results.append(query)
+            continue
+        query = dict(query, findings=static_findings(query))
+        if query['writes'] and not include_writes:
+            results.append(dict(query, skipped="writes; pass --include-writes to explain it in a rolled-back transaction"))
+            continue
+        values, problem = advisor.parameters(query)
+        if problem:
+            results.append(dict(query, skipped=problem))
+            continue
+        query['params'] = values
+        try:
+            execution, planning, plan = advisor.explain(query['sql'], values)
+        except Exception as error:  # the database's own error says it best
+            results.append(dict(query, error=str(error).strip().splitlines()[0]))
+            continue
+        query.update(execution_ms=execution, planning_ms=planning, plan_root=plan['Node Type'])
+        if execution is None:
+            query['findings'].append({'kind': 'timeout', 'seconds': timeout})
+        query['findings'] += plan_findings(plan, advisor.table_rows)
+        for proposal in advisor.proposals(query, plan):
+            # Keyed by name: the first definition of an index wins
+            entry = proposals.setdefault(proposal['name'], dict(proposal, queries=[]))
+            entry['queries'].append(query['id'])
+        results.append(query)
+        log(f"{query['id']:<12} {format_ms(execution, timeout)}  {query['route'] or ''}")
+
+    by_id = {query['id']: query for query in results if 'id' in query}
+    for proposal in proposals.values():
+        targets = [by_id[query_id] for query_id in proposal['queries']]
+        try:
+            after = advisor.trial(proposal, targets)
+        except Exception as error:
+            proposal['error'] = str(error).strip().splitlines()[0]
+            continue
+        proposal['before_ms'] = {query['id']: query['execution_ms'] for query in targets}
+        proposal['after_ms'] = after
+        # Over the queries that finished with the index; ones that still time
+        # out show no measurable change
+        finished = [query_id for query_id, ms in after.items() if ms is not None]
+        before_total = sum(timeout * 1000 if proposal['before_ms'][query_id] is None else proposal['before_ms'][query_id]
+                           for query_id in finished)
+        after_total = sum(after[query_id] for query_id in finished)
+        proposal['speedup'] = before_total / after_total if finished and after_total else None
+    return results, list(proposals.values())
+
+def migration(proposals, min_speedup=MIN_SPEEDUP):
+    # CREATE INDEX statements for the proposals that paid off, ready to run
+    # outside a transaction
+    lines = ["-- Indexes proposed by query_advisor.py from EXPLAIN ANALYZE of backend/server.js queries"]
+    requires = set()
+    accepted = [proposal for proposal in proposals if (proposal.get('speedup') or 0) >= min_speedup]
+    for proposal in accepted:
+        # A btree on (a) is redundant next to one on (a, b)
+        if proposal['method'] == 'btree' and any(
+                other is not proposal and other['method'] == 'btree' and other['table'] == proposal['table']
+                and len(other['columns']) > len(proposal['columns'])
+                and other['columns'][:len(proposal['columns'])] == proposal['columns'] for other in accepted):
+            continue
+        if proposal.get('requires') and proposal['requires'] not in requires:
+            requires.add(proposal['requires'])
+            lines.insert(1, proposal['requires'] + ';')
+        lines.append(f"\n-- {proposal['reason']} ({proposal['speedup']:.1f}x faster)")
+        lines.append(proposal['sql'] + ';')
+    return "\n".join(lines) + "\n"
+
+def format_ms(ms, timeout):
+    return f"{ms:>10.1f}ms" if ms is not None else f">{timeout * 1000:>9.0f}ms"
+
+def describe(results, proposals, timeout=STATEMENT_TIMEOUT):
+    explained = [query for query in results if 'execution_ms' in query]
+    lines = [f"Explained {len(explained)} of {len(results)} queries "
+             f"({sum(1 for query in results if 'skipped' in query)} skipped, "
+             f"{sum(1 for query in results if 'error' in query)} failed)."]
+    slowest = sorted(explained, key=lambda query: -(timeout * 1000 if query['execution_ms'] is None
+                                                     else query['execution_ms']))
+    for query in slowest[:15]:
+        kinds = ', '.join(sorted({finding['kind'] for finding in query['findings']}))
+        lines.append(f"  {format_ms(query['execution_ms'], timeout)}  {query['id']:<12} {query['route'] or '':<45} {kinds}")
+    for proposal in sorted(proposals, key=lambda proposal: -(proposal.get('speedup') or 0)):
+        if proposal.get('error'):
+            lines.append(f"  FAILED {proposal['sql']}: {proposal['error']}")
+            continue
+        lines.append(f"  {proposal['sql']}")
+        for query_id, before in proposal['before_ms'].items():
+            lines.append(f"    {format_ms(before, timeout)} -> {format_ms(proposal['after_ms'][query_id], timeout)}  {query_id}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Explain the SQL in backend/server.js against a seeded database and propose indexes")
+    parser.add_argument('source', nargs='?', default=SERVER_FILE)
+    parser.add_argument('--database-url', default=DEFAULT_DATABASE_URL)
+    parser.add_argument('--list', action='store_true', help="print the extracted queries without connecting")
+    parser.add_argument('--params', help="JSON object of query id (LINE:VARIANT) -> parameter values")
+    parser.add_argument('--include-writes', action='store_true', help="also explain INSERT/UPDATE/DELETE (always rolled back)")
+    parser.add_argument('--repeats', type=int, default=REPEATS)
+    parser.add_argument('--timeout', type=float, default=STATEMENT_TIMEOUT, help="seconds per statement before falling back to estimates")
+    parser.add_argument('--output', default=REPORT_FILE)
+    parser.add_argument('--migration', help="write CREATE INDEX statements for proposals that paid off to this file")
+    parser.add_argument('--min-speedup', type=float, default=MIN_SPEEDUP)
+    args = parser.parse_args()
+
+    queries = extract_queries(args.source)
+    if args.list:
+        for query in queries:
+            if 'skipped' in query:
+                print(f"-- line {query['line']} skipped: {query['skipped']}")
+            else:
+                print(f"-- {query['id']} {query['route'] or ''}\n{query['sql']};")
+        sys.exit(0)
+
+    overrides = {}
+    if args.params:
+        with open(args.params, 'r', encoding='utf-8') as f:
+            overrides = json.load(f)
+    conn = connect(args.database_url)
+    try:
+        results, proposals = advise(queries, conn, overrides, args.include_writes, args.repeats, args.timeout)
+    finally:
+        conn.close()
+    report = {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'source': args.source,
+        'queries': results,
+        'proposals': proposals,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+        f.write("\n")
+    if args.migration:
+        with open(args.migration, 'w') as f:
+            f.write(migration(proposals, args.min_speedup))
+    print(describe(results, proposals, args.timeout))
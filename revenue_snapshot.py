@@ -0,0 +1,333 @@
+import argparse
+import json
+import os
+import re
+import time
+
+from catalog_loader import DEFAULT_DATABASE_URL, connect
+from catalog_manifest import write_if_changed
+from export_stream import EXPORT_FILE, iter_tables, load_index, read_rows
+
+SNAPSHOT_DIR = 'revenue_snapshot'
+SNAPSHOT_FILE = 'snapshot.json'
+SNAPSHOT_VERSION = 1
+
+# Rows converted to arrays at a time while building, so the Python objects for
+# at most one chunk are alive at once
+BUILD_CHUNK_ROWS = 65_536
+
+# Rows per server-side cursor fetch when reading from Postgres
+FETCH_ROWS = 50_000
+
+# Categorical columns: stored as small integer codes into a per-snapshot list
+# of values. Code 0 is always the empty/unknown value.
+CATEGORICAL = ['transaction_type', 'payment_mode', 'status', 'department']
+DAY_MONTH_YEAR = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})')
+
+# Same effective date as the dashboard and operations ledger: the
+# transaction date, then the patient's date of entry, then created_at
+TRANSACTIONS_SQL = """
+SELECT t.amount, t.transaction_type, t.payment_mode, t.status,
+       COALESCE(NULLIF(t.department, ''), p.assigned_department),
+       t.transaction_date::text, p.date_of_entry::text, t.created_at::text,
+       t.discount_percentage
+FROM patient_transactions t
+LEFT JOIN patients p ON p.id = t.patient_id
+"""
+
+def require_numpy():
+    # Only the snapshot needs NumPy; the rest of the tooling does not
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError("Revenue snapshots need NumPy (pip install numpy)") from None
+    return numpy
+
+def iso_date(value):
+    # 'YYYY-MM-DD' from an ISO date or timestamp, or from DD/MM/YYYY as
+    # date_of_entry is sometimes stored; None when there is nothing usable
+    if not value:
+        return None
+    value = str(value).strip()
+    match = DAY_MONTH_YEAR.match(value)
+    if match:
+        day, month, year = match.groups()
+        return f"{year}-{int(month):02d}-{int(day):02d}"
+    return value[:10] if len(value) >= 10 and value[4] == '-' else None
+
+def effective_date(transaction_date, date_of_entry, created_at):
+    return iso_date(transaction_date) or iso_date(date_of_entry) or iso_date(created_at)
+
+def record(amount, transaction_type, payment_mode, status, department, date, discount_percentage):
+    return (float(amount or 0), (transaction_type or '').upper(), (payment_mode or '').upper(),
+            (status or '').upper(), (department or '').strip().upper(), date, float(discount_percentage or 0))
+
+def records_from_rows(transactions, patients):
+    # `patients` maps patient id -> (date_of_entry, assigned_department)
+    for t in transactions:
+        date_of_entry, assigned_department = patients.get(t.get('patient_id'), (None, None))
+        yield record(t.get('amount'), t.get('transaction_type'), t.get('payment_mode'), t.get('status'),
+                     t.get('department') or assigned_department,
+                     effective_date(t.get('transaction_date'), date_of_entry, t.get('created_at')),
+                     t.get('discount_percentage'))
+
+def patient_lookup(rows):
+    return {p['id']: (p.get('date_of_entry'), p.get('assigned_department')) for p in rows}
+
+def iter_export_records(path=EXPORT_FILE):
+    # Two streaming passes: patients first, since the export does not promise
+    # they come before their transactions
+    patients = {}
+    for name, rows in iter_tables(path):
+        if name == 'patients':
+            patients = patient_lookup(rows)
+            break
+    for name, rows in iter_tables(path):
+        if name == 'patient_transactions':
+            yield from records_from_rows(rows, patients)
+            return
+
+def iter_split_records(output_dir):
+    # Per-table NDJSON written by export_stream.py
+    index = load_index(output_dir)
+    patients = patient_lookup(read_rows('patients', output_dir=output_dir, index=index)) \
+        if 'patients' in index['tables'] else {}
+    yield from records_from_rows(read_rows('patient_transactions', output_dir=output_dir, index=index), patients)
+
+def iter_database_records(database_url=DEFAULT_DATABASE_URL, fetch_rows=FETCH_ROWS):
+    # A named (server-side) cursor streams the table in batches
+    conn = connect(database_url)
+    try:
+        with conn.cursor(name='revenue_snapshot') as cursor:
+            cursor.itersize = fetch_rows
+            cursor.execute(TRANSACTIONS_SQL)
+            for amount, kind, mode, status, department, transaction_date, date_of_entry, created_at, discount in cursor:
+                yield record(amount, kind, mode, status, department,
+                             effective_date(transaction_date, date_of_entry, created_at), discount)
+    finally:
+        conn.close()
+
+class Snapshot:
+    # Column arrays for patient_transactions:
+    #   date      datetime64[D], NaT when no date is known
+    #   amount    float64, negative for refunds
+    #   discount  float64, discount implied by discount_percentage
+    #   <categorical column>  uint16 codes into self.categories[column]
+    def __init__(self, columns, categories, source=None):
+        self.columns = columns
+        self.categories = categories
+        self.source = source
+
+    def __len__(self):
+        return len(self.columns['amount'])
+
+    def codes(self, column, values):
+        # Codes of the given category values; values not in the snapshot get
+        # no code, so they match nothing
+        lookup = {value: code for code, value in enumerate(self.categories[column])}
+        return [lookup[value] for value in values if value in lookup]
+
+    def save(self, output_dir=SNAPSHOT_DIR):
+        np = require_numpy()
+        os.makedirs(output_dir, exist_ok=True)
+        for name, array in self.columns.items():
+            np.save(os.path.join(output_dir, f"{name}.npy"), array)
+        meta = {'version': SNAPSHOT_VERSION, 'rows': len(self), 'source': self.source,
+                'columns': sorted(self.columns), 'categories': self.categories}
+        write_if_changed(os.path.join(output_dir, SNAPSHOT_FILE), json.dumps(meta, indent=2) + "\n")
+
+    @classmethod
+    def load(cls, output_dir=SNAPSHOT_DIR, mmap=True):
+        # Memory-mapped by default: a report touches only the pages it reads
+        np = require_numpy()
+        with open(os.path.join(output_dir, SNAPSHOT_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(f"{output_dir} was written by another version of revenue_snapshot.py; rebuild it")
+        columns = {name: np.load(os.path.join(output_dir, f"{name}.npy"), mmap_mode='r' if mmap else None)
+                   for name in meta['columns']}
+        return cls(columns, meta['categories'], meta['source'])
+
+def build_snapshot(records, source=None, chunk_rows=BUILD_CHUNK_ROWS):
+    # `records` are tuples from record(); they are converted a chunk at a time
+    np = require_numpy()
+    categories = {column: [''] for column in CATEGORICAL}
+    lookups = {column: {'': 0} for column in CATEGORICAL}
+    chunks = {name: [] for name in ['date', 'amount', 'discount'] + CATEGORICAL}
+
+    def encode(column, value):
+        lookup = lookups[column]
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(categories[column])
+            categories[column].append(value)
+        return code
+
+    def flush(batch):
+        amounts, kinds, modes, statuses, departments, dates, percentages = zip(*batch)
+        amount = np.array(amounts, dtype=np.float64)
+        percentage = np.clip(np.array(percentages, dtype=np.float64), 0, 99.99)
+        chunks['amount'].append(amount)
+        # Amounts are stored after discount: original = amount / (1 - p/100)
+        chunks['discount'].append(np.abs(amount) * percentage / (100 - percentage))
+        chunks['date'].append(np.array([date or 'NaT' for date in dates], dtype='datetime64[D]'))
+        for column, values in zip(CATEGORICAL, (kinds, modes, statuses, departments)):
+            chunks[column].append(np.fromiter((encode(column, value) for value in values), dtype=np.uint16,
+                                              count=len(values)))
+
+    batch = []
+    for item in records:
+        batch.append(item)
+        if len(batch) >= chunk_rows:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+
+    empty = {'date': 'datetime64[D]', 'amount': np.float64, 'discount': np.float64}
+    columns = {name: np.concatenate(parts) if parts else np.empty(0, dtype=empty.get(name, np.uint16))
+               for name, parts in chunks.items()}
+    return Snapshot(columns, categories, source)
+
+def synthetic_snapshot(rows, years=3, seed=0):
+    # Random transactions over `years` years, for timing reports at scale
+    np = require_numpy()
+    rng = np.random.default_rng(seed)
+    categories = {
+        'transaction_type': ['', 'CONSULTATION', 'LAB_TEST', 'XRAY', 'PROCEDURE', 'REFUND', 'DISCOUNT'],
+        'payment_mode': ['', 'CASH', 'UPI', 'ONLINE', 'CARD'],
+        'status': ['', 'COMPLETED', 'CANCELLED'],
+        'department': [''] + [f"DEPARTMENT {i}" for i in range(1, 25)],
+    }
+    kind = rng.choice(len(categories['transaction_type']) - 1, rows, p=[.6, .2, .08, .08, .02, .02]) + 1
+    amount = rng.integers(100, 5000, rows).astype(np.float64)
+    amount[kind == categories['transaction_type'].index('REFUND')] *= -1
+    percentage = np.where(rng.random(rows) < .1, rng.choice([5.0, 10.0, 20.0], rows), 0.0)
+    columns = {
+        'date': np.datetime64('2023-01-01') + rng.integers(0, 365 * years, rows).astype('timedelta64[D]'),
+        'amount': amount,
+        'discount': np.abs(amount) * percentage / (100 - percentage),
+        'transaction_type': kind.astype(np.uint16),
+        'payment_mode': rng.integers(1, len(categories['payment_mode']), rows).astype(np.uint16),
+        'status': np.where(rng.random(rows) < .01, 2, 1).astype(np.uint16),
+        'department': rng.integers(0, len(categories['department']), rows).astype(np.uint16),
+    }
+    return Snapshot(columns, categories, f"synthetic:{rows}")
+
+def category_mask(snapshot, column, values):
+    # Rows whose category is one of `values`, via a lookup table over codes
+    # (cheaper than np.isin on millions of rows)
+    np = require_numpy()
+    table = np.zeros(len(snapshot.categories[column]), dtype=bool)
+    table[snapshot.codes(column, values)] = True
+    return table[snapshot.columns[column]]
+
+def revenue_report(snapshot, by='day', start=None, end=None):
+    # Revenue, refunds and discounts grouped by 'day', 'month' or
+    # 'department', with one bincount per measure. Cancelled transactions
+    # count toward nothing; refunds are negative amounts or REFUND rows;
+    # DISCOUNT rows add to discounts alongside discount_percentage.
+    np = require_numpy()
+    columns = snapshot.columns
+    # Days since the epoch; NaT is the smallest int64
+    day = columns['date'].view(np.int64)
+    amount = columns['amount']
+
+    keep = ~category_mask(snapshot, 'status', ['CANCELLED'])
+    if start is not None:
+        keep &= day >= np.datetime64(start, 'D').astype(np.int64)
+    if end is not None:
+        keep &= day <= np.datetime64(end, 'D').astype(np.int64)
+    refund_rows = (amount < 0) | category_mask(snapshot, 'transaction_type', ['REFUND'])
+    discount_rows = category_mask(snapshot, 'transaction_type', ['DISCOUNT'])
+    revenue_rows = ~refund_rows & ~discount_rows
+
+    if by == 'department':
+        groups = columns['department'].astype(np.int64)
+        labels = [value or 'UNASSIGNED' for value in snapshot.categories['department']]
+    elif by in ('day', 'month'):
+        keep &= day != np.iinfo(np.int64).min
+        if not keep.any():
+            return []
+        first = int(day[keep].min())
+        days = np.arange(first, int(day[keep].max()) + 1).astype('datetime64[D]')
+        groups = np.clip(day - first, 0, len(days) - 1)
+        labels = [str(label) for label in days]
+        if by == 'month':
+            # Map through the (small) table of distinct days rather than
+            # converting every row's date to a month
+            months = days.astype('datetime64[M]')
+            month_of_day = (months - months[0]).astype(np.int64)
+            groups = month_of_day[groups]
+            labels = [str(label) for label in np.arange(months[0], months[-1] + 1)]
+    else:
+        raise ValueError(f"Unknown grouping: {by}")
+
+    # Dropped rows go to one extra bin past the labels
+    size = len(labels)
+    groups = np.where(keep, groups, size)
+
+    def total(mask, values):
+        return np.bincount(groups, weights=np.where(mask, values, 0.0), minlength=size + 1)[:size]
+
+    magnitude = np.abs(amount)
+    revenue = total(revenue_rows, amount)
+    refunds = total(refund_rows, magnitude)
+    discounts = total(discount_rows, magnitude) + total(revenue_rows, columns['discount'])
+    count = np.bincount(groups, minlength=size + 1)[:size]
+
+    report = []
+    for group in np.flatnonzero(count):
+        report.append({
+            by: labels[group],
+            'transactions': int(count[group]),
+            'revenue': float(revenue[group]),
+            'refunds': float(refunds[group]),
+            'discounts': float(discounts[group]),
+            'net': float(revenue[group] - refunds[group]),
+        })
+    if by == 'department':
+        report.sort(key=lambda row: -row['revenue'])
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a columnar patient_transactions snapshot and report revenue from it")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--export', metavar='JSON', help=f"build from a Supabase export (default {EXPORT_FILE})")
+    source.add_argument('--split', metavar='DIR', help="build from per-table NDJSON written by export_stream.py")
+    source.add_argument('--database-url', help="build from patient_transactions in Postgres")
+    source.add_argument('--synthetic', type=int, metavar='ROWS', help="build a random snapshot of ROWS transactions")
+    source.add_argument('--load', action='store_true', help="report from the existing snapshot without rebuilding")
+    parser.add_argument('--output', default=SNAPSHOT_DIR)
+    parser.add_argument('--by', choices=['day', 'month', 'department'], default='month')
+    parser.add_argument('--from', dest='start', metavar='YYYY-MM-DD')
+    parser.add_argument('--to', dest='end', metavar='YYYY-MM-DD')
+    parser.add_argument('--top', type=int, default=24, help="report rows to print (the last ones for day/month)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.load:
+        snapshot = Snapshot.load(args.output)
+    else:
+        if args.synthetic:
+            snapshot = synthetic_snapshot(args.synthetic)
+        elif args.split:
+            snapshot = build_snapshot(iter_split_records(args.split), f"split:{os.path.abspath(args.split)}")
+        elif args.database_url:
+            snapshot = build_snapshot(iter_database_records(args.database_url), 'database')
+        else:
+            path = args.export or EXPORT_FILE
+            snapshot = build_snapshot(iter_export_records(path), f"export:{os.path.abspath(path)}")
+        snapshot.save(args.output)
+        snapshot = Snapshot.load(args.output)
+    loaded = time.perf_counter()
+
+    report = revenue_report(snapshot, args.by, args.start, args.end)
+    reported = time.perf_counter()
+
+    rows = report[:args.top] if args.by == 'department' else report[-args.top:]
+    for row in rows:
+        print(f"{row[args.by]:<24} {row['transactions']:>9,} txns  revenue {row['revenue']:>14,.2f}  "
+              f"refunds {row['refunds']:>12,.2f}  discounts {row['discounts']:>12,.2f}  net {row['net']:>14,.2f}")
+    print(f"{len(snapshot):,} transactions in {args.output}; built/loaded in {loaded - started:.2f}s, "
+          f"{len(report)} {args.by} groups in {(reported - loaded) * 1000:.1f}ms.")
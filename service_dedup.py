@@ -0,0 +1,77 @@
+import json
+import re
+
+from catalog_index import normalize_name
+from catalog_manifest import write_if_changed
+
+REPORT_FILE = 'service_merge_report.json'
+
+# Spelling variants seen in the lab master that mean the same thing
+TOKEN_SYNONYMS = {
+    'hr': 'hrs',
+    'hour': 'hrs',
+    'hours': 'hrs',
+    'urinary': 'urine',
+}
+
+NUMBERED_PREFIX = re.compile(r'^\s*\d+\s*:\s*')
+# Runs of letters or digits; punctuation is dropped and "24hrs" splits in two
+TOKEN = re.compile(r'[a-z]+|[0-9]+')
+
+def canonical_key(name):
+    # "24 Hrs. Urine Albumin", "24 Hrs Urinary Albumin" and "135:24HRS urine
+    # albumin" all map to "24 hrs urine albumin". Word order is kept:
+    # "Gram Stain (CSF)" and "CSF Gram Stain" stay apart.
+    tokens = []
+    for token in TOKEN.findall(NUMBERED_PREFIX.sub('', name.lower())):
+        if token[0].isdigit():
+            token = token.lstrip('0') or '0'
+        tokens.append(TOKEN_SYNONYMS.get(token, token))
+    return ' '.join(tokens)
+
+# Near-duplicates are found by bucketing on canonical_key(), one dict lookup
+# per name, so the cost is linear in the list rather than pairwise. A name is
+# only merged into a kept spelling with the same price; one with a different
+# price is kept too and listed for review, since either price may be right.
+class ServiceDeduper:
+    def __init__(self):
+        self.groups = {}
+
+    def add(self, name, price):
+        # True if `name` should be kept
+        key = canonical_key(name)
+        group = self.groups.get(key)
+        if group is None:
+            self.groups[key] = {'kept': [{'name': name, 'price': price}], 'merged': []}
+            return True
+        for kept in group['kept']:
+            if kept['price'] == price:
+                group['merged'].append({'name': name, 'price': price, 'into': kept['name']})
+                return False
+        group['kept'].append({'name': name, 'price': price})
+        return True
+
+    def report(self):
+        merges = []
+        review = []
+        for key, group in self.groups.items():
+            if group['merged']:
+                merges.append({'key': key, 'merged': group['merged']})
+            if len(group['kept']) > 1:
+                review.append({'key': key, 'rows': group['kept']})
+        return {
+            'groups': len(self.groups),
+            'merged': sum(len(m['merged']) for m in merges),
+            'price_conflicts': len(review),
+            'merges': merges,
+            # Same name, different prices: all rows were kept, a human decides
+            'review': review,
+        }
+
+def priced_key(name, rates):
+    # ID registry key for a name kept a second time at another price, so each
+    # price of "24 Hrs Urine Magnesium" gets a code of its own
+    return f"{normalize_name(name)} @ {'/'.join(f'{rate:g}' for rate in rates)}"
+
+def write_report(report, output_file=REPORT_FILE):
+    return write_if_changed(output_file, json.dumps(report, indent=2, ensure_ascii=False) + "\n")
@@ -0,0 +1,34 @@
+import json
+
+from catalog_index import normalize_name
+from catalog_manifest import write_if_changed
+
+REGISTRY_FILE = 'service_ids.json'
+
+# Codes are handed out once per (family, normalized name) and then persisted,
+# so inserting or reordering lines in a price list never renumbers the
+# services after it. The first free number of each family is recorded, so
+# removed services do not get their codes reused.
+class ServiceIdRegistry:
+    def __init__(self, path=REGISTRY_FILE):
+        self.path = path
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.families = json.load(f)
+        except FileNotFoundError:
+            self.families = {}
+
+    def assign(self, family, name, start=1, key=None):
+        # Callers that already normalized the name can pass it as `key`
+        entry = self.families.setdefault(family, {'next': start, 'ids': {}})
+        if key is None:
+            key = normalize_name(name)
+        code = entry['ids'].get(key)
+        if code is None:
+            code = f"{family}-{entry['next']:03d}"
+            entry['ids'][key] = code
+            entry['next'] += 1
+        return code
+
+    def save(self):
+        return write_if_changed(self.path, json.dumps(self.families, indent=2, ensure_ascii=False) + "\n")
@@ -377,23 +377,18 @@ const App: React.FC = () => {
       toast.dismiss(expenseToast);
       const refundToast = toast.loading('Fetching refunds...', { duration: 0 });
 
-      // Get all refunds with error handling
-      let refunds: any[] = [];
+      // Get all refunds; a failed page fails the backup instead of saving
+      // the refunds fetched so far as if they were all of them
+      const refunds: any[] = [];
       try {
-        // Use ExactDateService to get all refunds (wide date range)
-        const refundData = await ExactDateService.getPatientRefunds('2000-01-01', '2100-12-31');
-        const refundError = null;
-
-        if (!refundError && refundData) {
-          refunds = refundData;
-          logger.log(`✅ Retrieved ${refunds.length} refunds for backup`);
-        } else {
-          logger.warn('⚠️ Refunds table not accessible, skipping refunds in backup');
-          refunds = [];
+        // Page through all refunds; each request is capped at the API page size
+        for await (const page of ExactDateService.iteratePatientRefunds()) {
+          refunds.push(...page);
         }
+        logger.log(`✅ Retrieved ${refunds.length} refunds for backup`);
       } catch (error) {
-        logger.warn('⚠️ Error fetching refunds, using empty array:', error);
-        refunds = [];
+        toast.dismiss(refundToast);
+        throw error;
       }
 
       toast.dismiss(refundToast);
@@ -440,7 +435,7 @@ const App: React.FC = () => {
           data: refunds || [],
           fields: refunds.length > 0 ? Object.keys(refunds[0]) : ['id', 'amount', 'reason', 'patient_id', 'created_at'],
           total_amount: refunds?.reduce((sum, r) => sum + (r.amount || 0), 0) || 0,
-          note: refunds.length === 0 ? 'Refunds table not accessible during backup' : 'All refunds included'
+          note: refunds.length === 0 ? 'No refunds recorded' : 'All refunds included'
         },
         summary: {
           total_patients: patients?.length || 0,
@@ -588,8 +583,8 @@ const App: React.FC = () => {
   };
 
   const performDataExport = async () => {
+    const loadingToast = toast.loading('Fetching data from database...');
     try {
-      const loadingToast = toast.loading('Fetching data from database...');
 
       const exportDataObject: any = {
         export_info: {
@@ -632,25 +627,19 @@ const App: React.FC = () => {
         };
       }
 
-      // Add refunds data to export
-      try {
-        // Use ExactDateService to get all refunds (wide date range)
-        const refunds = await ExactDateService.getPatientRefunds('2000-01-01', '2100-12-31');
-
-        exportDataObject.refunds = {
-          count: refunds?.length || 0,
-          data: refunds || [],
-          note: refunds?.length === 0 ? 'No refunds found or table not accessible' : 'All refunds included'
-        };
-      } catch (error) {
-        logger.warn('⚠️ Refunds not available for export:', error);
-        exportDataObject.refunds = {
-          count: 0,
-          data: [],
-          note: 'Refunds table not accessible'
-        };
+      // Add refunds data to export, a page at a time; a failed page fails the
+      // export rather than writing part of the refunds as all of them
+      const refunds: any[] = [];
+      for await (const page of ExactDateService.iteratePatientRefunds()) {
+        refunds.push(...page);
       }
 
+      exportDataObject.refunds = {
+        count: refunds.length,
+        data: refunds,
+        note: refunds.length === 0 ? 'No refunds found' : 'All refunds included'
+      };
+
       toast.dismiss(loadingToast);
       toast.loading('Generating export file...', { duration: 2000 });
 
@@ -739,6 +728,7 @@ const App: React.FC = () => {
       toast.success(`Data exported successfully as ${fileName}!`);
 
     } catch (error) {
+      toast.dismiss(loadingToast);
       toast.error('Export failed. Please try again.');
       logger.error('Export error:', error);
     }
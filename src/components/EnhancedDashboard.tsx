@@ -134,19 +134,6 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
     }
   };
 
-  // Helper function to fetch all refunds using ExactDateService
-  const fetchAllRefunds = async () => {
-    try {
-      // Use ExactDateService to get all refunds (wide date range)
-      const allRefunds = await ExactDateService.getPatientRefunds('2000-01-01', '2100-12-31');
-      console.log(`📊 Total refunds fetched via API: ${allRefunds.length}`);
-      return allRefunds;
-    } catch (error) {
-      console.warn('⚠️ Refunds query failed, using empty array:', error);
-      return [];
-    }
-  };
-
   // Fetch dashboard data
   const { data: dashboardStats, isLoading: statsLoading, refetch: refetchStats } = useQuery({
     queryKey: queryKeys.dashboardStats,
@@ -349,6 +336,54 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
     }
   };
 
+  // IST day bounds (YYYY-MM-DD) for the daily stats request, matching getDateRange
+  const getDailyStatsRange = (): { start?: string; end?: string } => {
+    const todayStr = formatDateString(new Date());
+
+    switch (dateFilter) {
+      case 'today':
+        return { start: todayStr, end: todayStr };
+      case 'week': {
+        const weekDate = new Date();
+        weekDate.setDate(weekDate.getDate() - 6);
+        return { start: formatDateString(weekDate), end: todayStr };
+      }
+      case 'month': {
+        const now = new Date();
+        return { start: formatDateString(new Date(now.getFullYear(), now.getMonth(), 1)), end: todayStr };
+      }
+      case 'custom':
+        if (customStartDate && customEndDate) {
+          return { start: customStartDate, end: customEndDate };
+        }
+        return { start: todayStr, end: todayStr };
+      default:
+        return {};
+    }
+  };
+
+  // Per-day totals from the daily_stats rollups, with today computed live by
+  // the server; the cards use these instead of every patient, transaction and refund
+  const { data: dailyStats, isFetched: dailyStatsFetched, refetch: refetchDailyStats } = useQuery({
+    queryKey: ['dashboard', 'daily-stats', dateFilter, customStartDate, customEndDate],
+    queryFn: async () => {
+      try {
+        const range = getDailyStatsRange();
+        return await dashboardService.getDailyStats(range.start, range.end);
+      } catch (error) {
+        console.warn('Could not fetch daily stats, falling back to raw data:', error);
+        return null;
+      }
+    },
+    staleTime: 60 * 1000,
+  });
+
+  // Until daily_stats.py has run once the rollups only hold the live days, so
+  // the cards fall back to aggregating the raw patients and transactions.
+  // The breakdown modals load the raw rows on demand either way.
+  const rollupReady = !!dailyStats?.refreshedAt;
+  const needRawData = dailyStatsFetched && !rollupReady;
+
   // Fetch ALL patients data without date filtering (we'll filter in getCardData for consistency)
   const { data: allPatientsData, refetch: refetchPatients } = useQuery({
     queryKey: ['all-patients'],
@@ -363,6 +398,7 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
         return [];
       }
     },
+    enabled: needRawData,
     staleTime: 5 * 60 * 1000,
   });
 
@@ -458,9 +494,9 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
     staleTime: 5 * 60 * 1000,
   });
 
-  // Fetch operations revenue/expense data with date filtering
+  // Fetch operations revenue data with date filtering
   const { data: operationsData, refetch: refetchOperations } = useQuery({
-    queryKey: ['operations', 'revenue-expenses', dateFilter, customStartDate, customEndDate],
+    queryKey: ['operations', 'revenue', dateFilter, customStartDate, customEndDate],
     queryFn: async () => {
       try {
         // Get date range for filtering
@@ -653,6 +689,49 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
           })
         });
 
+        return {
+          revenue: revenueData || [],
+        };
+      } catch (error) {
+        console.warn('Could not fetch operations data:', error);
+        return { revenue: [] };
+      }
+    },
+    enabled: needRawData,
+    staleTime: 5 * 60 * 1000,
+  });
+
+  // Refunds for the raw fallback; the rollups carry refund_amount otherwise.
+  // null means the fetch failed, so net revenue is shown as unavailable
+  // rather than computed with zero refunds.
+  const { data: rawRefundsData, refetch: refetchRefunds } = useQuery({
+    queryKey: ['operations', 'refunds', dateFilter, customStartDate, customEndDate],
+    queryFn: async () => {
+      try {
+        const dateRange = getDateRange();
+        const pageOptions = dateRange ? { startDate: dateRange.start.toISOString(), endDate: dateRange.end.toISOString() } : {};
+        const refunds: any[] = [];
+        for await (const page of ExactDateService.iteratePatientRefunds(pageOptions)) {
+          refunds.push(...page);
+        }
+        console.log(`📊 Total refunds fetched via API: ${refunds.length}`);
+        return refunds;
+      } catch (error) {
+        console.warn('⚠️ Refunds query failed, net revenue unavailable:', error);
+        return null;
+      }
+    },
+    enabled: needRawData,
+    staleTime: 5 * 60 * 1000,
+  });
+
+  // Fetch expenses with date filtering (not part of the daily_stats rollups)
+  const { data: expensesData, refetch: refetchExpenses } = useQuery({
+    queryKey: ['operations', 'expenses', dateFilter, customStartDate, customEndDate],
+    queryFn: async () => {
+      try {
+        const dateRange = getDateRange();
+
         // Get ALL expenses using pagination - we'll filter in JavaScript for consistency
         const allExpenseData = await fetchAllExpenses();
 
@@ -671,35 +750,10 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
           });
         }
 
-        // ADDED: Query refunds to match operations ledger calculation using pagination
-        const allRefundData = await fetchAllRefunds();
-
-        // Apply date filtering for refunds if not 'all'
-        let refunds = allRefundData;
-        if (dateRange) {
-          const startDate = dateRange.start.toISOString();
-          const endDate = dateRange.end.toISOString();
-
-          refunds = allRefundData.filter(refund => {
-            if (!refund.created_at) return false;
-            return refund.created_at >= startDate && refund.created_at <= endDate;
-          });
-        }
-
-        console.log('↩️ Dashboard Refunds Debug:', {
-          filter: dateFilter,
-          refundCount: refunds?.length || 0,
-          totalRefunds: refunds?.reduce((sum, r) => sum + (r.amount || 0), 0) || 0
-        });
-
-        return {
-          revenue: revenueData || [],
-          expenses: expenseData || [],
-          refunds: refunds || [],
-        };
+        return expenseData || [];
       } catch (error) {
-        console.warn('Could not fetch operations data:', error);
-        return { revenue: [], expenses: [], refunds: [] };
+        console.warn('Could not fetch expenses:', error);
+        return [];
       }
     },
     staleTime: 5 * 60 * 1000,
@@ -803,10 +857,14 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
       console.log('🔄 Refreshing all dashboard data...');
       await Promise.all([
         refetchStats(),
-        refetchPatients(),
+        refetchDailyStats(),
         refetchBeds(),
-        refetchOperations(),
+        refetchExpenses(),
         refetchAppointments(),
+        // The raw rows are only loaded for the fallback cards and the breakdowns
+        ...(allPatientsData ? [refetchPatients()] : []),
+        ...(operationsData ? [refetchOperations()] : []),
+        ...(needRawData ? [refetchRefunds()] : []),
       ]);
       console.log('✅ Dashboard refresh completed successfully');
       toast.success('Dashboard data refreshed!');
@@ -856,7 +914,8 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
 
           toast.success(`Appointment accepted for ${appointment.patient_name}! Patient is now visible in patient list.`);
           loadLocalAppointments(); // Refresh the appointments list
-          refetchPatients(); // Refresh patient list to show the now-visible patient
+          refetchDailyStats(); // Refresh the patient count to include the now-visible patient
+          if (allPatientsData) refetchPatients(); // Refresh patient list to show the now-visible patient
           return;
         }
       }
@@ -924,7 +983,8 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
           toast.success(`Appointment rejected! Patient ${cancelledAppointment.patient_name} has been removed.`);
           loadLocalAppointments(); // Refresh the appointments list
           // Also refresh patient data in case a patient was deleted
-          refetchPatients();
+          refetchDailyStats();
+          if (allPatientsData) refetchPatients();
           return;
         }
       }
@@ -1065,8 +1125,13 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
     // CONSISTENCY FIX: Use same filtering logic as breakdown
     let totalPatients = 0;
     let totalRevenue = 0;
+    const dailyStatsDays = dailyStats?.days || [];
 
-    if (dateFilter === 'today') {
+    if (rollupReady) {
+      // Rollup days already apply the same ORTHO/DR. HEMANT and IPD bill exclusions
+      totalPatients = dailyStatsDays.reduce((sum, day) => sum + day.new_patients, 0);
+      totalRevenue = dailyStatsDays.reduce((sum, day) => sum + day.revenue, 0);
+    } else if (dateFilter === 'today') {
       // For 'today' filter, count actual today's patients using robust date comparison
       const todayStr = formatDateString(new Date());
 
@@ -1254,7 +1319,7 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
       const todayStr = formatDateString(new Date());
 
       // 🔧 DATA VALIDATION: Check if expense data exists
-      const allExpenses = operationsData?.expenses || [];
+      const allExpenses = expensesData || [];
       console.log('💸 EXPENSE DATA VALIDATION:', {
         allExpensesCount: allExpenses.length,
         todayStr,
@@ -1299,7 +1364,7 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
       const weekStartStr = formatDateString(weekStartDate);
 
       // 🔧 Count expenses for week using ROBUST date comparison (same as breakdown modal)
-      const allExpenses = operationsData?.expenses || [];
+      const allExpenses = expensesData || [];
       const weekExpenses = allExpenses.filter((e: any) => {
         if (!e.expense_date) return false;
         return isDateInRange(e.expense_date, weekStartStr, weekTodayStr);
@@ -1312,19 +1377,25 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
         weekRange: `${weekStartStr} to ${weekTodayStr} (Last 7 days)`,
         calculatedExpenses: totalExpenses,
         weekExpensesCount: weekExpenses.length,
-        preFilteredExpenses: (operationsData?.expenses || []).reduce((sum: number, e: any) => sum + (e.amount || 0), 0),
+        preFilteredExpenses: (expensesData || []).reduce((sum: number, e: any) => sum + (e.amount || 0), 0),
         note: 'This should now match exactly with breakdown modal calculations'
       });
     } else {
       // For other filters, use existing filtered data
-      totalExpenses = operationsData?.expenses.reduce((sum: number, expense: any) =>
-        sum + (expense.amount || 0), 0) || 0;
+      totalExpenses = (expensesData || []).reduce((sum: number, expense: any) =>
+        sum + (expense.amount || 0), 0);
+    }
+    // Without the rollups refunds come from the raw fetch; if that failed (or
+    // is still loading) they are unknown, not zero
+    let totalRefunds: number | null = null;
+    if (rollupReady) {
+      totalRefunds = dailyStatsDays.reduce((sum, day) => sum + day.refund_amount, 0);
+    } else if (rawRefundsData) {
+      totalRefunds = rawRefundsData.reduce((sum: number, refund: any) => sum + (refund.amount || 0), 0);
     }
-    const totalRefunds = operationsData?.refunds?.reduce((sum: number, refund: any) =>
-      sum + (refund.amount || 0), 0) || 0;
 
     // Calculate net revenue matching operations ledger formula
-    const netRevenue = totalRevenue - totalExpenses - totalRefunds;
+    const netRevenue = totalRefunds === null ? null : totalRevenue - totalExpenses - totalRefunds;
 
     // 🔧 COMPREHENSIVE DEBUG: Final dashboard totals with data validation
     console.log('📊 FINAL DASHBOARD TOTALS (FIXED - robust date handling applied):', {
@@ -1338,16 +1409,18 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
         netRevenue
       },
       dataSources: {
+        source: rollupReady ? 'daily_stats' : 'raw',
+        dailyStatsDays: dailyStatsDays.length,
         allPatientsCount: allPatientsData?.length || 0,
         allRevenueCount: operationsData?.revenue?.length || 0,
-        allExpensesCount: operationsData?.expenses?.length || 0,
-        allRefundsCount: operationsData?.refunds?.length || 0
+        allExpensesCount: expensesData?.length || 0,
+        allRefundsCount: rollupReady ? null : rawRefundsData?.length ?? null
       },
       dataValidation: {
-        hasPatientData: (allPatientsData?.length || 0) > 0,
-        hasRevenueData: (operationsData?.revenue?.length || 0) > 0,
-        hasExpenseData: (operationsData?.expenses?.length || 0) > 0,
-        allDataLoaded: !!(allPatientsData && operationsData)
+        hasPatientData: rollupReady || (allPatientsData?.length || 0) > 0,
+        hasRevenueData: rollupReady || (operationsData?.revenue?.length || 0) > 0,
+        hasExpenseData: (expensesData?.length || 0) > 0,
+        allDataLoaded: rollupReady ? !!expensesData : !!(allPatientsData && operationsData && expensesData)
       },
       calculation: 'Revenue - Expenses - Refunds = Net Revenue'
     });
@@ -1358,6 +1431,8 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
       availableBeds,
       revenue: totalRevenue,
       expenses: totalExpenses,
+      refunds: totalRefunds,
+      netRevenue,
     };
   };
 
@@ -1389,8 +1464,9 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
 
           const currentFilteredPatients = patientsData || [];
 
-          // Use the SAME all patients data as the main card to ensure consistency
-          const allPatientsForBreakdown = allPatientsData || [];
+          // Use the SAME all patients data as the main card to ensure consistency;
+          // with the rollups serving the cards it is only loaded on the first breakdown
+          const allPatientsForBreakdown = allPatientsData ?? (await refetchPatients()).data ?? [];
 
           console.log('📊 Data Source Consistency Check:', {
             currentFilter: dateFilter,
@@ -1541,7 +1617,7 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
           console.log('💰 Revenue Card Click: Using EXACT same data as main dashboard...');
 
           // Use the SAME pre-filtered data that the main dashboard uses for complete consistency
-          const allRevenueData = operationsData?.revenue || [];
+          const allRevenueData = operationsData?.revenue ?? (await refetchOperations()).data?.revenue ?? [];
 
           console.log('💰 Revenue Card: Using main dashboard revenue data for consistency:', {
             transactionCount: allRevenueData.length,
@@ -1794,20 +1870,20 @@ export const EnhancedDashboard: React.FC<Props> = ({ onNavigate }) => {
             today: expenseTodayStr,
             weekRange: `${expenseWeekStr} to ${expenseTodayStr} (Last 7 days)`,
             monthRange: `${expenseMonthStr} to ${expenseTodayStr} (This month)`,
-            allExpensesCount: operationsData?.expenses?.length || 0,
+            allExpensesCount: expensesData?.length || 0,
             calculation: {
               weekDays: Math.ceil((today.getTime() - expenseWeekStartDate.getTime()) / (1000 * 60 * 60 * 24)) + 1,
               monthDays: Math.ceil((today.getTime() - expenseMonthStartDate.getTime()) / (1000 * 60 * 60 * 24)) + 1
             }
           });
 
-          const todayExpenses = operationsData?.expenses.filter((e: any) =>
+          const todayExpenses = expensesData?.filter((e: any) =>
             e.expense_date && isSameDate(e.expense_date, expenseTodayStr)) || [];
-          const weekExpenses = operationsData?.expenses.filter((e: any) => {
+          const weekExpenses = expensesData?.filter((e: any) => {
             if (!e.expense_date) return false;
             return isDateInRange(e.expense_date, expenseWeekStr, expenseTodayStr);
           }) || [];
-          const monthExpenses = operationsData?.expenses.filter((e: any) => {
+          const monthExpenses = expensesData?.filter((e: any) => {
             if (!e.expense_date) return false;
             return isDateInRange(e.expense_date, expenseMonthStr, expenseTodayStr);
           }) || [];
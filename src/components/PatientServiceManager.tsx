@@ -241,7 +241,8 @@ const PatientServiceManager: React.FC<PatientServiceManagerProps> = ({
       setServices([...services, serviceItem]);
 
       // 🔄 CRITICAL FIX: Invalidate React Query cache to refresh dashboard
-      queryClient.invalidateQueries({ queryKey: ['operations'] }); // This covers ['operations', 'revenue-expenses', ...]
+      queryClient.invalidateQueries({ queryKey: ['operations'] }); // This covers ['operations', 'revenue', ...] and ['operations', 'expenses', ...]
+      queryClient.invalidateQueries({ queryKey: ['dashboard', 'daily-stats'] }); // Today's cards are computed live
       queryClient.invalidateQueries({ queryKey: ['all-patients'] });
       queryClient.invalidateQueries({ queryKey: ['beds'] });
       queryClient.invalidateQueries({ queryKey: ['appointments'] });
@@ -347,6 +348,7 @@ const PatientServiceManager: React.FC<PatientServiceManagerProps> = ({
 
       // 🔄 CRITICAL: Invalidate React Query cache to refresh operations ledger
       queryClient.invalidateQueries({ queryKey: ['operations'] });
+      queryClient.invalidateQueries({ queryKey: ['dashboard', 'daily-stats'] });
       queryClient.invalidateQueries({ queryKey: ['all-patients'] });
       queryClient.invalidateQueries({ queryKey: ['transactions'] });
 
@@ -7,7 +7,7 @@ import type { PatientWithRelations } from '../../config/supabaseNew';
 import { MEDICAL_SERVICES_DATA, searchServices, type MedicalService } from '../../data/medicalServices';
 import { logger } from '../../utils/logger';
 import BillingService, { type IPDBill } from '../../services/billingService';
-import { RGHS_PACKAGES_DATA, type RGHSPackage } from '../../data/rghsPackages';
+import { RGHS_PACKAGES_DATA, RGHS_RATE_TIER_COUNT, getRghsPackagesForTier, type RGHSPackage } from '../../data/rghsPackages';
 import { HOSPITAL_SERVICES_DATA, HOSPITAL_PROCEDURES_DATA, type HospitalService as HospitalServiceType, type HospitalProcedure } from '../../data/hospitalServicesAndProcedures';
 
 interface BillingRow {
@@ -225,6 +225,7 @@ const NewIPDBillingModule: React.FC = () => {
   const [packageSearchTerm, setPackageSearchTerm] = useState('');
   const [showPackageDropdown, setShowPackageDropdown] = useState(false);
   const [rghsPackages, setRghsPackages] = useState<RGHSPackage[]>(RGHS_PACKAGES_DATA);
+  const [rghsRateTier, setRghsRateTier] = useState(0);
 
   // Hospital Services & Procedures State
   const [hospitalServices] = useState<HospitalServiceType[]>(HOSPITAL_SERVICES_DATA);
@@ -1811,6 +1812,14 @@ const NewIPDBillingModule: React.FC = () => {
     }
   };
 
+  // Switching tier re-prices the list and any package already picked
+  const handleRghsTierChange = (tier: number) => {
+    const packages = getRghsPackagesForTier(tier);
+    setRghsRateTier(tier);
+    setRghsPackages(packages);
+    setSelectedPackage(current => current ? packages.find(pkg => pkg.code === current.code) || null : null);
+  };
+
   const handlePayerSelect = (payer: string) => {
     setSelectedPayer(payer);
     setShowPayerModal(false);
@@ -3932,6 +3941,19 @@ const NewIPDBillingModule: React.FC = () => {
                           <div className="w-2 h-2 bg-orange-500 rounded-full mr-2"></div>
                           RGHS / Package Selection
                         </h5>
+                        {RGHS_RATE_TIER_COUNT > 1 && (
+                          <select
+                            value={rghsRateTier}
+                            onChange={(e) => handleRghsTierChange(Number(e.target.value))}
+                            className="px-3 py-1 text-sm border border-orange-300 rounded-md focus:outline-none focus:ring-2 focus:ring-orange-500"
+                          >
+                            {Array.from({ length: RGHS_RATE_TIER_COUNT }, (_, tier) => (
+                              <option key={tier} value={tier}>
+                                {tier === 0 ? 'Standard Rate' : `Rate Tier ${tier + 1}`}
+                              </option>
+                            ))}
+                          </select>
+                        )}
                       </div>
 
                       {selectedPackage ? (
@@ -3952,7 +3974,9 @@ const NewIPDBillingModule: React.FC = () => {
                             </div>
                             <div className="text-right">
                               <div className="text-xl font-bold text-orange-700">₹{selectedPackage.rate.toLocaleString()}</div>
-                              <div className="text-xs text-orange-500 mt-1">Package Rate</div>
+                              <div className="text-xs text-orange-500 mt-1">
+                                {rghsRateTier === 0 ? 'Package Rate' : `Package Rate (Tier ${rghsRateTier + 1})`}
+                              </div>
                             </div>
                           </div>
                         </div>
@@ -0,0 +1,77 @@
+// Lazy per-category access to the catalogs. When parse_rghs.py and
+// generate_services.py are run with --sharded they write one file per category
+// plus a manifest.json; each shard becomes its own chunk and is only fetched
+// when a screen asks for that category. Without shards on disk, the loaders
+// fall back to the full catalog modules, filtered by category.
+import type { MedicalService } from './medicalServices';
+import { assertRghsColumnsVersion, columnsToPackages, type RGHSPackage, type RGHSPackageColumns } from './rghsColumns';
+
+export interface CatalogShardEntry {
+  name: string;
+  file: string;
+  count: number;
+  hash: string;
+}
+
+interface CatalogShardManifest {
+  version: number;
+  shards: CatalogShardEntry[];
+}
+
+const SHARD_MANIFEST_VERSION = 1;
+
+const rghsManifests = import.meta.glob<CatalogShardManifest>('./rghsPackageShards/manifest.json', { eager: true, import: 'default' });
+const medicalManifests = import.meta.glob<CatalogShardManifest>('./medicalServiceShards/manifest.json', { eager: true, import: 'default' });
+
+const rghsShardLoaders = import.meta.glob<RGHSPackageColumns>(
+  ['./rghsPackageShards/*.json', '!./rghsPackageShards/manifest.json'],
+  { import: 'default' }
+);
+const medicalShardLoaders = import.meta.glob<MedicalService[]>('./medicalServiceShards/*.ts', { import: 'MEDICAL_SERVICES_SHARD' });
+
+// Same mapping as shard_name() in catalog_compiler.py
+const shardName = (category: string): string => category.replace(/[^A-Za-z0-9_]/g, '_') || 'UNCATEGORIZED';
+
+const readManifest = (manifests: Record<string, CatalogShardManifest>): CatalogShardManifest | null => {
+  const manifest = Object.values(manifests)[0];
+  if (!manifest) {
+    return null;
+  }
+  if (manifest.version !== SHARD_MANIFEST_VERSION) {
+    throw new Error(`Catalog shard manifest version ${manifest.version} is not supported (expected ${SHARD_MANIFEST_VERSION}). Re-run the generator with --sharded.`);
+  }
+  return manifest;
+};
+
+const RGHS_SHARDS = readManifest(rghsManifests);
+const MEDICAL_SERVICE_SHARDS = readManifest(medicalManifests);
+
+export const listRghsShards = (): CatalogShardEntry[] => RGHS_SHARDS?.shards ?? [];
+export const listMedicalServiceShards = (): CatalogShardEntry[] => MEDICAL_SERVICE_SHARDS?.shards ?? [];
+
+export const loadRghsShard = async (category: string, tier = 0): Promise<RGHSPackage[]> => {
+  if (!RGHS_SHARDS) {
+    const { getRghsPackagesForTier } = await import('./rghsPackages');
+    return getRghsPackagesForTier(tier).filter(pkg => pkg.category === category);
+  }
+
+  const entry = RGHS_SHARDS.shards.find(shard => shard.name === shardName(category));
+  const load = entry && rghsShardLoaders[`./rghsPackageShards/${entry.file}`];
+  if (!load) {
+    return [];
+  }
+  const columns = await load();
+  assertRghsColumnsVersion(columns);
+  return columnsToPackages(columns, tier);
+};
+
+export const loadMedicalServiceShard = async (category: string): Promise<MedicalService[]> => {
+  if (!MEDICAL_SERVICE_SHARDS) {
+    const { MEDICAL_SERVICES_DATA } = await import('./medicalServices');
+    return MEDICAL_SERVICES_DATA.filter(service => service.category === category);
+  }
+
+  const entry = MEDICAL_SERVICE_SHARDS.shards.find(shard => shard.name === shardName(category));
+  const load = entry && medicalShardLoaders[`./medicalServiceShards/${entry.file}`];
+  return load ? load() : [];
+};
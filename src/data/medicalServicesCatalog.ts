@@ -0,0 +1,615 @@
+// Generated by generate_services.py from its lab price list; do not edit.
+import type { MedicalService } from './medicalServices';
+
+export const MEDICAL_SERVICES_DATA: MedicalService[] = [
+  { id: 'LAB-001', code: 'LAB-001', name: `24 Hrs Urinary Albumin`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-002', code: 'LAB-002', name: `24 Hrs Urinary Calcium`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-003', code: 'LAB-003', name: `24 Hrs Urinary Electrolyte`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-004', code: 'LAB-004', name: `24 HRS URINARY URIC ACID`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-005', code: 'LAB-005', name: `24 Hrs Urine Chloride`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-006', code: 'LAB-006', name: `24 HRS URINE CREATININE`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-007', code: 'LAB-007', name: `24 Hrs Urine Creatinine Clearance`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-008', code: 'LAB-008', name: `24 Hrs Urine Magnesium`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-611', code: 'LAB-611', name: `24 Hrs Urine Magnesium`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-009', code: 'LAB-009', name: `24 HRS Urine Phosphorous`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-010', code: 'LAB-010', name: `24 Hrs Urine Sodium`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-011', code: 'LAB-011', name: `24 Hrs Urine Urea`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-013', code: 'LAB-013', name: `24 Hrs. Urine Albumin`, category: 'LAB_TEST', defaultPrice: 400.0, basePrice: 400.0, isActive: true },
+  { id: 'LAB-014', code: 'LAB-014', name: `24 Hrs. Urine Protein`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-015', code: 'LAB-015', name: `24 Hrs. urine stone analysis`, category: 'LAB_TEST', defaultPrice: 4200.0, basePrice: 4200.0, isActive: true },
+  { id: 'LAB-016', code: 'LAB-016', name: `24 Hrs.Urine Albumin/Creatinine Ratio`, category: 'LAB_TEST', defaultPrice: 400.0, basePrice: 400.0, isActive: true },
+  { id: 'LAB-017', code: 'LAB-017', name: `24 Hrs.Urine Calcium/Creatinine Ratio`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-018', code: 'LAB-018', name: `24Hrs Urine Potassium`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-019', code: 'LAB-019', name: `5 DRUGS SENSITIVITY`, category: 'LAB_TEST', defaultPrice: 2630.0, basePrice: 2630.0, isActive: true },
+  { id: 'LAB-020', code: 'LAB-020', name: `ABG`, category: 'LAB_TEST', defaultPrice: 2000.0, basePrice: 2000.0, isActive: true },
+  { id: 'LAB-021', code: 'LAB-021', name: `Absolute Basophils Count (ABC)`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-022', code: 'LAB-022', name: `Absolute Eosinophil Count (AEC)`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-023', code: 'LAB-023', name: `Absolute Lymphocyte Count (ALC)`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-024', code: 'LAB-024', name: `Absolute Monocytes Count (AMC)`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-025', code: 'LAB-025', name: `Absolute Neutrophil Count (ANC)`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-026', code: 'LAB-026', name: `Absolute Reticulocyte Count (ARC)`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-027', code: 'LAB-027', name: `Activated Partial Thromboplastin Time`, category: 'LAB_TEST', defaultPrice: 380.0, basePrice: 380.0, isActive: true },
+  { id: 'LAB-028', code: 'LAB-028', name: `AFB CUTURE  DRUGS PANEL`, category: 'LAB_TEST', defaultPrice: 5250.0, basePrice: 5250.0, isActive: true },
+  { id: 'LAB-029', code: 'LAB-029', name: `AFB SUSCEPTIBILITY 10 DRUG PANEL`, category: 'LAB_TEST', defaultPrice: 4200.0, basePrice: 4200.0, isActive: true },
+  { id: 'LAB-030', code: 'LAB-030', name: `Air Culture`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-031', code: 'LAB-031', name: `Albumin (Serum)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-032', code: 'LAB-032', name: `Alfa Feto Protein (AFP) Fluid`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-033', code: 'LAB-033', name: `Alfa Feto Protein (AFP) Serum`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-034', code: 'LAB-034', name: `ALKALI DENATURATION TEST (ADT)`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-035', code: 'LAB-035', name: `Alkaline Phosphatase`, category: 'LAB_TEST', defaultPrice: 190.0, basePrice: 190.0, isActive: true },
+  { id: 'LAB-036', code: 'LAB-036', name: `ALLERGY PANEL-1 BASIC (27 ALLERGENS)`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-037', code: 'LAB-037', name: `ALLERGY PANEL-2 PREMIUM (40 ALLERGEN)`, category: 'LAB_TEST', defaultPrice: 3360.0, basePrice: 3360.0, isActive: true },
+  { id: 'LAB-038', code: 'LAB-038', name: `ALLERGY PANEL-3 COMPREHENSIVE`, category: 'LAB_TEST', defaultPrice: 4200.0, basePrice: 4200.0, isActive: true },
+  { id: 'LAB-039', code: 'LAB-039', name: `Amylase`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-040', code: 'LAB-040', name: `Anaerobic Blood Culture`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-041', code: 'LAB-041', name: `Anaerobic Swab Culture`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-042', code: 'LAB-042', name: `Anemia Profile`, category: 'LAB_TEST', defaultPrice: 2520.0, basePrice: 2520.0, isActive: true },
+  { id: 'LAB-043', code: 'LAB-043', name: `Anion Gap`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-044', code: 'LAB-044', name: `Anti - CCP`, category: 'LAB_TEST', defaultPrice: 1700.0, basePrice: 1700.0, isActive: true },
+  { id: 'LAB-045', code: 'LAB-045', name: `Anti Cardiolipin Antibodies (IgG)`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-046', code: 'LAB-046', name: `Anti Cardiolipin Antibodies (IgM)`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-047', code: 'LAB-047', name: `Anti HAV IgM`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-048', code: 'LAB-048', name: `Anti HBe`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-049', code: 'LAB-049', name: `Anti HBs`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-050', code: 'LAB-050', name: `Anti HCV`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-051', code: 'LAB-051', name: `Anti HEV IgG`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-052', code: 'LAB-052', name: `Anti HEV IgM`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-053', code: 'LAB-053', name: `ANTI MULLERIAN HORMONE`, category: 'LAB_TEST', defaultPrice: 2300.0, basePrice: 2300.0, isActive: true },
+  { id: 'LAB-054', code: 'LAB-054', name: `Anti Nuclear Antibody (ANA)`, category: 'LAB_TEST', defaultPrice: 840.0, basePrice: 840.0, isActive: true },
+  { id: 'LAB-055', code: 'LAB-055', name: `Anti Phospholipid Antibodies (IgG)`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-056', code: 'LAB-056', name: `Anti Phospholipid Antibodies (IgM)`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-057', code: 'LAB-057', name: `Anti SARS-COV-2 IgG`, category: 'LAB_TEST', defaultPrice: 1250.0, basePrice: 1250.0, isActive: true },
+  { id: 'LAB-058', code: 'LAB-058', name: `Anti Thyroglobulin Antibody`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-059', code: 'LAB-059', name: `Anti Thyroid Antibody`, category: 'LAB_TEST', defaultPrice: 1160.0, basePrice: 1160.0, isActive: true },
+  { id: 'LAB-060', code: 'LAB-060', name: `Anti Thyroid Peroxidase Antibody`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-061', code: 'LAB-061', name: `Antistreptolysin O Titre (ASO)`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-062', code: 'LAB-062', name: `APLA PROFILE`, category: 'LAB_TEST', defaultPrice: 5350.0, basePrice: 5350.0, isActive: true },
+  { id: 'LAB-063', code: 'LAB-063', name: `Appavisc Solution Culture`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-064', code: 'LAB-064', name: `Arneth count`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-065', code: 'LAB-065', name: `Arthritis Profile`, category: 'LAB_TEST', defaultPrice: 3830.0, basePrice: 3830.0, isActive: true },
+  { id: 'LAB-066', code: 'LAB-066', name: `Ascitic Fluid Biochemistry`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-067', code: 'LAB-067', name: `Ascitic Fluid Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-068', code: 'LAB-068', name: `Ascitic Fluid Cytology`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-069', code: 'LAB-069', name: `Ascitic Fluid For ADA`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-070', code: 'LAB-070', name: `Ascitic Fluid for Albumin`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-071', code: 'LAB-071', name: `Ascitic fluid for bilirubin`, category: 'LAB_TEST', defaultPrice: 130.0, basePrice: 130.0, isActive: true },
+  { id: 'LAB-072', code: 'LAB-072', name: `Ascitic Fluid for LDH`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-073', code: 'LAB-073', name: `ASLO QUALITATIVE`, category: 'LAB_TEST', defaultPrice: 350.0, basePrice: 350.0, isActive: true },
+  { id: 'LAB-074', code: 'LAB-074', name: `ATT DRUG SENSITIVITY  TEST`, category: 'LAB_TEST', defaultPrice: 5250.0, basePrice: 5250.0, isActive: true },
+  { id: 'LAB-075', code: 'LAB-075', name: `Autologus`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-076', code: 'LAB-076', name: `BAL Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-077', code: 'LAB-077', name: `BAL For Biochemistry`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-078', code: 'LAB-078', name: `BAL For Cytology`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-079', code: 'LAB-079', name: `Bicarbonate (HCO3)`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-080', code: 'LAB-080', name: `Bilirubin-Direct`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-081', code: 'LAB-081', name: `Bilirubin-Indirect`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-082', code: 'LAB-082', name: `Bilirubin-Total`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-083', code: 'LAB-083', name: `Bilirubin-Total ( T & D )`, category: 'LAB_TEST', defaultPrice: 300.0, basePrice: 300.0, isActive: true },
+  { id: 'LAB-084', code: 'LAB-084', name: `Biopsy for AFB`, category: 'PROCEDURE', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-085', code: 'LAB-085', name: `Biopsy For Second Opinion 1`, category: 'PROCEDURE', defaultPrice: 1050.0, basePrice: 1050.0, isActive: true },
+  { id: 'LAB-086', code: 'LAB-086', name: `Biopsy For Second Opinion 2-4`, category: 'PROCEDURE', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-087', code: 'LAB-087', name: `Biopsy For Second Opinion 5`, category: 'PROCEDURE', defaultPrice: 2100.0, basePrice: 2100.0, isActive: true },
+  { id: 'LAB-088', code: 'LAB-088', name: `Biopsy Large`, category: 'PROCEDURE', defaultPrice: 1400.0, basePrice: 1400.0, isActive: true },
+  { id: 'LAB-089', code: 'LAB-089', name: `Biopsy Large Complex`, category: 'PROCEDURE', defaultPrice: 2100.0, basePrice: 2100.0, isActive: true },
+  { id: 'LAB-090', code: 'LAB-090', name: `Biopsy Medium`, category: 'PROCEDURE', defaultPrice: 1150.0, basePrice: 1150.0, isActive: true },
+  { id: 'LAB-091', code: 'LAB-091', name: `Biopsy Small`, category: 'PROCEDURE', defaultPrice: 850.0, basePrice: 850.0, isActive: true },
+  { id: 'LAB-092', code: 'LAB-092', name: `Bleeding Time`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-093', code: 'LAB-093', name: `Blood Bag Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-094', code: 'LAB-094', name: `Blood Glucose (Fasting)`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-095', code: 'LAB-095', name: `Blood Glucose (PP)`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-096', code: 'LAB-096', name: `Blood Glucose (Random)`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-097', code: 'LAB-097', name: `Blood Glucose 1hrs.`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-098', code: 'LAB-098', name: `Blood Glucose 2hrs.`, category: 'LAB_TEST', defaultPrice: 40.0, basePrice: 40.0, isActive: true },
+  { id: 'LAB-099', code: 'LAB-099', name: `Blood Group ABO`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-100', code: 'LAB-100', name: `Blood Urea Nitrogen (BUN)`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-101', code: 'LAB-101', name: `Body  fluid for bilirubin`, category: 'LAB_TEST', defaultPrice: 130.0, basePrice: 130.0, isActive: true },
+  { id: 'LAB-102', code: 'LAB-102', name: `Body Fluid  Bile Pigment (BP)`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-103', code: 'LAB-103', name: `Body Fluid  Bile Salt (BS)`, category: 'LAB_TEST', defaultPrice: 60.0, basePrice: 60.0, isActive: true },
+  { id: 'LAB-104', code: 'LAB-104', name: `Body Fluid Biochemistry`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-105', code: 'LAB-105', name: `Body Fluid Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-106', code: 'LAB-106', name: `Body Fluid Cytology`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-107', code: 'LAB-107', name: `Body Fluid For ADA`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-108', code: 'LAB-108', name: `Body Fluid KOH`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-109', code: 'LAB-109', name: `BOH Profile`, category: 'LAB_TEST', defaultPrice: 11550.0, basePrice: 11550.0, isActive: true },
+  { id: 'LAB-110', code: 'LAB-110', name: `Bone Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-111', code: 'LAB-111', name: `Bone Health Screening`, category: 'LAB_TEST', defaultPrice: 1310.0, basePrice: 1310.0, isActive: true },
+  { id: 'LAB-112', code: 'LAB-112', name: `Bone Marrow Aspiration Cytology`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-113', code: 'LAB-113', name: `Bone Marrow Biopsy Small`, category: 'PROCEDURE', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-114', code: 'LAB-114', name: `Botanical cafe Packge`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-115', code: 'LAB-115', name: `Bronchial Brushing Cytology`, category: 'LAB_TEST', defaultPrice: 470.0, basePrice: 470.0, isActive: true },
+  { id: 'LAB-116', code: 'LAB-116', name: `Bronchial Fluid Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-117', code: 'LAB-117', name: `Bronchial Washing  Cytology`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-118', code: 'LAB-118', name: `Buffy Coat for LD Bodies`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-119', code: 'LAB-119', name: `CA - 125 (Ovary)`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-120', code: 'LAB-120', name: `CA 15.3`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-121', code: 'LAB-121', name: `Calcium`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-122', code: 'LAB-122', name: `Calcium-Ionic`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-123', code: 'LAB-123', name: `Calrctinin`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-124', code: 'LAB-124', name: `CAPD Fluid For Creatinine`, category: 'LAB_TEST', defaultPrice: 470.0, basePrice: 470.0, isActive: true },
+  { id: 'LAB-125', code: 'LAB-125', name: `CAPD Fluid For Cyto`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-126', code: 'LAB-126', name: `CAPD Fluid For Sugar`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-127', code: 'LAB-127', name: `Carcino Emryonic Antigen (CEA)`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-128', code: 'LAB-128', name: `CARDIAC HEALTH SCREEN BASIC-1199`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-129', code: 'LAB-129', name: `CARDIAC HEALTH SCREEN EXTENSIVE-4999`, category: 'LAB_TEST', defaultPrice: 5250.0, basePrice: 5250.0, isActive: true },
+  { id: 'LAB-130', code: 'LAB-130', name: `CARDIAC HEALTH SCREEN PLUS`, category: 'LAB_TEST', defaultPrice: 2100.0, basePrice: 2100.0, isActive: true },
+  { id: 'LAB-131', code: 'LAB-131', name: `Cardiac Risk Check`, category: 'LAB_TEST', defaultPrice: 2100.0, basePrice: 2100.0, isActive: true },
+  { id: 'LAB-132', code: 'LAB-132', name: `CBC`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-133', code: 'LAB-133', name: `CBC / HAEMOGRAM + ESR`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-134', code: 'LAB-134', name: `CBC/ HAEMOGRAM+PBF`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-135', code: 'LAB-135', name: `Cell Block Preparation`, category: 'LAB_TEST', defaultPrice: 580.0, basePrice: 580.0, isActive: true },
+  { id: 'LAB-136', code: 'LAB-136', name: `CERVICAL CANCER SCREENING`, category: 'LAB_TEST', defaultPrice: 2950.0, basePrice: 2950.0, isActive: true },
+  { id: 'LAB-137', code: 'LAB-137', name: `Chloride`, category: 'LAB_TEST', defaultPrice: 190.0, basePrice: 190.0, isActive: true },
+  { id: 'LAB-138', code: 'LAB-138', name: `Chloride-CSF`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-139', code: 'LAB-139', name: `Chloride-Fluid`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-140', code: 'LAB-140', name: `Cholesterol LDL / HDL Ratio`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-141', code: 'LAB-141', name: `Cholesterol Total`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-142', code: 'LAB-142', name: `Cholesterol Total / HDL Ratio`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-143', code: 'LAB-143', name: `Clot Retraction Time (CRT)`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-144', code: 'LAB-144', name: `Clotting Time`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-145', code: 'LAB-145', name: `Coagulation Profile`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-146', code: 'LAB-146', name: `Comprehensive Health Checkup (Female)`, category: 'LAB_TEST', defaultPrice: 10500.0, basePrice: 10500.0, isActive: true },
+  { id: 'LAB-147', code: 'LAB-147', name: `Comprehensive Health Checkup (Male)`, category: 'LAB_TEST', defaultPrice: 10500.0, basePrice: 10500.0, isActive: true },
+  { id: 'LAB-148', code: 'LAB-148', name: `Corneal Scrapping Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-149', code: 'LAB-149', name: `Cpk Total`, category: 'LAB_TEST', defaultPrice: 450.0, basePrice: 450.0, isActive: true },
+  { id: 'LAB-150', code: 'LAB-150', name: `CPK-MB`, category: 'LAB_TEST', defaultPrice: 450.0, basePrice: 450.0, isActive: true },
+  { id: 'LAB-151', code: 'LAB-151', name: `Creatinine`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-152', code: 'LAB-152', name: `CRP Quantitative`, category: 'LAB_TEST', defaultPrice: 500.0, basePrice: 500.0, isActive: true },
+  { id: 'LAB-153', code: 'LAB-153', name: `CRP-High Senstivity`, category: 'LAB_TEST', defaultPrice: 500.0, basePrice: 500.0, isActive: true },
+  { id: 'LAB-154', code: 'LAB-154', name: `CSF Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-155', code: 'LAB-155', name: `CSF For ADA`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-156', code: 'LAB-156', name: `CSF For Albumin`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-157', code: 'LAB-157', name: `CSF For Ammonia`, category: 'LAB_TEST', defaultPrice: 950.0, basePrice: 950.0, isActive: true },
+  { id: 'LAB-158', code: 'LAB-158', name: `CSF For Billrubin`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-159', code: 'LAB-159', name: `CSF For Biochemistry`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-160', code: 'LAB-160', name: `CSF For Cytology`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-161', code: 'LAB-161', name: `CSF For LDH`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-162', code: 'LAB-162', name: `CSF For Xanthochromia`, category: 'LAB_TEST', defaultPrice: 300.0, basePrice: 300.0, isActive: true },
+  { id: 'LAB-163', code: 'LAB-163', name: `CSF GRAM STAIN`, category: 'LAB_TEST', defaultPrice: 130.0, basePrice: 130.0, isActive: true },
+  { id: 'LAB-164', code: 'LAB-164', name: `CSF Indian INK Stain`, category: 'LAB_TEST', defaultPrice: 300.0, basePrice: 300.0, isActive: true },
+  { id: 'LAB-165', code: 'LAB-165', name: `CSF KOH`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-166', code: 'LAB-166', name: `Culture Aerobic,Biological Indicater`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-167', code: 'LAB-167', name: `Culture Report Other`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-168', code: 'LAB-168', name: `Culture Report Stool`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-169', code: 'LAB-169', name: `Culture Report Urine`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-170', code: 'LAB-170', name: `Cytology Report`, category: 'LAB_TEST', defaultPrice: 580.0, basePrice: 580.0, isActive: true },
+  { id: 'LAB-171', code: 'LAB-171', name: `Cytomegalo Virus IgG`, category: 'LAB_TEST', defaultPrice: 390.0, basePrice: 390.0, isActive: true },
+  { id: 'LAB-172', code: 'LAB-172', name: `Cytomegalo Virus IgG URINE`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-173', code: 'LAB-173', name: `Cytomegalo Virus IgM`, category: 'LAB_TEST', defaultPrice: 390.0, basePrice: 390.0, isActive: true },
+  { id: 'LAB-174', code: 'LAB-174', name: `Cytomegalo Virus IgM URINE`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-175', code: 'LAB-175', name: `D - Dimer`, category: 'LAB_TEST', defaultPrice: 1470.0, basePrice: 1470.0, isActive: true },
+  { id: 'LAB-176', code: 'LAB-176', name: `Dengue Antigen & Antibody`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-177', code: 'LAB-177', name: `Dengue IgG & IgM`, category: 'LAB_TEST', defaultPrice: 850.0, basePrice: 850.0, isActive: true },
+  { id: 'LAB-178', code: 'LAB-178', name: `Dengue IgG ELISA`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-179', code: 'LAB-179', name: `Dengue IgM`, category: 'LAB_TEST', defaultPrice: 850.0, basePrice: 850.0, isActive: true },
+  { id: 'LAB-180', code: 'LAB-180', name: `Dengue IgM ELISA`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-181', code: 'LAB-181', name: `Dengue NS1 ELISA`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-182', code: 'LAB-182', name: `Dengue NS1Ag`, category: 'LAB_TEST', defaultPrice: 840.0, basePrice: 840.0, isActive: true },
+  { id: 'LAB-183', code: 'LAB-183', name: `DHEA SULPHATE`, category: 'LAB_TEST', defaultPrice: 750.0, basePrice: 750.0, isActive: true },
+  { id: 'LAB-184', code: 'LAB-184', name: `Diabetes Plus`, category: 'LAB_TEST', defaultPrice: 1890.0, basePrice: 1890.0, isActive: true },
+  { id: 'LAB-185', code: 'LAB-185', name: `Differential Leucocyte Count`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-186', code: 'LAB-186', name: `Digital Image Microscopy (1-5)`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-187', code: 'LAB-187', name: `Direct Coombs Test`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-188', code: 'LAB-188', name: `DOG-CBC`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-189', code: 'LAB-189', name: `DOG-CBC/ HAEMOGRAM+PBF`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-190', code: 'LAB-190', name: `Double Marker Screning Test`, category: 'LAB_TEST', defaultPrice: 2500.0, basePrice: 2500.0, isActive: true },
+  { id: 'LAB-191', code: 'LAB-191', name: `E.T. Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-192', code: 'LAB-192', name: `EBNA CYTOLOGY`, category: 'LAB_TEST', defaultPrice: 470.0, basePrice: 470.0, isActive: true },
+  { id: 'LAB-193', code: 'LAB-193', name: `EBUS BIOPSY`, category: 'PROCEDURE', defaultPrice: 2100.0, basePrice: 2100.0, isActive: true },
+  { id: 'LAB-194', code: 'LAB-194', name: `EBUS CYTOLOGY`, category: 'LAB_TEST', defaultPrice: 1050.0, basePrice: 1050.0, isActive: true },
+  { id: 'LAB-195', code: 'LAB-195', name: `Electrolytes Serum`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-196', code: 'LAB-196', name: `ER/PR/Her-2 neu`, category: 'LAB_TEST', defaultPrice: 5250.0, basePrice: 5250.0, isActive: true },
+  { id: 'LAB-197', code: 'LAB-197', name: `ESR`, category: 'LAB_TEST', defaultPrice: 60.0, basePrice: 60.0, isActive: true },
+  { id: 'LAB-198', code: 'LAB-198', name: `ESTIMATED GFR`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-199', code: 'LAB-199', name: `Estradiol (E2)`, category: 'LAB_TEST', defaultPrice: 740.0, basePrice: 740.0, isActive: true },
+  { id: 'LAB-200', code: 'LAB-200', name: `Estriol Unconjugated (E3)`, category: 'LAB_TEST', defaultPrice: 740.0, basePrice: 740.0, isActive: true },
+  { id: 'LAB-201', code: 'LAB-201', name: `Estrogen Receptors ER/Progesterone Recep`, category: 'LAB_TEST', defaultPrice: 3470.0, basePrice: 3470.0, isActive: true },
+  { id: 'LAB-202', code: 'LAB-202', name: `EXECUTIVE PLUS`, category: 'LAB_TEST', defaultPrice: 3150.0, basePrice: 3150.0, isActive: true },
+  { id: 'LAB-203', code: 'LAB-203', name: `Executive Premium`, category: 'LAB_TEST', defaultPrice: 3680.0, basePrice: 3680.0, isActive: true },
+  { id: 'LAB-204', code: 'LAB-204', name: `FENA TEST`, category: 'LAB_TEST', defaultPrice: 890.0, basePrice: 890.0, isActive: true },
+  { id: 'LAB-205', code: 'LAB-205', name: `Ferritin`, category: 'LAB_TEST', defaultPrice: 740.0, basePrice: 740.0, isActive: true },
+  { id: 'LAB-206', code: 'LAB-206', name: `FEVER PROFILE`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-207', code: 'LAB-207', name: `Fluid for (CEA)`, category: 'LAB_TEST', defaultPrice: 740.0, basePrice: 740.0, isActive: true },
+  { id: 'LAB-208', code: 'LAB-208', name: `Fluid for Albumin`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-209', code: 'LAB-209', name: `Fluid for Alkaline Phosphatase`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-210', code: 'LAB-210', name: `Fluid For Amylase`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-211', code: 'LAB-211', name: `Fluid for cholesterol`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-212', code: 'LAB-212', name: `Fluid for Creatinine`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-213', code: 'LAB-213', name: `Fluid for LDH`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-214', code: 'LAB-214', name: `Fluid For Lipase`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-215', code: 'LAB-215', name: `Fluid for Protein`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-216', code: 'LAB-216', name: `Fluid for Specific Gravity`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-217', code: 'LAB-217', name: `Fluid For Sugar`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-218', code: 'LAB-218', name: `Fluid for Triglycerides`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-219', code: 'LAB-219', name: `Fluid for Uric Acid`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-220', code: 'LAB-220', name: `Fluid PH`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-221', code: 'LAB-221', name: `FNAC`, category: 'PROCEDURE', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-222', code: 'LAB-222', name: `FNAC - USG GUIDED`, category: 'XRAY', defaultPrice: 1300.0, basePrice: 1300.0, isActive: true },
+  { id: 'LAB-223', code: 'LAB-223', name: `FNAC For Second Opinion`, category: 'PROCEDURE', defaultPrice: 840.0, basePrice: 840.0, isActive: true },
+  { id: 'LAB-224', code: 'LAB-224', name: `Follicle Stimulating Hormone`, category: 'LAB_TEST', defaultPrice: 470.0, basePrice: 470.0, isActive: true },
+  { id: 'LAB-225', code: 'LAB-225', name: `Free BHCG`, category: 'LAB_TEST', defaultPrice: 1050.0, basePrice: 1050.0, isActive: true },
+  { id: 'LAB-226', code: 'LAB-226', name: `Free PSA`, category: 'LAB_TEST', defaultPrice: 950.0, basePrice: 950.0, isActive: true },
+  { id: 'LAB-227', code: 'LAB-227', name: `Free PSA/ Total PSA Ratio`, category: 'LAB_TEST', defaultPrice: 1680.0, basePrice: 1680.0, isActive: true },
+  { id: 'LAB-228', code: 'LAB-228', name: `Free T3`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-229', code: 'LAB-229', name: `Free T4`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-230', code: 'LAB-230', name: `Fructose (Qualitative)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-231', code: 'LAB-231', name: `FSH/LH/PROLACTIN`, category: 'LAB_TEST', defaultPrice: 1370.0, basePrice: 1370.0, isActive: true },
+  { id: 'LAB-232', code: 'LAB-232', name: `Fungal Smear`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-233', code: 'LAB-233', name: `G6PD (Quantitative)`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-234', code: 'LAB-234', name: `Gastric aspiration for Occult Blood`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-235', code: 'LAB-235', name: `Gene Expert Test`, category: 'LAB_TEST', defaultPrice: 3700.0, basePrice: 3700.0, isActive: true },
+  { id: 'LAB-236', code: 'LAB-236', name: `GGTP`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-237', code: 'LAB-237', name: `Globulin`, category: 'LAB_TEST', defaultPrice: 180.0, basePrice: 180.0, isActive: true },
+  { id: 'LAB-238', code: 'LAB-238', name: `Glucose Tolerance Test (GTT)`, category: 'LAB_TEST', defaultPrice: 350.0, basePrice: 350.0, isActive: true },
+  { id: 'LAB-239', code: 'LAB-239', name: `Good Health Plan (Female)`, category: 'LAB_TEST', defaultPrice: 5250.0, basePrice: 5250.0, isActive: true },
+  { id: 'LAB-240', code: 'LAB-240', name: `Good Health Plan (Male)`, category: 'LAB_TEST', defaultPrice: 5250.0, basePrice: 5250.0, isActive: true },
+  { id: 'LAB-241', code: 'LAB-241', name: `Gram Stain`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-242', code: 'LAB-242', name: `Gram Stain ( BAL )`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-243', code: 'LAB-243', name: `Gram Stain (Ascitic Fluid)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-244', code: 'LAB-244', name: `Gram Stain (Body Fluid)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-245', code: 'LAB-245', name: `Gram Stain (CSF)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-246', code: 'LAB-246', name: `Gram Stain (Pericardial Fluid)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-247', code: 'LAB-247', name: `Gram Stain (Pleural Fluid)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-248', code: 'LAB-248', name: `Gram Stain (Pleural Pus)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-249', code: 'LAB-249', name: `Gram Stain (Pus)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-250', code: 'LAB-250', name: `Gram Stain (Sputum)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-251', code: 'LAB-251', name: `Gram Stain (Swab)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-252', code: 'LAB-252', name: `Gram Stain (Urethral Smear)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-253', code: 'LAB-253', name: `Gram Stain (Urine)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-254', code: 'LAB-254', name: `Gram Stain (Vitreous)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-255', code: 'LAB-255', name: `GUIDED BIOPSY PANEL`, category: 'PROCEDURE', defaultPrice: 4700.0, basePrice: 4700.0, isActive: true },
+  { id: 'LAB-256', code: 'LAB-256', name: `Haemoglobin (Hb)`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-257', code: 'LAB-257', name: `HAEMOPHILIA PROFILE`, category: 'LAB_TEST', defaultPrice: 4200.0, basePrice: 4200.0, isActive: true },
+  { id: 'LAB-258', code: 'LAB-258', name: `Hairs Scrapping KOH`, category: 'LAB_TEST', defaultPrice: 130.0, basePrice: 130.0, isActive: true },
+  { id: 'LAB-259', code: 'LAB-259', name: `HB Core IgM`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-260', code: 'LAB-260', name: `HbA1c`, category: 'LAB_TEST', defaultPrice: 600.0, basePrice: 600.0, isActive: true },
+  { id: 'LAB-261', code: 'LAB-261', name: `HBe Antigen`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-262', code: 'LAB-262', name: `HBs Ag`, category: 'LAB_TEST', defaultPrice: 350.0, basePrice: 350.0, isActive: true },
+  { id: 'LAB-263', code: 'LAB-263', name: `HBs Ag-ELISA`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-264', code: 'LAB-264', name: `HCT/Hematocrit (Fluid )`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-265', code: 'LAB-265', name: `HDL Cholesterol`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-266', code: 'LAB-266', name: `Health Check Up Profile`, category: 'LAB_TEST', defaultPrice: 1050.0, basePrice: 1050.0, isActive: true },
+  { id: 'LAB-267', code: 'LAB-267', name: `HEALTH PACKAGE MRCC`, category: 'LAB_TEST', defaultPrice: 4250.0, basePrice: 4250.0, isActive: true },
+  { id: 'LAB-268', code: 'LAB-268', name: `HEALTH PANEL SCREENENING`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-269', code: 'LAB-269', name: `Hepatitis Profile`, category: 'LAB_TEST', defaultPrice: 1570.0, basePrice: 1570.0, isActive: true },
+  { id: 'LAB-270', code: 'LAB-270', name: `Her-2/Neu (CErB2)-IHC`, category: 'LAB_TEST', defaultPrice: 2100.0, basePrice: 2100.0, isActive: true },
+  { id: 'LAB-271', code: 'LAB-271', name: `Herpes Simplex Virus 1 & 2 IgG`, category: 'LAB_TEST', defaultPrice: 390.0, basePrice: 390.0, isActive: true },
+  { id: 'LAB-272', code: 'LAB-272', name: `Herpes Simplex Virus 1 & 2 IgM`, category: 'LAB_TEST', defaultPrice: 390.0, basePrice: 390.0, isActive: true },
+  { id: 'LAB-273', code: 'LAB-273', name: `Herpes Simplex Virus 1&2 IgG CSF`, category: 'LAB_TEST', defaultPrice: 390.0, basePrice: 390.0, isActive: true },
+  { id: 'LAB-274', code: 'LAB-274', name: `Herpes Simplex Virus 1&2 IgM CSF`, category: 'LAB_TEST', defaultPrice: 390.0, basePrice: 390.0, isActive: true },
+  { id: 'LAB-275', code: 'LAB-275', name: `HILLS N DUNES Health Package`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-276', code: 'LAB-276', name: `Historiya Royal Health Package`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-277', code: 'LAB-277', name: `HIV 1 & 2  Antibody`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-278', code: 'LAB-278', name: `HIV Combo`, category: 'LAB_TEST', defaultPrice: 470.0, basePrice: 470.0, isActive: true },
+  { id: 'LAB-279', code: 'LAB-279', name: `HIV DUO`, category: 'LAB_TEST', defaultPrice: 470.0, basePrice: 470.0, isActive: true },
+  { id: 'LAB-280', code: 'LAB-280', name: `HIV Elisa`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-281', code: 'LAB-281', name: `HLA-B27`, category: 'LAB_TEST', defaultPrice: 2100.0, basePrice: 2100.0, isActive: true },
+  { id: 'LAB-282', code: 'LAB-282', name: `HPV DNA PCR`, category: 'LAB_TEST', defaultPrice: 4200.0, basePrice: 4200.0, isActive: true },
+  { id: 'LAB-283', code: 'LAB-283', name: `HPV DNA PCR + PAP (LBC)`, category: 'LAB_TEST', defaultPrice: 2940.0, basePrice: 2940.0, isActive: true },
+  { id: 'LAB-284', code: 'LAB-284', name: `HSV DNA PCR`, category: 'LAB_TEST', defaultPrice: 6830.0, basePrice: 6830.0, isActive: true },
+  { id: 'LAB-285', code: 'LAB-285', name: `I/T Ratio`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-286', code: 'LAB-286', name: `IgG to Chikungunya (Elisa)`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-287', code: 'LAB-287', name: `IgM to Chikungunya`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-288', code: 'LAB-288', name: `IgM to Chikungunya (ELISA)`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-289', code: 'LAB-289', name: `IL - 6 LEVEL`, category: 'LAB_TEST', defaultPrice: 2850.0, basePrice: 2850.0, isActive: true },
+  { id: 'LAB-290', code: 'LAB-290', name: `Indian INK Stain`, category: 'LAB_TEST', defaultPrice: 290.0, basePrice: 290.0, isActive: true },
+  { id: 'LAB-291', code: 'LAB-291', name: `Indirect Coombs Test`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-292', code: 'LAB-292', name: `Infection Control Culture`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-293', code: 'LAB-293', name: `INFERTILITY FEMALE PANEL`, category: 'LAB_TEST', defaultPrice: 4200.0, basePrice: 4200.0, isActive: true },
+  { id: 'LAB-294', code: 'LAB-294', name: `INFERTILITY MALE PANEL`, category: 'LAB_TEST', defaultPrice: 4200.0, basePrice: 4200.0, isActive: true },
+  { id: 'LAB-295', code: 'LAB-295', name: `Inhibin -A`, category: 'LAB_TEST', defaultPrice: 2100.0, basePrice: 2100.0, isActive: true },
+  { id: 'LAB-296', code: 'LAB-296', name: `Insulin`, category: 'LAB_TEST', defaultPrice: 500.0, basePrice: 500.0, isActive: true },
+  { id: 'LAB-297', code: 'LAB-297', name: `Insulin Fasting`, category: 'LAB_TEST', defaultPrice: 500.0, basePrice: 500.0, isActive: true },
+  { id: 'LAB-298', code: 'LAB-298', name: `Insulin PP`, category: 'LAB_TEST', defaultPrice: 500.0, basePrice: 500.0, isActive: true },
+  { id: 'LAB-299', code: 'LAB-299', name: `iPTH Intact`, category: 'LAB_TEST', defaultPrice: 1250.0, basePrice: 1250.0, isActive: true },
+  { id: 'LAB-300', code: 'LAB-300', name: `Iron`, category: 'LAB_TEST', defaultPrice: 440.0, basePrice: 440.0, isActive: true },
+  { id: 'LAB-301', code: 'LAB-301', name: `IRON PROFILE`, category: 'LAB_TEST', defaultPrice: 2300.0, basePrice: 2300.0, isActive: true },
+  { id: 'LAB-302', code: 'LAB-302', name: `IRON PROFILE SCREEN`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-303', code: 'LAB-303', name: `KOH Mount`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-304', code: 'LAB-304', name: `Lactate`, category: 'LAB_TEST', defaultPrice: 1050.0, basePrice: 1050.0, isActive: true },
+  { id: 'LAB-305', code: 'LAB-305', name: `Lactate Dehydrogenase (LDH)`, category: 'LAB_TEST', defaultPrice: 470.0, basePrice: 470.0, isActive: true },
+  { id: 'LAB-306', code: 'LAB-306', name: `Lactate-CSF`, category: 'LAB_TEST', defaultPrice: 1050.0, basePrice: 1050.0, isActive: true },
+  { id: 'LAB-307', code: 'LAB-307', name: `LBC (GENITAL PAP SMEAR)`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-308', code: 'LAB-308', name: `LDL Cholesterol`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-309', code: 'LAB-309', name: `LE Cell Phenomenon`, category: 'LAB_TEST', defaultPrice: 230.0, basePrice: 230.0, isActive: true },
+  { id: 'LAB-310', code: 'LAB-310', name: `Leptospira IgG`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-311', code: 'LAB-311', name: `Leptospira IgM`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-312', code: 'LAB-312', name: `LH / FSH RATIO`, category: 'LAB_TEST', defaultPrice: 950.0, basePrice: 950.0, isActive: true },
+  { id: 'LAB-313', code: 'LAB-313', name: `Lipase`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-314', code: 'LAB-314', name: `Lipid Profile`, category: 'LAB_TEST', defaultPrice: 680.0, basePrice: 680.0, isActive: true },
+  { id: 'LAB-315', code: 'LAB-315', name: `Liver Abscess Biochemistry`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-316', code: 'LAB-316', name: `Liver Abscess Cytology`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-317', code: 'LAB-317', name: `Liver Abscess For ADA`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-318', code: 'LAB-318', name: `Liver Function Test`, category: 'LAB_TEST', defaultPrice: 720.0, basePrice: 720.0, isActive: true },
+  { id: 'LAB-319', code: 'LAB-319', name: `LUNG CARCINOMA PROFILE`, category: 'LAB_TEST', defaultPrice: 15750.0, basePrice: 15750.0, isActive: true },
+  { id: 'LAB-320', code: 'LAB-320', name: `Luteinising Hormone (LH)`, category: 'LAB_TEST', defaultPrice: 470.0, basePrice: 470.0, isActive: true },
+  { id: 'LAB-321', code: 'LAB-321', name: `Magnesium`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-322', code: 'LAB-322', name: `Malarial Parasite By QBC`, category: 'LAB_TEST', defaultPrice: 270.0, basePrice: 270.0, isActive: true },
+  { id: 'LAB-323', code: 'LAB-323', name: `Malarial Parasite Card`, category: 'LAB_TEST', defaultPrice: 250.0, basePrice: 250.0, isActive: true },
+  { id: 'LAB-324', code: 'LAB-324', name: `Malarial Parasite Identification`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-325', code: 'LAB-325', name: `MDR FOR TB`, category: 'LAB_TEST', defaultPrice: 3350.0, basePrice: 3350.0, isActive: true },
+  { id: 'LAB-326', code: 'LAB-326', name: `Mean Corp. Hb (MCH)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-327', code: 'LAB-327', name: `Mean Corp. Hb Con. (MCHC)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-328', code: 'LAB-328', name: `Mean Corp. Volume (MCV)`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-329', code: 'LAB-329', name: `Medicine Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-330', code: 'LAB-330', name: `Mesh Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-331', code: 'LAB-331', name: `Micro Filaria-Blood Smear`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-332', code: 'LAB-332', name: `MIGRANE PROFILE`, category: 'LAB_TEST', defaultPrice: 3600.0, basePrice: 3600.0, isActive: true },
+  { id: 'LAB-333', code: 'LAB-333', name: `Milk Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-334', code: 'LAB-334', name: `Montoux Test`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-335', code: 'LAB-335', name: `MOTHERS HEALTH PACKAGE`, category: 'LAB_TEST', defaultPrice: 2100.0, basePrice: 2100.0, isActive: true },
+  { id: 'LAB-336', code: 'LAB-336', name: `Nails Scrapping KOH`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-337', code: 'LAB-337', name: `Neutrophil to Lymphocyte Ratio`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-338', code: 'LAB-338', name: `NEW BORN SCREENING  ( 3 Conditions)`, category: 'LAB_TEST', defaultPrice: 1050.0, basePrice: 1050.0, isActive: true },
+  { id: 'LAB-339', code: 'LAB-339', name: `NT Pro BNP`, category: 'LAB_TEST', defaultPrice: 2520.0, basePrice: 2520.0, isActive: true },
+  { id: 'LAB-340', code: 'LAB-340', name: `NTC VENTURES PACKAGE`, category: 'LAB_TEST', defaultPrice: 1680.0, basePrice: 1680.0, isActive: true },
+  { id: 'LAB-341', code: 'LAB-341', name: `Obesity Profile`, category: 'LAB_TEST', defaultPrice: 3040.0, basePrice: 3040.0, isActive: true },
+  { id: 'LAB-342', code: 'LAB-342', name: `Opthalmic Irrigating Solution Culture`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-343', code: 'LAB-343', name: `Oral Cytology`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-344', code: 'LAB-344', name: `Oral Glucose Challenge Test(OGCT) 01 Hrs`, category: 'LAB_TEST', defaultPrice: 190.0, basePrice: 190.0, isActive: true },
+  { id: 'LAB-345', code: 'LAB-345', name: `Oral Glucose Challenge Test(OGCT)02 Hrs`, category: 'LAB_TEST', defaultPrice: 190.0, basePrice: 190.0, isActive: true },
+  { id: 'LAB-346', code: 'LAB-346', name: `Osmotic Fragility Test`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-347', code: 'LAB-347', name: `OT Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-348', code: 'LAB-348', name: `PAP SMEAR CYTO`, category: 'LAB_TEST', defaultPrice: 580.0, basePrice: 580.0, isActive: true },
+  { id: 'LAB-349', code: 'LAB-349', name: `PAPP - A`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-350', code: 'LAB-350', name: `Paraffin Block For Opinion`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-351', code: 'LAB-351', name: `PCR HEPATITIS 'C'VIRUS(QUANTITATIVE)`, category: 'LAB_TEST', defaultPrice: 5250.0, basePrice: 5250.0, isActive: true },
+  { id: 'LAB-352', code: 'LAB-352', name: `PCR(DNA)HEPATITIS 'B'VIRUS(QUALITATIVE)`, category: 'LAB_TEST', defaultPrice: 4750.0, basePrice: 4750.0, isActive: true },
+  { id: 'LAB-353', code: 'LAB-353', name: `PCV/Hematocrit (HCT)`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-354', code: 'LAB-354', name: `Pericadial Fluid For ADA`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-355', code: 'LAB-355', name: `Pericardial  Fluid for LDH`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-356', code: 'LAB-356', name: `Pericardial Fluid Biochemistry`, category: 'LAB_TEST', defaultPrice: 290.0, basePrice: 290.0, isActive: true },
+  { id: 'LAB-357', code: 'LAB-357', name: `Pericardial Fluid Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-358', code: 'LAB-358', name: `Pericardial Fluid Cytology`, category: 'LAB_TEST', defaultPrice: 290.0, basePrice: 290.0, isActive: true },
+  { id: 'LAB-359', code: 'LAB-359', name: `Peripheral Blood Smear ( PBF)`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-360', code: 'LAB-360', name: `Peritoneal  Fluid/Serum Billrubin`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-361', code: 'LAB-361', name: `Peritoneal Fluid Biochemistry`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-362', code: 'LAB-362', name: `Peritoneal Fluid Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-363', code: 'LAB-363', name: `Peritoneal Fluid Cytology`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-364', code: 'LAB-364', name: `Peritoneal Fluid For ADA`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-365', code: 'LAB-365', name: `Peritoneal Fluid For Billrubin`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-366', code: 'LAB-366', name: `PH`, category: 'LAB_TEST', defaultPrice: 70.0, basePrice: 70.0, isActive: true },
+  { id: 'LAB-367', code: 'LAB-367', name: `Phosphorus`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-368', code: 'LAB-368', name: `Platelet Count`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-369', code: 'LAB-369', name: `Platelet Morphology`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-370', code: 'LAB-370', name: `Pleural Brushing`, category: 'LAB_TEST', defaultPrice: 470.0, basePrice: 470.0, isActive: true },
+  { id: 'LAB-371', code: 'LAB-371', name: `Pleural Fluid Biochemistry`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-372', code: 'LAB-372', name: `Pleural Fluid Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-373', code: 'LAB-373', name: `Pleural Fluid Cytology`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-374', code: 'LAB-374', name: `Pleural Fluid For ADA`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-375', code: 'LAB-375', name: `Pleural Fluid for cholesterol`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-376', code: 'LAB-376', name: `Pleural Fluid for LDH`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-377', code: 'LAB-377', name: `Pleural Fluid for Triglycerides`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-378', code: 'LAB-378', name: `Pleural Fluid KOH`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-379', code: 'LAB-379', name: `Pleural Pus Biochemistry`, category: 'LAB_TEST', defaultPrice: 290.0, basePrice: 290.0, isActive: true },
+  { id: 'LAB-380', code: 'LAB-380', name: `Pleural Pus For Cytology`, category: 'LAB_TEST', defaultPrice: 290.0, basePrice: 290.0, isActive: true },
+  { id: 'LAB-381', code: 'LAB-381', name: `POI-1st`, category: 'LAB_TEST', defaultPrice: 840.0, basePrice: 840.0, isActive: true },
+  { id: 'LAB-382', code: 'LAB-382', name: `Post FOB Cytology`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-383', code: 'LAB-383', name: `Potassium`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-384', code: 'LAB-384', name: `Potassium -Fluid`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-385', code: 'LAB-385', name: `Pre Endoscopy Profile`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-386', code: 'LAB-386', name: `Pre Oprative Profile`, category: 'LAB_TEST', defaultPrice: 1150.0, basePrice: 1150.0, isActive: true },
+  { id: 'LAB-387', code: 'LAB-387', name: `Pregnancy profile`, category: 'LAB_TEST', defaultPrice: 2700.0, basePrice: 2700.0, isActive: true },
+  { id: 'LAB-388', code: 'LAB-388', name: `Procalcitonin(PCT)`, category: 'LAB_TEST', defaultPrice: 2210.0, basePrice: 2210.0, isActive: true },
+  { id: 'LAB-389', code: 'LAB-389', name: `Progesterone`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-390', code: 'LAB-390', name: `Prolactin`, category: 'LAB_TEST', defaultPrice: 470.0, basePrice: 470.0, isActive: true },
+  { id: 'LAB-391', code: 'LAB-391', name: `Protein-CSF`, category: 'LAB_TEST', defaultPrice: 190.0, basePrice: 190.0, isActive: true },
+  { id: 'LAB-392', code: 'LAB-392', name: `Protein-Total`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-393', code: 'LAB-393', name: `Prothrombin Time With INR`, category: 'LAB_TEST', defaultPrice: 230.0, basePrice: 230.0, isActive: true },
+  { id: 'LAB-394', code: 'LAB-394', name: `Protien ( A/G Ratio)`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-395', code: 'LAB-395', name: `PRP Test`, category: 'LAB_TEST', defaultPrice: 1680.0, basePrice: 1680.0, isActive: true },
+  { id: 'LAB-396', code: 'LAB-396', name: `PTH`, category: 'LAB_TEST', defaultPrice: 1260.0, basePrice: 1260.0, isActive: true },
+  { id: 'LAB-397', code: 'LAB-397', name: `Pus Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-398', code: 'LAB-398', name: `Pus For ADA`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-399', code: 'LAB-399', name: `Pus For Biochemistry`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-400', code: 'LAB-400', name: `Pus For Cytology`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-401', code: 'LAB-401', name: `Quadruple Test Screening`, category: 'LAB_TEST', defaultPrice: 3400.0, basePrice: 3400.0, isActive: true },
+  { id: 'LAB-402', code: 'LAB-402', name: `R.A. Quantitative`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-403', code: 'LAB-403', name: `Rapid B.A.L. Fungal Culture`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-404', code: 'LAB-404', name: `Rapid Blood Arobic & Fungal Culture`, category: 'LAB_TEST', defaultPrice: 1900.0, basePrice: 1900.0, isActive: true },
+  { id: 'LAB-405', code: 'LAB-405', name: `Rapid Blood Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1900.0, basePrice: 1900.0, isActive: true },
+  { id: 'LAB-406', code: 'LAB-406', name: `Rapid Body Fluids Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-407', code: 'LAB-407', name: `Rapid CSF Aerobic & Fungal Culture`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-408', code: 'LAB-408', name: `Rapid CSF Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-409', code: 'LAB-409', name: `Rapid Ear Swab Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-410', code: 'LAB-410', name: `Rapid Endotracheal/Catheter Tips Culture`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-411', code: 'LAB-411', name: `Rapid fungal Blood Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-412', code: 'LAB-412', name: `Rapid Fungal Culture`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-413', code: 'LAB-413', name: `Rapid Nasal Swab Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-414', code: 'LAB-414', name: `Rapid OT Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-415', code: 'LAB-415', name: `Rapid Pus Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-416', code: 'LAB-416', name: `Rapid Semen Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-417', code: 'LAB-417', name: `Rapid Sputum Aerobic Fungal Culture`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-418', code: 'LAB-418', name: `Rapid Sputum Anaerobic Culture`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-419', code: 'LAB-419', name: `Rapid Sputum Nocardia Culture`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+  { id: 'LAB-420', code: 'LAB-420', name: `Rapid Stool Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1400.0, basePrice: 1400.0, isActive: true },
+  { id: 'LAB-421', code: 'LAB-421', name: `Rapid Swab Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-422', code: 'LAB-422', name: `Rapid Throat Swab Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-423', code: 'LAB-423', name: `Rapid Tip Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-424', code: 'LAB-424', name: `Rapid Urine AFB Culture`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-425', code: 'LAB-425', name: `Rapid Urine Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 950.0, basePrice: 950.0, isActive: true },
+  { id: 'LAB-426', code: 'LAB-426', name: `Rapid Vaginal Swab Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-427', code: 'LAB-427', name: `Rapid Water Culture`, category: 'LAB_TEST', defaultPrice: 1050.0, basePrice: 1050.0, isActive: true },
+  { id: 'LAB-428', code: 'LAB-428', name: `Red Cell Distribution Width (RDW)`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-429', code: 'LAB-429', name: `Regent Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-430', code: 'LAB-430', name: `Renal Function Test RFT`, category: 'LAB_TEST', defaultPrice: 580.0, basePrice: 580.0, isActive: true },
+  { id: 'LAB-431', code: 'LAB-431', name: `Reticulocyte Count`, category: 'LAB_TEST', defaultPrice: 190.0, basePrice: 190.0, isActive: true },
+  { id: 'LAB-432', code: 'LAB-432', name: `Rh Antibody Titre`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-433', code: 'LAB-433', name: `Routine Fungal Culture (Aerobic)`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-434', code: 'LAB-434', name: `Rubella IgG`, category: 'LAB_TEST', defaultPrice: 390.0, basePrice: 390.0, isActive: true },
+  { id: 'LAB-435', code: 'LAB-435', name: `Rubella IgM`, category: 'LAB_TEST', defaultPrice: 390.0, basePrice: 390.0, isActive: true },
+  { id: 'LAB-436', code: 'LAB-436', name: `SAAG (Serum  Albumin Ascites Gradient)`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-437', code: 'LAB-437', name: `Salmonella Typhi IgG`, category: 'LAB_TEST', defaultPrice: 230.0, basePrice: 230.0, isActive: true },
+  { id: 'LAB-438', code: 'LAB-438', name: `Salmonella Typhi IgM`, category: 'LAB_TEST', defaultPrice: 240.0, basePrice: 240.0, isActive: true },
+  { id: 'LAB-439', code: 'LAB-439', name: `Scalp Scrapping KOH`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-440', code: 'LAB-440', name: `Scrub Typhus Rapid Test`, category: 'LAB_TEST', defaultPrice: 1310.0, basePrice: 1310.0, isActive: true },
+  { id: 'LAB-441', code: 'LAB-441', name: `SEMEN ANALYSIS`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-442', code: 'LAB-442', name: `Semen Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 580.0, basePrice: 580.0, isActive: true },
+  { id: 'LAB-443', code: 'LAB-443', name: `SEMEN WASH`, category: 'LAB_TEST', defaultPrice: 2300.0, basePrice: 2300.0, isActive: true },
+  { id: 'LAB-444', code: 'LAB-444', name: `SEPSIS SREEN`, category: 'LAB_TEST', defaultPrice: 600.0, basePrice: 600.0, isActive: true },
+  { id: 'LAB-445', code: 'LAB-445', name: `Serum ADA`, category: 'LAB_TEST', defaultPrice: 370.0, basePrice: 370.0, isActive: true },
+  { id: 'LAB-446', code: 'LAB-446', name: `Serum Cortisol`, category: 'LAB_TEST', defaultPrice: 790.0, basePrice: 790.0, isActive: true },
+  { id: 'LAB-447', code: 'LAB-447', name: `Serum Creatinine Clearance`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-448', code: 'LAB-448', name: `Settle Plate Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-449', code: 'LAB-449', name: `SGOT`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-450', code: 'LAB-450', name: `SGPT`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-451', code: 'LAB-451', name: `Sickling Test`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-452', code: 'LAB-452', name: `Skin Scrapping for AFB`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-453', code: 'LAB-453', name: `Skin Scrapping KOH`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-454', code: 'LAB-454', name: `Smear for Babesia`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-455', code: 'LAB-455', name: `Smear for Fungal Elements`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-456', code: 'LAB-456', name: `Sodium`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-457', code: 'LAB-457', name: `Sodium -Fluid`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-458', code: 'LAB-458', name: `Spot Urinary Calcium`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-459', code: 'LAB-459', name: `Spot Urinary Urea`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-460', code: 'LAB-460', name: `Spot Urine Calcium/Creatinine Ratio`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-461', code: 'LAB-461', name: `Spot Urine Phosphorus/Creatinine Ratio`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-462', code: 'LAB-462', name: `Sputum Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-463', code: 'LAB-463', name: `Sputum Cytology`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-464', code: 'LAB-464', name: `Sputum Examination for Nocardia`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-465', code: 'LAB-465', name: `Sputum For GENEXPERT / XDR RESISTANCE`, category: 'LAB_TEST', defaultPrice: 4200.0, basePrice: 4200.0, isActive: true },
+  { id: 'LAB-466', code: 'LAB-466', name: `Sputum KOH`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-467', code: 'LAB-467', name: `Sputum Occult Blood`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-468', code: 'LAB-468', name: `Stained HP/Cytology Slides For Opinion`, category: 'LAB_TEST', defaultPrice: 1580.0, basePrice: 1580.0, isActive: true },
+  { id: 'LAB-469', code: 'LAB-469', name: `Stool Analysis`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-470', code: 'LAB-470', name: `Stool Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 580.0, basePrice: 580.0, isActive: true },
+  { id: 'LAB-471', code: 'LAB-471', name: `Stool for Cryptosporidium`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-472', code: 'LAB-472', name: `STOOL FOR FAT GLOBULES`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-473', code: 'LAB-473', name: `Stool for Fungal elements`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-474', code: 'LAB-474', name: `Stool For Hanging Drop`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-475', code: 'LAB-475', name: `Stool Occult Blood`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-476', code: 'LAB-476', name: `Stool PH`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-477', code: 'LAB-477', name: `Stool Reducing Sugar`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-478', code: 'LAB-478', name: `SUPER HEALTH PACKAGE 7`, category: 'LAB_TEST', defaultPrice: 6300.0, basePrice: 6300.0, isActive: true },
+  { id: 'LAB-479', code: 'LAB-479', name: `Swab Culture`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-480', code: 'LAB-480', name: `Swab Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-481', code: 'LAB-481', name: `Swab KOH`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-482', code: 'LAB-482', name: `Synovial Fluid Biochemistry`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-483', code: 'LAB-483', name: `Synovial Fluid Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-484', code: 'LAB-484', name: `Synovial Fluid Cytology`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-485', code: 'LAB-485', name: `Synovial Fluid For ADA`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-486', code: 'LAB-486', name: `Synovial fluid gram stain`, category: 'LAB_TEST', defaultPrice: 130.0, basePrice: 130.0, isActive: true },
+  { id: 'LAB-487', code: 'LAB-487', name: `TB (Quantiferon) IGRA`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-488', code: 'LAB-488', name: `TB PCR (DNA) MTB (C.S.F.)`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-489', code: 'LAB-489', name: `TB PCR (DNA) MTB (Menstrual Blood)`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-490', code: 'LAB-490', name: `TB PCR (DNA) MTB (Pus)`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-491', code: 'LAB-491', name: `TB PCR (DNA) MTB (Tissue)`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-492', code: 'LAB-492', name: `TB PCR (DNA) MTB Body Fluid`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-493', code: 'LAB-493', name: `TB PCR (DNA) MTB Semen`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-494', code: 'LAB-494', name: `TB PCR (DNA)MTB (BAL)`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-495', code: 'LAB-495', name: `TB PCR (DNA)MTB Urine`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-496', code: 'LAB-496', name: `TB PCR DNA MTB (Sputum)`, category: 'LAB_TEST', defaultPrice: 2600.0, basePrice: 2600.0, isActive: true },
+  { id: 'LAB-497', code: 'LAB-497', name: `TBNA CYTOLOGY`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-498', code: 'LAB-498', name: `Throat  Swab For  KLB (Albert stain )`, category: 'LAB_TEST', defaultPrice: 190.0, basePrice: 190.0, isActive: true },
+  { id: 'LAB-499', code: 'LAB-499', name: `Throat Swab Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-500', code: 'LAB-500', name: `Thyroid Function Test`, category: 'LAB_TEST', defaultPrice: 580.0, basePrice: 580.0, isActive: true },
+  { id: 'LAB-501', code: 'LAB-501', name: `TIP Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-502', code: 'LAB-502', name: `Tissue Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-503', code: 'LAB-503', name: `Tissue Processing (Blocks & Slides)`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-504', code: 'LAB-504', name: `TLC/DLC`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-505', code: 'LAB-505', name: `Torch IgG`, category: 'LAB_TEST', defaultPrice: 1150.0, basePrice: 1150.0, isActive: true },
+  { id: 'LAB-506', code: 'LAB-506', name: `Torch IgM`, category: 'LAB_TEST', defaultPrice: 1150.0, basePrice: 1150.0, isActive: true },
+  { id: 'LAB-507', code: 'LAB-507', name: `Total IgE`, category: 'LAB_TEST', defaultPrice: 680.0, basePrice: 680.0, isActive: true },
+  { id: 'LAB-508', code: 'LAB-508', name: `Total Iron Binding Capicity (TIBC)`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-509', code: 'LAB-509', name: `Total Leucocyte Count (TLC)`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-510', code: 'LAB-510', name: `Total PSA`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-511', code: 'LAB-511', name: `Total Red Blood Cell Count (RBC)`, category: 'LAB_TEST', defaultPrice: 170.0, basePrice: 170.0, isActive: true },
+  { id: 'LAB-512', code: 'LAB-512', name: `Total T3`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-513', code: 'LAB-513', name: `Total T4`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-514', code: 'LAB-514', name: `Total Testosterone`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-515', code: 'LAB-515', name: `Toxoplasma IgG`, category: 'LAB_TEST', defaultPrice: 390.0, basePrice: 390.0, isActive: true },
+  { id: 'LAB-516', code: 'LAB-516', name: `Toxoplasma IgM`, category: 'LAB_TEST', defaultPrice: 390.0, basePrice: 390.0, isActive: true },
+  { id: 'LAB-517', code: 'LAB-517', name: `TPHA`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-518', code: 'LAB-518', name: `TPHA -CSF`, category: 'LAB_TEST', defaultPrice: 260.0, basePrice: 260.0, isActive: true },
+  { id: 'LAB-519', code: 'LAB-519', name: `TPHA Quantitative`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-520', code: 'LAB-520', name: `Triglycerides`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-521', code: 'LAB-521', name: `Triple Marker Screening With Graph`, category: 'LAB_TEST', defaultPrice: 2500.0, basePrice: 2500.0, isActive: true },
+  { id: 'LAB-522', code: 'LAB-522', name: `Troponin- I`, category: 'LAB_TEST', defaultPrice: 840.0, basePrice: 840.0, isActive: true },
+  { id: 'LAB-523', code: 'LAB-523', name: `Troponin- I FIA`, category: 'LAB_TEST', defaultPrice: 840.0, basePrice: 840.0, isActive: true },
+  { id: 'LAB-524', code: 'LAB-524', name: `Troponin T hs`, category: 'LAB_TEST', defaultPrice: 840.0, basePrice: 840.0, isActive: true },
+  { id: 'LAB-525', code: 'LAB-525', name: `TSH`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-526', code: 'LAB-526', name: `TTG Antibody IgA`, category: 'LAB_TEST', defaultPrice: 1000.0, basePrice: 1000.0, isActive: true },
+  { id: 'LAB-527', code: 'LAB-527', name: `Typhi Dot IgG/IgM`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-528', code: 'LAB-528', name: `TZANCK SMEAR`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-529', code: 'LAB-529', name: `UIBC`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-530', code: 'LAB-530', name: `URE 24 HRS MICROALBUMIN`, category: 'LAB_TEST', defaultPrice: 350.0, basePrice: 350.0, isActive: true },
+  { id: 'LAB-531', code: 'LAB-531', name: `URE 24 HRS PROTEIN:CREATININE RATIO`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-532', code: 'LAB-532', name: `Urea`, category: 'LAB_TEST', defaultPrice: 130.0, basePrice: 130.0, isActive: true },
+  { id: 'LAB-533', code: 'LAB-533', name: `Urethral Smear Gonococci`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-534', code: 'LAB-534', name: `Uric Acid`, category: 'LAB_TEST', defaultPrice: 190.0, basePrice: 190.0, isActive: true },
+  { id: 'LAB-535', code: 'LAB-535', name: `Urine Albumin`, category: 'LAB_TEST', defaultPrice: 70.0, basePrice: 70.0, isActive: true },
+  { id: 'LAB-536', code: 'LAB-536', name: `Urine Albumin/Creatinine Ratio`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-537', code: 'LAB-537', name: `Urine Analysis`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-538', code: 'LAB-538', name: `Urine Bence Jones Protein`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-539', code: 'LAB-539', name: `Urine Bile Pigment (BP)`, category: 'LAB_TEST', defaultPrice: 70.0, basePrice: 70.0, isActive: true },
+  { id: 'LAB-540', code: 'LAB-540', name: `Urine Bile Salt (BS)`, category: 'LAB_TEST', defaultPrice: 70.0, basePrice: 70.0, isActive: true },
+  { id: 'LAB-541', code: 'LAB-541', name: `Urine Chyle`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-542', code: 'LAB-542', name: `Urine Cotinine`, category: 'LAB_TEST', defaultPrice: 1050.0, basePrice: 1050.0, isActive: true },
+  { id: 'LAB-543', code: 'LAB-543', name: `Urine Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-544', code: 'LAB-544', name: `Urine for Amylase`, category: 'LAB_TEST', defaultPrice: 420.0, basePrice: 420.0, isActive: true },
+  { id: 'LAB-545', code: 'LAB-545', name: `Urine for Dysmorphic RBC`, category: 'LAB_TEST', defaultPrice: 130.0, basePrice: 130.0, isActive: true },
+  { id: 'LAB-546', code: 'LAB-546', name: `Urine For Fat Globules`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-547', code: 'LAB-547', name: `Urine for Fungal elements`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-548', code: 'LAB-548', name: `Urine for Occult Blood`, category: 'LAB_TEST', defaultPrice: 70.0, basePrice: 70.0, isActive: true },
+  { id: 'LAB-549', code: 'LAB-549', name: `Urine For Pregnancy Test`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-550', code: 'LAB-550', name: `Urine for RBC`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-551', code: 'LAB-551', name: `Urine for Spermatozoa`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-552', code: 'LAB-552', name: `Urine Hemoglobunuria`, category: 'LAB_TEST', defaultPrice: 60.0, basePrice: 60.0, isActive: true },
+  { id: 'LAB-553', code: 'LAB-553', name: `Urine Ketone Bodies`, category: 'LAB_TEST', defaultPrice: 70.0, basePrice: 70.0, isActive: true },
+  { id: 'LAB-554', code: 'LAB-554', name: `Urine Protein/Creatinine Ratio`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-555', code: 'LAB-555', name: `Urine Reducing Sugar`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-556', code: 'LAB-556', name: `Urine Specific Gravity`, category: 'LAB_TEST', defaultPrice: 70.0, basePrice: 70.0, isActive: true },
+  { id: 'LAB-557', code: 'LAB-557', name: `Urine Spot Chloride`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-558', code: 'LAB-558', name: `Urine Spot Creatinine`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-559', code: 'LAB-559', name: `Urine Spot Magnesium`, category: 'LAB_TEST', defaultPrice: 630.0, basePrice: 630.0, isActive: true },
+  { id: 'LAB-560', code: 'LAB-560', name: `Urine Spot Microalbumin`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-561', code: 'LAB-561', name: `Urine Spot Phosphorus`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-562', code: 'LAB-562', name: `Urine Spot Potassium`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-563', code: 'LAB-563', name: `Urine Spot Sodium`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-564', code: 'LAB-564', name: `Urine Spot Total Protein`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-565', code: 'LAB-565', name: `Urine Sugar`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-566', code: 'LAB-566', name: `Urine Sugar (Fasting)`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-567', code: 'LAB-567', name: `Urine Sugar (PP)`, category: 'LAB_TEST', defaultPrice: 50.0, basePrice: 50.0, isActive: true },
+  { id: 'LAB-568', code: 'LAB-568', name: `UROFLOMETERY`, category: 'LAB_TEST', defaultPrice: 700.0, basePrice: 700.0, isActive: true },
+  { id: 'LAB-569', code: 'LAB-569', name: `V.E.C.`, category: 'LAB_TEST', defaultPrice: 190.0, basePrice: 190.0, isActive: true },
+  { id: 'LAB-570', code: 'LAB-570', name: `Vaginal Swab Culture & Sensitivity`, category: 'LAB_TEST', defaultPrice: 580.0, basePrice: 580.0, isActive: true },
+  { id: 'LAB-571', code: 'LAB-571', name: `Vasculitis Profile`, category: 'LAB_TEST', defaultPrice: 6620.0, basePrice: 6620.0, isActive: true },
+  { id: 'LAB-572', code: 'LAB-572', name: `VBG`, category: 'LAB_TEST', defaultPrice: 1900.0, basePrice: 1900.0, isActive: true },
+  { id: 'LAB-573', code: 'LAB-573', name: `VDRL`, category: 'LAB_TEST', defaultPrice: 210.0, basePrice: 210.0, isActive: true },
+  { id: 'LAB-574', code: 'LAB-574', name: `VDRL In Dilution`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-575', code: 'LAB-575', name: `VDRL In Dilution-CSF`, category: 'LAB_TEST', defaultPrice: 530.0, basePrice: 530.0, isActive: true },
+  { id: 'LAB-576', code: 'LAB-576', name: `VIRAL FEVER PANEL 1`, category: 'LAB_TEST', defaultPrice: 1290.0, basePrice: 1290.0, isActive: true },
+  { id: 'LAB-577', code: 'LAB-577', name: `VIRAL FEVER PANEL 2`, category: 'LAB_TEST', defaultPrice: 4140.0, basePrice: 4140.0, isActive: true },
+  { id: 'LAB-578', code: 'LAB-578', name: `Vitamin B12`, category: 'LAB_TEST', defaultPrice: 950.0, basePrice: 950.0, isActive: true },
+  { id: 'LAB-579', code: 'LAB-579', name: `Vitamin D Total (25-Hydroxy)`, category: 'LAB_TEST', defaultPrice: 1700.0, basePrice: 1700.0, isActive: true },
+  { id: 'LAB-580', code: 'LAB-580', name: `Vitamin Vita Health`, category: 'LAB_TEST', defaultPrice: 1890.0, basePrice: 1890.0, isActive: true },
+  { id: 'LAB-581', code: 'LAB-581', name: `Vitreous Fluid KOH`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-582', code: 'LAB-582', name: `VLDL Cholesterol`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-583', code: 'LAB-583', name: `WBCT-20  (On Spot)`, category: 'LAB_TEST', defaultPrice: 110.0, basePrice: 110.0, isActive: true },
+  { id: 'LAB-584', code: 'LAB-584', name: `Wet mount`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-585', code: 'LAB-585', name: `WHOLE BLOOD CLOTTING TEST(WBCT)`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-586', code: 'LAB-586', name: `Widal Test Slide`, category: 'LAB_TEST', defaultPrice: 190.0, basePrice: 190.0, isActive: true },
+  { id: 'LAB-587', code: 'LAB-587', name: `Widal Tube Test`, category: 'LAB_TEST', defaultPrice: 320.0, basePrice: 320.0, isActive: true },
+  { id: 'LAB-588', code: 'LAB-588', name: `Z N Stain (Ascitic Fluid) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-589', code: 'LAB-589', name: `Z N Stain (Bro.Secretion) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-590', code: 'LAB-590', name: `Z N Stain (Cryptosporidium) for AFB`, category: 'LAB_TEST', defaultPrice: 160.0, basePrice: 160.0, isActive: true },
+  { id: 'LAB-591', code: 'LAB-591', name: `Z N Stain (CSF) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-592', code: 'LAB-592', name: `Z N Stain (Liver Abscess) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-593', code: 'LAB-593', name: `Z N Stain (Menstrual Blood) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-594', code: 'LAB-594', name: `Z N Stain (Nasal Smear) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-595', code: 'LAB-595', name: `Z N Stain (Pericardial Fluid) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-596', code: 'LAB-596', name: `Z N Stain (Peritoneal Fluid) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-597', code: 'LAB-597', name: `Z N Stain (Pleural Brushing) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-598', code: 'LAB-598', name: `Z N Stain (Pleural Fluid) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-599', code: 'LAB-599', name: `Z N Stain (Pleural Pus) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-600', code: 'LAB-600', name: `Z N Stain (Pus) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-601', code: 'LAB-601', name: `Z N Stain (Semen) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-602', code: 'LAB-602', name: `Z N Stain (Sputum) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-603', code: 'LAB-603', name: `Z N Stain (Suction Tip) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-604', code: 'LAB-604', name: `Z N Stain (Swab) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-605', code: 'LAB-605', name: `Z N Stain (Synovial Fluid) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-606', code: 'LAB-606', name: `Z N Stain (Tracheal Asp.) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-607', code: 'LAB-607', name: `Z N Stain (Urine) for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-608', code: 'LAB-608', name: `Z N Stain for AFB`, category: 'LAB_TEST', defaultPrice: 150.0, basePrice: 150.0, isActive: true },
+  { id: 'LAB-609', code: 'LAB-609', name: `βETA - HCG (βHCG)`, category: 'LAB_TEST', defaultPrice: 800.0, basePrice: 800.0, isActive: true },
+  { id: 'LAB-610', code: 'LAB-610', name: `Allergy Drugs Only`, category: 'LAB_TEST', defaultPrice: 1600.0, basePrice: 1600.0, isActive: true },
+];
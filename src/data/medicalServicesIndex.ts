@@ -0,0 +1,3 @@
+import type { CatalogIndex } from '../utils/catalogIndex';
+
+export const MEDICAL_SERVICES_INDEX: CatalogIndex = {"version":1,"names":["24 hrs urinary albumin","24 hrs urinary calcium","24 hrs urinary electrolyte","24 hrs urinary uric acid","24 hrs urine chloride","24 hrs urine creatinine","24 hrs urine creatinine clearance","24 hrs urine magnesium","24 hrs urine magnesium","24 hrs urine phosphorous","24 hrs urine sodium","24 hrs urine urea","24 hrs urine albumin","24 hrs urine protein","24 hrs urine stone analysis","24 hrs urine albumin creatinine ratio","24 hrs urine calcium creatinine ratio","24hrs urine potassium","5 drugs sensitivity","abg","absolute basophils count abc","absolute eosinophil count aec","absolute lymphocyte count alc","absolute monocytes count amc","absolute neutrophil count anc","absolute reticulocyte count arc","activated partial thromboplastin time","afb cuture drugs panel","afb susceptibility 10 drug panel","air culture","albumin serum","alfa feto protein afp fluid","alfa feto protein afp serum","alkali denaturation test adt","alkaline phosphatase","allergy panel 1 basic 27 allergens","allergy panel 2 premium 40 allergen","allergy panel 3 comprehensive","amylase","anaerobic blood culture","anaerobic swab culture","anemia profile","anion gap","anti ccp","anti cardiolipin antibodies igg","anti cardiolipin antibodies igm","anti hav igm","anti hbe","anti hbs","anti hcv","anti hev igg","anti hev igm","anti mullerian hormone","anti nuclear antibody ana","anti phospholipid antibodies igg","anti phospholipid antibodies igm","anti sars cov 2 igg","anti thyroglobulin antibody","anti thyroid antibody","anti thyroid peroxidase antibody","antistreptolysin o titre aso","apla profile","appavisc solution culture","arneth count","arthritis profile","ascitic fluid biochemistry","ascitic fluid culture sensitivity","ascitic fluid cytology","ascitic fluid for ada","ascitic fluid for albumin","ascitic fluid for bilirubin","ascitic fluid for ldh","aslo qualitative","att drug sensitivity test","autologus","bal culture sensitivity","bal for biochemistry","bal for cytology","bicarbonate hco3","bilirubin direct","bilirubin indirect","bilirubin total","bilirubin total t d","biopsy for afb","biopsy for second opinion 1","biopsy for second opinion 2 4","biopsy for second opinion 5","biopsy large","biopsy large complex","biopsy medium","biopsy small","bleeding time","blood bag culture sensitivity","blood glucose fasting","blood glucose pp","blood glucose random","blood glucose 1hrs","blood glucose 2hrs","blood group abo","blood urea nitrogen bun","body fluid for bilirubin","body fluid bile pigment bp","body fluid bile salt bs","body fluid biochemistry","body fluid culture sensitivity","body fluid cytology","body fluid for ada","body fluid koh","boh profile","bone culture sensitivity","bone health screening","bone marrow aspiration cytology","bone marrow biopsy small","botanical cafe packge","bronchial brushing cytology","bronchial fluid culture sensitivity","bronchial washing cytology","buffy coat for ld bodies","ca 125 ovary","ca 15 3","calcium","calcium ionic","calrctinin","capd fluid for creatinine","capd fluid for cyto","capd fluid for sugar","carcino emryonic antigen cea","cardiac health screen basic 1199","cardiac health screen extensive 4999","cardiac health screen plus","cardiac risk check","cbc","cbc haemogram esr","cbc haemogram pbf","cell block preparation","cervical cancer screening","chloride","chloride csf","chloride fluid","cholesterol ldl hdl ratio","cholesterol total","cholesterol total hdl ratio","clot retraction time crt","clotting time","coagulation profile","comprehensive health checkup female","comprehensive health checkup male","corneal scrapping culture sensitivity","cpk total","cpk mb","creatinine","crp quantitative","crp high senstivity","csf culture sensitivity","csf for ada","csf for albumin","csf for ammonia","csf for billrubin","csf for biochemistry","csf for cytology","csf for ldh","csf for xanthochromia","csf gram stain","csf indian ink stain","csf koh","culture aerobic biological indicater","culture report other","culture report stool","culture report urine","cytology report","cytomegalo virus igg","cytomegalo virus igg urine","cytomegalo virus igm","cytomegalo virus igm urine","d dimer","dengue antigen antibody","dengue igg igm","dengue igg elisa","dengue igm","dengue igm elisa","dengue ns1 elisa","dengue ns1ag","dhea sulphate","diabetes plus","differential leucocyte count","digital image microscopy 1 5","direct coombs test","dog cbc","dog cbc haemogram pbf","double marker screning test","e t culture sensitivity","ebna cytology","ebus biopsy","ebus cytology","electrolytes serum","er pr her 2 neu","esr","estimated gfr","estradiol e2","estriol unconjugated e3","estrogen receptors er progesterone recep","executive plus","executive premium","fena test","ferritin","fever profile","fluid for cea","fluid for albumin","fluid for alkaline phosphatase","fluid for amylase","fluid for cholesterol","fluid for creatinine","fluid for ldh","fluid for lipase","fluid for protein","fluid for specific gravity","fluid for sugar","fluid for triglycerides","fluid for uric acid","fluid ph","fnac","fnac usg guided","fnac for second opinion","follicle stimulating hormone","free bhcg","free psa","free psa total psa ratio","free t3","free t4","fructose qualitative","fsh lh prolactin","fungal smear","g6pd quantitative","gastric aspiration for occult blood","gene expert test","ggtp","globulin","glucose tolerance test gtt","good health plan female","good health plan male","gram stain","gram stain bal","gram stain ascitic fluid","gram stain body fluid","gram stain csf","gram stain pericardial fluid","gram stain pleural fluid","gram stain pleural pus","gram stain pus","gram stain sputum","gram stain swab","gram stain urethral smear","gram stain urine","gram stain vitreous","guided biopsy panel","haemoglobin hb","haemophilia profile","hairs scrapping koh","hb core igm","hba1c","hbe antigen","hbs ag","hbs ag elisa","hct hematocrit fluid","hdl cholesterol","health check up profile","health package mrcc","health panel screenening","hepatitis profile","her 2 neu cerb2 ihc","herpes simplex virus 1 2 igg","herpes simplex virus 1 2 igm","herpes simplex virus 1 2 igg csf","herpes simplex virus 1 2 igm csf","hills n dunes health package","historiya royal health package","hiv 1 2 antibody","hiv combo","hiv duo","hiv elisa","hla b27","hpv dna pcr","hpv dna pcr pap lbc","hsv dna pcr","i t ratio","igg to chikungunya elisa","igm to chikungunya","igm to chikungunya elisa","il 6 level","indian ink stain","indirect coombs test","infection control culture","infertility female panel","infertility male panel","inhibin a","insulin","insulin fasting","insulin pp","ipth intact","iron","iron profile","iron profile screen","koh mount","lactate","lactate dehydrogenase ldh","lactate csf","lbc genital pap smear","ldl cholesterol","le cell phenomenon","leptospira igg","leptospira igm","lh fsh ratio","lipase","lipid profile","liver abscess biochemistry","liver abscess cytology","liver abscess for ada","liver function test","lung carcinoma profile","luteinising hormone lh","magnesium","malarial parasite by qbc","malarial parasite card","malarial parasite identification","mdr for tb","mean corp hb mch","mean corp hb con mchc","mean corp volume mcv","medicine culture sensitivity","mesh culture sensitivity","micro filaria blood smear","migrane profile","milk culture sensitivity","montoux test","mothers health package","nails scrapping koh","neutrophil to lymphocyte ratio","new born screening 3 conditions","nt pro bnp","ntc ventures package","obesity profile","opthalmic irrigating solution culture","oral cytology","oral glucose challenge test ogct 01 hrs","oral glucose challenge test ogct 02 hrs","osmotic fragility test","ot culture sensitivity","pap smear cyto","papp a","paraffin block for opinion","pcr hepatitis c virus quantitative","pcr dna hepatitis b virus qualitative","pcv hematocrit hct","pericadial fluid for ada","pericardial fluid for ldh","pericardial fluid biochemistry","pericardial fluid culture sensitivity","pericardial fluid cytology","peripheral blood smear pbf","peritoneal fluid serum billrubin","peritoneal fluid biochemistry","peritoneal fluid culture sensitivity","peritoneal fluid cytology","peritoneal fluid for ada","peritoneal fluid for billrubin","ph","phosphorus","platelet count","platelet morphology","pleural brushing","pleural fluid biochemistry","pleural fluid culture sensitivity","pleural fluid cytology","pleural fluid for ada","pleural fluid for cholesterol","pleural fluid for ldh","pleural fluid for triglycerides","pleural fluid koh","pleural pus biochemistry","pleural pus for cytology","poi 1st","post fob cytology","potassium","potassium fluid","pre endoscopy profile","pre oprative profile","pregnancy profile","procalcitonin pct","progesterone","prolactin","protein csf","protein total","prothrombin time with inr","protien a g ratio","prp test","pth","pus culture sensitivity","pus for ada","pus for biochemistry","pus for cytology","quadruple test screening","r a quantitative","rapid b a l fungal culture","rapid blood arobic fungal culture","rapid blood culture sensitivity","rapid body fluids culture sensitivity","rapid csf aerobic fungal culture","rapid csf culture sensitivity","rapid ear swab culture sensitivity","rapid endotracheal catheter tips culture","rapid fungal blood culture sensitivity","rapid fungal culture","rapid nasal swab culture sensitivity","rapid ot culture sensitivity","rapid pus culture sensitivity","rapid semen culture sensitivity","rapid sputum aerobic fungal culture","rapid sputum anaerobic culture","rapid sputum nocardia culture","rapid stool culture sensitivity","rapid swab culture sensitivity","rapid throat swab culture sensitivity","rapid tip culture sensitivity","rapid urine afb culture","rapid urine culture sensitivity","rapid vaginal swab culture sensitivity","rapid water culture","red cell distribution width rdw","regent culture sensitivity","renal function test rft","reticulocyte count","rh antibody titre","routine fungal culture aerobic","rubella igg","rubella igm","saag serum albumin ascites gradient","salmonella typhi igg","salmonella typhi igm","scalp scrapping koh","scrub typhus rapid test","semen analysis","semen culture sensitivity","semen wash","sepsis sreen","serum ada","serum cortisol","serum creatinine clearance","settle plate culture sensitivity","sgot","sgpt","sickling test","skin scrapping for afb","skin scrapping koh","smear for babesia","smear for fungal elements","sodium","sodium fluid","spot urinary calcium","spot urinary urea","spot urine calcium creatinine ratio","spot urine phosphorus creatinine ratio","sputum culture sensitivity","sputum cytology","sputum examination for nocardia","sputum for genexpert xdr resistance","sputum koh","sputum occult blood","stained hp cytology slides for opinion","stool analysis","stool culture sensitivity","stool for cryptosporidium","stool for fat globules","stool for fungal elements","stool for hanging drop","stool occult blood","stool ph","stool reducing sugar","super health package 7","swab culture","swab culture sensitivity","swab koh","synovial fluid biochemistry","synovial fluid culture sensitivity","synovial fluid cytology","synovial fluid for ada","synovial fluid gram stain","tb quantiferon igra","tb pcr dna mtb c s f","tb pcr dna mtb menstrual blood","tb pcr dna mtb pus","tb pcr dna mtb tissue","tb pcr dna mtb body fluid","tb pcr dna mtb semen","tb pcr dna mtb bal","tb pcr dna mtb urine","tb pcr dna mtb sputum","tbna cytology","throat swab for klb albert stain","throat swab culture sensitivity","thyroid function test","tip culture sensitivity","tissue culture sensitivity","tissue processing blocks slides","tlc dlc","torch igg","torch igm","total ige","total iron binding capicity tibc","total leucocyte count tlc","total psa","total red blood cell count rbc","total t3","total t4","total testosterone","toxoplasma igg","toxoplasma igm","tpha","tpha csf","tpha quantitative","triglycerides","triple marker screening with graph","troponin i","troponin i fia","troponin t hs","tsh","ttg antibody iga","typhi dot igg igm","tzanck smear","uibc","ure 24 hrs microalbumin","ure 24 hrs protein creatinine ratio","urea","urethral smear gonococci","uric acid","urine albumin","urine albumin creatinine ratio","urine analysis","urine bence jones protein","urine bile pigment bp","urine bile salt bs","urine chyle","urine cotinine","urine culture sensitivity","urine for amylase","urine for dysmorphic rbc","urine for fat globules","urine for fungal elements","urine for occult blood","urine for pregnancy test","urine for rbc","urine for spermatozoa","urine hemoglobunuria","urine ketone bodies","urine protein creatinine ratio","urine reducing sugar","urine specific gravity","urine spot chloride","urine spot creatinine","urine spot magnesium","urine spot microalbumin","urine spot phosphorus","urine spot potassium","urine spot sodium","urine spot total protein","urine sugar","urine sugar fasting","urine sugar pp","uroflometery","v e c","vaginal swab culture sensitivity","vasculitis profile","vbg","vdrl","vdrl in dilution","vdrl in dilution csf","viral fever panel 1","viral fever panel 2","vitamin b12","vitamin d total 25 hydroxy","vitamin vita health","vitreous fluid koh","vldl cholesterol","wbct 20 on spot","wet mount","whole blood clotting test wbct","widal test slide","widal tube test","z n stain ascitic fluid for afb","z n stain bro secretion for afb","z n stain cryptosporidium for afb","z n stain csf for afb","z n stain liver abscess for afb","z n stain menstrual blood for afb","z n stain nasal smear for afb","z n stain pericardial fluid for afb","z n stain peritoneal fluid for afb","z n stain pleural brushing for afb","z n stain pleural fluid for afb","z n stain pleural pus for afb","z n stain pus for afb","z n stain semen for afb","z n stain sputum for afb","z n stain suction tip for afb","z n stain swab for afb","z n stain synovial fluid for afb","z n stain tracheal asp for afb","z n stain urine for afb","z n stain for afb","eta hcg hcg","allergy drugs only"],"tokens":["01","02","1","10","1199","125","15","1hrs","1st","2","20","24","24hrs","25","27","2hrs","3","4","40","4999","5","6","7","a","abc","abg","abo","abscess","absolute","acid","activated","ada","adt","aec","aerobic","afb","afp","ag","air","albert","albumin","alc","alfa","alkali","alkaline","allergen","allergens","allergy","amc","ammonia","amylase","ana","anaerobic","analysis","anc","anemia","anion","anti","antibodies","antibody","antigen","antistreptolysin","apla","appavisc","arc","arneth","arobic","arthritis","ascites","ascitic","aslo","aso","asp","aspiration","att","autologus","b","b12","b27","babesia","bag","bal","basic","basophils","bence","bhcg","bicarbonate","bile","bilirubin","billrubin","binding","biochemistry","biological","biopsy","bleeding","block","blocks","blood","bnp","bodies","body","boh","bone","born","botanical","bp","bro","bronchial","brushing","bs","buffy","bun","by","c","ca","cafe","calcium","calrctinin","cancer","capd","capicity","carcino","carcinoma","card","cardiac","cardiolipin","catheter","cbc","ccp","cea","cell","cerb2","cervical","challenge","check","checkup","chikungunya","chloride","cholesterol","chyle","clearance","clot","clotting","coagulation","coat","combo","complex","comprehensive","con","conditions","control","coombs","core","corneal","corp","cortisol","cotinine","count","cov","cpk","creatinine","crp","crt","cryptosporidium","csf","culture","cuture","cyto","cytology","cytomegalo","d","dehydrogenase","denaturation","dengue","dhea","diabetes","differential","digital","dilution","dimer","direct","distribution","dlc","dna","dog","dot","double","drop","drug","drugs","dunes","duo","dysmorphic","e","e2","e3","ear","ebna","ebus","electrolyte","electrolytes","elements","elisa","emryonic","endoscopy","endotracheal","eosinophil","er","esr","estimated","estradiol","estriol","estrogen","eta","examination","executive","expert","extensive","f","fasting","fat","female","fena","ferritin","feto","fever","fia","filaria","fluid","fluids","fnac","fob","follicle","for","fragility","free","fructose","fsh","function","fungal","g","g6pd","gap","gastric","gene","genexpert","genital","gfr","ggtp","globules","globulin","glucose","gonococci","good","gradient","gram","graph","gravity","group","gtt","guided","haemoglobin","haemogram","haemophilia","hairs","hanging","hav","hb","hba1c","hbe","hbs","hcg","hco3","hct","hcv","hdl","health","hematocrit","hemoglobunuria","hepatitis","her","herpes","hev","high","hills","historiya","hiv","hla","hormone","hp","hpv","hrs","hs","hsv","hydroxy","i","identification","iga","ige","igg","igm","igra","ihc","il","image","in","indian","indicater","indirect","infection","infertility","inhibin","ink","inr","insulin","intact","ionic","ipth","iron","irrigating","jones","ketone","klb","koh","l","lactate","large","lbc","ld","ldh","ldl","le","leptospira","leucocyte","level","lh","lipase","lipid","liver","lung","luteinising","lymphocyte","magnesium","malarial","male","marker","marrow","mb","mch","mchc","mcv","mdr","mean","medicine","medium","menstrual","mesh","micro","microalbumin","microscopy","migrane","milk","monocytes","montoux","morphology","mothers","mount","mrcc","mtb","mullerian","n","nails","nasal","neu","neutrophil","new","nitrogen","nocardia","ns1","ns1ag","nt","ntc","nuclear","o","obesity","occult","ogct","on","only","opinion","oprative","opthalmic","oral","osmotic","ot","other","ovary","package","packge","panel","pap","papp","paraffin","parasite","partial","pbf","pcr","pct","pcv","pericadial","pericardial","peripheral","peritoneal","peroxidase","ph","phenomenon","phosphatase","phospholipid","phosphorous","phosphorus","pigment","plan","plate","platelet","pleural","plus","poi","post","potassium","pp","pr","pre","pregnancy","premium","preparation","pro","procalcitonin","processing","profile","progesterone","prolactin","protein","prothrombin","protien","prp","psa","pth","pus","qbc","quadruple","qualitative","quantiferon","quantitative","r","random","rapid","ratio","rbc","rdw","recep","receptors","red","reducing","regent","renal","report","resistance","reticulocyte","retraction","rft","rh","risk","routine","royal","rubella","s","saag","salmonella","salt","sars","scalp","scrapping","screen","screenening","screening","screning","scrub","second","secretion","semen","sensitivity","senstivity","sepsis","serum","settle","sgot","sgpt","sickling","simplex","skin","slide","slides","small","smear","sodium","solution","specific","spermatozoa","spot","sputum","sreen","stain","stained","stimulating","stone","stool","suction","sugar","sulphate","super","susceptibility","swab","synovial","t","t3","t4","tb","tbna","test","testosterone","throat","thromboplastin","thyroglobulin","thyroid","tibc","time","tip","tips","tissue","titre","tlc","to","tolerance","torch","total","toxoplasma","tpha","tracheal","triglycerides","triple","troponin","tsh","ttg","tube","typhi","typhus","tzanck","uibc","unconjugated","up","ure","urea","urethral","uric","urinary","urine","uroflometery","usg","v","vaginal","vasculitis","vbg","vdrl","ventures","viral","virus","vita","vitamin","vitreous","vldl","volume","wash","washing","water","wbct","wet","whole","widal","width","with","xanthochromia","xdr","z"],"tokenPostings":[[343],[344],[35,84,185,270,271,272,273,276,575],[28],[127],[118],[119],[96],[380],[36,56,85,195,269,270,271,272,273,276,576],[582],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,529,530],[17],[578],[35],[97],[37,119,337],[85],[36],[128],[18,86,185],[288],[477],[294,348,393,401,402],[20],[19],[98],[314,315,316,591],[20,21,22,23,24,25],[3,218,533],[26],[68,106,154,316,353,363,373,397,444,484],[33],[21],[165,406,416,432],[27,28,83,423,451,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],[31,32],[261,262],[29],[497],[0,12,15,30,69,155,207,435,534,535],[22],[31,32],[33],[34,208],[36],[35],[35,36,37,609],[23],[156],[38,209,543],[53],[39,40,417],[14,440,468,536],[24],[41],[42],[43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59],[44,45,54,55],[53,57,58,59,175,276,431,525],[126,175,260],[60],[61],[62],[25],[63],[403],[64],[435],[65,66,67,68,69,70,71,242,587],[72],[60],[605],[111,233],[73],[74],[351,402],[577],[280],[453],[92],[75,76,77,241,493],[35,127],[20],[537],[224],[78],[101,102,538,539],[70,79,80,81,82,100],[157,359,364],[507],[65,76,103,158,314,355,360,370,378,398,481],[165],[83,84,85,86,87,88,89,90,112,192,254],[91],[134,349],[502],[39,92,93,94,95,96,97,98,99,233,330,358,403,404,410,466,474,488,510,547,584,592],[338],[117,552],[100,101,102,103,104,105,106,107,243,405,491],[108],[109,110,111,112],[337],[113],[101,538],[588],[114,115,116],[114,369,596],[102,539],[117],[99],[321],[350,487,568],[118,119],[113],[1,16,120,121,457,459],[122],[135],[123,124,125],[507],[126],[318],[322],[127,128,129,130],[44,45],[409],[131,132,133,187,188],[43],[126,206],[134,308,427,510],[269],[135],[343,344],[130,265],[145,146],[285,286,287],[4,136,137,138,556],[139,140,141,210,264,307,374,581],[540],[6,446],[142],[143,584],[144],[117],[277],[88],[37,145,146],[326],[337],[291],[186,290],[258],[147],[325,326,327],[445],[541],[20,21,22,23,24,25,63,184,367,430,508,510],[56],[148,149],[5,6,15,16,123,150,211,446,459,460,530,535,553,557],[151,152],[142],[470,589],[137,153,154,155,156,157,158,159,160,161,162,163,164,244,272,273,305,390,406,407,517,574,590],[29,39,40,62,66,75,92,104,109,115,147,153,165,166,167,168,190,291,328,329,332,341,346,356,361,371,396,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,428,432,441,447,461,469,478,479,482,498,500,501,542,569],[27],[124,347],[67,77,105,111,114,116,159,169,191,193,315,342,357,362,372,379,381,399,462,467,483,496],[170,171,172,173],[82,174,578],[304],[33],[175,176,177,178,179,180,181],[182],[183],[184],[185],[573,574],[174],[79,186],[427],[503],[281,282,283,351,487,488,489,490,491,492,493,494,495],[187,188],[526],[189],[473],[28,73],[18,27,609],[274],[278],[544],[190,568],[198],[199],[408],[191],[192,193],[2],[194],[454,472,546],[177,179,180,262,279,285,287],[126],[384],[409],[21],[195,200],[132,196],[197],[198],[199],[200],[608],[463],[201,202],[234],[128],[487],[93,296,565],[471,545],[145,238,292],[203],[204],[31,32],[205,575,576],[522],[330],[31,65,66,67,68,69,70,71,100,101,102,103,104,105,106,107,115,123,124,125,138,206,207,208,209,210,211,212,213,214,215,216,217,218,219,242,243,245,246,263,353,354,355,356,357,359,360,361,362,363,364,370,371,372,373,374,375,376,377,383,456,481,482,483,484,485,491,580,587,594,595,597,604],[405],[220,221,222],[381],[223],[68,69,70,71,76,77,83,84,85,86,100,106,117,123,124,125,154,155,156,157,158,159,160,161,206,207,208,209,210,211,212,213,214,215,216,217,218,222,233,316,324,349,353,354,363,364,373,374,375,376,379,397,398,399,451,453,454,463,464,467,470,471,472,473,484,497,543,544,545,546,547,548,549,550,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],[345],[224,225,226,227,228],[229],[230,311],[317,429,499],[231,402,403,406,410,411,416,432,454,472,546],[393],[232],[42],[233],[234],[464],[306],[197],[235],[471,545],[236],[93,94,95,96,97,237,343,344],[532],[238,239],[435],[162,240,241,242,243,244,245,246,247,248,249,250,251,252,253,485],[520],[215,555],[98],[237],[221,254],[255],[132,133,188],[256],[257],[473],[46],[255,258,325,326],[259],[47,260],[48,261,262],[608],[78],[263,352],[49],[139,141,264],[110,127,128,129,145,146,238,239,265,266,267,274,275,334,477,579],[263,352],[551],[268,350,351],[195,269],[270,271,272,273],[50,51],[152],[274],[275],[276,277,278,279],[280],[52,223,319],[467],[281,282],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,343,344,529,530],[523],[283],[578],[284,521,522],[323],[525],[506],[44,50,54,56,170,171,176,177,270,272,285,309,433,436,504,514,526],[45,46,51,55,172,173,176,178,179,258,271,273,286,287,310,434,437,505,515,526],[486],[269],[288],[185],[573,574],[163,289],[165],[80,290],[291],[292,293],[294],[163,289],[392],[295,296,297],[298],[121],[298],[299,300,301,507],[341],[537],[552],[497],[107,164,257,302,335,377,438,452,465,480,580],[402],[303,304,305],[87,88],[282,306],[117],[71,160,212,304,354,375],[139,307],[308],[309,310],[184,508],[288],[230,311,319],[213,312],[313],[314,315,316,317,591],[318],[319],[22,336],[7,8,320,558],[321,322,323],[146,239,293],[189,520],[111,112],[149],[325],[326],[327],[324],[325,326,327],[328],[89],[488,592],[329],[330],[529,559],[185],[331],[332],[23],[333],[368],[334],[302,583],[266],[487,488,489,490,491,492,493,494,495],[52],[274,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],[335],[412,593],[195,269],[24,336],[337],[99],[418,463],[180],[181],[338],[339],[53],[60],[340],[233,466,474,547],[343,344],[582],[609],[84,85,86,222,349,467],[385],[341],[342,343,344],[345],[346,413],[166],[118],[266,274,275,334,339,477],[113],[27,28,35,36,37,254,267,292,293,575,576],[282,306,347],[348],[349],[321,322,323],[26],[133,188,358],[281,282,283,350,351,487,488,489,490,491,492,493,494,495],[387],[352],[353],[245,354,355,356,357,594],[358],[359,360,361,362,363,364,595],[59],[219,365,475],[308],[34,208],[54,55],[9],[366,460,560],[101,538],[238,239],[447],[367,368],[246,247,369,370,371,372,373,374,375,376,377,378,379,596,597,598],[129,183,201],[380],[381],[17,382,383,561],[94,297,566],[195],[384,385],[386,548],[36,202],[134],[338],[387],[502],[41,61,64,108,144,205,256,265,268,300,301,313,318,331,340,384,385,386,570],[200,388],[230,389],[13,31,32,214,390,391,530,537,553,563],[392],[393],[394],[225,226,509],[395],[247,248,378,379,396,397,398,399,414,489,598,599],[321],[400],[72,229,351],[486],[151,232,350,401,518],[401],[95],[402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,439],[15,16,139,141,226,284,311,336,393,459,460,530,535,553],[510,544,549],[427],[200],[200],[427,510],[476,554],[428],[429],[166,167,168,169],[464],[25,430],[142],[429],[431],[130],[432],[275],[433,434],[487],[435],[436,437],[102,539],[56],[438],[147,257,335,438,451,452],[127,128,129,301],[267],[110,135,337,400,520],[189],[439],[84,85,86,222],[588],[415,440,441,442,492,600],[18,66,73,75,92,104,109,115,147,153,190,328,329,332,346,356,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,498,500,501,542,569],[152],[443],[30,32,194,359,435,444,445,446],[447],[448],[449],[450],[270,271,272,273],[451,452],[585],[467,502],[90,112],[231,251,306,330,347,358,453,454,527,532,593],[10,455,456,562],[62,341],[215,555],[550],[457,458,459,460,556,557,558,559,560,561,562,563,582],[249,416,417,418,461,462,463,464,465,466,495,601],[443],[162,163,240,241,242,243,244,245,246,247,248,249,250,251,252,253,289,485,497,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],[467],[223],[14],[167,419,468,469,470,471,472,473,474,475,476],[602],[125,216,476,554,564,565,566],[182],[477],[28],[40,250,408,412,420,421,425,478,479,480,497,498,569,603],[481,482,483,484,485,604],[82,190,284,523],[227,511],[228,512],[324,486,487,488,489,490,491,492,493,494,495],[496],[33,73,186,189,203,234,237,290,317,333,343,344,345,394,400,429,439,450,499,548,584,585,586],[513],[421,497,498],[26],[57],[58,59,499],[507],[26,91,142,143,392],[422,500,602],[409],[490,501,502],[60,431],[503,508],[285,286,287,336],[237],[504,505],[81,82,140,141,148,226,391,506,507,508,509,510,511,512,513,563,578],[514,515],[516,517,518],[605],[217,376,519],[520],[521,522,523],[524],[525],[586],[436,437,526],[439],[527],[528],[199],[265],[529,530],[11,99,458,531],[251,532],[3,218,533],[0,1,2,3,457,458],[4,5,6,7,8,9,10,11,12,13,14,15,16,17,168,171,173,252,423,424,459,460,494,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,606],[567],[221],[568],[425,569],[570],[571],[572,573,574],[339],[575,576],[170,171,172,173,270,271,272,273,350,351],[579],[577,578,579],[253,580],[581],[327],[442],[116],[426],[582,584],[583],[584],[585,586],[427],[392,520],[161],[464],[587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607]],"trigrams":{" 01":[343]," 02":[344]," 1 ":[35,185,270,271,272,273,276]," 10":[28]," 11":[127]," 12":[118]," 15":[119]," 1h":[96]," 1s":[380]," 2 ":[36,56,85,195,269,270,271,272,273,276]," 20":[582]," 24":[529,530]," 25":[578]," 27":[35]," 2h":[97]," 3 ":[37,337]," 40":[36]," 49":[128]," 6 ":[288]," a ":[393,401,402]," ab":[20,98,314,315,316,591]," ac":[3,218,533]," ad":[33,68,106,154,316,353,363,373,397,444,484]," ae":[21,165,406,416,432]," af":[31,32,83,423,451,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607]," ag":[261,262]," al":[0,12,15,22,35,36,69,155,207,208,435,497,534,535]," am":[23,156,209,543]," an":[14,24,44,45,53,54,55,57,58,59,126,175,260,276,417,431,440,468,525,536]," ar":[25,403]," as":[60,111,233,242,435,587,605]," b ":[351,402]," b1":[577]," b2":[280]," ba":[20,35,92,127,241,453,493]," be":[537]," bh":[224]," bi":[65,70,76,100,101,102,103,112,157,158,165,192,254,314,355,359,360,364,370,378,398,481,507,538,539]," bl":[39,134,233,330,349,358,403,404,410,466,474,488,502,510,547,584,592]," bn":[338]," bo":[117,243,337,405,491,552]," bp":[101,538]," br":[114,369,588,596]," bs":[102,539]," bu":[99]," by":[321]," c ":[350,487]," ca":[1,16,44,45,113,135,318,322,409,457,459,507]," cb":[187,188]," cc":[43]," ce":[126,206,269,308,427,510]," ch":[4,130,145,146,210,264,265,285,286,287,307,343,344,374,540,556,581]," cl":[6,446,584]," co":[20,21,22,23,24,25,37,56,63,88,117,184,186,258,277,290,291,325,326,327,337,367,430,445,508,510,541]," cr":[5,6,15,16,123,142,211,446,459,460,470,530,535,553,557,589]," cs":[137,244,272,273,305,390,406,407,517,574,590]," cu":[27,29,39,40,62,66,75,92,104,109,115,147,153,190,291,328,329,332,341,346,356,361,371,396,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,428,432,441,447,461,469,478,479,482,498,500,501,542,569]," cy":[67,77,105,111,114,116,124,159,191,193,315,342,347,357,362,372,379,381,399,462,467,483,496]," d ":[578]," de":[33,304]," di":[79,174,427,573,574]," dl":[503]," dn":[281,282,283,351,487,488,489,490,491,492,493,494,495]," do":[526]," dr":[18,27,28,73,473,609]," du":[274,278]," dy":[544]," e ":[568]," e2":[198]," e3":[199]," ea":[408]," el":[2,177,179,180,262,279,285,287,454,472,546]," em":[126]," en":[384,409]," eo":[21]," er":[200]," es":[132]," ex":[128,234,463]," fa":[93,296,471,545,565]," fe":[31,32,145,238,292,575,576]," fi":[330,522]," fl":[31,65,66,67,68,69,70,71,100,101,102,103,104,105,106,107,115,123,124,125,138,242,243,245,246,263,353,354,355,356,357,359,360,361,362,363,364,370,371,372,373,374,375,376,377,383,405,456,481,482,483,484,485,491,580,587,594,595,597,604]," fo":[68,69,70,71,76,77,83,84,85,86,100,106,117,123,124,125,154,155,156,157,158,159,160,161,206,207,208,209,210,211,212,213,214,215,216,217,218,222,233,316,324,349,353,354,363,364,373,374,375,376,379,381,397,398,399,451,453,454,463,464,467,470,471,472,473,484,497,543,544,545,546,547,548,549,550,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607]," fr":[345]," fs":[311]," fu":[317,402,403,406,410,411,416,429,432,454,472,499,546]," g ":[393]," ga":[42]," ge":[306,464]," gf":[197]," gl":[93,94,95,96,97,343,344,471,545]," go":[532]," gr":[98,162,215,435,485,520,555]," gt":[237]," gu":[221]," ha":[46,132,133,188,473]," hb":[47,48,255,325,326]," hc":[49,78,352,608]," hd":[139,141]," he":[50,51,110,127,128,129,145,146,195,238,239,263,274,275,334,350,351,352,477,551,579]," hi":[152]," ho":[52,223,319]," hp":[467]," hr":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,343,344,529,530]," hs":[523]," hy":[578]," i ":[522]," id":[323]," ig":[44,45,46,50,51,54,55,56,170,171,172,173,176,177,178,179,258,270,271,272,273,309,310,433,434,436,437,486,504,505,506,514,515,525,526]," ih":[269]," im":[185]," in":[80,163,165,289,298,392,573,574]," io":[121]," ir":[341,507]," jo":[537]," ke":[552]," kl":[497]," ko":[107,164,257,335,377,438,452,465,480,580]," l ":[402]," la":[87,88]," lb":[282]," ld":[71,117,139,160,212,304,354,375]," le":[184,288,508]," lh":[230,319]," li":[213,591]," ly":[22,336]," ma":[7,8,111,112,146,189,239,293,520,558]," mb":[149]," mc":[325,326,327]," me":[89,488,592]," mi":[185,529,559]," mo":[23,302,368,583]," mr":[266]," mt":[487,488,489,490,491,492,493,494,495]," mu":[52]," n ":[274,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607]," na":[412,593]," ne":[24,195,269]," ni":[99]," no":[418,463]," ns":[180,181]," nu":[53]," o ":[60]," oc":[233,466,474,547]," og":[343,344]," on":[582,609]," op":[84,85,86,222,349,385,467]," ot":[166,413]," ov":[118]," pa":[26,27,28,35,36,37,113,254,266,267,274,275,282,292,293,306,321,322,323,334,339,477,575,576]," pb":[133,188,358]," pc":[281,282,283,387,487,488,489,490,491,492,493,494,495]," pe":[59,245,594,595]," ph":[9,34,54,55,208,219,308,460,475,560]," pi":[101,538]," pl":[129,183,201,238,239,246,247,447,596,597,598]," po":[17,561]," pp":[94,297,566]," pr":[13,31,32,36,41,61,64,108,134,144,195,200,202,205,214,230,256,265,268,300,301,313,318,331,338,340,384,385,386,502,530,537,548,553,563,570]," ps":[225,226,509]," pu":[247,248,378,379,414,489,598,599]," qb":[321]," qu":[72,151,229,232,350,351,401,486,518]," ra":[15,16,95,139,141,226,284,311,336,393,439,459,460,530,535,553]," rb":[510,544,549]," rd":[427]," re":[25,142,166,167,168,169,200,464,476,510,554]," rf":[429]," ri":[130]," ro":[275]," s ":[487]," sa":[56,102,539]," sc":[110,127,128,129,135,147,189,257,267,301,335,337,400,438,451,452,520]," se":[18,30,32,66,73,75,84,85,86,92,104,109,115,147,152,153,190,194,222,328,329,332,346,356,359,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,435,441,447,461,469,479,482,492,498,500,501,542,569,588,600]," si":[270,271,272,273]," sl":[467,502,585]," sm":[90,112,231,251,306,330,347,358,527,532,593]," so":[10,62,341,562]," sp":[215,249,416,417,418,495,550,555,556,557,558,559,560,561,562,563,582,601]," sr":[443]," st":[14,162,163,167,223,240,241,242,243,244,245,246,247,248,249,250,251,252,253,289,419,485,497,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607]," su":[28,125,182,216,476,554,564,565,566,602]," sw":[40,250,408,412,420,421,425,497,498,569,603]," sy":[604]," t ":[82,190,284,523]," t3":[227,511]," t4":[228,512]," tb":[324]," te":[33,73,186,189,203,234,237,290,317,333,343,344,345,394,400,429,439,450,499,513,548,584,585,586]," th":[26,57,58,59,421]," ti":[26,60,91,142,143,392,409,422,431,490,507,602]," tl":[508]," to":[81,82,140,141,148,226,237,285,286,287,336,391,563,578]," tr":[217,376,605]," tu":[586]," ty":[436,437,439]," un":[199]," up":[265]," ur":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,99,168,171,173,218,251,252,423,424,457,458,459,460,494,606]," us":[221]," va":[425]," ve":[339]," vi":[170,171,172,173,253,270,271,272,273,350,351,579]," vo":[327]," wa":[116,426,442]," wb":[584]," wi":[392,427,520]," xa":[161]," xd":[464],"0 a":[36],"0 d":[28],"0 o":[582],"01 ":[343],"02 ":[344],"1 2":[270,271,272,273,276],"1 5":[185],"1 b":[35],"1 e":[180],"1 h":[343],"10 ":[28],"119":[127],"125":[118],"15 ":[119],"199":[127],"1ag":[181],"1hr":[96],"1st":[380],"2 4":[85],"2 a":[276],"2 h":[344],"2 i":[56,269,270,271,272,273],"2 n":[195,269],"2 p":[36],"20 ":[582],"24 ":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,529,530],"24h":[17],"25 ":[118,578],"27 ":[35],"2hr":[97],"3 c":[37,337],"4 h":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,529,530],"40 ":[36],"499":[128],"4hr":[17],"5 3":[119],"5 d":[18],"5 h":[578],"5 o":[118],"6 l":[288],"6pd":[232],"7 a":[35],"999":[128],"a 1":[118,119],"a b":[280,330],"a c":[191,418,496,517],"a e":[285,287],"a f":[31,32],"a g":[393],"a h":[351,579,608],"a i":[309,310,433,434,514,515],"a l":[402],"a m":[487,488,489,490,491,492,493,494,495],"a n":[99],"a p":[41,61,256,281,282,283,318],"a q":[401,518],"a r":[226,275],"a s":[182],"a t":[203,226,436,437],"a1c":[259],"aag":[435],"ab ":[40,408,412,420,421,425,478,479,480,497,498,569,603],"abc":[20],"abe":[183,453],"abg":[19],"abo":[98],"abs":[20,21,22,23,24,25,314,315,316,591],"ac ":[127,128,129,130,221,222],"ach":[409,605],"aci":[3,218,533],"ack":[113,266,274,275,334,339,477],"act":[26,142,230,298,303,304,305,389],"ada":[68,106,154,316,353,363,373,397,444,484],"adi":[198,353,435],"adr":[400],"adt":[33],"aec":[21],"aem":[132,133,188,255,256],"aer":[39,40,165,406,416,417,432],"afb":[27,28,83,423,451,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],"afe":[113],"aff":[349],"afp":[31,32],"ag ":[92,262,435],"age":[185,266,274,275,334,339,477],"agi":[345,425,569],"agn":[7,8,320,558],"agu":[144],"ail":[335],"ain":[162,163,240,241,242,243,244,245,246,247,248,249,250,251,252,253,289,467,485,497,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],"air":[29,257],"al ":[26,75,76,77,82,113,114,115,116,135,141,147,165,184,185,226,231,245,246,247,251,275,306,321,322,323,342,343,344,353,354,355,356,357,358,359,360,361,362,363,364,369,370,371,372,373,374,375,376,377,378,379,402,403,406,409,410,411,412,416,425,429,432,454,472,481,482,483,484,485,488,506,507,508,509,510,511,512,513,532,546,563,569,575,576,578,585,586,592,593,594,595,596,597,598,604,605],"ala":[321,322,323],"alb":[0,12,15,30,69,155,207,435,497,529,534,535,559],"alc":[1,16,22,120,121,387,457,459],"ale":[145,146,238,239,292,293],"alf":[31,32],"ali":[33,34,72,208,229,351],"alk":[33,34,208],"all":[35,36,37,90,112,343,344,609],"alm":[341,436,437],"alo":[170,171,172,173],"alp":[438],"alr":[122],"alt":[102,110,127,128,129,145,146,238,239,265,266,267,274,275,334,477,539,579],"aly":[14,440,468,536],"am ":[132,133,162,188,240,241,242,243,244,245,246,247,248,249,250,251,252,253,485],"amc":[23],"ami":[463,577,578,579],"amm":[156],"amy":[38,209,543],"an ":[52,163,238,239,289,325,326,327],"ana":[14,39,40,53,417,440,468,536],"anc":[6,24,135,237,386,446,464,527,548],"and":[95],"ane":[27,28,35,36,37,41,254,267,292,293,331,575,576],"ang":[473],"ani":[42,113],"ant":[43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,126,151,161,175,232,260,276,350,401,431,486,518,525],"ap ":[282,306,347],"apd":[123,124,125],"aph":[520],"api":[402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,439,507],"apl":[61],"app":[62,147,257,335,348,438,451,452],"ar ":[53,347,358,408,453,454,532,565,566,593],"ara":[6,134,321,322,323,349,446],"arb":[78],"arc":[25,126,318],"ard":[44,45,127,128,129,130,245,322,354,355,356,357,418,463,594],"arg":[87,88],"ari":[321,322,323,330],"ark":[189,520],"arn":[63],"aro":[403],"arr":[111,112],"ars":[56],"art":[26,64],"ary":[0,1,2,3,118,457,458],"asa":[412,593],"asc":[65,66,67,68,69,70,71,242,435,570,587],"ase":[34,38,59,208,209,213,304,312,543],"ash":[116,442],"asi":[35,127,321,322,323],"asl":[72],"asm":[514,515],"aso":[20,60],"asp":[111,233,605],"ass":[17,382,383,561],"ast":[26,93,233,296,565],"at ":[117,421,471,497,498,545],"ata":[34,208],"ate":[26,78,165,182,197,199,303,304,305,367,368,426,447],"ath":[409],"ati":[5,6,15,16,33,72,111,123,134,139,141,144,150,151,211,223,226,229,232,233,268,284,311,323,336,341,350,351,385,393,401,446,459,460,463,518,530,535,553,557],"ato":[263,352,550],"att":[73],"atu":[33],"aut":[74],"av ":[46],"avi":[62,215,555],"b a":[402,497],"b b":[491,493],"b c":[27,40,258,326,381,408,412,420,421,423,425,478,479,487,498,569],"b f":[497,603],"b k":[480],"b m":[325,488],"b p":[487,488,489,490,491,492,493,494,495],"b q":[486],"b s":[28,492,495],"b t":[439,490],"b u":[494],"b v":[351],"b12":[577],"b2 ":[269],"b27":[280],"ba1":[259],"bab":[453],"bag":[92],"bal":[75,76,77,241,493],"bas":[20,35,127],"bc ":[132,133,188,306],"bct":[582,584],"be ":[260,586],"bel":[433,434],"ben":[537],"ber":[497],"bes":[340,453],"bet":[183],"bhc":[224],"bic":[39,40,78,165,403,406,416,417,432],"bil":[28,70,79,80,81,82,100,101,102,157,359,364,538,539],"bin":[70,79,80,81,82,100,157,255,294,359,364,392,507],"bio":[65,76,83,84,85,86,87,88,89,90,103,112,158,165,192,254,314,355,360,370,378,398,481],"ble":[91,189],"blo":[39,92,93,94,95,96,97,98,99,134,233,330,349,358,403,404,410,466,474,488,502,510,547,584,592],"bna":[191,496],"bnp":[338],"bod":[44,45,53,54,55,57,58,59,100,101,102,103,104,105,106,107,117,175,243,276,405,431,491,525,552],"boh":[108],"bon":[78,109,110,111,112],"bop":[26],"bor":[337],"bot":[113],"bro":[114,115,116,588],"bru":[114,369,596],"bs ":[186,261,262,290],"bsc":[314,315,316,591],"bso":[20,21,22,23,24,25],"buf":[117],"bul":[57,236,471,545],"bum":[0,12,15,30,69,155,207,435,529,534,535,559],"bun":[99,551],"bus":[192,193],"but":[427],"by ":[321],"c 1":[127],"c 2":[35],"c a":[3,126,218,233,533],"c b":[39,165],"c c":[417],"c d":[503],"c f":[65,66,67,68,69,70,71,222,242,345,403,406,416,587],"c g":[215,306,555],"c h":[127,128,129,132,133,188],"c i":[341],"c r":[130,544],"c s":[40,62,487],"c u":[221],"c v":[339,350],"ca ":[118,119],"cad":[353],"caf":[113],"cal":[1,16,113,120,121,122,135,165,387,438,457,459],"can":[135],"cap":[123,124,125,507],"car":[44,45,78,126,127,128,129,130,245,318,322,354,355,356,357,418,463,594],"cat":[165,323,409],"cbc":[131,132,133,187,188],"cci":[532],"ccp":[43],"ccu":[233,466,474,547],"ce ":[237,537],"cea":[126,206],"cel":[134,308,427,510],"cep":[28,200],"cer":[135,217,269,376,519],"ces":[314,315,316,502,591],"cg ":[608],"ch ":[504,505],"cha":[343,344],"chc":[326],"che":[65,76,103,130,145,146,158,265,314,355,360,370,378,398,409,481,605],"chi":[114,115,116,285,286,287],"chl":[4,136,137,138,556],"cho":[139,140,141,210,264,307,374,581],"chr":[161],"chy":[540],"cid":[3,218,533],"cif":[215,555],"cin":[126,318,328,476,554],"cit":[65,66,67,68,69,70,71,242,387,435,507,587],"ciu":[1,16,120,121,457,459],"ck ":[134,265,349,527],"cka":[266,274,275,334,339,477],"ckg":[113],"ckl":[450],"cks":[502],"cku":[145,146],"cle":[6,53,223,446],"clo":[142,143,584],"co3":[78],"coa":[117,144],"coc":[184,508,532],"com":[37,88,145,146,277],"con":[84,85,86,199,222,291,326,337],"coo":[186,290],"cop":[185,384],"cor":[147,258,325,326,327,445],"cos":[93,94,95,96,97,237,343,344],"cot":[541],"cou":[20,21,22,23,24,25,63,184,367,430,508,510],"cov":[56],"cpk":[148,149],"cr ":[282,350,351,487,488,489,490,491,492,493,494,495],"cra":[147,257,335,438,451,452],"cre":[5,6,15,16,110,123,127,128,129,135,150,189,211,267,301,337,400,446,459,460,520,530,535,553,557,588],"cri":[263,352],"cro":[185,330,529,559],"crp":[151,152],"crt":[142],"cru":[439],"cry":[470,589],"csf":[137,153,154,155,156,157,158,159,160,161,162,163,164,244,272,273,305,390,406,407,517,574,590],"ct ":[186,263,290,343,344,582],"cta":[303,304,305],"cti":[26,122,142,230,291,317,389,429,499,602],"cto":[229],"ctr":[2,194],"cul":[25,29,39,40,62,66,75,92,104,109,115,147,153,165,166,167,168,190,233,291,328,329,332,341,346,356,361,371,396,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,428,430,432,441,447,461,466,469,474,478,479,482,498,500,501,542,547,569,570],"cut":[27,201,202],"cv ":[352],"cy ":[386,548],"cyt":[22,23,25,67,77,105,111,114,116,124,159,169,170,171,172,173,184,191,193,315,336,342,347,357,362,372,379,381,399,430,462,467,483,496,508],"d a":[54,55,58,403],"d b":[65,92,101,102,103,117,254,355,360,370,402,403,404,405,481,510],"d c":[39,66,67,104,105,115,356,357,361,362,371,372,404,406,407,410,427,482,483,510,584],"d d":[174],"d e":[199,408,409],"d f":[68,69,70,71,100,106,123,124,125,206,207,208,209,210,211,212,213,214,215,216,217,218,353,354,363,364,373,374,375,376,410,411,484,499,587,592,594,595,597,604],"d g":[93,94,95,96,97,98,197,485],"d h":[238,239,467],"d k":[107,377,580],"d n":[412],"d o":[84,85,86,222,413],"d p":[26,59,219,313,414],"d q":[232],"d s":[330,358,359,415,416,417,418,419,420],"d t":[421,422,439,578],"d u":[99,423,424],"d v":[425],"d w":[426],"dal":[585,586],"das":[59],"de ":[137,138],"ded":[221,254],"deh":[304],"den":[33,175,176,177,178,179,180,181,323],"des":[217,376,467,502,519],"dhe":[182],"dia":[127,128,129,130,163,183,245,289,353,354,355,356,357,418,463,594],"dic":[165,328],"die":[44,45,54,55,117,435,552],"dif":[184],"dig":[185],"dil":[573,574],"dim":[174],"din":[91,507],"dio":[44,45,198],"dir":[79,80,186,290],"dis":[427],"dit":[337],"diu":[10,89,455,456,470,562,589],"dl ":[139,141,264,307,581],"dlc":[503],"dna":[281,282,283,351,487,488,489,490,491,492,493,494,495],"dog":[187,188],"dom":[95],"dos":[384],"dot":[409,526],"dou":[189],"dr ":[324,464],"drl":[572,573,574],"dro":[304,473,578],"dru":[18,27,28,73,400,609],"ds ":[405],"dth":[427],"duc":[476,554],"dun":[274],"duo":[278],"dy ":[53,100,101,102,103,104,105,106,107,243,405,431,491,525],"dys":[544],"e 1":[96],"e 2":[97,529,530],"e 4":[128],"e 7":[477],"e a":[12,14,15,59,60,165,175,260,423,432,534,535,536],"e b":[20,224,321,537,538,539,552,584],"e c":[4,5,6,16,22,25,88,109,137,142,184,305,308,322,328,343,344,424,430,446,447,459,501,508,540,541,542,568],"e d":[27,304],"e e":[21,234,384],"e f":[93,138,432,543,544,545,546,547,548,549,550,606],"e h":[78,110,145,146,551],"e i":[176,177,178,179,258,323],"e j":[537],"e k":[552],"e l":[22,304,319],"e m":[7,8,23,111,112,185,189,266,327,520],"e n":[24,180,181],"e o":[385],"e p":[9,13,17,34,94,101,113,201,202,208,225,226,292,293,331,385,447,460,502,538,553],"e q":[229],"e r":[15,16,25,95,166,167,168,200,336,459,460,530,535,553,554],"e s":[10,14,66,75,92,102,104,109,115,147,153,190,223,301,328,329,332,346,356,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,498,500,501,539,542,555,556,557,558,559,560,561,562,563,564,565,566,569],"e t":[190,227,228,237,343,344,400,586],"e u":[11],"e w":[392],"ea ":[99,182],"eal":[110,127,128,129,145,146,147,238,239,265,266,267,274,275,334,359,360,361,362,363,364,409,477,579,595,605],"ean":[325,326,327],"ear":[6,53,231,251,306,330,347,358,408,446,453,454,527,532,593],"eat":[5,6,15,16,123,150,211,446,459,460,530,535,553,557],"ebn":[191],"ebu":[192,193],"ece":[200],"eci":[215,555],"eck":[130,145,146,265],"eco":[84,85,86,222],"ecr":[588],"ect":[2,79,80,186,194,290,291],"ecu":[201,202],"ed ":[26,197,199,254,427,467,510],"edi":[89,91,328],"edu":[476,554],"ee ":[224,225,226,227,228],"eed":[91],"een":[110,127,128,129,135,267,301,337,400,443,520],"ega":[170,171,172,173],"ege":[428],"egn":[386,548],"ehe":[37,145,146],"ehy":[304],"ein":[13,31,32,214,319,390,391,530,537,553,563],"el ":[35,36,37,267,575,576],"ele":[2,194,367,368,454,472,546],"eli":[177,179,180,262,279,285,287],"ell":[134,308,427,433,434,436,437,510],"ema":[145,238,263,292,352],"eme":[415,440,441,442,454,472,492,546,600],"emi":[36,41,65,76,103,158,202,314,355,360,370,378,398,481],"emo":[132,133,188,255,256,551],"emr":[126],"en ":[99,126,127,128,129,175,200,393,415,440,441,442,600],"ena":[33,203,304,429],"enc":[537],"end":[384,409],"ene":[234,267,464],"eng":[175,176,177,178,179,180,181,343,344],"eni":[110,135,189,267,306,337,400,520],"eno":[308],"ens":[18,35,37,66,73,75,92,104,109,115,128,145,146,147,152,153,190,328,329,332,346,356,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,488,498,500,501,542,569,592],"ent":[101,184,323,339,428,435,454,472,538,546],"eos":[21],"eou":[253,580],"epa":[134,268,350,351],"epo":[166,167,168,169],"eps":[443],"ept":[28,60,200,309,310],"er ":[135,189,195,200,205,269,314,315,316,317,409,426,477,520,575,576,591],"era":[237,358],"erb":[269],"ere":[184],"erg":[35,36,37,609],"eri":[52,217,245,353,354,355,356,357,358,359,360,361,362,363,364,376,519,594,595],"erm":[550],"ero":[39,40,59,139,140,141,165,200,210,264,307,374,388,406,416,417,432,486,513,581],"erp":[270,271,272,273],"err":[204],"ers":[334],"ert":[234,292,293,464,497],"eru":[30,32,194,359,435,444,445,446],"erv":[135],"ery":[567],"es ":[23,44,45,54,55,183,194,270,271,272,273,274,339,435,467,537],"esh":[329],"esi":[7,8,320,340,453,464,558],"esr":[132,196],"ess":[314,315,316,502,591],"est":[33,73,139,140,141,186,189,197,198,199,200,203,210,234,237,264,290,307,317,333,343,344,345,374,388,394,400,429,439,450,499,513,548,581,584,585,586],"et ":[367,368,583],"eta":[608],"ete":[183,409,567],"eth":[63,251,532],"eti":[25,430,588],"eto":[31,32,552],"etr":[142],"ett":[447],"eu ":[269],"euc":[184,508],"eur":[246,247,369,370,371,372,373,374,375,376,377,378,379,596,597,598],"eut":[24,336],"ev ":[50,51],"eve":[205,288,575,576],"ew ":[337],"ex ":[270,271,272,273],"exa":[463],"exe":[201,202],"exp":[234,464],"ext":[128],"f a":[406],"f c":[153,407],"f f":[154,155,156,157,158,159,160,161,590],"f g":[162],"f i":[163],"f k":[164],"fa ":[31,32],"fas":[93,296,565],"fat":[471,545],"fb ":[27,28,423],"fe ":[113],"fec":[291],"fem":[145,238,292],"fen":[203],"fer":[184,204,292,293,486],"fet":[31,32],"fev":[205,575,576],"ffe":[184],"ffi":[349],"ffy":[117],"fia":[522],"fic":[215,323,555],"fil":[41,61,64,108,144,205,256,265,268,300,301,313,318,330,331,340,384,385,386,570],"fin":[349],"flo":[567],"flu":[31,65,66,67,68,69,70,71,100,101,102,103,104,105,106,107,115,123,124,125,138,206,207,208,209,210,211,212,213,214,215,216,217,218,219,242,243,245,246,263,353,354,355,356,357,359,360,361,362,363,364,370,371,372,373,374,375,376,377,383,405,456,481,482,483,484,485,491,580,587,594,595,597,604],"fna":[220,221,222],"fob":[381],"fol":[223],"for":[68,69,70,71,76,77,83,84,85,86,100,106,117,123,124,125,154,155,156,157,158,159,160,161,206,207,208,209,210,211,212,213,214,215,216,217,218,222,233,316,324,349,353,354,363,364,373,374,375,376,379,397,398,399,451,453,454,463,464,467,470,471,472,473,484,497,543,544,545,546,547,548,549,550,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],"fp ":[31,32],"fra":[345],"fre":[224,225,226,227,228],"fru":[229],"fsh":[230,311],"fun":[231,317,402,403,406,410,411,416,429,432,454,472,499,546],"fy ":[117],"g 3":[337],"g a":[525],"g b":[502],"g c":[92,114,116,147,187,188,272,318,507],"g d":[473],"g e":[177,262],"g f":[451,596],"g g":[221],"g h":[223,319,608],"g i":[176,526],"g k":[257,335,438,452],"g p":[28],"g r":[393],"g s":[73,341,435,476,554],"g t":[91,143,189,285,450,584],"g u":[171],"g w":[520],"g6p":[232],"gal":[170,171,172,173,231,402,403,406,410,411,416,432,454,472,546],"gap":[42],"gar":[125,216,476,554,564,565,566],"gas":[233],"gat":[199,341],"gct":[343,344],"ge ":[88,185,266,343,344,477],"gen":[35,36,99,126,175,200,234,260,304,306,428,464],"ges":[200,388],"gfr":[197],"gg ":[171,176,177,272,285,526],"ggt":[235],"gh ":[152],"gic":[165],"gil":[345],"gin":[425,473,569],"git":[185],"glo":[57,236,255,471,545,551],"glu":[93,94,95,96,97,237,343,344],"gly":[217,376,519],"gm ":[173,179,273,286,287],"gme":[101,538],"gna":[386,548],"gne":[7,8,320,558],"gon":[532],"goo":[238,239],"got":[448],"gpt":[449],"gra":[132,133,162,188,215,240,241,242,243,244,245,246,247,248,249,250,251,252,253,331,435,485,486,520,555],"gro":[98],"gs ":[18,27,609],"gtp":[235],"gtt":[237],"gue":[175,176,177,178,179,180,181],"gui":[221,254],"gul":[144],"gun":[285,286,287],"gus":[74],"gy ":[35,36,37,169,467,609],"h a":[431],"h c":[63,145,146,265,329],"h f":[311],"h g":[520],"h i":[298,392,504,505],"h l":[230],"h m":[302],"h p":[108,230,238,239,266,267,274,275,334,477],"h r":[311,427],"h s":[110,127,128,129,152],"ha ":[517,518],"hae":[132,133,188,255,256],"hai":[257],"hal":[341,343,344],"han":[473],"hat":[34,182,208],"hav":[46],"hb ":[258,325,326],"hba":[259],"hbe":[47,260],"hbs":[48,261,262],"hcg":[224,608],"hco":[78],"hct":[263,352],"hcv":[49],"hdl":[139,141,264],"hea":[110,127,128,129,145,146,182,238,239,265,266,267,274,275,334,409,477,579,605],"hec":[130,145,146,265],"hem":[65,76,103,158,263,314,352,355,360,370,378,398,481,551],"hen":[37,145,146,308],"hep":[268,350,351],"her":[166,195,269,270,271,272,273,334,358],"het":[409],"hev":[50,51],"hi ":[436,437,526],"hia":[114,115,116],"hib":[294],"hic":[544],"hig":[152],"hik":[285,286,287],"hil":[20,21,24,256,274,336],"hin":[114,116,369,596],"his":[275],"hiv":[276,277,278,279],"hla":[280],"hlo":[4,136,137,138,556],"hoc":[22,161,336],"hol":[54,55,139,140,141,210,264,307,368,374,581,584],"hor":[9,52,223,319,366,460,560],"hos":[9,34,54,55,208,366,460,560],"hp ":[467],"hpv":[281,282],"hra":[251,532],"hri":[64],"hro":[26,161,392,421,497,498],"hrs":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,96,97,343,344,529,530],"hsv":[283],"hus":[439],"hyd":[304,578],"hyl":[540],"hyr":[57,58,59,499],"i 1":[380],"i c":[43,44,45],"i d":[33,526],"i f":[522],"i h":[46,47,48,49,50,51],"i i":[436,437],"i m":[52],"i n":[53],"i p":[54,55],"i s":[56],"i t":[57,58,59,284],"ia ":[41,256,330,418],"iab":[183],"iac":[127,128,129,130],"ial":[26,114,115,116,184,245,321,322,323,353,354,355,356,357,481,482,483,484,485,594,604],"ian":[52,163,289],"ibc":[507,528],"ibi":[28,294],"ibo":[44,45,53,54,55,57,58,59,175,276,431,525],"ibu":[427],"ic ":[3,35,39,40,65,66,67,68,69,70,71,126,127,165,215,218,233,242,341,345,403,406,416,417,533,544,555,587],"ica":[78,113,135,165,245,323,353,354,355,356,357,594],"ici":[328,507],"ick":[450],"icl":[223],"icr":[185,330,529,559],"icu":[25,430],"id ":[54,55,58,59,65,66,67,68,69,70,71,100,101,102,103,104,105,106,107,115,123,124,125,206,207,208,209,210,211,212,213,214,215,216,217,218,219,313,353,354,355,356,357,359,360,361,362,363,364,370,371,372,373,374,375,376,377,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,439,481,482,483,484,485,499,580,587,594,595,597,604],"ida":[59,585,586],"ide":[4,136,137,138,217,221,254,323,376,467,502,519,556,585],"idi":[470,589],"ids":[405],"idt":[427],"ien":[393,435],"ies":[44,45,54,55,117,552],"ife":[486],"iff":[184],"ifi":[215,323,555],"iga":[341,525],"ige":[126,175,260,506],"igg":[44,50,54,56,170,171,176,177,270,272,285,309,433,436,504,514,526],"igh":[152],"igi":[185],"igl":[217,376,519],"igm":[45,46,51,55,101,172,173,176,178,179,258,271,273,286,287,310,434,437,505,515,526,538],"igr":[331,486],"ihc":[269],"iku":[285,286,287],"il ":[21,24,288,336],"ila":[330],"ile":[41,61,64,101,102,108,144,205,256,265,268,300,301,313,318,331,340,384,385,386,538,539,570],"ili":[28,70,79,80,81,82,100,256,292,293,345],"ilk":[332],"ill":[157,274,359,364],"ils":[20,335],"ilu":[573,574],"ima":[185,197],"ime":[26,91,142,143,174,392],"imp":[270,271,272,273],"imu":[223],"in ":[15,26,30,31,32,44,45,57,60,79,80,81,82,241,242,243,244,245,246,247,248,249,250,251,252,253,255,294,296,297,349,387,390,391,392,435,451,452,521,522,523,530,535,553,573,574,577,578,579,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],"ina":[0,1,2,3,425,457,458,463,569],"ind":[80,163,165,289,290,507],"ine":[4,5,6,7,8,9,10,11,12,13,14,15,16,17,34,123,150,168,171,173,208,211,252,328,423,424,432,446,459,460,467,494,530,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,606],"inf":[291,292,293],"ing":[91,93,110,114,116,135,143,147,189,223,257,267,296,319,335,337,341,369,400,438,450,451,452,473,476,502,507,520,554,565,584,596],"inh":[294],"ini":[5,6,15,16,84,85,86,122,123,150,211,222,319,349,446,459,460,467,530,535,541,553,557],"ink":[163,289],"ino":[21,126,318],"inr":[392],"ins":[295,296,297],"int":[298],"ioc":[65,76,103,158,314,355,360,370,378,398,481],"iol":[44,45,165,198,199],"ion":[33,42,62,84,85,86,111,121,134,142,144,222,233,291,317,323,337,341,349,427,429,463,467,499,573,574,588,602],"iop":[83,84,85,86,87,88,89,90,112,192,254],"ip ":[422,500,602],"ipa":[213,312],"iph":[358],"ipi":[44,45,54,55,313],"ipl":[520],"ips":[409],"ipt":[298],"ir ":[29],"ira":[111,233,309,310,575,576],"ire":[79,80,186,290],"iro":[299,300,301,507],"irr":[341],"irs":[257],"iru":[70,79,80,81,82,100,170,171,172,173,270,271,272,273,350,351],"is ":[64,268,350,351,443,570],"isa":[177,179,180,262,279,285,287],"isc":[62],"isi":[319],"isk":[130],"iso":[445],"iss":[490,501,502],"ist":[60,65,76,103,158,275,314,355,360,370,378,398,427,464,481],"it ":[263,352],"ita":[72,151,185,229,232,306,350,351,401,518,577,578,579],"ite":[321,322,323,435],"ith":[392,520],"iti":[18,64,65,66,67,68,69,70,71,73,75,92,104,109,115,147,153,190,204,242,268,328,329,332,337,346,350,351,356,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,498,500,501,542,569,570,587],"ito":[359,360,361,362,363,364,387,595],"itr":[60,99,253,431,580],"ity":[18,28,66,73,75,92,104,109,115,147,152,153,190,215,292,293,328,329,332,340,345,346,356,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,498,500,501,507,542,555,569],"ium":[1,7,8,10,16,17,36,89,120,121,202,320,382,383,455,456,457,459,470,558,561,562,589],"iv ":[276,277,278,279],"iva":[26],"ive":[37,72,128,145,146,151,201,202,229,232,314,315,316,317,350,351,385,401,518,591],"ivi":[18,66,73,75,92,104,109,115,147,152,153,190,328,329,332,346,356,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,498,500,501,542,569],"iya":[275],"jon":[537],"jug":[199],"k c":[130,332],"k f":[349],"k m":[149],"k p":[134],"k s":[163,289,527],"k t":[148],"k u":[265],"kag":[266,274,275,334,339,477],"kal":[33,34,208],"ker":[189,520],"ket":[552],"kge":[113],"kin":[451,452],"klb":[497],"kli":[450],"koh":[107,164,257,302,335,377,438,452,465,480,580],"ks ":[502],"kun":[285,286,287],"kup":[145,146],"l 1":[35,575],"l 2":[36,576,578],"l 3":[37],"l 6":[288],"l a":[468,605],"l b":[114,134,358,369,410,488,592,596],"l c":[21,24,75,113,135,264,291,307,342,402,403,406,409,411,416,419,432,469,510,581],"l d":[427],"l e":[198,454,472,546],"l f":[76,77,115,245,246,353,354,355,356,357,359,360,361,362,363,364,370,371,372,373,374,375,376,377,402,429,470,471,472,473,481,482,483,484,485,575,576,594,595,597,604],"l g":[343,344],"l h":[139,141,275],"l i":[165,185,506,507,573,574],"l l":[139,184,508],"l o":[474],"l p":[226,247,306,308,321,322,323,378,379,475,509,563,598],"l r":[139,141,476,510],"l s":[147,231,251,267,412,425,532,569,593],"l t":[26,82,140,141,336,511,512,513,585,586],"l u":[199],"l w":[116],"la ":[61,280,433,434,436,437],"lac":[230,303,304,305,389],"lan":[238,239],"lar":[87,88,321,322,323,330],"las":[26,38,209,514,515,543],"lat":[144,223,367,368,447],"lb ":[497],"lbc":[282,306],"lbe":[497],"lbu":[0,12,15,30,69,155,207,435,529,534,535,559],"lc ":[503],"lci":[1,16,120,121,387,457,459],"ld ":[117],"ldh":[71,160,212,304,354,375],"ldl":[139,307,581],"le ":[101,102,189,223,292,293,301,308,400,447,520,538,539,584],"lea":[6,53,446],"lec":[2,194],"lee":[91],"lem":[454,472,546],"len":[343,344],"lep":[309,310],"ler":[35,36,37,52,237,609],"les":[139,140,141,210,264,307,374,471,545,581],"let":[367,368],"leu":[184,246,247,369,370,371,372,373,374,375,376,377,378,379,508,596,597,598],"lev":[288],"lex":[88,270,271,272,273],"lfa":[31,32],"lh ":[230,311],"li ":[33],"lia":[256],"lic":[223],"lid":[467,502,585],"lin":[34,57,208,236,295,296,297,450],"lip":[44,45,54,55,213,312,313],"lir":[70,79,80,81,82,100],"lis":[177,179,180,262,279,285,287],"lit":[28,72,229,292,293,345,351,570],"liv":[314,315,316,317,591],"lk ":[332],"lka":[33,34,208],"ll ":[134,308,427,510],"lla":[433,434,436,437],"lle":[35,36,37,52,343,344,609],"lli":[223],"llr":[157,359,364],"lls":[274],"lmi":[341],"lmo":[436,437],"lo ":[72,170,171,172,173],"lob":[57,236,255,471,545,551],"loc":[25,134,349,430,502],"log":[67,74,77,105,111,114,116,159,165,169,191,193,315,342,357,362,368,372,379,381,399,462,467,483,496],"lom":[567],"loo":[39,92,93,94,95,96,97,98,99,233,330,358,403,404,410,466,474,488,510,547,584,592],"lor":[4,136,137,138,556],"lot":[142,143,584],"lp ":[438],"lph":[182],"lrc":[122],"lru":[157,359,364],"ls ":[20,274,335],"lt ":[102,233,466,474,539,547],"lth":[110,127,128,129,145,146,238,239,265,266,267,274,275,334,477,579],"ltu":[29,39,40,62,66,75,92,104,109,115,147,153,165,166,167,168,190,291,328,329,332,341,346,356,361,371,396,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,428,432,441,447,461,469,478,479,482,498,500,501,542,569],"luc":[93,94,95,96,97,237,343,344],"lui":[31,65,66,67,68,69,70,71,100,101,102,103,104,105,106,107,115,123,124,125,138,206,207,208,209,210,211,212,213,214,215,216,217,218,219,242,243,245,246,263,353,354,355,356,357,359,360,361,362,363,364,370,371,372,373,374,375,376,377,383,405,456,481,482,483,484,485,491,580,587,594,595,597,604],"lum":[327],"lun":[318],"lus":[129,183,201],"lut":[20,21,22,23,24,25,62,319,341,573,574],"lyc":[217,376,519],"lym":[22,336],"lys":[14,60,440,468,536],"lyt":[2,194],"m 4":[36],"m a":[416,417,435,444],"m b":[359],"m c":[16,273,445,446,459,461,462],"m e":[132,179,463],"m f":[383,456,464,589,601],"m i":[121],"m k":[465],"m n":[418],"m o":[466],"m p":[133,188],"m s":[162,240,241,242,243,244,245,246,247,248,249,250,251,252,253,485],"m t":[286,287],"m u":[173],"ma ":[318,514,515],"mag":[7,8,185,320,558],"mal":[90,112,145,146,238,239,292,293,321,322,323],"mar":[111,112,189,520],"mat":[197,263,352,550],"mbi":[392],"mbo":[26,277],"mbs":[186,290],"mch":[325,326],"mcv":[327],"mdr":[324],"me ":[142,327,392],"mea":[231,251,306,325,326,327,330,347,358,453,454,527,532,593],"med":[89,328],"meg":[170,171,172,173],"men":[101,308,415,440,441,442,454,472,488,492,538,546,592,600],"mer":[174],"mes":[329],"met":[567],"mia":[41,161],"mic":[185,330,341,529,559],"mig":[331],"mil":[332],"min":[0,12,15,30,69,155,207,435,463,529,534,535,559,577,578,579],"mis":[65,76,103,158,314,355,360,370,378,398,481],"miu":[36,202],"mmo":[156],"mog":[132,133,188,255,551],"mon":[23,52,156,223,319,333,436,437],"mop":[256],"mor":[368,544],"mot":[334,345],"mou":[302,583],"mph":[22,336],"mpl":[88,270,271,272,273],"mpr":[37,145,146],"mrc":[266],"mry":[126],"mtb":[487,488,489,490,491,492,493,494,495],"mul":[52,223],"myl":[38,209,543],"n 1":[84],"n 2":[85],"n 5":[86],"n a":[31,32,44,45,57,175,242,294,393,435,440,587],"n b":[99,127,241,243,349,507,577,588],"n c":[15,62,111,126,244,291,325,326,327,341,390,415,441,530,535,553,574,589,590],"n d":[79,274,573,574,578],"n e":[128],"n f":[233,238,296,463,588,600,607],"n g":[42],"n h":[52,255],"n i":[80,163,289,486,521,522],"n l":[591],"n m":[239,326,592],"n n":[593],"n o":[60],"n p":[129,144,245,246,247,248,297,300,301,387,594,595,596,597,598,599],"n r":[200],"n s":[30,249,250,337,451,452,582,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],"n t":[26,33,81,82,142,317,391,392,429,499,523,602,605],"n u":[251,252,606],"n v":[253,579],"n w":[427,442],"na ":[191,203,281,282,283,351,487,488,489,490,491,492,493,494,495,496],"nac":[220,221,222],"nae":[39,40,417],"nai":[335],"nal":[14,425,429,440,468,536,569],"nan":[386,548],"nar":[0,1,2,3,457,458],"nas":[304,412,593],"nat":[33,78,463],"nce":[6,135,237,446,464,537],"nch":[114,115,116],"nck":[527],"nco":[199],"nct":[317,429,499],"ncy":[386,548],"nd ":[84,85,86,222],"ndi":[80,163,165,289,290,337,507],"ndo":[95,384,409],"ne ":[4,5,6,7,8,9,10,11,12,13,14,15,16,17,34,109,110,111,112,200,208,234,319,328,331,423,424,432,446,459,460,530,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,606],"nea":[147,359,360,361,362,363,364,595],"ned":[467],"nel":[27,28,35,36,37,254,267,292,293,436,437,575,576],"nem":[41],"nen":[267],"nes":[7,8,274,320,537,558],"net":[63],"neu":[24,195,269,336],"new":[337],"nex":[464],"nfe":[291,292,293],"ng ":[91,114,116,143,147,189,223,257,318,319,335,337,341,438,450,451,452,473,476,502,507,520,554,584,596],"nga":[231,402,403,406,410,411,416,432,454,472,546],"nge":[343,344],"ngi":[473],"ngu":[175,176,177,178,179,180,181,285,286,287],"nhi":[294],"nia":[156],"nic":[113,121,126],"nin":[5,6,15,16,110,122,123,135,150,189,211,267,337,387,400,446,459,460,520,521,522,523,530,535,541,553,557],"nio":[42,84,85,86,222,349,467],"nis":[319],"nit":[99,306],"nju":[199],"nk ":[163,289],"nly":[609],"no ":[126],"noc":[23,418,463,532],"nom":[308,318],"non":[308],"nop":[21],"nov":[481,482,483,484,485,604],"ns1":[180,181],"nsi":[18,37,66,73,75,92,104,109,115,128,145,146,147,153,190,328,329,332,346,356,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,498,500,501,542,569],"nst":[152,488,592],"nsu":[295,296,297],"nt ":[20,21,22,23,24,25,101,338,428,508,510,538],"nta":[298],"ntc":[339],"nth":[161],"nti":[43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,126,151,175,184,232,260,276,323,350,401,431,486,518,525],"nto":[333],"ntr":[291],"nts":[454,472,546],"ntu":[339],"nuc":[53],"nur":[551],"nya":[285,286,287],"o b":[338],"o c":[285,286,287],"o e":[126],"o f":[330],"o l":[336],"o p":[31,32],"o q":[72],"o s":[588],"o t":[60],"o v":[170,171,172,173],"oag":[144],"oal":[529,559],"oat":[117,421,497,498],"ob ":[381],"obe":[340],"obi":[39,40,165,255,403,406,416,417,432],"obu":[57,236,471,545,551],"oca":[387,418,463],"occ":[233,466,474,532,547],"oce":[502],"och":[65,76,103,158,161,314,355,360,370,378,398,481],"ock":[134,349,502],"oco":[532],"ocr":[263,352],"ocy":[22,23,25,184,336,430,508],"od ":[39,92,93,94,95,96,97,98,99,238,239,330,358,403,404,410,510,584,592],"odi":[10,44,45,54,55,117,455,456,552,562],"ody":[53,57,58,59,100,101,102,103,104,105,106,107,175,243,276,405,431,491,525],"ofi":[41,61,64,108,144,205,256,265,268,300,301,313,318,331,340,384,385,386,570],"ofl":[567],"og ":[187,188],"ogc":[343,344],"oge":[99,200,304,388],"ogi":[165],"ogl":[57,255,551],"ogr":[132,133,188],"ogu":[74],"ogy":[67,77,105,111,114,116,159,169,191,193,315,342,357,362,368,372,379,381,399,462,467,483,496],"oh ":[108,302],"oi ":[380],"oid":[58,59,499],"ol ":[139,140,141,198,199,291,419,468,469,470,471,472,473,474,475,476],"ola":[230,389],"ole":[139,140,141,210,237,264,307,374,581,584],"oli":[44,45,54,55],"oll":[223],"olo":[67,74,77,105,111,114,116,159,165,169,191,193,315,342,357,362,368,372,379,381,399,462,467,483,496],"olu":[20,21,22,23,24,25,62,327,341],"oly":[2,60,194],"oma":[318],"omb":[26,186,277,290,392],"ome":[170,171,172,173,308,567],"omi":[161],"omp":[37,88,145,146],"on ":[33,42,62,84,85,86,111,142,144,233,291,300,301,317,326,341,427,429,463,486,499,507,574,582,588,602],"ona":[78],"onc":[114,115,116],"ond":[84,85,86,222,337],"one":[14,52,109,110,111,112,200,223,319,359,360,361,362,363,364,388,436,437,513,537,552,595],"oni":[121,126,156,387,521,522,523],"onj":[199],"onl":[609],"ono":[23,532],"ons":[337],"ont":[291,333],"ood":[39,92,93,94,95,96,97,98,99,233,238,239,330,358,403,404,410,466,474,488,510,547,584,592],"ool":[167,419,468,469,470,471,472,473,474,475,476],"oom":[186,290],"oph":[20,21,24,256,336],"opi":[84,85,86,222,349,467],"opl":[26,514,515],"opo":[521,522,523],"opr":[385],"ops":[83,84,85,86,87,88,89,90,112,192,254],"opt":[341],"opy":[185,384],"or ":[68,69,70,71,76,77,83,84,85,86,100,106,117,123,124,125,154,155,156,157,158,159,160,161,206,207,208,209,210,211,212,213,214,215,216,217,218,222,233,316,324,349,353,354,363,364,373,374,375,376,379,397,398,399,451,453,454,463,464,467,470,471,472,473,484,497,543,544,545,546,547,548,549,550,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],"ora":[342,343,344],"orc":[504,505],"ore":[258],"ori":[4,136,137,138,275,470,556,589],"orm":[52,223,319],"orn":[147,337],"oro":[9],"orp":[325,326,327,368,544],"ors":[200],"ort":[166,167,168,169,445],"oru":[366,460,560],"osc":[185,384],"ose":[93,94,95,96,97,229,237,343,344],"osi":[21],"osm":[345],"osp":[9,34,54,55,208,309,310,366,460,470,560,589],"ost":[381,513],"ot ":[142,346,413,457,458,459,460,526,556,557,558,559,560,561,562,563],"ota":[17,81,82,113,140,141,148,226,382,383,391,506,507,508,509,510,511,512,513,561,563,578],"ote":[13,31,32,214,390,391,530,537,553,563],"oth":[166,334,392],"oti":[345,393,541],"otr":[409],"ott":[143,584],"oub":[189],"oun":[20,21,22,23,24,25,63,184,302,367,430,508,510,583],"oup":[98],"ous":[9,253,580],"out":[432],"oux":[333],"ov ":[56],"ova":[118],"ovi":[481,482,483,484,485,604],"ow ":[111,112],"oxi":[59],"oxo":[514,515],"oxy":[578],"oya":[275],"ozo":[550],"p a":[98,348],"p c":[422,467,500],"p f":[31,145,602,605],"p h":[152,325,326],"p l":[282],"p m":[146],"p p":[265],"p q":[151],"p s":[32,306,347,438],"p t":[394],"p v":[327],"pac":[113,266,274,275,334,339,477],"pan":[27,28,35,36,37,254,267,292,293,575,576],"pap":[282,306,347,348],"par":[26,134,321,322,323,349],"pas":[213,312],"pat":[268,350,351],"pav":[62],"pbf":[133,188,358],"pcr":[281,282,283,350,351,487,488,489,490,491,492,493,494,495],"pct":[387],"pcv":[352],"pd ":[123,124,125,232],"pec":[215,555],"per":[59,234,245,353,354,355,356,357,358,359,360,361,362,363,364,464,477,550,594,595],"pes":[270,271,272,273],"pha":[34,182,208,516,517,518],"phe":[308,358],"phi":[20,21,24,256,336,436,437,526,544],"pho":[9,22,34,54,55,208,336,366,368,460,560],"phu":[439],"pic":[507],"pid":[54,55,313,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,439],"pig":[101,538],"pin":[44,45,84,85,86,147,222,257,335,349,438,451,452,467],"pir":[111,233,309,310],"pk ":[148,149],"pla":[26,61,238,239,367,368,447,514,515],"ple":[88,246,247,270,271,272,273,369,370,371,372,373,374,375,376,377,378,379,400,520,596,597,598],"plu":[129,183,201],"poi":[380],"pon":[521,522,523],"por":[166,167,168,169,470,589],"pos":[381],"pot":[17,382,383,457,458,459,460,556,557,558,559,560,561,562,563,582],"pp ":[348],"ppa":[62],"ppi":[147,257,335,438,451,452],"pr ":[195],"pra":[385],"pre":[36,37,134,145,146,202,384,385,386,548],"pro":[13,31,32,41,61,64,108,144,200,205,214,230,256,265,268,300,301,313,318,331,338,340,384,385,386,387,388,389,390,391,392,393,502,530,537,553,563,570],"prp":[394],"ps ":[409],"psa":[225,226,509],"psi":[443],"psy":[83,84,85,86,87,88,89,90,112,192,254],"pth":[298,341,395],"pti":[28],"pto":[60,200,309,310,470,589],"pus":[247,248,378,379,396,397,398,399,414,489,598,599],"put":[249,416,417,418,461,462,463,464,465,466,495,601],"pv ":[281,282],"py ":[185,384],"qbc":[321],"qua":[72,151,229,232,350,351,400,401,486,518],"r 2":[195,269],"r a":[53,68,69,83,106,154,155,156,207,208,209,314,315,316,353,363,373,397,401,451,484,543,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],"r b":[70,76,100,157,158,364,398,453],"r c":[29,77,123,124,159,206,210,211,347,374,379,399,426,470],"r d":[351,487,488,489,490,491,492,493,494,495,544],"r f":[317,324,453,454,471,472,545,546,565,593],"r g":[464,532],"r h":[195,350,473,477],"r k":[497],"r l":[71,117,160,212,213,354,375],"r n":[463],"r o":[233,349,467,547],"r p":[195,200,205,214,282,358,548,566,575,576],"r r":[464,549],"r s":[84,85,86,125,135,189,215,216,222,408,520,550],"r t":[217,324,376,409],"r u":[218],"r x":[161],"ra ":[309,310],"rac":[142,409,605],"rad":[198,435],"raf":[349],"rag":[345],"ral":[246,247,251,342,343,344,358,369,370,371,372,373,374,375,376,377,378,379,532,575,576,596,597,598],"ram":[132,133,162,188,240,241,242,243,244,245,246,247,248,249,250,251,252,253,485],"ran":[6,95,237,331,446],"rap":[147,257,335,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,438,439,451,452,520],"ras":[321,322,323],"rat":[15,16,33,111,134,139,141,226,233,284,311,336,385,393,459,460,530,535,553],"rav":[215,555],"rb2":[269],"rbc":[510,544,549],"rbo":[78],"rcc":[266],"rch":[504,505],"rci":[126,318],"rct":[122],"rdi":[44,45,127,128,129,130,245,354,355,356,357,418,463,594],"rdw":[427],"re ":[27,60,66,75,92,104,109,115,147,153,165,166,167,168,190,258,328,329,332,346,356,361,371,384,385,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,432,441,447,461,469,479,482,498,500,501,529,530,542,569],"rea":[5,6,11,15,16,99,123,150,211,446,458,459,460,530,531,535,553,557],"rec":[79,80,186,200,290],"red":[427,476,510,554],"ree":[110,127,128,129,135,224,225,226,227,228,267,301,337,400,443,520],"reg":[386,428,548],"reh":[37,145,146],"rem":[36,202],"ren":[184,189,429],"reo":[253,580],"rep":[60,134,166,167,168,169],"res":[339,464],"ret":[25,142,251,430,532,588],"rft":[429],"rge":[35,36,87,88],"rgy":[35,36,37,609],"rh ":[431],"ria":[52,321,322,323,330,551],"rib":[427],"ric":[3,218,233,245,353,354,355,356,357,533,594],"rid":[4,136,137,138,217,376,470,519,556,589],"rig":[217,341,376,519],"rin":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,168,171,173,252,423,424,457,458,459,460,494,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,606],"rio":[199],"rip":[358,520],"ris":[130],"rit":[64,204,263,352,359,360,361,362,363,364,595],"riy":[275],"rke":[189,520],"rl ":[573,574],"rma":[550],"rmo":[52,223,319],"rn ":[337],"rne":[63,147],"ro ":[330,338,588],"roa":[421,497,498,529,559],"rob":[39,40,165,403,406,416,417,432],"roc":[387,502],"rof":[41,61,64,108,144,205,256,265,268,300,301,313,318,331,340,384,385,386,567,570],"rog":[57,99,200,304,388],"roi":[58,59,499],"rol":[2,139,140,141,194,210,230,264,291,307,374,389,581],"rom":[26,161,392],"ron":[114,115,116,200,299,300,301,388,486,507,513],"rop":[24,336,473,521,522,523],"ros":[185],"rot":[13,31,32,214,390,391,392,393,530,537,553,563],"rou":[9,98,432],"row":[111,112],"rox":[59,578],"roy":[275],"rp ":[151,152,325,326,327,394],"rpe":[270,271,272,273],"rph":[368,544],"rri":[204,341],"rro":[111,112],"rs ":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,56,200,257,334,529,530],"rt ":[166,167,168,234,464,497],"rth":[64],"rti":[26,292,293,445],"rua":[488,592],"rub":[70,79,80,81,82,100,157,359,364,433,434,439],"ruc":[229],"rug":[18,27,28,73,609],"rum":[30,32,194,359,435,444,445,446],"rup":[400],"rus":[114,170,171,172,173,270,271,272,273,350,351,366,369,460,560,596],"rvi":[135],"ry ":[0,1,2,3,457,458],"ryo":[126],"ryp":[470,589],"s 1":[270,271,272,273],"s a":[261,262],"s b":[192,314,351,378],"s c":[20,23,56,193,315,350,396,405,409,414,460],"s e":[200],"s f":[316,379,397,398,399,467,487,580,591,598,599],"s g":[435],"s h":[274,334],"s i":[44,45,54,55,170,171,172,173],"s m":[529],"s n":[274],"s o":[609],"s p":[27,64,183,268,339,530,537,570],"s q":[350,351],"s r":[439],"s s":[18,194,257,270,271,272,273,335,443,502],"s t":[186,290],"s u":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17],"s1 ":[180],"s1a":[181],"sa ":[226],"saa":[435],"sal":[102,412,436,437,539,593],"sar":[56],"sc ":[62],"sca":[438],"sce":[28,314,315,316,591],"sci":[65,66,67,68,69,70,71,242,435,587],"sco":[185,384],"scr":[110,127,128,129,135,147,189,257,267,301,335,337,400,438,439,451,452,520],"scu":[570],"se ":[59,93,94,95,96,97,229,237,304,343,344],"sec":[84,85,86,222,588],"sem":[415,440,441,442,492,600],"sen":[18,66,73,75,92,104,109,115,147,152,153,190,328,329,332,346,356,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,498,500,501,542,569],"sep":[443],"ser":[30,32,194,359,435,444,445,446],"set":[447],"sf ":[153,154,155,156,157,158,159,160,161,162,163,164,406,407,590],"sg ":[221],"sgo":[448],"sgp":[449],"sh ":[230,311,329],"shi":[114,116,369,596],"sia":[453],"sic":[35,127,450],"sim":[270,271,272,273],"sin":[21,60,319,502],"sis":[14,440,443,464,468,536],"sit":[18,66,73,75,92,104,109,115,147,153,190,321,322,323,328,329,332,340,346,356,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,498,500,501,542,569],"siu":[7,8,17,320,382,383,558,561],"siv":[37,128,145,146],"sk ":[130],"ski":[451,452],"sli":[467,502,585],"slo":[72],"sma":[90,112,514,515],"sme":[231,251,306,330,347,358,453,454,527,532,593],"smo":[345,544],"sod":[10,455,456,562],"sol":[20,21,22,23,24,25,62,341,445],"sop":[20],"sp ":[605],"spe":[215,550,555],"sph":[9,34,54,55,208,366,460,560],"spi":[111,233,309,310],"spo":[457,458,459,460,470,556,557,558,559,560,561,562,563,582,589],"spu":[249,416,417,418,461,462,463,464,465,466,495,601],"sre":[443],"ss ":[314,315,316,591],"ssi":[17,382,383,502,561],"ssu":[490,501,502],"st ":[33,237,343,344,381,400,429,584,585],"sta":[162,163,240,241,242,243,244,245,246,247,248,249,250,251,252,253,289,464,467,485,497,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],"ste":[139,140,141,200,210,264,307,374,388,513,581],"sti":[26,93,152,197,223,296,565],"sto":[14,167,275,419,468,469,470,471,472,473,474,475,476,513],"str":[60,65,76,103,158,198,199,200,233,314,355,360,370,378,398,427,481,488,592],"suc":[602],"sue":[490,501,502],"sug":[125,216,476,554,564,565,566],"sul":[182,295,296,297],"sup":[477],"sus":[28],"sv ":[283],"swa":[40,250,408,412,420,421,425,478,479,480,497,498,569,603],"sy ":[83,84,85,86,87,88,89,90,112,254],"syn":[481,482,483,484,485,604],"t 0":[343,344],"t 2":[582],"t a":[20,21,22,23,24,25,33],"t b":[101,102,233,466,474,538,539,547],"t c":[186,190,290,346,367,413,428,556,557],"t d":[73,82],"t f":[117,263,381],"t g":[237,471,545],"t h":[263,352,523],"t i":[526],"t m":[368,558,559,583],"t o":[166,343,344],"t p":[338,560,561],"t r":[142,284,429,510],"t s":[167,400,421,497,498,562,585],"t t":[234,508,563],"t u":[168,457,458,459,460],"t w":[584],"t x":[464],"ta ":[579,608],"tac":[298],"tai":[162,163,240,241,242,243,244,245,246,247,248,249,250,251,252,253,289,467,485,497,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],"tal":[81,82,140,141,148,185,226,306,391,506,507,508,509,510,511,512,513,563,578],"tam":[577,578,579],"tan":[113,464],"tas":[17,34,208,382,383,561],"tat":[72,151,229,232,303,304,305,350,351,401,518],"tb ":[486,487,488,489,490,491,492,493,494,495],"tbn":[496],"tc ":[339],"te ":[20,21,22,23,24,25,78,184,304,305,321,322,323,336,430,447,508],"ted":[26,197,199],"tei":[13,31,32,214,319,390,391,530,537,553,563],"tel":[367,368],"ten":[128],"ter":[139,140,141,165,200,210,264,307,374,388,409,426,513,567,581],"tes":[23,33,73,183,186,189,194,203,234,237,290,317,333,343,344,345,394,400,429,435,439,450,499,513,548,584,585,586],"tg ":[525],"th ":[63,110,127,128,129,145,146,238,239,265,266,267,274,275,298,334,392,427,477,520],"tha":[341],"the":[166,334,409],"tho":[161],"thr":[26,64,251,392,421,497,498,532],"thy":[57,58,59,499],"ti ":[43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59],"tia":[26,184],"tib":[28,44,45,53,54,55,57,58,59,175,276,431,507,525],"tic":[25,65,66,67,68,69,70,71,242,345,430,587],"tie":[393],"tif":[323,486],"tig":[126,175,260],"til":[292,293],"tim":[26,91,142,143,197,223,392],"tin":[5,6,15,16,26,93,122,123,143,150,204,211,223,230,296,341,389,432,446,459,460,530,535,541,553,557,565,584],"tio":[15,16,33,62,111,134,139,141,142,144,226,233,284,291,311,317,323,336,337,341,393,427,429,459,460,463,499,530,535,553,573,574,588,602],"tip":[409,422,500,602],"tis":[60,64,268,350,351,445,490,501,502,570],"tit":[60,151,232,268,350,351,401,431,518],"tiv":[18,26,66,72,73,75,92,104,109,115,147,151,152,153,190,201,202,229,232,328,329,332,346,350,351,356,361,371,385,396,401,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,498,500,501,518,542,569],"tlc":[503,508],"tle":[447],"to ":[31,32,285,286,287,336],"toc":[263,352],"tol":[60,67,74,77,105,111,114,116,159,169,191,193,237,315,342,357,362,372,379,381,399,462,467,483,496],"tom":[170,171,172,173],"ton":[14,359,360,361,362,363,364,387,552,595],"too":[167,419,468,469,470,471,472,473,474,475,476],"tor":[200,275,504,505],"tos":[229,309,310,470,513,589],"tot":[81,82,140,141,148,226,391,506,507,508,509,510,511,512,513,563,578],"tou":[333],"tox":[514,515],"toz":[550],"tph":[516,517,518],"tra":[142,198,409,605],"tre":[60,253,431,580],"tri":[199,217,233,376,427,519,520],"tro":[2,24,99,194,200,291,336,521,522,523],"tru":[488,592],"try":[65,76,103,158,314,355,360,370,378,398,481],"tsh":[524],"tt ":[73],"ttg":[525],"tti":[143,584],"ttl":[447],"tub":[586],"tum":[249,416,417,418,461,462,463,464,465,466,495,601],"tur":[27,29,33,39,40,62,66,75,92,104,109,115,147,153,165,166,167,168,190,291,328,329,332,339,341,346,356,361,371,396,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,428,432,441,447,461,469,478,479,482,498,500,501,542,569],"ty ":[28,73,292,293,340,345,507],"typ":[436,437,439,526],"tza":[527],"u c":[269],"uad":[400],"ual":[72,229,351,488,592],"uan":[151,232,350,401,486,518],"ub ":[439],"ube":[433,434,586],"ubi":[70,79,80,81,82,100,157,359,364],"ubl":[189],"uci":[476,554],"ucl":[53],"uco":[93,94,95,96,97,184,237,343,344,508],"uct":[229,602],"ue ":[175,176,177,178,179,180,181,501,502],"uff":[117],"ug ":[28,73],"uga":[125,199,216,476,554,564,565,566],"ugs":[18,27,609],"uib":[528],"uid":[31,65,66,67,68,69,70,71,100,101,102,103,104,105,106,107,115,123,124,125,138,206,207,208,209,210,211,212,213,214,215,216,217,218,219,221,242,243,245,246,254,263,353,354,355,356,357,359,360,361,362,363,364,370,371,372,373,374,375,376,377,383,405,456,481,482,483,484,485,491,580,587,594,595,597,604],"ula":[144,223],"ule":[471,545],"uli":[57,236,295,296,297,570],"ull":[52],"ulo":[25,430],"ulp":[182],"ult":[29,39,40,62,66,75,92,104,109,115,147,153,165,166,167,168,190,233,291,328,329,332,341,346,356,361,371,396,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,428,432,441,447,461,466,469,474,478,479,482,498,500,501,542,547,569],"um ":[16,36,121,359,383,416,417,418,435,444,445,446,456,459,461,462,463,464,465,466,589,601],"ume":[327],"umi":[0,12,15,30,69,155,207,435,529,534,535,559],"unc":[199,317,429,499],"une":[274],"ung":[231,285,286,287,318,402,403,406,410,411,416,432,454,472,546],"unt":[20,21,22,23,24,25,63,184,302,367,430,508,510,583],"unu":[551],"uny":[285,286,287],"up ":[98,145,146,265],"upe":[477],"upl":[400],"ura":[33,246,247,369,370,371,372,373,374,375,376,377,378,379,596,597,598],"ure":[11,27,29,39,40,62,66,75,92,99,104,109,115,147,153,165,166,167,168,190,251,291,328,329,332,339,341,346,356,361,371,396,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,428,432,441,447,458,461,469,478,479,482,498,500,501,529,530,531,532,542,569],"uri":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,168,171,173,218,252,423,424,457,458,459,460,494,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,606],"uro":[567],"us ":[170,171,172,173,192,193,270,271,272,273,350,351,378,379,396,397,398,399,414,439,460,580,598,599],"usc":[28],"usg":[221],"ush":[114,369,596],"ute":[20,21,22,23,24,25,319],"uti":[62,201,202,341,427,432,573,574],"uto":[74],"utr":[24,336],"utu":[27,249,416,417,418,461,462,463,464,465,466,495,601],"ux ":[333],"v 1":[276],"v 2":[56],"v c":[277],"v d":[278,281,282,283],"v e":[279,568],"v h":[352],"v i":[46,50,51],"vag":[425,569],"var":[118],"vas":[570],"vat":[26],"vbg":[571],"vdr":[572,573,574],"ve ":[128,145,146,201,202,385],"vel":[288],"ven":[339],"ver":[205,314,315,316,317,575,576,591],"via":[481,482,483,484,485,604],"vic":[135],"vir":[170,171,172,173,270,271,272,273,350,351,575,576],"vis":[62],"vit":[18,66,73,75,92,104,109,115,147,152,153,190,215,253,328,329,332,346,356,361,371,396,404,405,407,408,410,412,413,414,415,419,420,421,422,424,425,428,441,447,461,469,479,482,498,500,501,542,555,569,577,578,579,580],"vld":[581],"vol":[327],"w a":[111],"w b":[112,337],"wab":[40,250,408,412,420,421,425,478,479,480,497,498,569,603],"was":[116,442],"wat":[426],"wbc":[582,584],"wet":[583],"who":[584],"wid":[427,585,586],"wit":[392,520],"x t":[333],"x v":[270,271,272,273],"xam":[463],"xan":[161],"xdr":[464],"xec":[201,202],"xid":[59],"xop":[514,515],"xpe":[234,464],"xte":[128],"y 1":[28,185],"y a":[0,53],"y c":[1,117,457],"y d":[609],"y e":[2],"y f":[83,84,85,86,100,101,102,103,104,105,106,107,243,292,405,491],"y i":[525],"y l":[87,88],"y m":[89,293],"y p":[35,36,37,254,340,384,386],"y q":[321],"y r":[169],"y s":[90,112,467],"y t":[73,345,431,507,548],"y u":[3,458],"ya ":[275,285,287],"yal":[275],"yce":[217,376,519],"ydr":[304,578],"yla":[38,209,543],"yle":[540],"ymp":[22,336],"yno":[481,482,483,484,485,604],"yon":[126],"yph":[436,437,439,526],"ypt":[470,589],"yro":[57,58,59,499],"ysi":[14,60,440,468,536],"ysm":[544],"yte":[2,22,23,25,184,194,336,430,508],"yto":[67,77,105,111,114,116,124,159,169,170,171,172,173,191,193,315,342,347,357,362,372,379,381,399,462,467,483,496],"z n":[587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607],"zan":[527],"zoa":[550]},"positions":{"24 Hrs Urinary Albumin":0,"24 Hrs Urinary Calcium":1,"24 Hrs Urinary Electrolyte":2,"24 HRS URINARY URIC ACID":3,"24 Hrs Urine Chloride":4,"24 HRS URINE CREATININE":5,"24 Hrs Urine Creatinine Clearance":6,"24 Hrs Urine Magnesium":7,"24 HRS Urine Phosphorous":9,"24 Hrs Urine Sodium":10,"24 Hrs Urine Urea":11,"24 Hrs. Urine Albumin":12,"24 Hrs. Urine Protein":13,"24 Hrs. urine stone analysis":14,"24 Hrs.Urine Albumin/Creatinine Ratio":15,"24 Hrs.Urine Calcium/Creatinine Ratio":16,"24Hrs Urine Potassium":17,"5 DRUGS SENSITIVITY":18,"ABG":19,"Absolute Basophils Count (ABC)":20,"Absolute Eosinophil Count (AEC)":21,"Absolute Lymphocyte Count (ALC)":22,"Absolute Monocytes Count (AMC)":23,"Absolute Neutrophil Count (ANC)":24,"Absolute Reticulocyte Count (ARC)":25,"Activated Partial Thromboplastin Time":26,"AFB CUTURE  DRUGS PANEL":27,"AFB SUSCEPTIBILITY 10 DRUG PANEL":28,"Air Culture":29,"Albumin (Serum)":30,"Alfa Feto Protein (AFP) Fluid":31,"Alfa Feto Protein (AFP) Serum":32,"ALKALI DENATURATION TEST (ADT)":33,"Alkaline Phosphatase":34,"ALLERGY PANEL-1 BASIC (27 ALLERGENS)":35,"ALLERGY PANEL-2 PREMIUM (40 ALLERGEN)":36,"ALLERGY PANEL-3 COMPREHENSIVE":37,"Amylase":38,"Anaerobic Blood Culture":39,"Anaerobic Swab Culture":40,"Anemia Profile":41,"Anion Gap":42,"Anti - CCP":43,"Anti Cardiolipin Antibodies (IgG)":44,"Anti Cardiolipin Antibodies (IgM)":45,"Anti HAV IgM":46,"Anti HBe":47,"Anti HBs":48,"Anti HCV":49,"Anti HEV IgG":50,"Anti HEV IgM":51,"ANTI MULLERIAN HORMONE":52,"Anti Nuclear Antibody (ANA)":53,"Anti Phospholipid Antibodies (IgG)":54,"Anti Phospholipid Antibodies (IgM)":55,"Anti SARS-COV-2 IgG":56,"Anti Thyroglobulin Antibody":57,"Anti Thyroid Antibody":58,"Anti Thyroid Peroxidase Antibody":59,"Antistreptolysin O Titre (ASO)":60,"APLA PROFILE":61,"Appavisc Solution Culture":62,"Arneth count":63,"Arthritis Profile":64,"Ascitic Fluid Biochemistry":65,"Ascitic Fluid Culture & Sensitivity":66,"Ascitic Fluid Cytology":67,"Ascitic Fluid For ADA":68,"Ascitic Fluid for Albumin":69,"Ascitic fluid for bilirubin":70,"Ascitic Fluid for LDH":71,"ASLO QUALITATIVE":72,"ATT DRUG SENSITIVITY  TEST":73,"Autologus":74,"BAL Culture & Sensitivity":75,"BAL For Biochemistry":76,"BAL For Cytology":77,"Bicarbonate (HCO3)":78,"Bilirubin-Direct":79,"Bilirubin-Indirect":80,"Bilirubin-Total":81,"Bilirubin-Total ( T & D )":82,"Biopsy for AFB":83,"Biopsy For Second Opinion 1":84,"Biopsy For Second Opinion 2-4":85,"Biopsy For Second Opinion 5":86,"Biopsy Large":87,"Biopsy Large Complex":88,"Biopsy Medium":89,"Biopsy Small":90,"Bleeding Time":91,"Blood Bag Culture & Sensitivity":92,"Blood Glucose (Fasting)":93,"Blood Glucose (PP)":94,"Blood Glucose (Random)":95,"Blood Glucose 1hrs.":96,"Blood Glucose 2hrs.":97,"Blood Group ABO":98,"Blood Urea Nitrogen (BUN)":99,"Body  fluid for bilirubin":100,"Body Fluid  Bile Pigment (BP)":101,"Body Fluid  Bile Salt (BS)":102,"Body Fluid Biochemistry":103,"Body Fluid Culture & Sensitivity":104,"Body Fluid Cytology":105,"Body Fluid For ADA":106,"Body Fluid KOH":107,"BOH Profile":108,"Bone Culture & Sensitivity":109,"Bone Health Screening":110,"Bone Marrow Aspiration Cytology":111,"Bone Marrow Biopsy Small":112,"Botanical cafe Packge":113,"Bronchial Brushing Cytology":114,"Bronchial Fluid Culture & Sensitivity":115,"Bronchial Washing  Cytology":116,"Buffy Coat for LD Bodies":117,"CA - 125 (Ovary)":118,"CA 15.3":119,"Calcium":120,"Calcium-Ionic":121,"Calrctinin":122,"CAPD Fluid For Creatinine":123,"CAPD Fluid For Cyto":124,"CAPD Fluid For Sugar":125,"Carcino Emryonic Antigen (CEA)":126,"CARDIAC HEALTH SCREEN BASIC-1199":127,"CARDIAC HEALTH SCREEN EXTENSIVE-4999":128,"CARDIAC HEALTH SCREEN PLUS":129,"Cardiac Risk Check":130,"CBC":131,"CBC / HAEMOGRAM + ESR":132,"CBC/ HAEMOGRAM+PBF":133,"Cell Block Preparation":134,"CERVICAL CANCER SCREENING":135,"Chloride":136,"Chloride-CSF":137,"Chloride-Fluid":138,"Cholesterol LDL / HDL Ratio":139,"Cholesterol Total":140,"Cholesterol Total / HDL Ratio":141,"Clot Retraction Time (CRT)":142,"Clotting Time":143,"Coagulation Profile":144,"Comprehensive Health Checkup (Female)":145,"Comprehensive Health Checkup (Male)":146,"Corneal Scrapping Culture & Sensitivity":147,"Cpk Total":148,"CPK-MB":149,"Creatinine":150,"CRP Quantitative":151,"CRP-High Senstivity":152,"CSF Culture & Sensitivity":153,"CSF For ADA":154,"CSF For Albumin":155,"CSF For Ammonia":156,"CSF For Billrubin":157,"CSF For Biochemistry":158,"CSF For Cytology":159,"CSF For LDH":160,"CSF For Xanthochromia":161,"CSF GRAM STAIN":162,"CSF Indian INK Stain":163,"CSF KOH":164,"Culture Aerobic,Biological Indicater":165,"Culture Report Other":166,"Culture Report Stool":167,"Culture Report Urine":168,"Cytology Report":169,"Cytomegalo Virus IgG":170,"Cytomegalo Virus IgG URINE":171,"Cytomegalo Virus IgM":172,"Cytomegalo Virus IgM URINE":173,"D - Dimer":174,"Dengue Antigen & Antibody":175,"Dengue IgG & IgM":176,"Dengue IgG ELISA":177,"Dengue IgM":178,"Dengue IgM ELISA":179,"Dengue NS1 ELISA":180,"Dengue NS1Ag":181,"DHEA SULPHATE":182,"Diabetes Plus":183,"Differential Leucocyte Count":184,"Digital Image Microscopy (1-5)":185,"Direct Coombs Test":186,"DOG-CBC":187,"DOG-CBC/ HAEMOGRAM+PBF":188,"Double Marker Screning Test":189,"E.T. Culture & Sensitivity":190,"EBNA CYTOLOGY":191,"EBUS BIOPSY":192,"EBUS CYTOLOGY":193,"Electrolytes Serum":194,"ER/PR/Her-2 neu":195,"ESR":196,"ESTIMATED GFR":197,"Estradiol (E2)":198,"Estriol Unconjugated (E3)":199,"Estrogen Receptors ER/Progesterone Recep":200,"EXECUTIVE PLUS":201,"Executive Premium":202,"FENA TEST":203,"Ferritin":204,"FEVER PROFILE":205,"Fluid for (CEA)":206,"Fluid for Albumin":207,"Fluid for Alkaline Phosphatase":208,"Fluid For Amylase":209,"Fluid for cholesterol":210,"Fluid for Creatinine":211,"Fluid for LDH":212,"Fluid For Lipase":213,"Fluid for Protein":214,"Fluid for Specific Gravity":215,"Fluid For Sugar":216,"Fluid for Triglycerides":217,"Fluid for Uric Acid":218,"Fluid PH":219,"FNAC":220,"FNAC - USG GUIDED":221,"FNAC For Second Opinion":222,"Follicle Stimulating Hormone":223,"Free BHCG":224,"Free PSA":225,"Free PSA/ Total PSA Ratio":226,"Free T3":227,"Free T4":228,"Fructose (Qualitative)":229,"FSH/LH/PROLACTIN":230,"Fungal Smear":231,"G6PD (Quantitative)":232,"Gastric aspiration for Occult Blood":233,"Gene Expert Test":234,"GGTP":235,"Globulin":236,"Glucose Tolerance Test (GTT)":237,"Good Health Plan (Female)":238,"Good Health Plan (Male)":239,"Gram Stain":240,"Gram Stain ( BAL )":241,"Gram Stain (Ascitic Fluid)":242,"Gram Stain (Body Fluid)":243,"Gram Stain (CSF)":244,"Gram Stain (Pericardial Fluid)":245,"Gram Stain (Pleural Fluid)":246,"Gram Stain (Pleural Pus)":247,"Gram Stain (Pus)":248,"Gram Stain (Sputum)":249,"Gram Stain (Swab)":250,"Gram Stain (Urethral Smear)":251,"Gram Stain (Urine)":252,"Gram Stain (Vitreous)":253,"GUIDED BIOPSY PANEL":254,"Haemoglobin (Hb)":255,"HAEMOPHILIA PROFILE":256,"Hairs Scrapping KOH":257,"HB Core IgM":258,"HbA1c":259,"HBe Antigen":260,"HBs Ag":261,"HBs Ag-ELISA":262,"HCT/Hematocrit (Fluid )":263,"HDL Cholesterol":264,"Health Check Up Profile":265,"HEALTH PACKAGE MRCC":266,"HEALTH PANEL SCREENENING":267,"Hepatitis Profile":268,"Her-2/Neu (CErB2)-IHC":269,"Herpes Simplex Virus 1 & 2 IgG":270,"Herpes Simplex Virus 1 & 2 IgM":271,"Herpes Simplex Virus 1&2 IgG CSF":272,"Herpes Simplex Virus 1&2 IgM CSF":273,"HILLS N DUNES Health Package":274,"Historiya Royal Health Package":275,"HIV 1 & 2  Antibody":276,"HIV Combo":277,"HIV DUO":278,"HIV Elisa":279,"HLA-B27":280,"HPV DNA PCR":281,"HPV DNA PCR + PAP (LBC)":282,"HSV DNA PCR":283,"I/T Ratio":284,"IgG to Chikungunya (Elisa)":285,"IgM to Chikungunya":286,"IgM to Chikungunya (ELISA)":287,"IL - 6 LEVEL":288,"Indian INK Stain":289,"Indirect Coombs Test":290,"Infection Control Culture":291,"INFERTILITY FEMALE PANEL":292,"INFERTILITY MALE PANEL":293,"Inhibin -A":294,"Insulin":295,"Insulin Fasting":296,"Insulin PP":297,"iPTH Intact":298,"Iron":299,"IRON PROFILE":300,"IRON PROFILE SCREEN":301,"KOH Mount":302,"Lactate":303,"Lactate Dehydrogenase (LDH)":304,"Lactate-CSF":305,"LBC (GENITAL PAP SMEAR)":306,"LDL Cholesterol":307,"LE Cell Phenomenon":308,"Leptospira IgG":309,"Leptospira IgM":310,"LH / FSH RATIO":311,"Lipase":312,"Lipid Profile":313,"Liver Abscess Biochemistry":314,"Liver Abscess Cytology":315,"Liver Abscess For ADA":316,"Liver Function Test":317,"LUNG CARCINOMA PROFILE":318,"Luteinising Hormone (LH)":319,"Magnesium":320,"Malarial Parasite By QBC":321,"Malarial Parasite Card":322,"Malarial Parasite Identification":323,"MDR FOR TB":324,"Mean Corp. Hb (MCH)":325,"Mean Corp. Hb Con. (MCHC)":326,"Mean Corp. Volume (MCV)":327,"Medicine Culture & Sensitivity":328,"Mesh Culture & Sensitivity":329,"Micro Filaria-Blood Smear":330,"MIGRANE PROFILE":331,"Milk Culture & Sensitivity":332,"Montoux Test":333,"MOTHERS HEALTH PACKAGE":334,"Nails Scrapping KOH":335,"Neutrophil to Lymphocyte Ratio":336,"NEW BORN SCREENING  ( 3 Conditions)":337,"NT Pro BNP":338,"NTC VENTURES PACKAGE":339,"Obesity Profile":340,"Opthalmic Irrigating Solution Culture":341,"Oral Cytology":342,"Oral Glucose Challenge Test(OGCT) 01 Hrs":343,"Oral Glucose Challenge Test(OGCT)02 Hrs":344,"Osmotic Fragility Test":345,"OT Culture & Sensitivity":346,"PAP SMEAR CYTO":347,"PAPP - A":348,"Paraffin Block For Opinion":349,"PCR HEPATITIS 'C'VIRUS(QUANTITATIVE)":350,"PCR(DNA)HEPATITIS 'B'VIRUS(QUALITATIVE)":351,"PCV/Hematocrit (HCT)":352,"Pericadial Fluid For ADA":353,"Pericardial  Fluid for LDH":354,"Pericardial Fluid Biochemistry":355,"Pericardial Fluid Culture & Sensitivity":356,"Pericardial Fluid Cytology":357,"Peripheral Blood Smear ( PBF)":358,"Peritoneal  Fluid/Serum Billrubin":359,"Peritoneal Fluid Biochemistry":360,"Peritoneal Fluid Culture & Sensitivity":361,"Peritoneal Fluid Cytology":362,"Peritoneal Fluid For ADA":363,"Peritoneal Fluid For Billrubin":364,"PH":365,"Phosphorus":366,"Platelet Count":367,"Platelet Morphology":368,"Pleural Brushing":369,"Pleural Fluid Biochemistry":370,"Pleural Fluid Culture & Sensitivity":371,"Pleural Fluid Cytology":372,"Pleural Fluid For ADA":373,"Pleural Fluid for cholesterol":374,"Pleural Fluid for LDH":375,"Pleural Fluid for Triglycerides":376,"Pleural Fluid KOH":377,"Pleural Pus Biochemistry":378,"Pleural Pus For Cytology":379,"POI-1st":380,"Post FOB Cytology":381,"Potassium":382,"Potassium -Fluid":383,"Pre Endoscopy Profile":384,"Pre Oprative Profile":385,"Pregnancy profile":386,"Procalcitonin(PCT)":387,"Progesterone":388,"Prolactin":389,"Protein-CSF":390,"Protein-Total":391,"Prothrombin Time With INR":392,"Protien ( A/G Ratio)":393,"PRP Test":394,"PTH":395,"Pus Culture & Sensitivity":396,"Pus For ADA":397,"Pus For Biochemistry":398,"Pus For Cytology":399,"Quadruple Test Screening":400,"R.A. Quantitative":401,"Rapid B.A.L. Fungal Culture":402,"Rapid Blood Arobic & Fungal Culture":403,"Rapid Blood Culture & Sensitivity":404,"Rapid Body Fluids Culture & Sensitivity":405,"Rapid CSF Aerobic & Fungal Culture":406,"Rapid CSF Culture & Sensitivity":407,"Rapid Ear Swab Culture & Sensitivity":408,"Rapid Endotracheal/Catheter Tips Culture":409,"Rapid fungal Blood Culture & Sensitivity":410,"Rapid Fungal Culture":411,"Rapid Nasal Swab Culture & Sensitivity":412,"Rapid OT Culture & Sensitivity":413,"Rapid Pus Culture & Sensitivity":414,"Rapid Semen Culture & Sensitivity":415,"Rapid Sputum Aerobic Fungal Culture":416,"Rapid Sputum Anaerobic Culture":417,"Rapid Sputum Nocardia Culture":418,"Rapid Stool Culture & Sensitivity":419,"Rapid Swab Culture & Sensitivity":420,"Rapid Throat Swab Culture & Sensitivity":421,"Rapid Tip Culture & Sensitivity":422,"Rapid Urine AFB Culture":423,"Rapid Urine Culture & Sensitivity":424,"Rapid Vaginal Swab Culture & Sensitivity":425,"Rapid Water Culture":426,"Red Cell Distribution Width (RDW)":427,"Regent Culture & Sensitivity":428,"Renal Function Test RFT":429,"Reticulocyte Count":430,"Rh Antibody Titre":431,"Routine Fungal Culture (Aerobic)":432,"Rubella IgG":433,"Rubella IgM":434,"SAAG (Serum  Albumin Ascites Gradient)":435,"Salmonella Typhi IgG":436,"Salmonella Typhi IgM":437,"Scalp Scrapping KOH":438,"Scrub Typhus Rapid Test":439,"SEMEN ANALYSIS":440,"Semen Culture & Sensitivity":441,"SEMEN WASH":442,"SEPSIS SREEN":443,"Serum ADA":444,"Serum Cortisol":445,"Serum Creatinine Clearance":446,"Settle Plate Culture & Sensitivity":447,"SGOT":448,"SGPT":449,"Sickling Test":450,"Skin Scrapping for AFB":451,"Skin Scrapping KOH":452,"Smear for Babesia":453,"Smear for Fungal Elements":454,"Sodium":455,"Sodium -Fluid":456,"Spot Urinary Calcium":457,"Spot Urinary Urea":458,"Spot Urine Calcium/Creatinine Ratio":459,"Spot Urine Phosphorus/Creatinine Ratio":460,"Sputum Culture & Sensitivity":461,"Sputum Cytology":462,"Sputum Examination for Nocardia":463,"Sputum For GENEXPERT / XDR RESISTANCE":464,"Sputum KOH":465,"Sputum Occult Blood":466,"Stained HP/Cytology Slides For Opinion":467,"Stool Analysis":468,"Stool Culture & Sensitivity":469,"Stool for Cryptosporidium":470,"STOOL FOR FAT GLOBULES":471,"Stool for Fungal elements":472,"Stool For Hanging Drop":473,"Stool Occult Blood":474,"Stool PH":475,"Stool Reducing Sugar":476,"SUPER HEALTH PACKAGE 7":477,"Swab Culture":478,"Swab Culture & Sensitivity":479,"Swab KOH":480,"Synovial Fluid Biochemistry":481,"Synovial Fluid Culture & Sensitivity":482,"Synovial Fluid Cytology":483,"Synovial Fluid For ADA":484,"Synovial fluid gram stain":485,"TB (Quantiferon) IGRA":486,"TB PCR (DNA) MTB (C.S.F.)":487,"TB PCR (DNA) MTB (Menstrual Blood)":488,"TB PCR (DNA) MTB (Pus)":489,"TB PCR (DNA) MTB (Tissue)":490,"TB PCR (DNA) MTB Body Fluid":491,"TB PCR (DNA) MTB Semen":492,"TB PCR (DNA)MTB (BAL)":493,"TB PCR (DNA)MTB Urine":494,"TB PCR DNA MTB (Sputum)":495,"TBNA CYTOLOGY":496,"Throat  Swab For  KLB (Albert stain )":497,"Throat Swab Culture & Sensitivity":498,"Thyroid Function Test":499,"TIP Culture & Sensitivity":500,"Tissue Culture & Sensitivity":501,"Tissue Processing (Blocks & Slides)":502,"TLC/DLC":503,"Torch IgG":504,"Torch IgM":505,"Total IgE":506,"Total Iron Binding Capicity (TIBC)":507,"Total Leucocyte Count (TLC)":508,"Total PSA":509,"Total Red Blood Cell Count (RBC)":510,"Total T3":511,"Total T4":512,"Total Testosterone":513,"Toxoplasma IgG":514,"Toxoplasma IgM":515,"TPHA":516,"TPHA -CSF":517,"TPHA Quantitative":518,"Triglycerides":519,"Triple Marker Screening With Graph":520,"Troponin- I":521,"Troponin- I FIA":522,"Troponin T hs":523,"TSH":524,"TTG Antibody IgA":525,"Typhi Dot IgG/IgM":526,"TZANCK SMEAR":527,"UIBC":528,"URE 24 HRS MICROALBUMIN":529,"URE 24 HRS PROTEIN:CREATININE RATIO":530,"Urea":531,"Urethral Smear Gonococci":532,"Uric Acid":533,"Urine Albumin":534,"Urine Albumin/Creatinine Ratio":535,"Urine Analysis":536,"Urine Bence Jones Protein":537,"Urine Bile Pigment (BP)":538,"Urine Bile Salt (BS)":539,"Urine Chyle":540,"Urine Cotinine":541,"Urine Culture & Sensitivity":542,"Urine for Amylase":543,"Urine for Dysmorphic RBC":544,"Urine For Fat Globules":545,"Urine for Fungal elements":546,"Urine for Occult Blood":547,"Urine For Pregnancy Test":548,"Urine for RBC":549,"Urine for Spermatozoa":550,"Urine Hemoglobunuria":551,"Urine Ketone Bodies":552,"Urine Protein/Creatinine Ratio":553,"Urine Reducing Sugar":554,"Urine Specific Gravity":555,"Urine Spot Chloride":556,"Urine Spot Creatinine":557,"Urine Spot Magnesium":558,"Urine Spot Microalbumin":559,"Urine Spot Phosphorus":560,"Urine Spot Potassium":561,"Urine Spot Sodium":562,"Urine Spot Total Protein":563,"Urine Sugar":564,"Urine Sugar (Fasting)":565,"Urine Sugar (PP)":566,"UROFLOMETERY":567,"V.E.C.":568,"Vaginal Swab Culture & Sensitivity":569,"Vasculitis Profile":570,"VBG":571,"VDRL":572,"VDRL In Dilution":573,"VDRL In Dilution-CSF":574,"VIRAL FEVER PANEL 1":575,"VIRAL FEVER PANEL 2":576,"Vitamin B12":577,"Vitamin D Total (25-Hydroxy)":578,"Vitamin Vita Health":579,"Vitreous Fluid KOH":580,"VLDL Cholesterol":581,"WBCT-20  (On Spot)":582,"Wet mount":583,"WHOLE BLOOD CLOTTING TEST(WBCT)":584,"Widal Test Slide":585,"Widal Tube Test":586,"Z N Stain (Ascitic Fluid) for AFB":587,"Z N Stain (Bro.Secretion) for AFB":588,"Z N Stain (Cryptosporidium) for AFB":589,"Z N Stain (CSF) for AFB":590,"Z N Stain (Liver Abscess) for AFB":591,"Z N Stain (Menstrual Blood) for AFB":592,"Z N Stain (Nasal Smear) for AFB":593,"Z N Stain (Pericardial Fluid) for AFB":594,"Z N Stain (Peritoneal Fluid) for AFB":595,"Z N Stain (Pleural Brushing) for AFB":596,"Z N Stain (Pleural Fluid) for AFB":597,"Z N Stain (Pleural Pus) for AFB":598,"Z N Stain (Pus) for AFB":599,"Z N Stain (Semen) for AFB":600,"Z N Stain (Sputum) for AFB":601,"Z N Stain (Suction Tip) for AFB":602,"Z N Stain (Swab) for AFB":603,"Z N Stain (Synovial Fluid) for AFB":604,"Z N Stain (Tracheal Asp.) for AFB":605,"Z N Stain (Urine) for AFB":606,"Z N Stain for AFB":607,"βETA - HCG (βHCG)":608,"Allergy Drugs Only":609}};
@@ -0,0 +1,46 @@
+// Shape of rghsPackages.json and of each shard in rghsPackageShards/, as
+// written by parse_rghs.py. Kept free of data so lazy loaders can use it
+// without pulling the full catalog into their chunk.
+
+export const RGHS_COLUMNS_VERSION = 1;
+
+export interface RGHSPackage {
+  id: string;
+  code: string;
+  name: string;
+  rate: number;
+  category: string;
+  description?: string;
+}
+
+export interface RGHSPackageColumns {
+  version: number;
+  tiers: number;
+  codes: string[];
+  names: string[];
+  categories: string[];
+  category: number[]; // index into categories, per row
+  rates: number[]; // row-major, `tiers` entries per row
+}
+
+export const assertRghsColumnsVersion = (columns: RGHSPackageColumns): void => {
+  if (columns.version !== RGHS_COLUMNS_VERSION) {
+    throw new Error(`RGHS columns version ${columns.version} is not supported (expected ${RGHS_COLUMNS_VERSION}). Re-run parse_rghs.py.`);
+  }
+};
+
+export const columnsToPackages = (columns: RGHSPackageColumns, tier = 0): RGHSPackage[] => {
+  if (tier < 0 || tier >= columns.tiers) {
+    throw new Error(`RGHS rate tier ${tier} is out of range (0-${columns.tiers - 1})`);
+  }
+
+  const { codes, names, categories, category, rates, tiers } = columns;
+  return codes.map((code, row) => ({
+    id: `pkg_${code.toLowerCase()}`,
+    code,
+    name: names[row],
+    rate: rates[row * tiers + tier],
+    category: categories[category[row]],
+    description: names[row]
+  }));
+};
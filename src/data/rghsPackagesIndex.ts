@@ -0,0 +1,3 @@
+import type { CatalogIndex } from '../utils/catalogIndex';
+
+export const RGHS_PACKAGES_INDEX: CatalogIndex = {"version":1,"names":["consultation opd","consultation for inpatients","dressings of wounds","suturing of wounds with local anesthesia","aspiration pleural effusion diagnostic","aspiration pleural effusion therapeutic","abdominal aspiration diagnostic","abdominal aspiration therapeutic","pericardial aspiration","joint aspiration","skin biopsy","removal of stitches","venesection","phimosis under la","sternal puncture","injection for haemorrhoids","injection for varicose veins","catheterisation","dilatation of urethra","incision and drainage","intercostal drainage","peritoneal dialysis","excision of moles","excision of warts","excision of molluscum contagiosum","excision of venereal warts","excision of corns","intralesional injection for keloid","chemical cautery","subconjunctival subtenon injection one eye","subconjunctival subtenon injection both eyes","pterygium surgery","conjunctival peritomy","conjunctival wound repair","removal of corneal foreign body","corneal ulcer cauterization one eye","corneal ulcer cauterization both eyes","penetrating keratoplasty","lamellar keratoplasty","cyanoacrylate fibrin glue application","bandage contact lens for perforation","scleral graft conjunctival flap","keratoconus correction with lenses","extraction per tooth under la","complicated extraction under la","impacted tooth extraction under la","extraction under short ga special patients","cyst tumour excision up to 4 cm under la","cyst tumour excision above 4 cm","cyst tumour excision under ga","tm joint ankylosis under ga","intraoral soft tissue biopsy","intraoral bone biopsy","hemimandibulectomy with graft","hemimandibulectomy without graft","pure tone audiogram","impedance audiometry","sisi tone decay","hearing assessment","speech discrimination score","speech assessment","speech therapy session","cold caloric test","removal of foreign body from nose","removal of foreign body from ear","ear syringing","polyp removal under la","polyp removal under ga","haemorrhoidectomy","stapled haemorrhoidectomy","keloid excision","varicose vein surgery","coronary care with monitoring","oxygen compressed air per hour","ventilator charges per day","asd closure","vsd closure","cabg surgery","heart transplant","normal delivery","vacuum delivery","forceps delivery","cesarean section","abdominal hysterectomy","ndvh","total laparoscopic hysterectomy","mtp 1st trimester","mtp 2nd trimester","operations for vesicoureteric reflux vur urinary incontinence with bulking agents","uretero colic anastomosis","formation of an ileal conduit","ureteric catheterisation","biopsy of bladder cystoscopic","cysto litholapaxy","operations for injuries of the bladder","suprapubic drainage cystostomy vesicostomy","simple cystectomy","augmentation cystoplasty","open suprapubic prostatectomy","open retropubic prostatectomy","transurethral resection of prostate turp","urethroscopy cystopanendoscopy","substitution urethroplasty trans pubic urethroplasty","abdomino perineal urethroplasty","posterior urethral valve fulguration","reduction of paraphimosis","circumcision","meatotomy","meatoplasty","hypospadias with chordee correction","crippled hypospadias repair"],"tokens":["1st","2nd","4","abdominal","abdomino","above","agents","air","an","anastomosis","and","anesthesia","ankylosis","application","asd","aspiration","assessment","audiogram","audiometry","augmentation","bandage","biopsy","bladder","body","bone","both","bulking","cabg","caloric","care","catheterisation","cauterization","cautery","cesarean","charges","chemical","chordee","circumcision","closure","cm","cold","colic","complicated","compressed","conduit","conjunctival","consultation","contact","contagiosum","corneal","corns","coronary","correction","crippled","cyanoacrylate","cyst","cystectomy","cysto","cystopanendoscopy","cystoplasty","cystoscopic","cystostomy","day","decay","delivery","diagnostic","dialysis","dilatation","discrimination","drainage","dressings","ear","effusion","excision","extraction","eye","eyes","fibrin","flap","for","forceps","foreign","formation","from","fulguration","ga","glue","graft","haemorrhoidectomy","haemorrhoids","hearing","heart","hemimandibulectomy","hour","hypospadias","hysterectomy","ileal","impacted","impedance","incision","incontinence","injection","injuries","inpatients","intercostal","intralesional","intraoral","joint","keloid","keratoconus","keratoplasty","la","lamellar","laparoscopic","lens","lenses","litholapaxy","local","meatoplasty","meatotomy","moles","molluscum","monitoring","mtp","ndvh","normal","nose","of","one","opd","open","operations","oxygen","paraphimosis","patients","penetrating","per","perforation","pericardial","perineal","peritomy","peritoneal","phimosis","pleural","polyp","posterior","prostate","prostatectomy","pterygium","pubic","puncture","pure","reduction","reflux","removal","repair","resection","retropubic","scleral","score","section","session","short","simple","sisi","skin","soft","special","speech","stapled","sternal","stitches","subconjunctival","substitution","subtenon","suprapubic","surgery","suturing","syringing","test","the","therapeutic","therapy","tissue","tm","to","tone","tooth","total","trans","transplant","transurethral","trimester","tumour","turp","ulcer","under","up","ureteric","uretero","urethra","urethral","urethroplasty","urethroscopy","urinary","vacuum","valve","varicose","vein","veins","venereal","venesection","ventilator","vesicostomy","vesicoureteric","vsd","vur","warts","with","without","wound","wounds"],"tokenPostings":[[86],[87],[47,48],[6,7,83],[103],[48],[88],[73],[90],[89],[19],[3],[50],[39],[75],[4,5,6,7,8,9],[58,60],[55],[56],[97],[40],[10,51,52,92],[92,94],[34,63,64],[52],[30,36],[88],[77],[62],[72],[17,91],[35,36],[28],[82],[74],[28],[109],[106],[75,76],[47,48],[62],[89],[44],[73],[90],[32,33,41],[0,1],[40],[24],[34,35,36],[26],[72],[42,109],[110],[39],[47,48,49],[96],[93],[101],[97],[92],[95],[74],[57],[79,80,81],[4,6],[21],[18],[59],[19,20,95],[2],[64,65],[4,5],[22,23,24,25,26,47,48,49,70],[43,44,45,46],[29,35],[30,36],[39],[41],[1,15,16,27,40,88,94],[81],[34,63,64],[90],[63,64],[104],[46,49,50,67],[39],[41,53,54],[68,69],[15],[58],[78],[53,54],[73],[109,110],[83,85],[90],[45],[56],[19],[88],[15,16,27,29,30],[94],[1],[20],[27],[51,52],[9,50],[27,70],[42],[37,38],[13,43,44,45,47,66],[38],[85],[40],[42],[93],[3],[108],[107],[22],[24],[72],[86,87],[84],[79],[63],[2,3,11,18,22,23,24,25,26,34,63,64,90,92,94,100,105],[29,35],[0],[98,99],[88,94],[73],[105],[46],[37],[43,73,74],[40],[8],[103],[32],[21],[13],[4,5],[66,67],[104],[100],[98,99],[31],[102],[14],[55],[105],[88],[11,34,63,64,66,67],[33,110],[100],[99],[41],[59],[82],[61],[46],[96],[57],[10],[51],[46],[59,60,61],[69],[14],[11],[29,30],[102],[29,30],[95,98],[31,71,77],[3],[65],[62],[94],[5,7],[61],[51],[50],[47],[55,57],[43,45],[85],[102],[78],[100],[86,87],[47,48,49],[100],[35,36],[13,43,44,45,46,47,49,50,66,67],[47],[91],[89],[18],[104],[102,103],[101],[88],[80],[104],[16,71],[71],[16],[25],[12],[74],[95],[88],[76],[88],[23,25],[3,42,53,72,88,109],[54],[33],[2,3]],"trigrams":{" 1s":[86]," 2n":[87]," 4 ":[47,48]," ab":[48]," ag":[88]," ai":[73]," an":[3,19,50,89,90]," ap":[39]," as":[6,7,8,9,58,60]," au":[55,56]," bi":[10,51,52]," bl":[92,94]," bo":[30,34,36,52,63,64]," bu":[88]," ca":[28,35,36,62,72,91]," ch":[74,109]," cl":[75,76]," cm":[47,48]," co":[24,26,34,40,41,42,73,89,90,109]," cy":[92,95,96,97,101]," da":[74]," de":[57,79,80,81]," di":[4,6,21,59]," dr":[19,20,95]," ea":[64]," ef":[4,5]," ex":[44,45,47,48,49,70]," ey":[29,30,35,36]," fi":[39]," fl":[41]," fo":[1,15,16,27,34,40,63,64,88,94]," fr":[63,64]," fu":[104]," ga":[46,49,50,67]," gl":[39]," gr":[41,53,54]," ha":[15,69]," ho":[73]," hy":[83,85,110]," il":[90]," in":[1,27,29,30,88,94]," jo":[50]," ke":[27,37,38]," la":[13,43,44,45,47,66,85]," le":[40,42]," li":[93]," lo":[3]," mo":[22,24,72]," no":[63]," of":[2,3,11,18,22,23,24,25,26,34,63,64,90,92,94,100,105]," on":[29,35]," op":[0]," pa":[46,105]," pe":[32,40,43,73,74,103]," pl":[4,5]," pr":[98,99,100]," pu":[14,102]," re":[33,66,67,88,99,100,110]," sc":[59]," se":[61,82]," sh":[46]," so":[51]," sp":[46]," st":[11]," su":[29,30,31,71,77,98]," sy":[65]," te":[62]," th":[5,7,61,94]," ti":[51]," to":[43,45,47,55,57]," tr":[78,86,87,102]," tu":[47,48,49,100]," ul":[35,36]," un":[13,43,44,45,46,47,49,50,66,67]," up":[47]," ur":[18,88,102,103,104]," va":[16,104]," ve":[16,25,71,88,95]," vu":[88]," wa":[23,25]," wi":[3,42,53,54,72,88,109]," wo":[2,3,33],"1st":[86],"2nd":[87],"4 c":[47,48],"a s":[46],"abd":[6,7,83,103],"abg":[77],"abo":[48],"acr":[39],"act":[40,43,44,45,46],"acu":[80],"add":[92,94],"adi":[109,110],"aem":[15,68,69],"aft":[41,53,54],"age":[19,20,40,88,95],"agi":[24],"agn":[4,6],"ain":[19,20,95],"air":[33,73,110],"al ":[3,4,5,6,7,8,11,14,20,21,25,27,28,29,30,32,33,34,35,36,41,46,51,52,63,64,66,67,79,83,85,90,100,103,104],"ale":[27],"alo":[62],"alv":[104],"aly":[21],"ame":[38],"an ":[82,90],"ana":[89],"anc":[56],"and":[19,40,53,54],"ane":[3,101],"ank":[50],"ano":[39],"ans":[78,100,102],"ant":[78],"aor":[51,52],"apa":[85,93],"ape":[5,7],"aph":[105],"apl":[69],"app":[39],"apu":[95,98],"apy":[61],"ar ":[38,65],"ara":[105],"ard":[8],"are":[72,82],"arg":[74],"ari":[16,58,71],"aro":[85],"art":[23,25,78],"ary":[72,88],"as ":[109,110],"asd":[75],"asp":[4,5,6,7,8,9],"ass":[58,60],"ast":[37,38,89,97,102,103,108],"ata":[18],"ate":[39,44,98,99,100],"ath":[17,91],"ati":[0,1,4,5,6,7,8,9,17,18,35,36,37,39,40,46,59,88,90,91,94,97,104],"ato":[37,38,42,74,107,108],"aud":[55,56],"aug":[97],"aut":[28,35,36],"axy":[93],"ban":[40],"bco":[29,30],"bdo":[6,7,83,103],"bg ":[77],"bic":[95,98,99,102],"bio":[10,51,52,92],"bla":[92,94],"bod":[34,63,64],"bon":[52],"bot":[30,36],"bov":[48],"bri":[39],"bst":[102],"bte":[29,30],"bul":[53,54,88],"c a":[89],"c c":[91],"c d":[95],"c h":[85],"c p":[98,99],"c r":[88],"c t":[62],"c u":[102],"cab":[77],"cal":[3,28,62],"car":[8,72],"cat":[17,39,44,91],"cau":[28,35,36],"cay":[57],"ce ":[56,88],"cep":[81],"cer":[35,36],"ces":[82],"ch ":[59,60,61],"cha":[74],"che":[11,28],"cho":[109],"cia":[46],"cir":[106],"cis":[19,22,23,24,25,26,47,48,49,70,106],"cle":[41],"clo":[75,76],"cm ":[47],"col":[62,89],"com":[44,73],"con":[0,1,24,29,30,32,33,40,41,42,88,90],"cop":[85,92,101],"cor":[26,34,35,36,42,59,72,109],"cos":[16,20,71,95],"cou":[88],"cri":[59,110],"cry":[39],"ct ":[40],"cte":[45],"cti":[12,15,16,27,29,30,32,33,41,42,43,44,45,46,82,100,105,109],"cto":[53,54,68,69,83,85,96,98,99],"ctu":[14],"cum":[24,106],"cuu":[80],"cya":[39],"cys":[47,48,49,92,93,95,96,97,101],"d a":[73],"d c":[62,75,76],"d d":[19],"d e":[44,70],"d h":[69,110],"d r":[33],"d t":[45,87],"dag":[40],"dan":[56],"day":[74],"dde":[92,94],"dec":[57,68,69],"dee":[109],"del":[79,80,81],"der":[13,43,44,45,46,47,49,50,66,67,92,94],"dia":[4,6,8,21,109,110],"dib":[53,54],"dil":[18],"dio":[55,56],"dis":[59],"dom":[6,7,83,103],"dos":[101],"dra":[19,20,95],"dre":[2],"ds ":[3],"duc":[105],"dui":[90],"dvh":[84],"dy ":[63,64],"e 4":[48],"e a":[39,55,56],"e b":[51,52,94],"e c":[40,95,96,109],"e d":[57],"e e":[29,35],"e f":[39,104],"e t":[55,100],"e v":[16,71],"e w":[72,88],"eal":[21,25,34,35,36,90,103],"ean":[82],"ear":[58,64,65,78],"eat":[107,108],"eca":[57],"ech":[59,60,61],"eci":[46],"ect":[12,15,16,27,29,30,42,53,54,68,69,82,83,85,96,98,99,100,109],"ed ":[44,45,69,73,110],"eda":[56],"edu":[105],"ee ":[109],"eec":[59,60,61],"eff":[4,5],"efl":[88],"eig":[34,63,64],"ein":[16,71],"eli":[79,80,81],"ell":[38],"elo":[27,70],"emi":[28,53,54],"emo":[11,15,34,63,64,66,67,68,69],"en ":[73,98,99],"enc":[88],"end":[101],"ene":[12,25,37],"eno":[29,30],"ens":[40,42],"ent":[1,46,58,60,74,88,97],"epa":[33,110],"eps":[81],"er ":[13,35,36,43,44,45,46,47,49,50,66,67,73,74,92],"era":[5,7,37,38,41,42,61,88,94],"erc":[20],"ere":[25,83,85],"erf":[40],"eri":[8,17,21,32,35,36,88,91,103,104],"ern":[14],"ero":[89],"ery":[28,31,71,77,79,80,81],"es ":[74,94],"esa":[82],"ese":[12,100],"esi":[3,27,88,95],"ess":[2,58,60,61,73],"est":[3,62,86,87],"ete":[17,88,89,91],"eth":[18,100,101,102,103,104],"etr":[37,56,99],"eur":[4,5],"eut":[5,7],"exc":[22,23,24,25,26,47,48,49,70],"ext":[43,44,45,46],"eye":[29,30,35,36],"f a":[90],"f b":[92],"f c":[26,34],"f f":[63,64],"f m":[22,24],"f p":[100,105],"f s":[11],"f t":[94],"f u":[18],"f v":[25],"f w":[2,3,23],"ffu":[4,5],"fib":[39],"fla":[41],"flu":[88],"for":[1,15,16,27,34,40,63,64,81,88,90,94],"fro":[63,64],"ft ":[41,51],"ful":[104],"fus":[4,5],"g a":[58,88],"g k":[37],"g o":[3],"g s":[77],"ga ":[46],"ge ":[40,95],"gen":[73,88],"ger":[31,71,77],"ges":[74],"gin":[65],"gio":[24],"giu":[31],"glu":[39],"gme":[97],"gn ":[34,63,64],"gno":[4,6],"gra":[41,53,54,55],"gs ":[2],"gur":[104],"h a":[60],"h b":[88],"h c":[109],"h d":[59],"h e":[30,36,45],"h g":[53],"h l":[3,42],"h m":[72],"h t":[61],"h u":[43],"hae":[15,68,69],"har":[74],"he ":[94],"hea":[58,78],"hem":[28,53,54],"her":[5,7,61],"hes":[3,11],"het":[17,91],"him":[13,105],"hoi":[15,68,69],"hol":[93],"hor":[46,109],"hou":[54,73],"hra":[18,100,104],"hro":[101,102,103],"hyp":[109,110],"hys":[83,85],"i t":[57],"iag":[4,6],"ial":[8,21,46],"ias":[109,110],"ibr":[39],"ibu":[53,54],"ic ":[62,85,88,89,91,95,98,99,102],"ica":[8,28,39,44],"ico":[16,71,88,95],"id ":[70],"ide":[68,69],"ids":[15],"ien":[1,46],"ies":[94],"ign":[34,63,64],"ila":[18,74],"ile":[90],"ima":[53,54],"ime":[86,87],"imi":[59],"imo":[13,105],"imp":[45,56,96],"in ":[10,39,71],"ina":[6,7,19,20,59,83,88,95],"inc":[19,88],"ine":[88,103],"ing":[2,3,37,58,65,72,88],"inj":[15,16,27,29,30,94],"ino":[103],"inp":[1],"ins":[16],"int":[9,20,27,50,51,52],"iog":[55],"iom":[56],"ion":[0,1,4,5,6,7,8,9,12,15,16,17,18,19,22,23,24,25,26,27,29,30,35,36,39,40,42,43,44,45,46,47,48,49,59,61,70,82,88,90,91,94,97,100,102,104,105,106,109],"iop":[10,51,52,92],"ior":[104],"ios":[24],"ipp":[110],"ir ":[73],"ira":[4,5,6,7,8,9],"irc":[106],"is ":[13,50],"isa":[17,91],"isc":[59],"isi":[19,22,23,24,25,26,47,48,49,57,70,106],"iss":[51],"itc":[11],"ith":[3,42,53,54,72,88,93,109],"ito":[21,32,72],"itu":[102],"ium":[31],"iva":[29,30,32,33,41],"ive":[79,80,81],"iza":[35,36],"jec":[15,16,27,29,30],"joi":[9,50],"jun":[29,30,32,33,41],"jur":[94],"kel":[27,70],"ker":[37,38,42],"kin":[10,88],"kyl":[50],"l a":[3,6,7,8],"l b":[52],"l c":[28,90],"l d":[20,21,79],"l e":[4,5],"l f":[34,41],"l g":[41],"l h":[83],"l i":[27],"l l":[85],"l o":[11,34,63,64],"l p":[14,32,46],"l r":[100],"l s":[29,30,51],"l u":[35,36,66,67,103],"l v":[104],"l w":[25,33],"lad":[92,94],"lam":[38],"lan":[78],"lap":[41,85,93],"lar":[38],"las":[37,38,97,102,103,108],"lat":[18,39,74],"lce":[35,36],"ld ":[62],"le ":[96],"lea":[90],"lec":[53,54],"led":[69,110],"len":[40,42],"ler":[41],"les":[22,27],"leu":[4,5],"lgu":[104],"lic":[39,44,89],"lit":[93],"liv":[79,80,81],"lki":[88],"lla":[38],"llu":[24],"loc":[3],"loi":[27,70],"lor":[62],"los":[50,75,76],"lta":[0,1],"lue":[39],"lus":[24],"lux":[88],"lve":[104],"lyp":[66,67],"lys":[21],"m c":[24],"m d":[80],"m e":[64],"m j":[50],"m n":[63],"m s":[31],"m u":[47],"mal":[79],"man":[53,54],"mat":[90],"mci":[106],"mea":[107,108],"mel":[38],"men":[58,60,97],"mes":[86,87],"met":[56],"mic":[28],"mim":[53,54],"min":[6,7,59,83,103],"mol":[22,24],"mon":[72],"mor":[15,68,69],"mos":[13,89,105],"mou":[47,48,49],"mov":[11,34,63,64,66,67],"mpa":[45],"mpe":[56],"mpl":[44,96],"mpr":[73],"mtp":[86,87],"my ":[53,54,95],"n a":[19,48],"n b":[10,30,34,36,63,64],"n c":[73,97],"n d":[4,6],"n f":[1,15,16,27],"n g":[39],"n i":[29,30,90],"n o":[0,18,22,23,24,25,26,29,35,90,100,105],"n p":[4,5,43],"n r":[99],"n s":[59,71,82,98],"n t":[5,7],"n u":[44,45,46,47,49,102],"n w":[42],"nag":[19,20,95],"nal":[6,7,14,27,83],"nar":[72,88],"nas":[89],"nat":[59],"nce":[56,88],"nci":[19],"nco":[88],"nct":[14,29,30,32,33,41],"nd ":[19,33,87],"nda":[40],"nde":[13,43,44,45,46,47,49,50,66,67],"ndi":[53,54],"ndo":[101],"nds":[2,3],"ndu":[90],"ndv":[84],"ne ":[29,35,52,55,57],"nea":[21,34,35,36,103],"nen":[88,101],"ner":[25],"nes":[3,12],"net":[37],"ng ":[3,37,58,88],"ngi":[65],"ngs":[2],"nit":[72],"nje":[15,16,27,29,30],"nju":[29,30,32,33,41,94],"nky":[50],"no ":[103],"noa":[39],"non":[29,30],"nor":[79],"nos":[4,6,63],"npa":[1],"ns ":[40,88,94,102],"nse":[42],"nsp":[78],"nsu":[0,1,100],"nt ":[9,50],"nta":[24,40,97],"nte":[20],"nti":[74,88],"ntr":[27,51,52],"nts":[1,46,88],"nus":[42],"o 4":[47],"o c":[89],"o l":[93],"o p":[103],"oac":[39],"oca":[3],"oco":[42],"ody":[34,63,64],"of ":[2,3,11,18,22,23,24,25,26,34,63,64,90,92,94,100,105],"oft":[51],"ogr":[55],"oid":[15,27,68,69,70],"oin":[9,50],"ola":[93],"old":[62],"ole":[22],"oli":[89],"oll":[24],"oly":[66,67],"om ":[63,64],"ome":[56],"omi":[6,7,83,103],"omo":[89],"omp":[44,73],"omy":[32,53,54,68,69,83,85,95,96,98,99,107],"on ":[0,1,4,5,6,7,15,16,18,19,22,23,24,25,26,27,29,30,35,36,42,43,44,45,46,47,48,49,59,90,97,100,102,105],"ona":[27,72],"ond":[90],"one":[21,29,35,52,55,57],"oni":[72],"onj":[29,30,32,33,41],"ons":[0,1,88,94],"ont":[24,40,88],"onu":[42],"oot":[43,45],"opa":[101],"opd":[0],"ope":[88,94,98,99],"opi":[85,92],"opl":[37,38,97,102,103,108],"ops":[10,51,52,92],"opu":[99],"opy":[101],"or ":[1,15,16,27,40,74,88,94,104],"ora":[40,51,52],"orc":[81],"ord":[109],"ore":[34,59,63,64],"ori":[62,72],"orm":[79,90],"orn":[26,34,35,36],"oro":[72],"orr":[15,42,68,69,109],"ort":[46],"osc":[85,92,101],"ose":[16,63,71],"osi":[13,50,89,105],"osp":[109,110],"ost":[4,6,20,95,98,99,100,104],"osu":[24,75,76],"ota":[85],"oth":[30,36,43,45],"oto":[107],"oun":[2,3,33],"our":[47,48,49,73,88],"out":[54],"ova":[11,34,63,64,66,67],"ove":[48],"oxy":[73],"p 1":[86],"p 2":[87],"p r":[66,67],"p t":[47],"pac":[45],"pad":[109,110],"pai":[33,110],"pan":[101],"par":[85,105],"pat":[1,46],"pax":[93],"pec":[46],"ped":[56],"pee":[59,60,61],"pen":[37,98,99],"per":[8,21,32,40,43,73,74,88,94,103],"peu":[5,7],"phi":[13,105],"pic":[85,92],"pir":[4,5,6,7,8,9],"pla":[37,38,78,97,102,103,108],"ple":[4,5,69,96,110],"pli":[39,44],"pol":[66,67],"pos":[104,109,110],"ppl":[39,110],"pra":[95,98],"pre":[73],"pro":[98,99,100],"ps ":[81],"psy":[10,51,52,92],"pte":[31],"pub":[95,98,99,102],"pun":[14],"pur":[55],"py ":[61,101],"r c":[35,36,74,92],"r d":[74],"r e":[47,48,49],"r g":[49,50,67],"r h":[15,73],"r i":[1,94],"r k":[27,38],"r l":[13,43,44,45,47,66],"r p":[40,73],"r s":[46,65],"r t":[43],"r u":[88,104],"r v":[16,88],"rac":[43,44,45,46],"raf":[41,53,54],"rai":[19,20,95],"ral":[4,5,27,41,51,52,100,104],"ram":[55],"ran":[78,100,102],"rao":[51,52],"rap":[5,7,61,95,98,105],"rat":[4,5,6,7,8,9,37,38,40,42,88,94,104],"rce":[81],"rco":[20],"rcu":[106],"rde":[109],"rdi":[8],"re ":[55,72],"rea":[25,82],"rec":[42,83,85,109],"red":[105],"ref":[88],"rei":[34,63,64],"rem":[11,34,63,64,66,67],"rep":[33,110],"res":[2,73,100],"ret":[18,88,89,91,99,100,101,102,103,104],"rfo":[40],"rge":[31,71,74,77],"rho":[15,68,69],"ric":[8,16,62,71,88,91],"rie":[94],"rim":[59,86,87],"rin":[3,39,58,65,72,88,103],"rio":[104],"rip":[110],"ris":[17,91],"rit":[21,32],"riz":[35,36],"rma":[79,90],"rna":[14],"rne":[34,35,36],"rns":[26],"ro ":[89],"rom":[63,64],"ron":[72],"rop":[99,102,103],"ros":[85,98,99,100,101],"rre":[42,109],"rrh":[15,68,69],"rt ":[46,78],"rts":[23,25],"ry ":[72,88],"ryg":[31],"ryl":[39],"s c":[42],"s d":[81],"s f":[40,88,94],"s o":[2,94],"s p":[74,102],"s r":[110],"s u":[13,50],"s w":[3,109],"sar":[82],"sat":[17,91],"scl":[41],"sco":[59,85,92,101],"scr":[59],"scu":[24],"sd ":[75,76],"se ":[16,71],"sec":[12,82,100],"sed":[73],"ses":[42,58,60,61],"sho":[46],"si ":[57],"sia":[3],"sic":[88,95],"sim":[96],"sin":[2],"sio":[4,5,19,22,23,24,25,26,27,47,48,49,61,70,106],"sis":[13,21,50,57,89,105],"ski":[10],"sme":[58,60],"sof":[51],"spa":[109,110],"spe":[46,59,60,61],"spi":[4,5,6,7,8,9],"spl":[78],"sse":[58,60,73],"ssi":[2,61],"ssm":[58,60],"ssu":[51],"st ":[47,48,49,86],"sta":[20,69,98,99,100],"ste":[14,83,85,86,87,96,104],"sth":[3],"sti":[4,6,11,102],"sto":[89,92,93,95,97,101],"sty":[37,38,97,102,103,108],"sub":[29,30,102],"sue":[51],"sul":[0,1],"sum":[24],"sup":[95,98],"sur":[31,71,75,76,77,100],"sut":[3],"sy ":[92],"syr":[65],"t a":[9,50],"t c":[41],"t g":[46,54],"t l":[40],"t t":[47,48,49,51,78,86],"tac":[40],"tag":[24],"tal":[20,85],"tap":[69],"tat":[0,1,18,97,98,99,100],"tch":[11],"te ":[39,100],"tec":[96,98,99],"ted":[44,45],"ten":[29,30],"ter":[14,17,20,28,31,35,36,83,85,86,87,88,89,91,104],"tes":[62],"th ":[3,30,36,42,43,45,53,72,88,109],"the":[3,5,7,17,61,91,94],"tho":[54,93],"thr":[18,100,101,102,103,104],"tic":[4,5,6,7],"tie":[1,46],"til":[74],"tin":[37,88],"tio":[0,1,4,5,6,7,8,9,12,15,16,17,18,27,29,30,35,36,39,40,42,43,44,45,46,59,82,88,90,91,94,97,100,102,104,105,109],"tis":[51],"tit":[11,102],"tiv":[29,30,32,33,41],"tm ":[50],"to ":[47,93],"toc":[42],"tom":[32,53,54,68,69,83,85,89,95,96,98,99,107],"ton":[21,55,57],"too":[43,45],"top":[37,38,97,101,108],"tor":[72,74],"tos":[92,95],"tot":[85,107],"tp ":[86,87],"tra":[27,37,43,44,45,46,51,52,78,100,102],"tri":[86,87],"tro":[99],"try":[56],"tum":[47,48,49],"tur":[3,14,100],"tut":[102],"ty ":[102],"ubc":[29,30],"ubi":[95,98,99,102],"ubs":[102],"ubt":[29,30],"uct":[105],"udi":[55,56],"ue ":[39,51],"ugm":[97],"uit":[90],"ulc":[35,36],"ule":[53,54],"ulg":[104],"ulk":[88],"ult":[0,1],"um ":[24,31,80],"umc":[106],"umo":[47,48,49],"unc":[14,29,30,32,33,41],"und":[2,3,13,33,43,44,45,46,47,49,50,66,67],"up ":[47],"upr":[95,98],"ur ":[47,48,49,88],"ura":[4,5,104],"ure":[14,18,55,75,76,88,89,91,100,101,102,103,104],"urg":[31,71,77],"uri":[3,88,94],"urp":[100],"us ":[42],"usc":[24],"usi":[4,5],"ut ":[54],"ute":[28,35,36],"uti":[5,7,102],"utu":[3],"uum":[80],"ux ":[88],"vac":[80],"val":[11,29,30,32,33,34,41,63,64,66,67,104],"var":[16,71],"ve ":[48,104],"vei":[16,71],"ven":[12,25,74],"ver":[79,80,81],"ves":[88,95],"vsd":[76],"vur":[88],"war":[23,25],"wit":[3,42,53,54,72,88,109],"wou":[2,3,33],"x v":[88],"xci":[22,23,24,25,26,47,48,49,70],"xtr":[43,44,45,46],"xyg":[73],"y c":[72,101],"y f":[63,64],"y i":[88],"y o":[92],"y s":[61],"y t":[102],"y v":[95],"y w":[53,54],"yan":[39],"yes":[30,36],"yge":[73],"ygi":[31],"yla":[39],"ylo":[50],"yp ":[66,67],"ypo":[109,110],"yri":[65],"ysi":[21],"yst":[47,48,49,83,85,92,93,95,96,97,101],"zat":[35,36]},"positions":{"Consultation OPD":0,"Consultation for Inpatients":1,"Dressings of wounds":2,"Suturing of wounds with local anesthesia":3,"Aspiration Pleural Effusion (Diagnostic)":4,"Aspiration Pleural Effusion (Therapeutic)":5,"Abdominal Aspiration (Diagnostic)":6,"Abdominal Aspiration (Therapeutic)":7,"Pericardial Aspiration":8,"Joint Aspiration":9,"Skin Biopsy":10,"Removal of stitches":11,"Venesection":12,"Phimosis under LA":13,"Sternal puncture":14,"Injection for haemorrhoids":15,"Injection for varicose veins":16,"Catheterisation":17,"Dilatation of urethra":18,"Incision and drainage":19,"Intercostal drainage":20,"Peritoneal dialysis":21,"Excision of moles":22,"Excision of warts":23,"Excision of molluscum contagiosum":24,"Excision of venereal warts":25,"Excision of corns":26,"Intralesional injection for keloid":27,"Chemical cautery":28,"Subconjunctival / subtenon injection (one eye)":29,"Subconjunctival / subtenon injection (both eyes)":30,"Pterygium surgery":31,"Conjunctival peritomy":32,"Conjunctival wound repair":33,"Removal of corneal foreign body":34,"Corneal ulcer cauterization (one eye)":35,"Corneal ulcer cauterization (both eyes)":36,"Penetrating keratoplasty":37,"Lamellar keratoplasty":38,"Cyanoacrylate / fibrin glue application":39,"Bandage contact lens for perforation":40,"Scleral graft / conjunctival flap":41,"Keratoconus correction with lenses":42,"Extraction per tooth under LA":43,"Complicated extraction under LA":44,"Impacted tooth extraction under LA":45,"Extraction under short GA (special patients)":46,"Cyst/tumour excision up to 4 cm under LA":47,"Cyst/tumour excision above 4 cm":48,"Cyst/tumour excision under GA":49,"TM joint ankylosis under GA":50,"Intraoral soft tissue biopsy":51,"Intraoral bone biopsy":52,"Hemimandibulectomy with graft":53,"Hemimandibulectomy without graft":54,"Pure tone audiogram":55,"Impedance audiometry":56,"SISI / Tone decay":57,"Hearing assessment":58,"Speech discrimination score":59,"Speech assessment":60,"Speech therapy session":61,"Cold caloric test":62,"Removal of foreign body from nose":63,"Removal of foreign body from ear":64,"Ear syringing":65,"Polyp removal under LA":66,"Polyp removal under GA":67,"Haemorrhoidectomy":68,"Stapled haemorrhoidectomy":69,"Keloid excision":70,"Varicose vein surgery":71,"Coronary care with monitoring":72,"Oxygen / compressed air per hour":73,"Ventilator charges per day":74,"ASD closure":75,"VSD closure":76,"CABG surgery":77,"Heart transplant":78,"Normal delivery":79,"Vacuum delivery":80,"Forceps delivery":81,"Cesarean section":82,"Abdominal hysterectomy":83,"NDVH":84,"Total laparoscopic hysterectomy":85,"MTP 1st trimester":86,"MTP 2nd trimester":87,"Operations for Vesicoureteric Reflux (VUR) / Urinary incontinence with bulking agents":88,"Uretero-colic anastomosis":89,"Formation of an Ileal Conduit":90,"Ureteric catheterisation":91,"Biopsy of bladder (cystoscopic)":92,"Cysto-litholapaxy":93,"Operations for injuries of the bladder":94,"Suprapubic drainage (cystostomy / vesicostomy)":95,"Simple cystectomy":96,"Augmentation cystoplasty":97,"Open suprapubic prostatectomy":98,"Open retropubic prostatectomy":99,"Transurethral resection of prostate (TURP)":100,"Urethroscopy / cystopanendoscopy":101,"Substitution urethroplasty (trans-pubic urethroplasty)":102,"Abdomino-perineal urethroplasty":103,"Posterior urethral valve fulguration":104,"Reduction of paraphimosis":105,"Circumcision":106,"Meatotomy":107,"Meatoplasty":108,"Hypospadias with chordee correction":109,"Crippled hypospadias repair":110}};
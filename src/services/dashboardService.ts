@@ -28,6 +28,26 @@ export interface TopPerformers {
   }>;
 }
 
+export interface DailyStatsDay {
+  date: string;
+  transactions: number;
+  revenue: number;
+  refunds: number;
+  refund_amount: number;
+  new_patients: number;
+  admissions: number;
+  discharges: number;
+  in_patients: number;
+  occupied_beds: number;
+}
+
+export interface DailyStats {
+  days: DailyStatsDay[];
+  paymentModes: Array<{ payment_mode: string; transactions: number; revenue: number }>;
+  refreshedAt: string | null;
+  liveFrom: string | null;
+}
+
 class DashboardService {
   private getHeaders() {
     const token = localStorage.getItem('auth_token');
@@ -54,6 +74,24 @@ class DashboardService {
     }
   }
 
+  /**
+   * Get per-day totals (IST days, YYYY-MM-DD bounds inclusive) from the
+   * daily_stats rollups, with the days since the last refresh computed live
+   */
+  async getDailyStats(startDate?: string, endDate?: string): Promise<DailyStats> {
+    try {
+      const response = await axios.get(`${this.getBaseUrl()}/api/dashboard/daily-stats`, {
+        headers: this.getHeaders(),
+        params: { start_date: startDate, end_date: endDate }
+      });
+
+      return response.data as DailyStats;
+    } catch (error) {
+      console.error('Error fetching daily stats:', error);
+      throw error;
+    }
+  }
+
   /**
    * Get chart data for dashboard
    */
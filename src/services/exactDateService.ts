@@ -1,6 +1,20 @@
 import axios from 'axios';
 import type { PatientWithRelations } from '../config/supabaseNew';
 
+// Refunds per request when paging /api/patient_refunds
+export const REFUNDS_PAGE_SIZE = 500;
+// MAX_REFUNDS_PAGE_SIZE in backend/server.js; larger limits are cut to it
+export const MAX_REFUNDS_PAGE_SIZE = 1000;
+
+export interface RefundPageOptions {
+  startDate?: string;
+  endDate?: string;
+  limit?: number;
+  // Keyset cursor: page_cursor and id of the last refund already seen
+  afterCreatedAt?: string;
+  afterId?: string;
+}
+
 export class ExactDateService {
   private static getHeaders() {
     const token = localStorage.getItem('auth_token');
@@ -211,4 +225,52 @@ export class ExactDateService {
       return [];
     }
   }
+
+  // One page of refunds, newest first. `afterCreatedAt` / `afterId` continue
+  // from the last refund of the previous page; the server caps `limit` at
+  // MAX_REFUNDS_PAGE_SIZE.
+  static async getPatientRefundsPage(options: RefundPageOptions = {}): Promise<any[]> {
+    const { startDate, endDate, limit = REFUNDS_PAGE_SIZE, afterCreatedAt, afterId } = options;
+    const response = await axios.get(`${this.getBaseUrl()}/api/patient_refunds`, {
+      headers: this.getHeaders(),
+      params: {
+        start_date: startDate,
+        end_date: endDate,
+        limit,
+        after_created_at: afterCreatedAt,
+        after_id: afterId
+      }
+    });
+    return response.data || [];
+  }
+
+  // Yields refunds a page at a time, so no single response holds the whole
+  // table. A failed page throws: callers must not mistake the refunds seen so
+  // far for all of them. The limit is clamped to the server's cap, since a
+  // short page is what ends the listing.
+  static async *iteratePatientRefunds(options: RefundPageOptions = {}): AsyncGenerator<any[]> {
+    const limit = Math.min(options.limit ?? REFUNDS_PAGE_SIZE, MAX_REFUNDS_PAGE_SIZE);
+    let { afterCreatedAt, afterId } = options;
+    let fetched = 0;
+    while (true) {
+      let page: any[];
+      try {
+        page = await this.getPatientRefundsPage({ ...options, limit, afterCreatedAt, afterId });
+      } catch (error: any) {
+        console.error(`❌ Error getting patient refunds page after ${fetched} refunds:`, error);
+        throw error;
+      }
+      if (page.length > 0) {
+        fetched += page.length;
+        yield page;
+      }
+      if (page.length < limit) {
+        console.log(`💸 Retrieved ${fetched} refunds in pages of ${limit}`);
+        return;
+      }
+      const last = page[page.length - 1];
+      afterCreatedAt = last.page_cursor;
+      afterId = last.id;
+    }
+  }
 }
\ No newline at end of file
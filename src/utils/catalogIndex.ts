@@ -0,0 +1,92 @@
+// Lookups over the prebuilt catalog indexes emitted by parse_rghs.py and generate_services.py
+
+export const CATALOG_INDEX_VERSION = 1;
+
+export interface CatalogIndex {
+  version: number;
+  names: string[]; // normalized names, parallel to the catalog array
+  tokens: string[]; // sorted, for prefix lookups
+  tokenPostings: number[][]; // parallel to tokens
+  trigrams: Record<string, number[]>;
+  positions: Record<string, number>; // exact name -> catalog position
+}
+
+// Must stay in sync with normalize_name() in catalog_index.py
+export const normalizeCatalogName = (value: string): string =>
+  value.toLowerCase().replace(/[^a-z0-9]+/g, ' ').trim();
+
+export const assertCatalogIndexVersion = (index: CatalogIndex): void => {
+  if (index.version !== CATALOG_INDEX_VERSION) {
+    throw new Error(`Catalog index version ${index.version} is not supported (expected ${CATALOG_INDEX_VERSION}). Re-run the catalog generators.`);
+  }
+};
+
+export const findCatalogPosition = (index: CatalogIndex, name: string): number => {
+  const position = index.positions[name];
+  return position === undefined ? -1 : position;
+};
+
+const lowerBound = (sorted: string[], target: string): number => {
+  let lo = 0;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (sorted[mid] < target) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo;
+};
+
+const intersectSorted = (a: number[], b: number[]): number[] => {
+  const result: number[] = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      result.push(a[i]);
+      i++;
+      j++;
+    } else if (a[i] < b[j]) {
+      i++;
+    } else {
+      j++;
+    }
+  }
+  return result;
+};
+
+// Positions of entries with a token starting with `query`
+export const prefixSearchCatalog = (index: CatalogIndex, query: string): number[] => {
+  const q = normalizeCatalogName(query);
+  if (!q) return [];
+
+  const matches = new Set<number>();
+  for (let i = lowerBound(index.tokens, q); i < index.tokens.length && index.tokens[i].startsWith(q); i++) {
+    index.tokenPostings[i].forEach(position => matches.add(position));
+  }
+  return Array.from(matches).sort((a, b) => a - b);
+};
+
+// Positions of entries whose normalized name contains `query`, in catalog order
+export const searchCatalog = (index: CatalogIndex, query: string): number[] => {
+  const q = normalizeCatalogName(query);
+  if (!q) return [];
+  if (q.length < 3) return prefixSearchCatalog(index, q);
+
+  const postings: number[][] = [];
+  for (let i = 0; i + 3 <= q.length; i++) {
+    const list = index.trigrams[q.slice(i, i + 3)];
+    if (!list) return [];
+    postings.push(list);
+  }
+  postings.sort((a, b) => a.length - b.length);
+
+  let candidates = postings[0];
+  for (let i = 1; i < postings.length && candidates.length > 0; i++) {
+    candidates = intersectSorted(candidates, postings[i]);
+  }
+  return candidates.filter(position => index.names[position].includes(q));
+};
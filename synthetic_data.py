@@ -0,0 +1,486 @@
+import argparse
+import json
+import os
+import random
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, timedelta
+
+from catalog_loader import DEFAULT_DATABASE_URL, connect, copy_field, copy_file
+from catalog_manifest import write_if_changed
+from export_stream import EXPORT_FILE, iter_tables
+
+OUTPUT_DIR = 'synthetic_data'
+PROFILE_FILE = 'profile.json'
+MANIFEST_FILE = 'manifest.json'
+# 2: profiles hold labels and counts only, no names or free text
+MANIFEST_VERSION = 2
+
+DEFAULT_PATIENTS = 1_000_000
+DEFAULT_TRANSACTIONS = 10_000_000
+# Days of history the patients are spread over, ending at the export's last day
+DEFAULT_DAYS = 730
+# Patients per worker task; each shard writes its own file per table
+PATIENTS_PER_SHARD = 50_000
+FLUSH_PATIENTS = 5_000
+
+DEFAULT_HOSPITAL_ID = '550e8400-e29b-41d4-a716-446655440000'
+
+# The export has no admissions yet, so stays fall back to these weights
+# (days, weight) and the rate to one in a hundred patients
+DEFAULT_STAY_DAYS = [[1, 20], [2, 25], [3, 20], [4, 12], [5, 8], [7, 8], [10, 5], [14, 2]]
+DEFAULT_ADMISSION_RATE = 0.01
+NULL = '\\N'
+REFUND_REASONS = ['Procedure cancelled', 'Duplicate payment', 'Test not performed', 'Patient request',
+                  'Billing correction']
+# patient_refunds only allows CASH and ONLINE payment modes
+REFUND_MODES = {'CASH': 'CASH', 'ONLINE': 'ONLINE', 'UPI': 'ONLINE', 'CARD': 'ONLINE'}
+
+# Names are made up from these syllables, which are chosen to sound unlike
+# real names; nothing personal is taken from the export
+NAME_SYLLABLES = ['bo', 'ce', 'du', 'fe', 'go', 'ju', 'ke', 'lu', 'mo', 'nu', 'po', 'qui', 'ru', 'so', 'tu',
+                  'vo', 'we', 'xa', 'yo', 'zu']
+# Charge descriptions by transaction type, filled with the generated labels
+DESCRIPTIONS = {'CONSULTATION': 'Consultation Fee - {doctor} ({department})', 'ADMISSION_FEE': 'Admission Fee',
+                'LAB_TEST': 'Lab Test', 'XRAY': 'X-Ray', 'PROCEDURE': 'Procedure', 'SERVICE': 'Hospital Service'}
+
+# Tables in foreign key order; the loader finishes each before starting the next
+TABLES = {
+    'patients': ['id', 'patient_id', 'prefix', 'first_name', 'last_name', 'age', 'gender', 'phone', 'address',
+                 'has_reference', 'reference_details', 'assigned_department', 'assigned_doctor', 'patient_tag',
+                 'date_of_entry', 'ipd_status', 'is_active', 'hospital_id', 'created_at', 'updated_at'],
+    'beds': ['id', 'bed_number', 'room_type', 'daily_rate', 'status', 'patient_id', 'hospital_id',
+             'created_at', 'updated_at'],
+    'patient_admissions': ['id', 'patient_id', 'bed_id', 'admission_date', 'expected_discharge_date',
+                           'actual_discharge_date', 'total_amount', 'amount_paid', 'balance', 'status',
+                           'hospital_id', 'created_at', 'updated_at'],
+    'patient_transactions': ['id', 'patient_id', 'admission_id', 'transaction_type', 'description', 'amount',
+                             'payment_mode', 'department', 'doctor_name', 'status', 'transaction_date',
+                             'discount_percentage', 'hospital_id', 'created_at', 'updated_at'],
+    'patient_refunds': ['id', 'patient_id', 'original_transaction_id', 'amount', 'reason', 'refund_method',
+                        'payment_mode', 'status', 'hospital_id', 'created_at', 'updated_at'],
+}
+
+def weights(counter):
+    # JSON-friendly [[value, weight], ...]; tuple values become lists
+    return [[list(value) if isinstance(value, tuple) else value, count] for value, count in counter.most_common()]
+
+def parse_day(value):
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+def labeller(prefix):
+    # Numbered stand-ins for free text, in first-seen order; the same value
+    # always gets the same label, so its weight is kept but not its text
+    labels = {}
+
+    def label(value):
+        if not value:
+            return None
+        if value not in labels:
+            labels[value] = f"{prefix} {len(labels) + 1}"
+        return labels[value]
+    return label
+
+def pseudonym(rng):
+    return ''.join(rng.choice(NAME_SYLLABLES) for _ in range(3)).upper()
+
+def describe_charge(kind, doctor, department):
+    template = DESCRIPTIONS.get(kind, (kind or 'Charge').replace('_', ' ').title())
+    return template.format(doctor=doctor or 'Duty Doctor', department=department or 'General')
+
+def learn_profile(path=EXPORT_FILE):
+    # Field distributions from the real export, as counts only. Names, phone
+    # numbers and charge descriptions are not read; addresses, references,
+    # tags and doctors become numbered labels. Values that travel together
+    # (gender and prefix, department and doctor, a charge's type and amount)
+    # are learned jointly so generated rows stay coherent.
+    patients = {}
+    counters = {name: Counter() for name in (
+        'gender_prefix', 'age', 'address', 'reference', 'doctor', 'patient_tag', 'weekday',
+        'ipd_status', 'visits', 'visit_offset', 'charge', 'payment_mode', 'status', 'hour', 'refund_amount',
+        'refund_mode', 'stay_days', 'room', 'hospital_id')}
+    address = labeller('Locality')
+    reference = labeller('Reference')
+    doctor = labeller('DR. DOCTOR')
+    tag = labeller('Tag')
+    last_day = None
+    transactions = refunds = beds = 0
+
+    for name, rows in iter_tables(path):
+        if name == 'patients':
+            for row in rows:
+                gender = row.get('gender')
+                entry = parse_day(row.get('date_of_entry')) or parse_day(row.get('created_at'))
+                patients[row['id']] = entry
+                counters['gender_prefix'][(gender, row.get('prefix'))] += 1
+                counters['age'][row.get('age')] += 1
+                counters['address'][address(row.get('address'))] += 1
+                counters['reference'][(bool(row.get('has_reference')), reference(row.get('reference_details')))] += 1
+                counters['doctor'][(row.get('assigned_department'), doctor(row.get('assigned_doctor')))] += 1
+                counters['patient_tag'][tag(row.get('patient_tag'))] += 1
+                counters['ipd_status'][row.get('ipd_status')] += 1
+                counters['hospital_id'][row.get('hospital_id')] += 1
+                if entry:
+                    counters['weekday'][entry.weekday()] += 1
+                    last_day = max(last_day or entry, entry)
+        elif name == 'patient_transactions':
+            per_patient = Counter()
+            for row in rows:
+                transactions += 1
+                per_patient[row.get('patient_id')] += 1
+                amount = row.get('amount') or 0
+                day = parse_day(row.get('transaction_date')) or parse_day(row.get('created_at'))
+                entry = patients.get(row.get('patient_id'))
+                if day and entry:
+                    counters['visit_offset'][max(0, (day - entry).days)] += 1
+                if day:
+                    last_day = max(last_day or day, day)
+                if row.get('created_at'):
+                    counters['hour'][int(row['created_at'][11:13])] += 1
+                counters['charge'][(row.get('transaction_type'), amount, row.get('discount_percentage') or 0)] += 1
+                counters['payment_mode'][row.get('payment_mode')] += 1
+                counters['status'][row.get('status')] += 1
+                # Refunds are recorded as negative transactions in the export
+                if amount < 0:
+                    refunds += 1
+                    counters['refund_amount'][-amount] += 1
+                    counters['refund_mode'][REFUND_MODES.get(row.get('payment_mode'), 'CASH')] += 1
+            counters['visits'].update(per_patient.values())
+        elif name == 'patient_admissions':
+            for row in rows:
+                admitted = parse_day(row.get('admission_date'))
+                discharged = parse_day(row.get('actual_discharge_date') or row.get('discharge_date'))
+                if admitted and discharged:
+                    counters['stay_days'][max(1, (discharged - admitted).days)] += 1
+        elif name == 'beds':
+            for row in rows:
+                beds += 1
+                counters['room'][(row.get('room_type'), row.get('daily_rate') or 0)] += 1
+
+    if not patients:
+        raise ValueError(f"{path} has no patients to learn from")
+    admitted = counters['ipd_status']['ADMITTED'] + counters['ipd_status']['DISCHARGED']
+    hospital_ids = [value for value, _ in counters['hospital_id'].most_common() if value]
+    profile = {name: weights(counter) for name, counter in counters.items()
+               if name not in ('ipd_status', 'hospital_id')}
+    profile.update({
+        'source': os.path.abspath(path),
+        'patients': len(patients),
+        'transactions': transactions,
+        'beds': beds,
+        'last_day': (last_day or date.today()).isoformat(),
+        'hospital_id': hospital_ids[0] if hospital_ids else DEFAULT_HOSPITAL_ID,
+        'admission_rate': admitted / len(patients) if admitted else DEFAULT_ADMISSION_RATE,
+        'refund_rate': refunds / transactions if transactions else 0.0,
+    })
+    # Fallbacks for tables the export has few or no rows in
+    for name, default in (('stay_days', DEFAULT_STAY_DAYS), ('room', [[['GENERAL', 1000], 1]]),
+                          ('visits', [[1, 1]]), ('visit_offset', [[0, 1]]), ('hour', [[9, 1]]),
+                          ('refund_mode', [['CASH', 1]])):
+        if not profile[name]:
+            profile[name] = default
+    return profile
+
+class Sampler:
+    # Weighted choice over learned values. Text is escaped for COPY once here
+    # rather than per generated row.
+    def __init__(self, pairs):
+        self.values = [self.prepare(value) for value, _ in pairs]
+        self.cum = []
+        total = 0
+        for _, count in pairs:
+            total += count
+            self.cum.append(total)
+
+    @staticmethod
+    def prepare(value):
+        if isinstance(value, list):
+            return tuple(Sampler.prepare(item) for item in value)
+        if isinstance(value, str):
+            return copy_field(value)
+        return value
+
+    def one(self, rng):
+        return rng.choices(self.values, cum_weights=self.cum)[0]
+
+    def many(self, rng, k):
+        return rng.choices(self.values, cum_weights=self.cum, k=k)
+
+def copy_value(value):
+    # Sampled values are already escaped; None and booleans need spelling out
+    if value is None:
+        return NULL
+    if value is True or value is False:
+        return 't' if value else 'f'
+    return str(value)
+
+def make_uuid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+def timestamp(day, hour, rng):
+    return f"{day.isoformat()} {hour:02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}+00"
+
+def shard_beds(shard, shards, total_beds):
+    # Each shard owns a disjoint slice of the beds, so occupancy can be
+    # decided without coordinating with other workers
+    return total_beds * shard // shards, total_beds * (shard + 1) // shards
+
+def generate_shard(task):
+    # Writes one shard of every table; returns {table: rows written}
+    profile, output_dir, seed, shard, shards, first, last, transactions_per_patient, total_beds = task
+    rng = random.Random(seed * 1_000_003 + shard)
+    samplers = {name: Sampler(profile[name]) for name in (
+        'gender_prefix', 'age', 'address', 'reference', 'doctor', 'patient_tag', 'visits',
+        'visit_offset', 'charge', 'payment_mode', 'status', 'hour', 'refund_amount', 'refund_mode',
+        'stay_days', 'room')}
+    weekday = [0] * 7
+    for day, count in profile['weekday']:
+        weekday[day] = count
+    if not any(weekday):
+        weekday = [1] * 7
+    busiest = max(weekday)
+    hospital_id = profile['hospital_id']
+    end = date.fromisoformat(profile['last_day'])
+    days = profile['days']
+    start = end - timedelta(days=days - 1)
+    learned_visits = sum(count * weight for count, weight in profile['visits']) / max(
+        1, sum(weight for _, weight in profile['visits']))
+    visit_scale = transactions_per_patient / learned_visits if learned_visits else 1.0
+    admission_rate = profile['admission_rate']
+    refund_rate = profile['refund_rate']
+
+    counts = dict.fromkeys(TABLES, 0)
+    files = {table: open(os.path.join(output_dir, table, f"{shard:04d}.copy"), 'w', encoding='utf-8')
+             for table in TABLES}
+    buffers = {table: [] for table in TABLES}
+
+    # Beds of this shard; occupied ones get their patient when an active
+    # admission lands on them
+    bed_start, bed_stop = shard_beds(shard, shards, total_beds)
+    beds = []
+    for number in range(bed_start, bed_stop):
+        room_type, rate = samplers['room'].one(rng)
+        beds.append([make_uuid(rng), str(number + 1), room_type, rate, None])
+    free_beds = list(range(len(beds)))
+
+    try:
+        for index in range(first, last):
+            patient_uuid = make_uuid(rng)
+            while True:
+                entry = start + timedelta(days=rng.randrange(days))
+                if rng.random() * busiest < weekday[entry.weekday()]:
+                    break
+            gender, prefix = samplers['gender_prefix'].one(rng)
+            has_reference, reference = samplers['reference'].one(rng)
+            department, doctor = samplers['doctor'].one(rng)
+
+            # Admission first, so ipd_status and admission fee charges agree with it
+            admission_id = None
+            ipd_status = 'OPD'
+            if rng.random() < admission_rate:
+                admission_id = make_uuid(rng)
+                admitted = min(end, entry + timedelta(days=samplers['visit_offset'].one(rng)))
+                stay = samplers['stay_days'].one(rng)
+                discharged = admitted + timedelta(days=stay)
+                bed = None
+                if discharged > end and free_beds:
+                    bed = free_beds.pop(rng.randrange(len(free_beds)))
+                    beds[bed][4] = patient_uuid
+                elif discharged > end:
+                    # Ward is full: this stay ended on the last day instead
+                    discharged = end
+                elif beds:
+                    bed = rng.randrange(len(beds))
+                active = discharged > end
+                ipd_status = 'ADMITTED' if active else 'DISCHARGED'
+                rate = beds[bed][3] if bed is not None else profile['room'][0][0][1]
+                billed_days = max(1, ((end if active else discharged) - admitted).days)
+                total = billed_days * rate
+                paid = total if not active else int(total * rng.random()) // 100 * 100
+                admitted_at = timestamp(admitted, samplers['hour'].one(rng), rng)
+                buffers['patient_admissions'].append(
+                    f"{admission_id}\t{patient_uuid}\t{beds[bed][0] if bed is not None else NULL}\t{admitted_at}\t"
+                    f"{admitted + timedelta(days=stay)}\t{NULL if active else discharged}\t"
+                    f"{total}\t{paid}\t{total - paid}\t{'ACTIVE' if active else 'DISCHARGED'}\t{hospital_id}\t"
+                    f"{admitted_at}\t{admitted_at}\n")
+                counts['patient_admissions'] += 1
+
+            created = timestamp(entry, samplers['hour'].one(rng), rng)
+            buffers['patients'].append(
+                f"{patient_uuid}\tP{index + 1:06d}\t{copy_value(prefix)}\t{pseudonym(rng)}\t"
+                f"{pseudonym(rng)}\t{copy_value(samplers['age'].one(rng))}\t{copy_value(gender)}\t"
+                f"{rng.randrange(6_000_000_000, 10_000_000_000)}\t{copy_value(samplers['address'].one(rng))}\t"
+                f"{copy_value(has_reference)}\t{copy_value(reference)}\t{copy_value(department)}\t"
+                f"{copy_value(doctor)}\t{copy_value(samplers['patient_tag'].one(rng))}\t{entry}\t{ipd_status}\t"
+                f"t\t{hospital_id}\t{created}\t{created}\n")
+
+            # Visit counts keep the learned shape, stretched to the target
+            # transactions per patient with stochastic rounding
+            scaled = samplers['visits'].one(rng) * visit_scale
+            visits = max(1, int(scaled) + (rng.random() < scaled - int(scaled)))
+            charges = samplers['charge'].many(rng, visits)
+            modes = samplers['payment_mode'].many(rng, visits)
+            statuses = samplers['status'].many(rng, visits)
+            offsets = samplers['visit_offset'].many(rng, visits)
+            for (kind, amount, discount), mode, status, offset in zip(charges, modes, statuses, offsets):
+                transaction_id = make_uuid(rng)
+                day = min(end, entry + timedelta(days=offset))
+                created = timestamp(day, samplers['hour'].one(rng), rng)
+                linked = admission_id if kind == 'ADMISSION_FEE' else None
+                buffers['patient_transactions'].append(
+                    f"{transaction_id}\t{patient_uuid}\t{copy_value(linked)}\t{copy_value(kind)}\t"
+                    f"{copy_field(describe_charge(kind, doctor, department))}\t{amount}\t{copy_value(mode)}\t{copy_value(department)}\t"
+                    f"{copy_value(doctor)}\t{copy_value(status)}\t{day}\t{discount}\t{hospital_id}\t"
+                    f"{created}\t{created}\n")
+                if amount > 0 and rng.random() < refund_rate:
+                    refund_day = min(end, day + timedelta(days=rng.randrange(8)))
+                    refunded = timestamp(refund_day, samplers['hour'].one(rng), rng)
+                    refund_mode = samplers['refund_mode'].one(rng)
+                    buffers['patient_refunds'].append(
+                        f"{make_uuid(rng)}\t{patient_uuid}\t{transaction_id}\t"
+                        f"{min(amount, samplers['refund_amount'].one(rng))}\t{rng.choice(REFUND_REASONS)}\t"
+                        f"{refund_mode}\t{refund_mode}\tCOMPLETED\t{hospital_id}\t{refunded}\t{refunded}\n")
+                    counts['patient_refunds'] += 1
+            counts['patients'] += 1
+            counts['patient_transactions'] += visits
+
+            if (index - first + 1) % FLUSH_PATIENTS == 0:
+                for table, lines in buffers.items():
+                    files[table].writelines(lines)
+                    lines.clear()
+
+        created = timestamp(start, 0, rng)
+        for bed_id, number, room_type, rate, patient in beds:
+            buffers['beds'].append(
+                f"{bed_id}\t{number}\t{copy_value(room_type)}\t{rate}\t{'occupied' if patient else 'vacant'}\t"
+                f"{copy_value(patient)}\t{hospital_id}\t{created}\t{created}\n")
+        counts['beds'] = len(beds)
+        for table, lines in buffers.items():
+            files[table].writelines(lines)
+    finally:
+        for f in files.values():
+            f.close()
+    return counts
+
+def generate_dataset(profile, output_dir=OUTPUT_DIR, patients=DEFAULT_PATIENTS, transactions=DEFAULT_TRANSACTIONS,
+                     days=DEFAULT_DAYS, seed=0, workers=None, shard_size=PATIENTS_PER_SHARD):
+    # Writes COPY text files per table and shard plus manifest.json; the same
+    # profile, sizes and seed always produce the same files
+    for table in TABLES:
+        os.makedirs(os.path.join(output_dir, table), exist_ok=True)
+        for name in os.listdir(os.path.join(output_dir, table)):
+            if name.endswith('.copy'):
+                os.remove(os.path.join(output_dir, table, name))
+    profile = dict(profile, days=days)
+    write_if_changed(os.path.join(output_dir, PROFILE_FILE), json.dumps(profile, indent=2) + "\n")
+
+    shards = max(1, -(-patients // shard_size))
+    # Beds scale with patients at the export's ratio
+    total_beds = max(1, round(patients * profile['beds'] / profile['patients'])) if profile['beds'] else 0
+    tasks = [(profile, output_dir, seed, shard, shards, patients * shard // shards, patients * (shard + 1) // shards,
+              transactions / patients, total_beds) for shard in range(shards)]
+    totals = dict.fromkeys(TABLES, 0)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for counts in pool.map(generate_shard, tasks):
+            for table, count in counts.items():
+                totals[table] += count
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'seed': seed,
+        'days': days,
+        'profile': PROFILE_FILE,
+        'tables': {table: {'columns': columns, 'rows': totals[table],
+                           'files': [f"{table}/{shard:04d}.copy" for shard in range(shards)]}
+                   for table, columns in TABLES.items()},
+    }
+    write_if_changed(os.path.join(output_dir, MANIFEST_FILE), json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+def load_manifest(output_dir=OUTPUT_DIR):
+    with open(os.path.join(output_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"{output_dir} was written by another version of synthetic_data.py; generate it again")
+    return manifest
+
+def load_file(database_url, table, columns, path):
+    # One connection per file, so shards of a table load concurrently.
+    # Losing the last commits on a crash is fine for a benchmark database.
+    conn = connect(database_url)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SET synchronous_commit = off")
+        copy_file(cursor, f"COPY {table} ({', '.join(columns)}) FROM STDIN", path)
+        conn.commit()
+    finally:
+        conn.close()
+
+def load_dataset(output_dir=OUTPUT_DIR, database_url=DEFAULT_DATABASE_URL, workers=4, truncate=False):
+    # Loads tables in foreign key order, each table's shards in parallel, then
+    # refreshes planner statistics. Returns seconds per table.
+    manifest = load_manifest(output_dir)
+    if truncate:
+        conn = connect(database_url)
+        try:
+            conn.cursor().execute(f"TRUNCATE {', '.join(reversed(list(TABLES)))} CASCADE")
+            conn.commit()
+        finally:
+            conn.close()
+
+    timings = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for table in TABLES:
+            entry = manifest['tables'][table]
+            started = time.perf_counter()
+            futures = [pool.submit(load_file, database_url, table, entry['columns'], os.path.join(output_dir, name))
+                       for name in entry['files']]
+            for future in futures:
+                future.result()
+            timings[table] = time.perf_counter() - started
+
+    conn = connect(database_url)
+    try:
+        conn.autocommit = True
+        cursor = conn.cursor()
+        for table in TABLES:
+            cursor.execute(f"ANALYZE {table}")
+    finally:
+        conn.close()
+    return timings
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate and bulk-load a synthetic hospital dataset shaped like the real export")
+    parser.add_argument('--export', default=EXPORT_FILE, help="Supabase export to learn distributions from")
+    parser.add_argument('--output', default=OUTPUT_DIR)
+    parser.add_argument('--patients', type=int, default=DEFAULT_PATIENTS)
+    parser.add_argument('--transactions', type=int, default=DEFAULT_TRANSACTIONS)
+    parser.add_argument('--days', type=int, default=DEFAULT_DAYS, help="days of history to spread patients over")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--load', action='store_true', help="bulk-load the generated files into Postgres")
+    parser.add_argument('--load-only', action='store_true', help="load an existing output directory without generating")
+    parser.add_argument('--database-url', default=DEFAULT_DATABASE_URL)
+    parser.add_argument('--connections', type=int, default=4, help="concurrent COPY connections when loading")
+    parser.add_argument('--truncate', action='store_true', help="empty the target tables before loading")
+    args = parser.parse_args()
+
+    if not args.load_only:
+        started = time.perf_counter()
+        manifest = generate_dataset(learn_profile(args.export), args.output, args.patients, args.transactions,
+                                    args.days, args.seed, args.workers)
+        seconds = time.perf_counter() - started
+        for table, entry in manifest['tables'].items():
+            print(f"{table}: {entry['rows']:,} rows in {len(entry['files'])} files")
+        print(f"Generated {args.output} in {seconds:.1f}s.")
+    if args.load or args.load_only:
+        timings = load_dataset(args.output, args.database_url, args.connections, args.truncate)
+        for table, seconds in timings.items():
+            print(f"Loaded {table} in {seconds:.1f}s")
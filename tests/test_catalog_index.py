@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from catalog_index import CatalogIndex, normalize_name
+from generate_services import iter_services, raw_data
+from parse_rghs import parse_rghs_line
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def rghs_names():
+    with open(os.path.join(ROOT, 'temp_rghs_list.txt'), 'r') as f:
+        parsed = (parse_rghs_line(line) for line in f)
+        return [entry[1] for entry in parsed if entry and entry[0] == 'package']
+
+def service_names():
+    return [service['name'] for service in iter_services(raw_data.strip().split('\n'))]
+
+CATALOGS = {'rghs': rghs_names, 'services': service_names}
+
+def build(names):
+    index = CatalogIndex()
+    for name in names:
+        index.add(name)
+    return index
+
+def brute_force(names, query):
+    # What searchCatalog() promises: token prefixes below three characters,
+    # substrings of the normalized name from three on
+    q = normalize_name(query)
+    if not q:
+        return []
+    normalized = [normalize_name(name) for name in names]
+    if len(q) < 3:
+        return [i for i, name in enumerate(normalized) if any(token.startswith(q) for token in name.split())]
+    return [i for i, name in enumerate(normalized) if q in name]
+
+def queries(names):
+    # Prefixes and substrings of real names, plus punctuation, case and misses
+    found = set()
+    for name in names[::7]:
+        normalized = normalize_name(name)
+        found.update(normalized[:length] for length in (1, 2, 3, 5, 8))
+        middle = len(normalized) // 2
+        found.add(normalized[middle:middle + 4])
+        found.add(normalized[middle:middle + 9])
+        found.add(name.upper())
+    found.update(['', ' ', '--', 'a', 'xq', 'zzz', 'urine  (24 hrs)', 'c.t.', 'no such service'])
+    return sorted(found)
+
+@pytest.fixture(scope='module', params=sorted(CATALOGS))
+def catalog(request):
+    names = CATALOGS[request.param]()
+    return names, build(names)
+
+def test_catalogs_are_not_empty(catalog):
+    names, _ = catalog
+    assert len(names) > 50
+
+def test_search_matches_brute_force(catalog):
+    names, index = catalog
+    for query in queries(names):
+        assert index.search(query) == brute_force(names, query), query
+
+def test_every_name_finds_itself(catalog):
+    names, index = catalog
+    for position, name in enumerate(names):
+        if normalize_name(name):
+            assert position in index.search(name), name
+
+def test_postings_are_sorted_and_positions_keep_the_first(catalog):
+    names, index = catalog
+    emitted = index.to_dict()
+    assert emitted['tokens'] == sorted(emitted['tokens'])
+    for postings in emitted['tokenPostings'] + list(emitted['trigrams'].values()):
+        assert postings == sorted(set(postings))
+    for name, position in emitted['positions'].items():
+        assert names.index(name) == position
@@ -0,0 +1,113 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from cdc_export import MANIFEST_FILE, MANIFEST_VERSION, file_sha256, replay, restore, restore_chain
+from export_stream import read_rows
+
+def row(key, version):
+    return {'id': key, 'version': version}
+
+def write_lines(output_dir, name, lines):
+    path = os.path.join(output_dir, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        for line in lines:
+            f.write(json.dumps(line) + "\n")
+    return file_sha256(path)
+
+def segment(output_dir, seq, kind, low, high, versions, keys=None):
+    # versions: (key, micros, version) as write_segment stores them
+    name = f"patients/{seq:06d}-{kind}.ndjson.gz"
+    entry = {'seq': seq, 'kind': kind, 'file': name, 'rows': len(versions), 'low_us': low, 'high_us': high,
+             'sha256': write_lines(output_dir, name, [[key, micros, row(key, v)] for key, micros, v in versions])}
+    if keys is not None:
+        keys_name = f"patients/{seq:06d}-keys.ndjson.gz"
+        entry['keys'] = {'file': keys_name, 'rows': len(keys), 'sha256': write_lines(output_dir, keys_name, keys)}
+    return entry
+
+@pytest.fixture
+def backup(tmp_path):
+    # Checkpoints at 100, 200, 300 and 400. b is deleted before 200, c
+    # between 200 and 300, and e is inserted at 260.
+    output_dir = str(tmp_path / 'backup')
+    segments = [
+        segment(output_dir, 1, 'base', None, 100, [('a', 50, 1), ('b', 60, 1), ('c', 70, 1)]),
+        segment(output_dir, 2, 'delta', 100, 200, [('a', 150, 2), ('d', 180, 1)], keys=['a', 'c', 'd']),
+        segment(output_dir, 3, 'delta', 200, 300, [('e', 260, 1)], keys=['a', 'd', 'e']),
+        segment(output_dir, 4, 'base', None, 400, [('a', 150, 2), ('d', 180, 1), ('e', 260, 1)]),
+    ]
+    manifest = {'version': MANIFEST_VERSION, 'tables': {'patients': {'segments': segments, 'high_us': 400}},
+                'checkpoints': [{'high_us': high, 'tables': {'patients': seq}}
+                                for seq, high in ((1, 100), (2, 200), (3, 300), (4, 400))]}
+    with open(os.path.join(output_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    return output_dir, manifest['tables']['patients']
+
+@pytest.mark.parametrize('target,seqs', [
+    (50, None),
+    (100, [1]),
+    (150, [1, 2]),
+    (300, [1, 2, 3]),
+    (399, [1, 2, 3]),
+    (400, [4]),
+])
+def test_restore_chain(backup, target, seqs):
+    chain = restore_chain(backup[1], target)
+    assert (chain and [s['seq'] for s in chain]) == seqs
+
+def state(output_dir, entry, target, workdir):
+    return {r['id']: r['version'] for r in replay(output_dir, restore_chain(entry, target), target, str(workdir))}
+
+def test_replay_drops_keys_missing_from_the_listing(backup, tmp_path):
+    output_dir, entry = backup
+    assert state(output_dir, entry, 100, tmp_path) == {'a': 1, 'b': 1, 'c': 1}
+    assert state(output_dir, entry, 200, tmp_path) == {'a': 2, 'c': 1, 'd': 1}
+    assert state(output_dir, entry, 300, tmp_path) == {'a': 2, 'd': 1, 'e': 1}
+
+def test_replay_between_checkpoints(backup, tmp_path):
+    output_dir, entry = backup
+    # Only the listing taken by 250 counts, so c is still alive and e, which
+    # came at 260, is not there yet
+    assert state(output_dir, entry, 250, tmp_path) == {'a': 2, 'c': 1, 'd': 1}
+    assert state(output_dir, entry, 170, tmp_path) == {'a': 2, 'b': 1, 'c': 1}
+
+def test_replay_without_listings_keeps_deleted_rows(backup, tmp_path):
+    output_dir, entry = backup
+    for s in entry['segments']:
+        s.pop('keys', None)
+    assert state(output_dir, entry, 300, tmp_path) == {'a': 2, 'b': 1, 'c': 1, 'd': 1, 'e': 1}
+
+def test_replay_checks_checksums(backup, tmp_path):
+    output_dir, entry = backup
+    entry['segments'][1]['sha256'] = '0' * 64
+    with pytest.raises(ValueError, match='checksum'):
+        state(output_dir, entry, 300, tmp_path)
+
+def test_restore_writes_a_split_export(backup, tmp_path):
+    output_dir, _ = backup
+    restore_dir = str(tmp_path / 'restore')
+    messages = []
+    index = restore(output_dir, 300, restore_dir, log=messages.append)
+    assert index['tables']['patients']['rows'] == 3
+    assert [r['id'] for r in read_rows('patients', output_dir=restore_dir)] == ['a', 'd', 'e']
+    assert messages == ['patients: 3 rows from 3 segments']
+
+    index = restore(output_dir, None, restore_dir, log=messages.append)
+    assert index['tables']['patients']['rows'] == 3
+    assert messages[-1] == 'patients: 3 rows from 1 segments'
+
+def test_restore_warns_without_a_listing(backup, tmp_path):
+    output_dir, _ = backup
+    path = os.path.join(output_dir, MANIFEST_FILE)
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    for s in manifest['tables']['patients']['segments']:
+        s.pop('keys', None)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    messages = []
+    restore(output_dir, 300, str(tmp_path / 'restore'), log=messages.append)
+    assert messages[0].startswith('patients: warning, no key listing since the base')
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+
+import codemod_rules as rules
+from codemod import RULES, apply_rules, resolve_rules, run
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+OLD_DASHBOARD = f"""import React from 'react';
+{rules.HOSPITAL_IMPORT}
+
+export const EnhancedDashboard = () => {{
+{rules.OLD_FUNCTION_START}
+    const all: any[] = [];
+    let from = 0;
+    while (true) {{
+      const {{ data }} = await supabase.from('patient_refunds').select('*').range(from, from + 999);
+      if (!data?.length) break;
+      all.push(...data);
+      from += 1000;
+    }}
+    return all;
+  }};
+  return null;
+}};
+"""
+
+OLD_APP = f"""import React from 'react';
+{rules.EMAIL_IMPORT}
+
+const backup = async () => {{
+{rules.OLD_BACKUP}
+}};
+
+const exportAll = async () => {{
+{rules.OLD_EXPORT}
+}};
+"""
+
+SENTINEL = """const load = async () => {
+  // Use ExactDateService to get all refunds (wide date range)
+  const refunds = await ExactDateService.getPatientRefunds('2000-01-01', '2100-12-31');
+  const recent = await ExactDateService.getPatientRefunds('2024-01-01', '2024-12-31');
+  return [refunds, recent];
+};
+"""
+
+def migrate(content, path):
+    names = [name for name in resolve_rules(['migration']) if RULES[name].targets(path)]
+    content, applied, _, over_budget = apply_rules(content, [RULES[name] for name in names])
+    assert over_budget == []
+    return content, applied
+
+@pytest.mark.parametrize('path,content', [
+    (rules.DASHBOARD, OLD_DASHBOARD),
+    (rules.APP, OLD_APP),
+    ('components/Refunds.tsx', SENTINEL),
+])
+def test_migration_is_idempotent(path, content):
+    once, applied = migrate(content, path)
+    assert applied
+    assert migrate(once, path) == (once, [])
+
+def test_dashboard_migration():
+    content, applied = migrate(OLD_DASHBOARD, rules.DASHBOARD)
+    assert applied == ['dashboard-fetch-all-refunds', 'dashboard-exact-date-import', 'paginate-sentinel-refunds']
+    assert "import { ExactDateService } from '../services/exactDateService';" in content
+    assert 'supabase' not in content
+    assert 'for await (const page of ExactDateService.iteratePatientRefunds())' in content
+
+def test_dashboard_import_needs_a_call():
+    content = f"{rules.HOSPITAL_IMPORT}\nconst x = HospitalService.getPatients();\n"
+    assert migrate(content, rules.DASHBOARD) == (content, [])
+
+def test_only_sentinel_ranges_are_paged():
+    content, applied = migrate(SENTINEL, 'components/Refunds.tsx')
+    assert applied == ['paginate-sentinel-refunds']
+    assert rules.PAGED_COMMENT in content
+    assert "getPatientRefunds('2024-01-01', '2024-12-31')" in content
+    assert 'getPatientRefunds(\'2000-01-01\'' not in content
+
+def test_source_tree_needs_no_edits():
+    results = run(['migration'], os.path.join(ROOT, 'src'), workers=1, dry_run=True)
+    assert results
+    assert [result['path'] for result in results if result['diff']] == []
@@ -0,0 +1,96 @@
+import csv
+import os
+import random
+from operator import itemgetter
+
+import pytest
+
+from ledger_reconcile import (Source, external_sort, load_standin, merge_groups, reconcile, refund_in_range,
+                              synthetic_source, verify)
+
+def read_csv(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+def test_merge_groups():
+    patients = [('a', 'P1'), ('c', 'P3'), ('c', 'P3 again')]
+    transactions = [('a', 't1'), ('a', 't2'), ('b', 't3')]
+    refunds = [('c', 'r1'), ('d', 'r2')]
+    assert list(merge_groups(iter(patients), iter(transactions), iter(refunds))) == [
+        ('a', [('a', 'P1')], [[('a', 't1'), ('a', 't2')], []]),
+        ('b', [], [[('b', 't3')], []]),
+        ('c', [('c', 'P3'), ('c', 'P3 again')], [[], [('c', 'r1')]]),
+        ('d', [], [[], [('d', 'r2')]]),
+    ]
+
+def test_external_sort_spills_and_merges(tmp_path):
+    draw = random.Random(0)
+    rows = [(f"p{draw.randrange(500):03d}", i) for i in range(2000)]
+    merged = list(external_sort(iter(rows), itemgetter(0), str(tmp_path), run_rows=300))
+    assert len(os.listdir(tmp_path)) == 7
+    # Stable within a key, like a single sort
+    assert merged == sorted(rows, key=itemgetter(0))
+
+@pytest.mark.parametrize('created_at,inside', [
+    ('2024-03-01T00:00:00+00:00', True),
+    ('2024-03-31T00:00:00+00:00', True),
+    ('2024-03-31T00:00:00.000000', True),
+    ('2024-03-31T09:30:00+00:00', False),
+    ('2024-02-29T23:59:59+00:00', False),
+])
+def test_refund_range_matches_the_route(created_at, inside):
+    assert refund_in_range(created_at, '2024-03-01', '2024-03-31') is inside
+
+def small_source():
+    # (id, patient_code, date_of_entry, name)
+    patients = [('p1', 'P1', '2024-03-01', 'Patient 1'), ('p2', 'P2', '2024-03-02', 'Patient 2'),
+                ('p3', 'P3', '2024-03-05', 'Patient 3'), ('p3', 'P3B', '2024-03-05', 'Patient 3')]
+    # (patient_id, id, amount, status, transaction_date, created_at)
+    transactions = [
+        ('p1', 't1', 500.0, 'COMPLETED', '2024-03-01', '2024-03-01T10:00:00'),
+        ('p1', 't2', 300.0, 'CANCELLED', '2024-03-02', '2024-03-02T10:00:00'),
+        ('p2', 't3', 200.0, 'COMPLETED', '2024-03-02', '2024-03-20T10:00:00'),
+        ('p2', 't4', 100.0, 'COMPLETED', None, '2024-03-03T10:00:00'),
+        ('zz', 't5', 50.0, 'COMPLETED', '2024-03-04', '2024-03-04T10:00:00'),
+        ('p1', 't6', 900.0, 'COMPLETED', '2024-04-10', '2024-04-10T10:00:00'),
+    ]
+    # (patient_id, id, amount, created_at)
+    refunds = [('p1', 'r1', 100.0, '2024-03-02T12:00:00'), ('p2', 'r2', 400.0, '2024-03-03T12:00:00'),
+               ('yy', 'r3', 20.0, '2024-03-04T12:00:00')]
+    return Source({'patients': lambda: iter(patients), 'patient_transactions': lambda: iter(transactions),
+                   'patient_refunds': lambda: iter(refunds)})
+
+def test_reconcile(tmp_path):
+    output_dir = str(tmp_path / 'out')
+    reconciliation = reconcile(small_source(), output_dir, start='2024-03-01', end='2024-03-31')
+    summary = reconciliation.summary()
+    assert summary['transactions'] == 5
+    assert summary['refunds'] == 3
+    assert summary['revenue'] == 850.0
+    assert summary['refunded'] == 520.0
+    assert summary['mismatches'] == {'date_drift': 1, 'duplicate_patient_id': 1, 'ledger_date_differs': 1,
+                                     'orphan_refund': 1, 'orphan_transaction': 1, 'over_refund': 2}
+
+    balances = {row['patient']: (row['charged'], row['refunded'], row['first_day'], row['last_day'])
+                for row in read_csv(os.path.join(output_dir, 'patients.csv'))}
+    assert balances == {
+        'p1': ('500.00', '100.00', '2024-03-01', '2024-03-01'),
+        'p2': ('300.00', '400.00', '2024-03-02', '2024-03-02'),
+        'yy': ('0.00', '20.00', '2024-03-04', '2024-03-04'),
+        'zz': ('50.00', '0.00', '2024-03-04', '2024-03-04'),
+    }
+    mismatches = read_csv(os.path.join(output_dir, 'mismatches.csv'))
+    assert {(row['kind'], row['id']) for row in mismatches} == {
+        ('date_drift', 't3'), ('duplicate_patient_id', 'p3'), ('ledger_date_differs', 't4'),
+        ('orphan_refund', 'r3'), ('orphan_transaction', 't5'), ('over_refund', 'p2'), ('over_refund', 'yy')}
+    # Undated transactions and refunds land on the patient's entry day, else their own
+    daily = {row['day']: (row['revenue'], row['refunds']) for row in read_csv(os.path.join(output_dir, 'daily.csv'))}
+    assert daily == {'2024-03-01': ('500.00', '100.00'), '2024-03-02': ('300.00', '400.00'),
+                     '2024-03-04': ('50.00', '20.00')}
+
+@pytest.mark.parametrize('start,end', [(None, None), ('2024-03-01', '2024-06-15')])
+def test_engine_matches_the_routes_sql(tmp_path, start, end):
+    source = synthetic_source(300)
+    reconciliation = reconcile(source, str(tmp_path / 'out'), start=start, end=end)
+    assert reconciliation.transactions > 0 and reconciliation.refunds > 0
+    assert verify(reconciliation, load_standin(source)) == []
@@ -0,0 +1,137 @@
+import os
+
+import pytest
+
+from migration_runner import analyze, checksum, classify, dependencies, execution_order, load_script, split_statements, waves
+
+@pytest.fixture
+def make(tmp_path):
+    def make(name, sql):
+        path = os.path.join(tmp_path, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(sql)
+        return load_script(path, name)
+    return make
+
+def facts(sql):
+    statements, _, _ = split_statements(sql)
+    return analyze(statements)
+
+def names(scripts):
+    return [script['name'] for script in scripts]
+
+def test_analyze_objects():
+    creates, writes, reads, destructive, data_changes, comments_only, transactional, dynamic = facts("""
+        CREATE TABLE IF NOT EXISTS public.refunds (id uuid PRIMARY KEY, patient_id uuid REFERENCES patients(id));
+        CREATE INDEX IF NOT EXISTS idx_refunds_patient ON refunds(patient_id);
+        UPDATE refunds SET patient_id = NULL WHERE false;
+        -- DROP TABLE patients; in a comment
+        INSERT INTO audit_log SELECT * FROM "Legacy Refunds";
+    """)
+    assert creates == {'refunds', 'idx_refunds_patient'}
+    assert writes == {'refunds', 'idx_refunds_patient', 'audit_log'}
+    assert reads == {'patients', 'Legacy Refunds'}
+    # Backfilling a table the script creates is part of the schema change
+    assert (destructive, data_changes, comments_only, transactional, dynamic) == ([], [], False, True, False)
+
+def test_analyze_function_bodies_only_read():
+    creates, writes, reads, destructive, data_changes, _, _, dynamic = facts("""
+        CREATE OR REPLACE FUNCTION purge_refunds() RETURNS void AS $$
+        BEGIN
+          DELETE FROM patient_refunds WHERE amount = 0;
+          EXECUTE 'DROP TABLE ' || 'x';
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    assert creates == writes == {'purge_refunds'}
+    assert reads == {'patient_refunds'}
+    assert (destructive, data_changes, dynamic) == ([], [], False)
+
+@pytest.mark.parametrize('sql,kind', [
+    ("CREATE TABLE beds (id int);", 'migration'),
+    ("DELETE FROM beds WHERE id < 0;", 'destructive'),
+    ("DROP TABLE IF EXISTS beds;", 'destructive'),
+    ("UPDATE beds SET id = id + 1;", 'data'),
+    ("COMMENT ON TABLE beds IS 'reload';", 'check'),
+    ("SELECT COUNT(*) FROM beds;", 'check'),
+])
+def test_kinds(make, sql, kind):
+    assert make('script.sql', sql)['kind'] == kind
+
+def test_transactional_and_dynamic(make):
+    concurrent = make('index.sql', "CREATE INDEX CONCURRENTLY idx_beds ON beds(id);")
+    assert not concurrent['transactional']
+    assert make('dynamic.sql', "DO $$ BEGIN EXECUTE 'SELECT 1'; END $$;")['dynamic']
+
+def test_creator_runs_before_users(make):
+    scripts = [
+        make('ADD_REFUND_REASON.sql', "ALTER TABLE patient_refunds ADD COLUMN reason text;"),
+        make('CREATE_INDEXES.sql', "CREATE INDEX idx_refunds_reason ON patient_refunds(reason);"),
+        make('CREATE_REFUNDS.sql', "CREATE TABLE patient_refunds (id uuid, amount numeric);"),
+        make('CREATE_BEDS.sql', "CREATE TABLE beds (id uuid);"),
+    ]
+    assert names(execution_order(scripts)) == [
+        'CREATE_REFUNDS.sql', 'ADD_REFUND_REASON.sql', 'CREATE_INDEXES.sql', 'CREATE_BEDS.sql']
+
+def test_cycle_releases_earliest_listed(make):
+    scripts = [
+        make('a.sql', "CREATE TABLE a (id int REFERENCES b(id));"),
+        make('b.sql', "CREATE TABLE b (id int); CREATE VIEW b_view AS SELECT * FROM a;"),
+        make('c.sql', "CREATE TABLE c (id int);"),
+    ]
+    # Ready scripts go first; only then is the a <-> b cycle broken, at a
+    assert names(execution_order(scripts)) == ['c.sql', 'a.sql', 'b.sql']
+    assert names(execution_order(scripts[1::-1] + scripts[2:])) == ['c.sql', 'b.sql', 'a.sql']
+
+def test_dynamic_scripts_keep_their_place(make):
+    scripts = [
+        make('fix.sql', "DO $$ BEGIN EXECUTE 'ALTER TABLE t ADD COLUMN x int'; END $$;"),
+        make('create.sql', "CREATE TABLE t (id int);"),
+    ]
+    assert names(execution_order(scripts)) == ['fix.sql', 'create.sql']
+
+def test_dependencies(make):
+    ordered = [
+        make('1_patients.sql', "CREATE TABLE patients (id uuid);"),
+        make('2_beds.sql', "CREATE TABLE beds (id uuid);"),
+        make('3_report.sql', "CREATE VIEW patient_report AS SELECT * FROM patients;"),
+        make('4_alter.sql', "ALTER TABLE patients ADD COLUMN tag text;"),
+        make('5_dynamic.sql', "DO $$ BEGIN EXECUTE 'SELECT 1'; END $$;"),
+        make('6_after.sql', "CREATE TABLE notes (id uuid);"),
+    ]
+    deps = dependencies(ordered)
+    assert deps == {
+        '1_patients.sql': set(),
+        '2_beds.sql': set(),
+        '3_report.sql': {'1_patients.sql'},
+        # A writer waits for the readers since the last writer
+        '4_alter.sql': {'1_patients.sql', '3_report.sql'},
+        '5_dynamic.sql': {'1_patients.sql', '2_beds.sql', '3_report.sql', '4_alter.sql'},
+        '6_after.sql': {'5_dynamic.sql'},
+    }
+    assert waves(ordered, deps) == [['1_patients.sql', '2_beds.sql'], ['3_report.sql'], ['4_alter.sql'],
+                                    ['5_dynamic.sql'], ['6_after.sql']]
+
+def test_classify(make):
+    scripts = [
+        make('applied.sql', "CREATE TABLE a (id int);"),
+        make('edited.sql', "CREATE TABLE b (id int, note text);"),
+        make('moved.sql', "CREATE TABLE c (id int);"),
+        make('new.sql', "CREATE TABLE d (id int);"),
+    ]
+    moved = make('old_name.sql', "CREATE TABLE c (id int);")
+    ledger = {
+        'applied.sql': scripts[0]['checksum'],
+        'edited.sql': make('edited_before.sql', "CREATE TABLE b (id int);")['checksum'],
+        'old_name.sql': moved['checksum'],
+    }
+    assert classify(scripts, ledger) == {
+        'applied.sql': 'applied',
+        'edited.sql': 'changed',
+        'moved.sql': 'renamed',
+        'new.sql': 'pending',
+    }
+
+def test_checksum_ignores_line_endings():
+    assert checksum("CREATE TABLE a (id int);\r\n") == checksum("CREATE TABLE a (id int);\n")
+    assert checksum("CREATE TABLE a (id int);\n") != checksum("CREATE TABLE a (id bigint);\n")
@@ -0,0 +1,115 @@
+import os
+
+import pytest
+
+from query_advisor import QueryExtractor, extract_queries, relations, render, static_findings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVER = """
+app.get('/api/patients', authenticateToken, async (req, res) => {
+  const { search, limit } = req.query;
+  let query = 'SELECT * FROM patients p WHERE p.hospital_id = $1';
+  const params = [HOSPITAL_ID];
+  let paramCount = 2;
+  if (search) {
+    query += ` AND p.first_name ILIKE $${paramCount}`;
+    params.push(`%${search}%`);
+    paramCount++;
+  } else if (req.query.tag) {
+    query += ` AND p.patient_tag = $${paramCount}`;
+    paramCount++;
+  } else {
+    query += ' AND p.is_active = true';
+  }
+  query += ' ORDER BY p.created_at DESC';
+  if (limit) {
+    query += ` LIMIT $${paramCount}`;
+  }
+  const result = await pool.query(query, params);
+  res.json(result.rows);
+});
+
+app.post('/api/beds', authenticateToken, async (req, res) => {
+  const client = await pool.connect();
+  await client.query('BEGIN');
+  await client.query(
+    'INSERT INTO beds (bed_number, status) ' +
+    'VALUES ($1, $2) RETURNING *',
+    [req.body.bed_number, 'available']
+  );
+  await client.query(`UPDATE beds SET status = '${req.body.status}' WHERE id = $1`, [req.body.id]);
+  await client.query(buildQuery(req), []);
+  await client.query('COMMIT');
+});
+"""
+
+@pytest.fixture(scope='module')
+def queries():
+    return list(QueryExtractor(SERVER, 'server.js').queries())
+
+def test_builder_variants(queries):
+    variants = {q['variant']: q for q in queries if q['route'] == 'GET /api/patients'}
+    assert sorted(variants) == ['base', 'full']
+    # The base variant has only the unconditional appends
+    assert variants['base']['sql'] == \
+        'SELECT * FROM patients p WHERE p.hospital_id = $1 ORDER BY p.created_at DESC'
+    # The full one takes every append except the else/else if alternatives
+    assert variants['full']['sql'] == ('SELECT * FROM patients p WHERE p.hospital_id = $1 '
+                                       'AND p.first_name ILIKE $2 ORDER BY p.created_at DESC LIMIT $3')
+    assert variants['full']['id'] == f"{variants['full']['line']}:full"
+    assert not variants['full']['writes']
+
+def test_literals_and_skips(queries):
+    beds = [q for q in queries if q['route'] == 'POST /api/beds']
+    assert [(q.get('variant'), q.get('sql'), q.get('skipped')) for q in beds] == [
+        ('static', 'INSERT INTO beds (bed_number, status) VALUES ($1, $2) RETURNING *', None),
+        ('static', None, 'interpolates values into the SQL text'),
+        (None, None, 'query text is not a literal'),
+    ]
+    assert beds[0]['writes']
+    assert beds[0]['line'] == SERVER[:SERVER.index("client.query(\n")].count('\n') + 1
+
+def test_unfollowable_variable():
+    source = "app.get('/x', async () => { await pool.query(makeSql(), []); const q = sql; await pool.query(q); });"
+    assert [q['skipped'] for q in QueryExtractor(source).queries()] == [
+        'query text is not a literal', 'cannot follow how `q` is built']
+
+@pytest.mark.parametrize('pieces,sql', [
+    (['SELECT 1'], 'SELECT 1'),
+    # Dynamic `$${n}` placeholders are numbered after the literal ones
+    (['SELECT * FROM t WHERE a = $1 AND b = $', ('expr', 'paramCount'), ' AND c = $', ('expr', 'i')],
+     'SELECT * FROM t WHERE a = $1 AND b = $2 AND c = $3'),
+    (['SELECT * FROM t WHERE a = $2 AND b = $', ('expr', 'n'), '\n  AND c = $1'],
+     'SELECT * FROM t WHERE a = $2 AND b = $3 AND c = $1'),
+    (['SELECT * FROM ', ('expr', 'table')], None),
+])
+def test_render(pieces, sql):
+    assert render(pieces) == sql
+
+def test_relations_and_static_findings():
+    sql = "SELECT * FROM patients p JOIN patient_transactions AS t ON t.patient_id = p.id WHERE DATE(t.created_at) = $1 ORDER BY t.created_at"
+    assert relations(sql) == {'patients': 'patients', 'p': 'patients',
+                              'patient_transactions': 'patient_transactions', 't': 'patient_transactions'}
+    assert [f['kind'] for f in static_findings({'sql': sql})] == ['unbounded_order_by', 'function_on_column']
+    assert static_findings({'sql': "SELECT * FROM patients WHERE first_name ILIKE '%a' LIMIT 5"}) == [
+        {'kind': 'leading_wildcard'}]
+
+def test_server_queries_are_read():
+    queries = extract_queries(os.path.join(ROOT, 'backend', 'server.js'))
+    assert len(queries) > 50
+    stats = [q for q in queries if q['route'] == 'GET /api/dashboard/stats']
+    assert len(stats) == 1 and stats[0]['sql'].startswith('WITH bounds AS (')
+    assert sum('skipped' in q for q in queries) < len(queries) / 5
+
+def test_top_level_constants_are_inlined():
+    source = """const RECENT = `recent AS (SELECT * FROM beds WHERE id > $1)`;
+app.get('/x', async (req, res) => {
+  const table = 'beds';
+  await pool.query(`WITH ${RECENT} SELECT * FROM recent`, [1]);
+  await pool.query(`SELECT * FROM ${table}`);
+});"""
+    assert [(q.get('sql'), q.get('skipped')) for q in QueryExtractor(source).queries()] == [
+        ('WITH recent AS (SELECT * FROM beds WHERE id > $1) SELECT * FROM recent', None),
+        (None, 'interpolates values into the SQL text'),
+    ]
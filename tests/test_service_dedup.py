@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from generate_services import iter_services, raw_data, with_codes
+from ingest_tariffs import merge_results
+from service_dedup import ServiceDeduper, canonical_key
+from service_ids import ServiceIdRegistry
+
+@pytest.mark.parametrize('names', [
+    ['24 Hrs. Urine Albumin', '24 Hrs Urinary Albumin', '135:24HRS urine albumin', '24 hours urine albumin'],
+    ['HIV 1 & 2 Antibody', 'HIV 1/2 Antibody', 'hiv-1 2 antibody'],
+    ['Vitamin B12', 'VITAMIN B 012'],
+])
+def test_spelling_variants_share_a_key(names):
+    assert len({canonical_key(name) for name in names}) == 1
+
+@pytest.mark.parametrize('a,b', [
+    ('Gram Stain (CSF)', 'CSF GRAM STAIN'),
+    ('Ure Test', 'Urine Test'),
+    ('24 Hrs Urine Albumin', '24 Hrs Urine Albumin Creatinine Ratio'),
+])
+def test_different_names_stay_apart(a, b):
+    assert canonical_key(a) != canonical_key(b)
+
+def test_only_same_price_is_merged():
+    deduper = ServiceDeduper()
+    kept = [deduper.add(name, price) for name, price in [
+        ('24 Hrs Urinary Albumin', 210),
+        ('24 Hrs. Urine Albumin', 400),
+        ('24 HRS urine albumin', 210),
+        ('24 hrs urine albumin', 400),
+        ('Gram Stain (CSF)', 160),
+        ('CSF GRAM STAIN', 130),
+    ]]
+    assert kept == [True, True, False, False, True, True]
+
+    report = deduper.report()
+    assert report['merged'] == 2
+    assert report['price_conflicts'] == 1
+    assert report['review'] == [{'key': '24 hrs urine albumin', 'rows': [
+        {'name': '24 Hrs Urinary Albumin', 'price': 210},
+        {'name': '24 Hrs. Urine Albumin', 'price': 400},
+    ]}]
+    assert [m['into'] for m in report['merges'][0]['merged']] == ['24 Hrs Urinary Albumin', '24 Hrs. Urine Albumin']
+
+def test_catalog_keeps_every_price(tmp_path):
+    registry = ServiceIdRegistry(os.path.join(tmp_path, 'ids.json'))
+    services = list(with_codes(iter_services(raw_data.strip().split('\n')), registry))
+    codes = [service['code'] for service in services]
+    assert len(codes) == len(set(codes))
+
+    prices = {}
+    for service in services:
+        prices.setdefault(canonical_key(service['name']), set()).add(service['defaultPrice'])
+    assert prices[canonical_key('24 Hrs Urine Albumin')] == {210, 400}
+    assert prices[canonical_key('24 Hrs Urine Magnesium')] == {630, 320}
+    assert prices[canonical_key('Gram Stain (CSF)')] == {160}
+    assert prices[canonical_key('CSF Gram Stain')] == {130}
+
+def test_ingest_keeps_conflicting_rates(tmp_path):
+    def record(name, rates, source):
+        return {'family': 'LAB', 'name': name, 'category': 'LAB_TEST', 'rates': rates, 'source': source,
+                'key': canonical_key(name), 'id_key': name.lower()}
+
+    results = [(('lab', 'a.tsv', 0, 0), [record('24 Hrs Urine Magnesium', [630], 'a.tsv')], None),
+               (('lab', 'b.tsv', 0, 0), [record('24 Hrs Urine Magnesium', [320], 'b.tsv'),
+                                         record('24 HRS Urine Magnesium', [630], 'b.tsv')], None)]
+    services, stats = merge_results(results, ServiceIdRegistry(os.path.join(tmp_path, 'ids.json')))
+    assert [(s['code'], s['rates'], s['sources']) for s in services] == [
+        ('LAB-001', [630], ['a.tsv', 'b.tsv']),
+        ('LAB-002', [320], ['b.tsv']),
+    ]
+    assert stats == {'parsed': 3, 'duplicates': 1, 'rate_conflicts': 1}
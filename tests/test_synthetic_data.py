@@ -0,0 +1,64 @@
+import glob
+import json
+import os
+
+import pytest
+
+from synthetic_data import generate_dataset, learn_profile
+
+# Identifying text in the export; none of it may reach the profile or the rows
+PRIVATE = ['Zorawar', 'Quintessa', '14 Marker Lane', 'Referred by Dr. Kestrel', 'DR. FALCONER', 'VIP-ZETA',
+           '9876501234', 'Stitches for Zorawar', 'zorawar@example.com']
+
+def export(path):
+    patients = [{
+        'id': f"p{i}", 'patient_id': f"P{i:04d}", 'prefix': 'Mr' if i % 2 else 'Mrs',
+        'first_name': 'Zorawar' if i % 2 else 'Quintessa', 'last_name': 'Quintessa', 'age': 30 + i % 40,
+        'gender': 'MALE' if i % 2 else 'FEMALE', 'phone': '9876501234', 'email': 'zorawar@example.com',
+        'address': '14 Marker Lane', 'has_reference': i % 3 == 0,
+        'reference_details': 'Referred by Dr. Kestrel' if i % 3 == 0 else None,
+        'assigned_department': 'ORTHOPAEDIC', 'assigned_doctor': 'DR. FALCONER', 'patient_tag': 'VIP-ZETA',
+        'date_of_entry': f"2025-03-{1 + i % 28:02d}", 'ipd_status': 'OPD',
+        'hospital_id': '550e8400-e29b-41d4-a716-446655440000', 'created_at': f"2025-03-{1 + i % 28:02d}T09:00:00+00:00",
+    } for i in range(40)]
+    transactions = [{
+        'id': f"t{i}", 'patient_id': f"p{i % 40}", 'transaction_type': 'PROCEDURE' if i % 4 else 'CONSULTATION',
+        'amount': -200 if i % 25 == 0 else 500 + 100 * (i % 3), 'payment_mode': 'CASH', 'status': 'COMPLETED',
+        'description': 'Stitches for Zorawar', 'doctor_name': 'DR. FALCONER', 'transaction_date': f"2025-03-{1 + i % 28:02d}",
+        'created_at': f"2025-03-{1 + i % 28:02d}T10:00:00+00:00",
+    } for i in range(120)]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'patients': patients, 'patient_transactions': transactions, 'beds': []}, f)
+
+@pytest.fixture(scope='module')
+def profile(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('export') / 'export.json')
+    export(path)
+    return learn_profile(path)
+
+def leaks(text):
+    return [value for value in PRIVATE if value.lower() in text.lower()]
+
+def test_profile_holds_counts_and_labels_only(profile):
+    assert leaks(json.dumps(profile)) == []
+    assert profile['patients'] == 40 and profile['transactions'] == 120
+    assert profile['address'] == [['Locality 1', 40]]
+    assert profile['doctor'] == [[['ORTHOPAEDIC', 'DR. DOCTOR 1'], 40]]
+
+def test_generated_rows_carry_no_export_text(profile, tmp_path):
+    manifest = generate_dataset(profile, str(tmp_path), patients=300, transactions=1500, days=30, workers=1)
+    assert manifest['tables']['patients']['rows'] == 300
+    copied = ''
+    for path in sorted(glob.glob(os.path.join(str(tmp_path), '*', '*.copy'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            copied += f.read()
+    assert 'Locality 1' in copied and 'DR. DOCTOR 1' in copied
+    assert leaks(copied) == []
+
+def test_generation_is_deterministic(profile, tmp_path):
+    outputs = []
+    for run in ('a', 'b'):
+        generate_dataset(profile, str(tmp_path / run), patients=100, transactions=400, days=30, seed=7, workers=1)
+        with open(os.path.join(str(tmp_path / run), 'patients', '0000.copy'), 'r', encoding='utf-8') as f:
+            outputs.append(f.read())
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,66 @@
+import glob
+import os
+
+import pytest
+
+from ts_lexer import SourceIndex, index_for_path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Unused components that are not valid TypeScript; each must be reported once,
+# at the real mistake, as (error, line)
+BROKEN = {
+    # `const newFormHTML = \`` is never closed
+    'src/components/FlexiblePatientEntry.tsx': [("unclosed '`'", 292)],
+    # the ipdServices array is missing its ']'
+    'src/components/billing/IPDBillingModule.tsx': [("unclosed '['", 57)],
+}
+
+def read(path):
+    with open(os.path.join(ROOT, path), 'r', encoding='utf-8') as f:
+        return f.read()
+
+def sources():
+    paths = glob.glob(os.path.join(ROOT, 'src', '**', '*.ts'), recursive=True)
+    paths += glob.glob(os.path.join(ROOT, 'src', '**', '*.tsx'), recursive=True)
+    return sorted(os.path.relpath(path, ROOT).replace(os.sep, '/') for path in paths)
+
+def located(source, errors):
+    # "unclosed '[' at offset 2177" -> ("unclosed '['", 57)
+    result = []
+    for error in errors:
+        message, offset = error.rsplit(' at offset ', 1)
+        result.append((message, source.count('\n', 0, int(offset)) + 1))
+    return result
+
+def kinds(source, jsx=True):
+    index = SourceIndex(source, jsx)
+    assert index.errors == []
+    return [(kind, source[start:end]) for kind, start, end, _ in index.tokens if kind in ('regex', 'jsx', 'template')]
+
+@pytest.mark.parametrize('path', sources())
+def test_source_tree_lexes(path):
+    source = read(path)
+    assert located(source, index_for_path(path, source).errors) == BROKEN.get(path, [])
+
+def test_regex_after_condition_and_block():
+    assert kinds("if (ok) /x{/.test(s);") == [('regex', '/x{/')]
+    assert kinds("function f() {}\n/re{/.test(x);") == [('regex', '/re{/')]
+    assert kinds("const a = { x } / 2 / c; const d = b[0] / 2;") == []
+    assert kinds("const r = /[/{]+/g;") == [('regex', '/[/{]+/g')]
+
+def test_jsx_type_arguments():
+    assert kinds('const el = <Select<string> value="a" />;') == [('jsx', '/>')]
+    assert kinds('const el = <A<(x: number) => void> f={g}>t</A>;') == [('jsx', 't'), ('jsx', '</A>')]
+    assert kinds("const [s, set] = useState<string>('');") == []
+
+def test_jsx_text_and_templates():
+    assert kinds("const el = <p>Don't {x} > y } ok</p>;") == [('jsx', "Don't "), ('jsx', ' > y } ok'), ('jsx', '</p>')]
+    assert kinds("const t = `a ${b ? `${c}%` : `x${d}`} z`;") == [
+        ('template', 'a '), ('template', '%'), ('template', 'x'), ('template', ' z')]
+    assert kinds("const x = <Foo>y;", jsx=False) == []
+
+def test_one_error_per_mistake():
+    assert SourceIndex("const a = [1, 2;\nfunction g() { return (x); }").errors == ["unclosed '[' at offset 10"]
+    assert SourceIndex("function f() { const t = `a ${b}; }").errors == ["unclosed '`' at offset 25"]
+    assert SourceIndex("x = (a]\ny();").errors == ["unmatched ']' at offset 6", "unclosed '(' at offset 4"]
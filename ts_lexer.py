@@ -0,0 +1,431 @@
+import hashlib
+import re
+
+# Bump whenever tokens or the brace table change shape, so cached indexes
+# built by an older lexer are not reused
+LEXER_VERSION = 2
+
+# Indexes kept per process, keyed by content hash. Codemod rules that each
+# look up spans in the same file share one lex; once a rule rewrites the file
+# the new content hashes differently and is lexed again.
+CACHE_SIZE = 64
+_cache = {}
+
+CODE_TOKEN = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))
+  | (?P<string>'(?:[^'\\\n]|\\[\s\S])*'?|"(?:[^"\\\n]|\\[\s\S])*"?)
+  | (?P<ident>(?:[^\W\d]|\$)[\w$]*)
+  | (?P<number>\d[\w.]*|\.\d\w*)
+  | (?P<punct>=>|\.\.\.|\?\.|[^\s\w])
+""", re.VERBOSE)
+
+REGEX_LITERAL = re.compile(r"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*")
+# Template text up to the closing backtick or the next ${
+TEMPLATE_TEXT = re.compile(r"(?:[^`\\$]|\\[\s\S]|\$(?!\{))*")
+
+JSX_START = re.compile(r"<(?:[A-Za-z_$]|>)")
+# `<T,>(` and `<T extends X>(` open a generic arrow function, not an element
+GENERIC_ARROW = re.compile(r"<\s*[A-Za-z_$][\w$]*\s*(?:,|extends\b|=)")
+JSX_TAG_NAME = re.compile(r"[\w$.:-]*")
+JSX_TAG_PART = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<string>"[^"]*"?|'[^']*'?)
+  | (?P<self_close>/>)
+  | (?P<end>>)
+  | (?P<open>\{)
+  | (?P<name>[^\s=/>{}"']+|=)
+""", re.VERBOSE)
+JSX_TEXT = re.compile(r"[^<{]*")
+JSX_CLOSE_TAG = re.compile(r"</[^>]*>?")
+
+# After these a '/' starts a regex and a '<' starts JSX; after an identifier,
+# number or closing bracket they are operators
+EXPRESSION_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+                       'throw', 'case', 'do', 'else', 'yield', 'await'}
+
+CLOSERS = {')': '(', ']': '[', '}': '{'}
+# A '/' or '<' after the ')' of `if (...)` starts an operand, as it does at
+# the start of a statement after a block's '}'
+CONDITION_KEYWORDS = {'if', 'while', 'for', 'with'}
+BLOCK_KEYWORDS = {'else', 'try', 'finally', 'do'}
+BLOCK_CONTINUATIONS = {'else', 'catch', 'finally', 'while', 'as', 'satisfies'}
+
+def content_hash(content):
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+# Tokens are (kind, start, end, depth) tuples; depth counts the brackets,
+# template ${} and JSX elements enclosing the token. Comments and whitespace
+# are dropped, and JSX text is one 'jsx' token per run.
+class SourceIndex:
+    def __init__(self, source, jsx=True):
+        self.source = source
+        self.jsx = jsx
+        self.tokens = []
+        # open position -> close position for every (), [], {} and ${}
+        self.closing = {}
+        # close positions of conditions and blocks, which end no operand
+        self.statement_closes = set()
+        self.errors = []
+        self._lex()
+
+    def text(self, i):
+        _, start, end, _ = self.tokens[i]
+        return self.source[start:end]
+
+    def _expression_expected(self):
+        # True when the next token starts an operand, not an operator
+        if not self.tokens:
+            return True
+        kind, start, end, _ = self.tokens[-1]
+        if kind == 'ident':
+            return self.source[start:end] in EXPRESSION_KEYWORDS
+        if kind in ('number', 'string', 'regex', 'template', 'jsx'):
+            return False
+        text = self.source[start:end]
+        if text in (')', '}'):
+            return start in self.statement_closes
+        return text != ']'
+
+    def _opens_statement(self, char):
+        # The '(' after `if` and friends, or a '{' that opens a block rather
+        # than an object literal
+        if not self.tokens:
+            return char == '{'
+        kind, start, end, _ = self.tokens[-1]
+        text = self.source[start:end]
+        if char == '(':
+            return kind == 'ident' and text in CONDITION_KEYWORDS
+        if kind == 'ident':
+            return text in BLOCK_KEYWORDS
+        return kind == 'punct' and text in (';', '{', '}', ')')
+
+    def _skip_type_arguments(self, pos):
+        # Past `<string>` in `<Select<string> ...>`; the '>' of an arrow type
+        # inside does not close it
+        source = self.source
+        if not source.startswith('<', pos):
+            return pos
+        depth = 0
+        while pos < len(source):
+            if source.startswith('=>', pos):
+                pos += 2
+                continue
+            if source[pos] == '<':
+                depth += 1
+            elif source[pos] == '>':
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+            pos += 1
+        return pos
+
+    def _unwind(self, stack, char):
+        # Index of the frame a closer matches. Frames above it were left
+        # open, as in an array missing its ']', and are reported and dropped,
+        # so one typo is one error rather than one per enclosing bracket.
+        # Recovery stays inside the current template ${} or JSX expression.
+        for i in range(len(stack) - 1, -1, -1):
+            opener = stack[i][0]
+            if opener == CLOSERS[char] or (char == '}' and opener == '${'):
+                for frame in stack[i + 1:]:
+                    self.errors.append(f"unclosed {frame[0]!r} at offset {frame[1]}")
+                del stack[i + 1:]
+                return True
+            if opener not in '([{':
+                return False
+        return False
+
+    def _after_jsx_element(self, stack, start, end):
+        # Back to the parent element's children, or to code when this was the
+        # outermost element; then the element is an operand like any other
+        if stack and stack[-1][0] == '<':
+            return 'jsx_children'
+        self.tokens.append(('jsx', start, end, len(stack)))
+        return 'code'
+
+    def _lex(self):
+        source = self.source
+        tokens = self.tokens
+        size = len(source)
+        # Frames: [char, open position, mode to resume when it closes]
+        stack = []
+        # Open positions of conditions and blocks
+        statements = set()
+        mode = 'code'
+        pos = 0
+
+        while pos < size:
+            if mode == 'template':
+                match = TEMPLATE_TEXT.match(source, pos)
+                if match.end() > pos:
+                    tokens.append(('template', pos, match.end(), len(stack)))
+                pos = match.end()
+                if pos >= size:
+                    break
+                if source[pos] == '`':
+                    pos += 1
+                    mode = stack.pop()[2]
+                else:  # ${
+                    stack.append(['${', pos, 'template'])
+                    tokens.append(('punct', pos, pos + 2, len(stack)))
+                    pos += 2
+                    mode = 'code'
+                continue
+
+            if mode == 'jsx_children':
+                match = JSX_TEXT.match(source, pos)
+                if match.end() > pos:
+                    tokens.append(('jsx', pos, match.end(), len(stack)))
+                pos = match.end()
+                if pos >= size:
+                    break
+                if source[pos] == '{':
+                    stack.append(['{', pos, 'jsx_children'])
+                    tokens.append(('punct', pos, pos + 1, len(stack)))
+                    pos += 1
+                    mode = 'code'
+                elif source.startswith('</', pos):
+                    match = JSX_CLOSE_TAG.match(source, pos)
+                    pos = match.end()
+                    stack.pop()
+                    mode = self._after_jsx_element(stack, match.start(), pos)
+                else:
+                    pos = self._skip_type_arguments(JSX_TAG_NAME.match(source, pos + 1).end())
+                    mode = 'jsx_tag'
+                continue
+
+            if mode == 'jsx_tag':
+                match = JSX_TAG_PART.match(source, pos)
+                if match is None:
+                    pos += 1
+                    continue
+                pos = match.end()
+                kind = match.lastgroup
+                if kind == 'open':
+                    stack.append(['{', match.start(), 'jsx_tag'])
+                    tokens.append(('punct', match.start(), pos, len(stack)))
+                    mode = 'code'
+                elif kind == 'self_close':
+                    mode = self._after_jsx_element(stack, match.start(), pos)
+                elif kind == 'end':
+                    stack.append(['<', match.start(), None])
+                    mode = 'jsx_children'
+                continue
+
+            match = CODE_TOKEN.match(source, pos)
+            kind = match.lastgroup
+            start, pos = pos, match.end()
+            if kind in ('ws', 'comment'):
+                continue
+            if kind != 'punct':
+                tokens.append((kind, start, pos, len(stack)))
+                continue
+
+            char = source[start:pos]
+            if char == '`':
+                stack.append(['`', start, 'code'])
+                mode = 'template'
+            elif char == '/' and self._expression_expected():
+                regex = REGEX_LITERAL.match(source, start)
+                if regex:
+                    pos = regex.end()
+                    tokens.append(('regex', start, pos, len(stack)))
+                else:
+                    tokens.append(('punct', start, pos, len(stack)))
+            elif (char == '<' and self.jsx and self._expression_expected() and JSX_START.match(source, start)
+                  and not GENERIC_ARROW.match(source, start)):
+                pos = self._skip_type_arguments(JSX_TAG_NAME.match(source, start + 1).end())
+                mode = 'jsx_tag'
+            elif char in '([{':
+                if self._opens_statement(char):
+                    statements.add(start)
+                stack.append([char, start, 'code'])
+                tokens.append(('punct', start, pos, len(stack)))
+            elif char in CLOSERS:
+                if self._unwind(stack, char):
+                    tokens.append(('punct', start, pos, len(stack)))
+                    opener, open_pos, resume = stack.pop()
+                    self.closing[open_pos] = start
+                    if open_pos in statements:
+                        self.statement_closes.add(start)
+                    mode = resume
+                else:
+                    tokens.append(('punct', start, pos, len(stack)))
+                    self.errors.append(f"unmatched {char!r} at offset {start}")
+            else:
+                tokens.append(('punct', start, pos, len(stack)))
+
+        # Past an unterminated template every closer was read as template
+        # text, so only the template and what opened inside it are reported
+        templates = [i for i, frame in enumerate(stack) if frame[0] == '`']
+        for opener, open_pos, _ in stack[templates[0] if templates else 0:]:
+            self.errors.append(f"unclosed {opener!r} at offset {open_pos}")
+
+    def find_token(self, position):
+        # Index of the first token starting at or after `position`
+        lo, hi = 0, len(self.tokens)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.tokens[mid][1] < position:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def block_end(self, open_pos):
+        # Offset just past the '}' closing the block opened at `open_pos`, or
+        # past a ';' that directly follows it
+        close = self.closing.get(open_pos)
+        if close is None:
+            return -1
+        i = self.find_token(close + 1)
+        if i < len(self.tokens) and self.text(i) == ';':
+            return self.tokens[i][2]
+        return close + 1
+
+    def _ends_block_statement(self, i):
+        # A '}' followed on a later line by a new statement, as after
+        # `if (...) {...}`; `} else`, `} = obj` and `}, [deps])` continue
+        if i + 1 >= len(self.tokens):
+            return True
+        kind, start, _, _ = self.tokens[i + 1]
+        return (kind == 'ident' and self.text(i + 1) not in BLOCK_CONTINUATIONS
+                and '\n' in self.source[self.tokens[i][2]:start])
+
+    def statement_span(self, position):
+        # (start, end) of the innermost statement containing `position`. An
+        # offset inside call arguments, brackets or ${} climbs out to the
+        # statement around them.
+        tokens = self.tokens
+        if not tokens:
+            return 0, len(self.source)
+        i = min(self.find_token(position), len(tokens) - 1)
+        depth = tokens[i][3]
+
+        j = i - 1
+        while j >= 0:
+            token_depth = tokens[j][3]
+            text = self.text(j)
+            if token_depth == depth:
+                if text in ('(', '[', '${'):
+                    depth -= 1
+                elif text in (';', '{'):
+                    break
+            elif token_depth == depth + 1 and text == '}' and self._ends_block_statement(j):
+                break
+            j -= 1
+        start = tokens[j + 1][1]
+
+        end = len(self.source)
+        k = i
+        while k < len(tokens):
+            token_depth = tokens[k][3]
+            text = self.text(k)
+            if token_depth == depth and text == ';':
+                end = tokens[k][2]
+                break
+            if token_depth == depth and text == '}':
+                end = tokens[k][1]
+                break
+            if token_depth < depth:
+                end = tokens[k][1]
+                break
+            if token_depth == depth + 1 and text == '}' and self._ends_block_statement(k):
+                end = tokens[k][2]
+                break
+            k += 1
+        return start, end
+
+    def _body_after(self, i, depth):
+        # Offset of the first '{' directly inside `depth` from token i on,
+        # unless the enclosing statement or bracket ends first
+        while i < len(self.tokens):
+            token_depth = self.tokens[i][3]
+            text = self.text(i)
+            if text == '{' and token_depth == depth + 1:
+                return self.tokens[i][1]
+            if token_depth <= depth and text in (';', ')', ']', '}'):
+                return None
+            i += 1
+        return None
+
+    def _statement_end(self, close, depth):
+        # Past the ';' ending the statement whose last block closes at
+        # `close`, skipping call arguments such as the deps of useCallback
+        end = close + 1
+        i = self.find_token(close + 1)
+        while i < len(self.tokens) and self.tokens[i][3] > depth:
+            end = self.tokens[i][2]
+            i += 1
+        if i < len(self.tokens) and self.tokens[i][3] == depth and self.text(i) == ';':
+            end = self.tokens[i][2]
+        return end
+
+    def find_declaration(self, name):
+        # Span of `function name(...) {...}`, `const name = (...) => {...}`
+        # (also wrapped, as in useCallback(async () => {...}, [])),
+        # `const name = function (...) {...}` or a method `name(...) {...}`.
+        # Returns {'start', 'end', 'body_start', 'body_end'} or None.
+        tokens = self.tokens
+        for i, (kind, start, end, depth) in enumerate(tokens):
+            if kind != 'ident' or self.source[start:end] != name:
+                continue
+            prev = self.text(i - 1) if i else ''
+            if prev == '.':
+                continue
+
+            decl_start = start
+            if prev in ('function', 'const', 'let', 'var'):
+                j = i - 1
+                while j > 0 and self.text(j - 1) in ('export', 'default', 'async'):
+                    j -= 1
+                decl_start = tokens[j][1]
+
+            body = None
+            if prev == 'function':
+                body = self._body_after(i + 1, depth)
+            elif prev in ('const', 'let', 'var'):
+                # Skip a type annotation up to '=', then find the function
+                # the value starts with
+                k = i + 1
+                while k < len(tokens) and not (tokens[k][3] == depth and self.text(k) in ('=', ';')):
+                    k += 1
+                while k < len(tokens) and tokens[k][3] >= depth:
+                    text = self.text(k)
+                    if text in ('=>', 'function'):
+                        body = self._body_after(k + 1, tokens[k][3])
+                        break
+                    if tokens[k][3] == depth and text == ';':
+                        break
+                    k += 1
+            elif i + 1 < len(tokens) and self.text(i + 1) == '(':
+                # Method shorthand; a call is followed by ';', '.', ')' etc.
+                close = self.closing.get(tokens[i + 1][1])
+                if close is not None:
+                    body = self._body_after(self.find_token(close + 1), depth)
+
+            if body is None:
+                continue
+            body_end = self.closing[body] + 1
+            return {
+                'start': decl_start,
+                'end': self._statement_end(body_end - 1, depth) if prev in ('const', 'let', 'var') else body_end,
+                'body_start': body,
+                'body_end': body_end,
+            }
+        return None
+
+def index_source(content, jsx=True):
+    key = (content_hash(content), jsx, LEXER_VERSION)
+    index = _cache.get(key)
+    if index is None:
+        index = SourceIndex(content, jsx)
+        if len(_cache) >= CACHE_SIZE:
+            _cache.pop(next(iter(_cache)))
+        _cache[key] = index
+    return index
+
+def index_for_path(path, content):
+    # JSX is only recognized in .tsx/.jsx; in .ts a '<' can be a type assertion
+    return index_source(content, jsx=path.endswith(('.tsx', '.jsx')))